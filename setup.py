@@ -69,6 +69,7 @@ console_scripts = [
     "MacroServer = sardana.tango.macroserver:main",
     "Pool = sardana.tango.pool:main",
     "Sardana = sardana.tango:main",
+    "sardanabenchmark = sardana.benchmark:main",
     "sardanatestsuite = sardana.test.testsuite:main",
     "spock = sardana.spock:main",
 ]
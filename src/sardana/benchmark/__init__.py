@@ -0,0 +1,42 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This package provides benchmarks of Sardana which run offline, using the
+dummy controllers and the test fixtures of the Pool, and produce
+machine-readable (JSON) results so the performance can be compared between
+releases e.g.::
+
+    sardanabenchmark -o sardana-3.0.json
+    sardanabenchmark --ctrls 4 --axes 8 --compare sardana-3.0.json
+    sardanabenchmark -b scan.pipeline.spec+h5+json -p rate=1000
+
+or from Python::
+
+    from sardana.benchmark import run
+    results = run(["pool.step_count"], nb_ctrls=2, nb_axes=4)
+"""
+
+from .common import *  # NOQA
+from . import pool  # NOQA
+from . import scan  # NOQA
+from . import macroserver  # NOQA
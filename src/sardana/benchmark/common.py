@@ -0,0 +1,280 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides the infrastructure of the benchmarks: registration,
+measurement, result statistics, comparison with a baseline and the command
+line interface."""
+
+__all__ = ["benchmark", "get_benchmarks", "measure", "summarize", "run",
+           "save_results", "load_results", "compare", "main"]
+
+__docformat__ = 'restructuredtext'
+
+import sys
+import json
+import time
+import math
+import platform
+import datetime
+import collections
+
+_BENCHMARKS = collections.OrderedDict()
+
+BenchmarkInfo = collections.namedtuple("BenchmarkInfo",
+                                       "name func unit higher_is_better doc")
+
+
+def benchmark(name, unit="s", higher_is_better=False):
+    """Decorator registering a benchmark function.
+
+    The function receives the benchmark parameters as keyword arguments (it
+    must accept any of them with ``**kwargs``) and returns either a
+    sequence of samples or a dict with the ``samples`` key and, optionally,
+    any other (JSON serializable) information.
+
+    :param name: benchmark name e.g. ``pool.step_count``
+    :type name: str
+    :param unit: unit of the samples
+    :type unit: str
+    :param higher_is_better: whether higher sample values mean better
+                             performance (e.g. throughput)
+    :type higher_is_better: bool
+    """
+    def decorator(func):
+        doc = (func.__doc__ or "").strip().split("\n")[0]
+        _BENCHMARKS[name] = BenchmarkInfo(name, func, unit, higher_is_better,
+                                          doc)
+        return func
+    return decorator
+
+
+def get_benchmarks():
+    """Get the registered benchmarks.
+
+    :return: map of benchmark names and information
+    :rtype: collections.OrderedDict<str, BenchmarkInfo>
+    """
+    return _BENCHMARKS
+
+
+def measure(func, repeat=10, warmup=1, setup=None):
+    """Measure the duration of a function call.
+
+    :param func: function to measure
+    :type func: callable
+    :param repeat: number of measured calls
+    :type repeat: int
+    :param warmup: number of calls executed before measuring
+    :type warmup: int
+    :param setup: function called (not measured) before each call
+    :type setup: callable
+    :return: durations (in seconds) of the measured calls
+    :rtype: list<float>
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def summarize(samples):
+    """Calculate the statistics of the samples.
+
+    :param samples: sample values
+    :type samples: seq<float>
+    :return: number of samples, minimum, maximum, mean, median and standard
+             deviation
+    :rtype: dict<str, float>
+    """
+    samples = sorted(samples)
+    n = len(samples)
+    if n == 0:
+        return dict(n=0)
+    mean = sum(samples) / n
+    half = n // 2
+    if n % 2:
+        median = samples[half]
+    else:
+        median = (samples[half - 1] + samples[half]) / 2
+    if n > 1:
+        stdev = math.sqrt(sum((s - mean) ** 2 for s in samples) / (n - 1))
+    else:
+        stdev = 0.
+    return dict(n=n, min=samples[0], max=samples[-1], mean=mean,
+                median=median, stdev=stdev)
+
+
+def _get_metadata(params):
+    from sardana import Release
+    return dict(sardana=Release.version,
+                python=platform.python_version(),
+                platform=platform.platform(),
+                machine=platform.machine(),
+                date=datetime.datetime.now().isoformat(),
+                params=params)
+
+
+def run(names=None, **params):
+    """Run benchmarks.
+
+    :param names: names of the benchmarks to run (default: all of them)
+    :type names: seq<str>
+    :param params: benchmark parameters e.g. ``nb_ctrls``, ``nb_axes``
+                   or ``repeat``
+    :return: results with the keys ``metadata`` and ``results`` (one
+             dict per benchmark with its name, unit, statistics, samples
+             and any other information it reported)
+    :rtype: dict
+    """
+    benchmarks = get_benchmarks()
+    if names is None:
+        names = list(benchmarks.keys())
+    results = []
+    for name in names:
+        try:
+            info = benchmarks[name]
+        except KeyError:
+            raise ValueError("unknown benchmark '%s'" % name)
+        ret = info.func(**params)
+        if not isinstance(ret, dict):
+            ret = dict(samples=list(ret))
+        result = collections.OrderedDict(
+            name=name, unit=info.unit,
+            higher_is_better=info.higher_is_better)
+        result["stats"] = summarize(ret["samples"])
+        result.update(ret)
+        results.append(result)
+    return dict(metadata=_get_metadata(params), results=results)
+
+
+def save_results(results, file_name):
+    """Save results (as returned by :func:`run`) in a JSON file"""
+    with open(file_name, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(file_name):
+    """Load results saved with :func:`save_results`"""
+    with open(file_name) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Compare the medians of the results with a baseline.
+
+    :param results: results as returned by :func:`run`
+    :type results: dict
+    :param baseline: baseline results e.g. of a previous release
+    :type baseline: dict
+    :param tolerance: relative change considered as a regression
+    :type tolerance: float
+    :return: one tuple per benchmark present in both: name, baseline
+             median, current median, relative change (positive means
+             worse) and whether it is a regression
+    :rtype: list<tuple(str, float, float, float, bool)>
+    """
+    baseline = {r["name"]: r for r in baseline["results"]}
+    ret = []
+    for result in results["results"]:
+        name = result["name"]
+        base = baseline.get(name)
+        if base is None:
+            continue
+        base_median = base["stats"]["median"]
+        median = result["stats"]["median"]
+        if base_median == 0:
+            continue
+        change = (median - base_median) / base_median
+        if result["higher_is_better"]:
+            change = -change
+        ret.append((name, base_median, median, change, change > tolerance))
+    return ret
+
+
+def main():
+    from taurus.external import argparse
+
+    parser = argparse.ArgumentParser(description='Sardana benchmarks')
+    parser.add_argument('-b', '--benchmark', dest='names', action='append',
+                        help='benchmark to run (may be repeated, default: '
+                             'all of them)')
+    parser.add_argument('-l', '--list', action='store_true', default=False,
+                        help='list the available benchmarks and exit')
+    parser.add_argument('--ctrls', dest='nb_ctrls', type=int, default=1,
+                        help='number of controllers')
+    parser.add_argument('--axes', dest='nb_axes', type=int, default=1,
+                        help='number of axes per controller')
+    parser.add_argument('-r', '--repeat', type=int, default=10,
+                        help='number of measurements of each benchmark')
+    parser.add_argument('-p', '--param', dest='params', action='append',
+                        default=[], metavar='NAME=VALUE',
+                        help='additional benchmark parameter e.g. rate=1000 '
+                             '(may be repeated)')
+    parser.add_argument('-o', '--output',
+                        help='JSON file where to save the results')
+    parser.add_argument('-c', '--compare',
+                        help='JSON file with the baseline results')
+    parser.add_argument('-t', '--tolerance', type=float, default=0.2,
+                        help='relative change considered as a regression')
+    args = parser.parse_args()
+
+    if args.list:
+        for info in list(get_benchmarks().values()):
+            print("%-30s %s" % (info.name, info.doc))
+        sys.exit(0)
+
+    params = dict(nb_ctrls=args.nb_ctrls, nb_axes=args.nb_axes,
+                  repeat=args.repeat)
+    for param in args.params:
+        name, _, value = param.partition("=")
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+        params[name.strip()] = value
+    results = run(args.names, **params)
+    for result in results["results"]:
+        stats = result["stats"]
+        print("%-30s median: %-12.6g min: %-12.6g max: %-12.6g [%s]" %
+              (result["name"], stats["median"], stats["min"], stats["max"],
+               result["unit"]))
+    if args.output:
+        save_results(results, args.output)
+
+    exit_code = 0
+    if args.compare:
+        baseline = load_results(args.compare)
+        for name, base, current, change, regression in \
+                compare(results, baseline, args.tolerance):
+            print("%-30s %12.6g -> %-12.6g %+7.1f%% %s" %
+                  (name, base, current, change * 100,
+                   "REGRESSION" if regression else ""))
+            if regression:
+                exit_code = 1
+    sys.exit(exit_code)
@@ -0,0 +1,54 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains a counter/timer controller which counts the
+parameter writes. It is used by the Pool benchmarks."""
+
+__all__ = ["BenchmarkCounterTimerController"]
+
+__docformat__ = 'restructuredtext'
+
+from sardana.pool.poolcontrollers.DummyCounterTimerController import \
+    DummyCounterTimerController
+
+
+class BenchmarkCounterTimerController(DummyCounterTimerController):
+    """Dummy counter/timer controller which counts the calls to
+    :meth:`SetCtrlPar` and :meth:`SetAxisPar`"""
+
+    gender = "Simulation"
+    model = "Benchmark"
+
+    def __init__(self, inst, props, *args, **kwargs):
+        DummyCounterTimerController.__init__(self, inst, props, *args,
+                                             **kwargs)
+        self.nb_set_ctrl_par = 0
+        self.nb_set_axis_par = 0
+
+    def SetCtrlPar(self, par, value):
+        self.nb_set_ctrl_par += 1
+        DummyCounterTimerController.SetCtrlPar(self, par, value)
+
+    def SetAxisPar(self, axis, par, value):
+        self.nb_set_axis_par += 1
+        DummyCounterTimerController.SetAxisPar(self, axis, par, value)
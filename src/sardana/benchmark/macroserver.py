@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides the benchmarks of the MacroServer macro
+preparation e.g. parsing of the macro parameters typed by the user."""
+
+__all__ = []
+
+__docformat__ = 'restructuredtext'
+
+from sardana.util.parser import ParamParser
+from sardana.benchmark.common import benchmark, measure
+
+
+def _param_def(name, type_, min_=1, max_=None):
+    return dict(name=name, type=type_, default_value=None, description=name,
+                min=min_, max=max_)
+
+
+#: parameters definition of a ``mv`` like macro with a repeat of pairs
+_MV_PARAMS_DEF = [
+    _param_def("motor_pos_list", [_param_def("motor", "Moveable"),
+                                  _param_def("pos", "Float")]),
+]
+
+#: parameters definition with nested repeats followed by a plain parameter
+_NESTED_PARAMS_DEF = [
+    _param_def("groups", [_param_def("motors", [_param_def("motor",
+                                                           "Moveable")]),
+                          _param_def("value", "Float")]),
+    _param_def("channel", "ExpChannel"),
+]
+
+
+@benchmark("macroserver.param_parser", unit="s")
+def param_parser(repeat=10, nb_axes=8, nb_commands=1000, **kwargs):
+    """Parsing of macro parameters with the per macro cached parser"""
+    mv_str = " ".join("mot%02d %d" % (i, i) for i in range(nb_axes))
+    nested_str = "[%s] ct01" % " ".join(
+        "[[mot%02d mot%02d] %d]" % (i, i + 1, i) for i in range(nb_axes))
+    commands = [(_MV_PARAMS_DEF, mv_str), (_NESTED_PARAMS_DEF, nested_str)]
+    parsers = [(ParamParser(params_def), params_str)
+               for params_def, params_str in commands]
+
+    def parse_cached():
+        for _ in range(nb_commands // len(parsers)):
+            for parser, params_str in parsers:
+                parser.parse(params_str)
+
+    def parse_uncached():
+        for _ in range(nb_commands // len(commands)):
+            for params_def, params_str in commands:
+                ParamParser(params_def).parse(params_str)
+
+    samples = measure(parse_cached, repeat)
+    uncached = measure(parse_uncached, repeat)
+    return dict(samples=samples, uncached=uncached)
@@ -0,0 +1,408 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides the benchmarks of the Pool: acquisition, motion,
+value buffer events and pseudo counter calculation. They use the dummy
+controllers in a :class:`~sardana.pool.test.fake.FakePool`."""
+
+__all__ = ["PoolBenchmarkEnvironment"]
+
+__docformat__ = 'restructuredtext'
+
+import os
+import copy
+import time
+import threading
+
+from sardana.pool import AcqSynchType
+from sardana.pool.pooldefs import SynchDomain, SynchParam
+from sardana.pool.poolmotion import PoolMotion
+from sardana.pool.test import (BasePoolTestCase, FakePool,
+                               createMGUserConfiguration,
+                               createPoolMeasurementGroup,
+                               dummyMeasurementGroupConf01)
+from sardana.benchmark.common import benchmark, measure
+
+#: dummy controllers (class, library and element creation method name) per
+#: type of channel
+CHANNEL_CTRLS = {
+    "ct": ("DummyCounterTimerController", "DummyCounterTimerController.py",
+           "createCTElement"),
+    "oned": ("DummyOneDController", "DummyOneDController.py",
+             "createOneDElement"),
+    "twod": ("DummyTwoDController", "DummyTwoDController.py",
+             "createTwoDElement"),
+    # counter/timer counting the parameter writes
+    "bench_ct": ("BenchmarkCounterTimerController",
+                 "BenchmarkCounterTimerController.py", "createCTElement"),
+}
+
+#: directory of the benchmark controllers
+CONTROLLERS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "controllers")
+
+
+class PoolBenchmarkEnvironment(BasePoolTestCase):
+    """Pool with dummy controllers and elements created on demand. Use it
+    as a context manager to clean up the pool at the end."""
+
+    def __init__(self, nb_ctrls=1, nb_axes=1):
+        self.nb_ctrls = nb_ctrls
+        self.nb_axes = nb_axes
+        self.pool = FakePool(self.POOLPATH + [CONTROLLERS_PATH],
+                             self.LOGLEVEL)
+        self.ctrls = {}
+        self.cts = {}
+        self.zerods = {}
+        self.oneds = {}
+        self.twods = {}
+        self.tgs = {}
+        self.mots = {}
+        self.pcs = {}
+        self.pms = {}
+        self.exp_channels = {}
+        self._nb_ctrls_created = 0
+        self._nb_mgs = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.tearDown()
+
+    def _create_ctrl(self, klass, lib):
+        self._nb_ctrls_created += 1
+        name = "_bench_ctrl_%d" % self._nb_ctrls_created
+        return self.createController(name, klass, lib)
+
+    def create_channels(self, kind="ct", nb_ctrls=None, nb_axes=None,
+                        synchronizer=None):
+        """Create channels of the given kind (see :data:`CHANNEL_CTRLS`).
+
+        :param synchronizer: trigger/gate name emulating the hardware
+                             synchronization (only for the controllers
+                             supporting it)
+        :return: channel names grouped by controller
+        :rtype: list<list<str>>"""
+        klass, lib, create = CHANNEL_CTRLS[kind]
+        create = getattr(self, create)
+        ret = []
+        for _ in range(nb_ctrls or self.nb_ctrls):
+            ctrl = self._create_ctrl(klass, lib)
+            if (synchronizer is not None
+                    and "synchronizer" in ctrl.ctrl_info.ctrl_attributes):
+                ctrl.set_ctrl_attr("synchronizer", synchronizer)
+            names = []
+            for axis in range(1, (nb_axes or self.nb_axes) + 1):
+                name = "%s_%d" % (ctrl.name, axis)
+                self.exp_channels[name] = create(ctrl, name, axis)
+                names.append(name)
+            ret.append(names)
+        return ret
+
+    def create_trigger_gate(self):
+        ctrl = self._create_ctrl("DummyTriggerGateController",
+                                 "DummyTriggerGateController.py")
+        name = "%s_1" % ctrl.name
+        self.createTGElement(ctrl, name, 1)
+        return name
+
+    def create_motors(self, nb_ctrls=None, nb_axes=None):
+        """Create dummy motors with fast motion parameters.
+
+        :return: motors
+        :rtype: list<:class:`~sardana.pool.poolmotor.PoolMotor`>"""
+        motors = []
+        for _ in range(nb_ctrls or self.nb_ctrls):
+            ctrl = self._create_ctrl("DummyMotorController",
+                                     "DummyMotorController.py")
+            for axis in range(1, (nb_axes or self.nb_axes) + 1):
+                name = "%s_%d" % (ctrl.name, axis)
+                motor = self.createMotorElement(ctrl, name, axis)
+                ctrl.ctrl.SetAxisPar(axis, "velocity", 1000)
+                ctrl.ctrl.SetAxisPar(axis, "acceleration", 0.001)
+                ctrl.ctrl.SetAxisPar(axis, "deceleration", 0.001)
+                motors.append(motor)
+        return motors
+
+    def create_measurement_group(self, channels, synchronizer="software",
+                                 synch_type=AcqSynchType.Trigger):
+        """Create a measurement group.
+
+        :param channels: channel names grouped by controller (the first
+                         one being the timer)
+        :type channels: seq<seq<str>>
+        :return: measurement group
+        :rtype: :class:`~sardana.pool.poolmeasurementgroup.PoolMeasurementGroup`
+        """
+        config = [[(name, synchronizer, synch_type) for name in names]
+                  for names in channels]
+        mg_conf, channel_ids, _ = createMGUserConfiguration(self.pool,
+                                                            config)
+        self._nb_mgs += 1
+        conf = copy.deepcopy(dummyMeasurementGroupConf01)
+        conf["name"] = conf["full_name"] = "_bench_mg_%d" % self._nb_mgs
+        conf["user_elements"] = channel_ids
+        mg = createPoolMeasurementGroup(self.pool, conf)
+        self.pool.add_element(mg)
+        mg.set_configuration_from_user(mg_conf, to_fqdn=False)
+        return mg
+
+    @staticmethod
+    def acquire(mg, sleep_time=0.001):
+        """Prepare, start and wait until the end of the acquisition"""
+        mg.prepare()
+        mg.start_acquisition()
+        acq = mg.acquisition
+        while acq.is_running():
+            time.sleep(sleep_time)
+
+
+class _ValueCounter(object):
+    """Listener counting the values received in the value buffer events"""
+
+    #: maximum time (s) to wait for the expected values
+    Timeout = 10
+
+    def __init__(self, expected):
+        self.expected = expected
+        self.count = 0
+        self.done = threading.Event()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Wait until the expected values were received.
+
+        :raises: RuntimeError if they were not received in :attr:`Timeout`
+                 seconds (the measurement would not be valid)"""
+        if not self.done.wait(self.Timeout):
+            raise RuntimeError("received %d of %d values in %ss" %
+                               (self.count, self.expected, self.Timeout))
+
+    def event_received(self, src, type_, value):
+        if type_.name.lower() != "valuebuffer":
+            return
+        with self.lock:
+            self.count += len(value)
+            if self.count >= self.expected:
+                self.done.set()
+
+
+def _synchronization(repeats, active, total, delay=0):
+    return [{SynchParam.Delay: {SynchDomain.Time: delay},
+             SynchParam.Active: {SynchDomain.Time: active},
+             SynchParam.Total: {SynchDomain.Time: total},
+             SynchParam.Repeats: repeats}]
+
+
+@benchmark("pool.step_count", unit="s")
+def step_count(nb_ctrls=1, nb_axes=1, repeat=10, integ_time=0.01,
+               **kwargs):
+    """Step count (prepare, start and wait) overhead of counter/timers"""
+    with PoolBenchmarkEnvironment(nb_ctrls, nb_axes) as env:
+        mg = env.create_measurement_group(env.create_channels("ct"))
+        mg.set_synchronization(_synchronization(1, integ_time, integ_time))
+        samples = measure(lambda: env.acquire(mg), repeat)
+    return dict(samples=[s - integ_time for s in samples],
+                integ_time=integ_time)
+
+
+@benchmark("pool.ctrl_par_writes", unit="writes")
+def ctrl_par_writes(nb_ctrls=1, nb_axes=1, repeat=1000, integ_time=0.0001,
+                    **kwargs):
+    """Controller parameter writes per point of a step scan (after the first
+    point) done by the measurement group preparation"""
+    with PoolBenchmarkEnvironment(nb_ctrls, nb_axes) as env:
+        channels = env.create_channels("bench_ct")
+        mg = env.create_measurement_group(channels)
+        mg.set_synchronization(_synchronization(1, integ_time, integ_time))
+        ctrls = [env.exp_channels[names[0]].controller.ctrl
+                 for names in channels]
+
+        def nb_writes():
+            return sum(ctrl.nb_set_ctrl_par + ctrl.nb_set_axis_par
+                       for ctrl in ctrls)
+
+        env.acquire(mg)
+        first_point = nb_writes()
+        samples = []
+        for _ in range(repeat):
+            nb = nb_writes()
+            env.acquire(mg)
+            samples.append(nb_writes() - nb)
+    return dict(samples=samples, first_point=first_point)
+
+
+def _continuous_acquisition(kind, nb_ctrls, nb_axes, repeat, repetitions,
+                            active_time, latency_time):
+    with PoolBenchmarkEnvironment(nb_ctrls, nb_axes) as env:
+        tg = env.create_trigger_gate()
+        channels = env.create_channels(kind, synchronizer=tg)
+        if kind != "ct":
+            # counter/timer as the measurement group timer
+            channels = env.create_channels("ct", 1, 1, tg) + channels
+        mg = env.create_measurement_group(channels, tg)
+        total_time = active_time + latency_time
+        mg.set_synchronization(_synchronization(repetitions, active_time,
+                                                total_time))
+        elements = [env.exp_channels[name]
+                    for names in channels for name in names]
+        expected = repetitions * len(elements)
+        counters = []
+
+        def setup():
+            counters[:] = [_ValueCounter(repetitions) for _ in elements]
+            for element, counter in zip(elements, counters):
+                element.add_listener(counter)
+
+        def acquire():
+            env.acquire(mg)
+            for counter in counters:
+                counter.wait()
+
+        def teardown():
+            for element, counter in zip(elements, counters):
+                element.remove_listener(counter)
+
+        samples = []
+        for duration in measure(acquire, repeat, setup=setup):
+            teardown()
+            samples.append(expected / duration)
+        teardown()
+    return dict(samples=samples, repetitions=repetitions,
+                nb_channels=len(elements),
+                theoretical_time=repetitions * total_time)
+
+
+@benchmark("pool.continuous_acquisition.ct", unit="values/s",
+           higher_is_better=True)
+def continuous_acquisition_ct(nb_ctrls=1, nb_axes=1, repeat=10,
+                              repetitions=100, active_time=0.001,
+                              latency_time=0.001, **kwargs):
+    """Hardware triggered acquisition throughput of counter/timers"""
+    return _continuous_acquisition("ct", nb_ctrls, nb_axes, repeat,
+                                   repetitions, active_time, latency_time)
+
+
+@benchmark("pool.continuous_acquisition.oned", unit="values/s",
+           higher_is_better=True)
+def continuous_acquisition_oned(nb_ctrls=1, nb_axes=1, repeat=10,
+                                repetitions=100, active_time=0.001,
+                                latency_time=0.001, **kwargs):
+    """Hardware triggered acquisition throughput of 1D channels"""
+    return _continuous_acquisition("oned", nb_ctrls, nb_axes, repeat,
+                                   repetitions, active_time, latency_time)
+
+
+@benchmark("pool.continuous_acquisition.twod", unit="values/s",
+           higher_is_better=True)
+def continuous_acquisition_twod(nb_ctrls=1, nb_axes=1, repeat=10,
+                                repetitions=10, active_time=0.01,
+                                latency_time=0.01, **kwargs):
+    """Hardware triggered acquisition throughput of 2D channels"""
+    return _continuous_acquisition("twod", nb_ctrls, nb_axes, repeat,
+                                   repetitions, active_time, latency_time)
+
+
+@benchmark("pool.motion", unit="s")
+def motion(nb_ctrls=1, nb_axes=1, repeat=10, distance=1, **kwargs):
+    """Motion loop overhead of dummy motors (beyond the motion duration)"""
+    with PoolBenchmarkEnvironment(nb_ctrls, nb_axes) as env:
+        motors = env.create_motors()
+        action = PoolMotion(motors[0])
+        for motor in motors:
+            action.add_element(motor)
+        positions = [0]
+
+        def move():
+            positions[0] = distance - positions[0]
+            items = {}
+            for motor in motors:
+                motor.calculate_motion(positions[0], items=items)
+            action.run(items=items, synch=True)
+
+        samples = []
+        for elapsed in measure(move, repeat):
+            duration = max(motor.controller.ctrl.m[motor.axis - 1].duration
+                           for motor in motors)
+            samples.append(elapsed - duration)
+    return dict(samples=samples, nb_motors=len(motors))
+
+
+@benchmark("pool.value_buffer_events", unit="events/s",
+           higher_is_better=True)
+def value_buffer_events(repeat=10, nb_listeners=10, chunk_size=100,
+                        nb_chunks=10, **kwargs):
+    """Fan-out of value buffer events of a channel to its listeners"""
+    with PoolBenchmarkEnvironment(1, 1) as env:
+        channel = env.exp_channels[env.create_channels("ct")[0][0]]
+        listeners = []
+        values = [float(i) for i in range(chunk_size)]
+
+        def setup():
+            for listener in listeners:
+                channel.remove_listener(listener)
+            channel.clear_value_buffer()
+            listeners[:] = [_ValueCounter(chunk_size * nb_chunks)
+                            for _ in range(nb_listeners)]
+            for listener in listeners:
+                channel.add_listener(listener)
+
+        def extend():
+            for _ in range(nb_chunks):
+                channel.extend_value_buffer(values)
+            for listener in listeners:
+                listener.wait()
+
+        samples = [nb_listeners * nb_chunks / duration
+                   for duration in measure(extend, repeat, setup=setup)]
+    return dict(samples=samples, chunk_size=chunk_size)
+
+
+@benchmark("pool.pseudo_counter", unit="values/s", higher_is_better=True)
+def pseudo_counter(repeat=10, chunk_size=1000, **kwargs):
+    """Calculation of a pseudo counter (IoverI0) from its value buffers"""
+    with PoolBenchmarkEnvironment(1, 2) as env:
+        names = env.create_channels("ct", 1, 2)[0]
+        ct1, ct2 = [env.exp_channels[name] for name in names]
+        ctrl = env._create_ctrl("IoverI0", "IoverI0")
+        pc = env.createPCElement(ctrl, "_bench_pc_1", 1, (ct1.id, ct2.id))
+        values = [float(i + 1) for i in range(chunk_size)]
+        counter = []
+
+        def setup():
+            for channel in (ct1, ct2, pc):
+                channel.clear_value_buffer()
+            if counter:
+                pc.remove_listener(counter[0])
+            counter[:] = [_ValueCounter(chunk_size)]
+            pc.add_listener(counter[0])
+
+        def calculate():
+            ct1.extend_value_buffer(values)
+            ct2.extend_value_buffer(values)
+            counter[0].wait()
+
+        samples = [chunk_size / duration
+                   for duration in measure(calculate, repeat, setup=setup)]
+    return dict(samples=samples, chunk_size=chunk_size)
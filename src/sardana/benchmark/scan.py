@@ -0,0 +1,252 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides the benchmarks of the MacroServer scan data
+pipeline: value buffer events (as received by the continuous scans) are
+processed by :class:`~sardana.macroserver.scan.gscan.CAcquisition`, merged
+in records by the :class:`~sardana.macroserver.scan.scandata.ScanData` and
+written by the recorders."""
+
+__all__ = ["ScanPipeline", "RECORDERS"]
+
+__docformat__ = 'restructuredtext'
+
+import os
+import time
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+
+from taurus.core.util.codecs import CodecFactory
+
+from sardana.macroserver.scan.gscan import CAcquisition
+from sardana.macroserver.scan.scandata import ScanData
+from sardana.macroserver.scan.recorder import DataHandler, DataRecorder
+from sardana.macroserver.scan.test.helper import createScanDataEnvironment
+from sardana.benchmark.common import benchmark
+
+
+class _Stream(object):
+    """Door like object encoding the record data sent by the
+    :class:`~sardana.macroserver.recorders.output.JsonRecorder`"""
+
+    def __init__(self):
+        self.nb_packets = 0
+
+    def getID(self):
+        return "benchmark"
+
+    def _sendRecordData(self, data, codec=None):
+        CodecFactory().encode(codec, ('', data))
+        self.nb_packets += 1
+
+
+def _create_spec(directory, stream):
+    from sardana.macroserver.recorders.storage import SPEC_FileRecorder
+    return SPEC_FileRecorder(filename=os.path.join(directory, "scan.spec"))
+
+
+def _create_h5(directory, stream):
+    from sardana.macroserver.recorders.h5storage import NXscanH5_FileRecorder
+    return NXscanH5_FileRecorder(filename=os.path.join(directory, "scan.h5"))
+
+
+def _create_json(directory, stream):
+    from sardana.macroserver.recorders.output import JsonRecorder
+    return JsonRecorder(stream)
+
+
+#: recorder factories
+RECORDERS = {
+    "spec": _create_spec,
+    "h5": _create_h5,
+    "json": _create_json,
+}
+
+
+class _LatencyRecorder(DataRecorder):
+    """Recorder storing the time when each record was written"""
+
+    def __init__(self, **pars):
+        DataRecorder.__init__(self, **pars)
+        self.times = {}
+
+    def _writeRecord(self, record):
+        self.times[record.recordno] = time.perf_counter()
+
+
+class _Channel(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def getFullName(self):
+        return self.name
+
+
+def _get_memory():
+    """Get the resident memory of the process (in bytes)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (IOError, OSError, ValueError):
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_maxrss * 1024
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return None
+    idx = int(round(percent / 100. * (len(sorted_values) - 1)))
+    return sorted_values[idx]
+
+
+class ScanPipeline(object):
+    """Continuous scan data pipeline fed with synthetic value buffer events.
+
+    :param recorders: recorder names (see :data:`RECORDERS`)
+    :type recorders: seq<str>
+    :param nb_channels: number of channels
+    :type nb_channels: int
+    :param nb_points: number of points of the scan
+    :type nb_points: int
+    :param chunk_size: number of points of each value buffer event
+    :type chunk_size: int
+    :param rate: points per second at which the events are pushed
+                 (0 means as fast as possible)
+    :type rate: float
+    """
+
+    def __init__(self, recorders=(), nb_channels=1, nb_points=1000,
+                 chunk_size=10, rate=0):
+        self.recorders = recorders
+        self.channels = [_Channel("ch%d" % i) for i in range(nb_channels)]
+        self.nb_points = nb_points
+        self.chunk_size = chunk_size
+        self.rate = rate
+
+    def _push(self, acquisition, push_times):
+        period = self.chunk_size / float(self.rate) if self.rate else 0
+        start = time.perf_counter()
+        for nb, first in enumerate(range(0, self.nb_points,
+                                         self.chunk_size)):
+            if period:
+                delay = start + nb * period - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            index = list(range(first, min(first + self.chunk_size,
+                                          self.nb_points)))
+            data = [float(i) for i in index]
+            last_channel = self.channels[-1]
+            for channel in self.channels:
+                value_buffer = dict(value=list(data), index=list(index))
+                if channel is last_channel:
+                    # the records may be written already by this call
+                    now = time.perf_counter()
+                    for i in index:
+                        push_times[i] = now
+                acquisition.value_buffer_changed(channel, value_buffer)
+
+    def run(self):
+        """Run the scan.
+
+        :return: elapsed time (in seconds), latency of each record (from
+                 the moment the last channel value was pushed until it was
+                 written by all the recorders) and memory growth (in bytes)
+        :rtype: tuple(float, list<float>, int)
+        """
+        directory = tempfile.mkdtemp(prefix="sardanabenchmark")
+        stream = _Stream()
+        try:
+            data_handler = DataHandler()
+            for name in self.recorders:
+                data_handler.addRecorder(RECORDERS[name](directory, stream))
+            latency_recorder = _LatencyRecorder()
+            data_handler.addRecorder(latency_recorder)
+            columns = [channel.name for channel in self.channels]
+            env = createScanDataEnvironment(columns, directory, "scan.h5")
+            env.update(macro_id="benchmark", title="benchmark",
+                       counters=columns, ref_moveables=[], deadtime=0,
+                       starttime=datetime.now())
+            scan_data = ScanData(environment=env, data_handler=data_handler)
+            acquisition = CAcquisition()
+            acquisition.data = scan_data
+            push_times = {}
+            memory = _get_memory()
+            start = time.perf_counter()
+            scan_data.start()
+            pusher = threading.Thread(target=self._push,
+                                      args=(acquisition, push_times))
+            pusher.start()
+            pusher.join()
+            acquisition.wait_value_buffer()
+            env["endtime"] = datetime.now()
+            scan_data.end()
+            elapsed = time.perf_counter() - start
+            memory_growth = _get_memory() - memory
+            acquisition.join_thread_pool()
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        latencies = [t - push_times[i]
+                     for i, t in latency_recorder.times.items()
+                     if i in push_times]
+        return elapsed, latencies, memory_growth
+
+
+def _scan_pipeline(recorders, nb_ctrls=1, nb_axes=1, repeat=10,
+                   nb_points=1000, chunk_size=10, rate=0, **kwargs):
+    pipeline = ScanPipeline(recorders, nb_ctrls * nb_axes, nb_points,
+                            chunk_size, rate)
+    samples, latencies, memory_growth = [], [], []
+    for _ in range(repeat):
+        elapsed, latency, growth = pipeline.run()
+        samples.append(nb_points / elapsed)
+        latencies.extend(latency)
+        memory_growth.append(growth)
+    latencies.sort()
+    percentiles = {"p%d" % p: _percentile(latencies, p)
+                   for p in (50, 90, 99, 100)}
+    return dict(samples=samples, recorders=list(recorders),
+                nb_channels=nb_ctrls * nb_axes, nb_points=nb_points,
+                chunk_size=chunk_size, rate=rate,
+                latency=percentiles, memory_growth=memory_growth)
+
+
+def _register(recorders):
+    name = "scan.pipeline"
+    if recorders:
+        name += "." + "+".join(recorders)
+
+    def scan_pipeline(**kwargs):
+        return _scan_pipeline(recorders, **kwargs)
+
+    scan_pipeline.__doc__ = ("Continuous scan data pipeline throughput with "
+                             "%s recorders" % (", ".join(recorders) or "no"))
+    benchmark(name, unit="points/s", higher_is_better=True)(scan_pipeline)
+
+
+for _recorders in ((), ("spec",), ("h5",), ("json",),
+                   ("spec", "h5", "json")):
+    _register(_recorders)
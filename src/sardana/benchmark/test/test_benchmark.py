@@ -0,0 +1,106 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import unittest
+
+from sardana.benchmark import run, summarize, compare, get_benchmarks
+from sardana.benchmark.pool import _ValueCounter
+from sardana.benchmark.scan import ScanPipeline
+
+
+class BenchmarkTestCase(unittest.TestCase):
+
+    def test_summarize(self):
+        stats = summarize([3, 1, 2, 4])
+        self.assertEqual(stats["n"], 4)
+        self.assertEqual(stats["min"], 1)
+        self.assertEqual(stats["max"], 4)
+        self.assertEqual(stats["median"], 2.5)
+        self.assertEqual(stats["mean"], 2.5)
+
+    def test_compare(self):
+        def results(step_count, throughput):
+            return dict(results=[
+                dict(name="a", higher_is_better=False,
+                     stats=dict(median=step_count)),
+                dict(name="b", higher_is_better=True,
+                     stats=dict(median=throughput))])
+        baseline = results(1.0, 100.)
+        comparison = compare(results(1.1, 50.), baseline, tolerance=0.2)
+        regressions = {name: regression
+                       for name, _, _, _, regression in comparison}
+        self.assertEqual(regressions, {"a": False, "b": True})
+        comparison = compare(results(1.5, 150.), baseline, tolerance=0.2)
+        regressions = {name: regression
+                       for name, _, _, _, regression in comparison}
+        self.assertEqual(regressions, {"a": True, "b": False})
+
+    def test_run(self):
+        """Run all the pool benchmarks with small sizes"""
+        names = [name for name in get_benchmarks() if name.startswith("pool")]
+        results = run(names, nb_ctrls=2, nb_axes=2, repeat=2,
+                      repetitions=5)
+        self.assertIn("metadata", results)
+        self.assertEqual(len(results["results"]), len(names))
+        for result in results["results"]:
+            self.assertEqual(result["stats"]["n"], 2, result["name"])
+
+    def test_ctrl_par_writes(self):
+        """Verify that the controller parameters are written only for the
+        first point"""
+        results = run(["pool.ctrl_par_writes"], nb_ctrls=2, repeat=3)
+        result = results["results"][0]
+        self.assertGreater(result["first_point"], 0)
+        self.assertEqual(result["samples"], [0, 0, 0])
+
+    def test_value_counter_timeout(self):
+        """Verify that missing values invalidate the measurement"""
+        counter = _ValueCounter(10)
+        counter.Timeout = 0.01
+        self.assertRaises(RuntimeError, counter.wait)
+
+    def test_scan_pipeline(self):
+        """Run the scan pipeline benchmark with all the recorders"""
+        results = run(["scan.pipeline.spec+h5+json"], nb_ctrls=2, repeat=2,
+                      nb_points=20, chunk_size=3)
+        result = results["results"][0]
+        self.assertEqual(result["stats"]["n"], 2)
+        self.assertEqual(len(result["memory_growth"]), 2)
+        self.assertIsNotNone(result["latency"]["p50"])
+
+    def test_scan_pipeline_latency(self):
+        """Verify that the latency of every record is measured from the
+        moment its last channel value was pushed"""
+        pipeline = ScanPipeline(nb_channels=3, nb_points=20, chunk_size=3)
+        _, latencies, _ = pipeline.run()
+        self.assertEqual(len(latencies), 20)
+        for latency in latencies:
+            self.assertGreaterEqual(latency, 0)
+
+    def test_param_parser(self):
+        """Run the macro parameters parsing benchmark"""
+        results = run(["macroserver.param_parser"], nb_axes=2, repeat=2,
+                      nb_commands=10)
+        result = results["results"][0]
+        self.assertEqual(result["stats"]["n"], 2)
+        self.assertEqual(len(result["uncached"]), 2)
@@ -48,6 +48,8 @@ import io
 import threading
 import traceback
 
+from time import perf_counter as _clock
+
 from taurus.core.util.log import Logger
 from taurus.core.util.prop import propertx
 from taurus.console.table import Table
@@ -55,6 +57,7 @@ from taurus.console.list import List
 
 from sardana.sardanadefs import State
 from sardana.util.wrap import wraps
+from sardana.util.profiler import get_current_profiler
 
 from sardana.macroserver.msparameter import Type, ParamType, ParamRepeat, \
     Optional
@@ -202,8 +205,11 @@ class Hookable(Logger):
         """
         if hint is None:
             return self._getHooks()
-        else:
-            return self._getHookHintsDict().get(hint, [])
+        hooks = self._getHookHintsDict().get(hint, [])
+        profiler = get_current_profiler()
+        if profiler is not None:
+            hooks = [ProfiledHook(profiler, hint, hook) for hook in hooks]
+        return hooks
 
     def appendHook(self, hook_info):
         """Append a hook according to the hook information
@@ -323,10 +329,34 @@ class ExecMacroHook(object):
     def macro_obj(self):
         return self._macro_obj_wr()
 
+    def getMacroName(self):
+        """Returns the name of the macro executed by this hook"""
+        name = self._pars[0]
+        if isinstance(name, (list, tuple)):
+            name = name[0]
+        return name
+
     def __call__(self):
         self.macro_obj.execMacro(*self._pars, **self._opts)
 
 
+class ProfiledHook(object):
+    """A callable hook which records the wall time of the wrapped hook
+    in the "hook" category of the given profiler."""
+
+    def __init__(self, profiler, hint, hook):
+        self._profiler = profiler
+        self._hook = hook
+        if isinstance(hook, ExecMacroHook):
+            name = hook.getMacroName()
+        else:
+            name = getattr(hook, "__name__", hook.__class__.__name__)
+        self._name = "%s %s" % (hint, name)
+
+    def __call__(self):
+        self._profiler.call("hook", self._name, self._hook)
+
+
 class MacroFinder:
 
     def __init__(self, macro_obj):
@@ -353,28 +383,48 @@ class MacroFinder:
         return f
 
 
+def _raiseStopException(macro, when, fn_name):
+    if macro._macro_thread == threading.current_thread():
+        macro.setProcessingStop(True)
+    macro.executor._waitStopDone()
+    raise StopException("stopped %s calling %s" % (when, fn_name))
+
+
 def mAPI(fn):
     """Wraps the given Macro method as being protected by the stop procedure.
     To be used by the :class:`Macro` as a decorator for all methods.
+
+    If a profiler is bound to the current thread the wall time of the call
+    and of the stop checks are recorded in the "api" and "stop_check"
+    categories respectively.
+
     :param: macro method
     :return: wrapped macro method"""
+    fn_name = fn.__name__
+
     @wraps(fn)
     def new_fn(*args, **kwargs):
         self = args[0]
-        if not self.isProcessingStop():
-            is_macro_th = self._macro_thread == threading.current_thread()
-            if self._shouldRaiseStopException():
-                if is_macro_th:
-                    self.setProcessingStop(True)
-                self.executor._waitStopDone()
-                raise StopException("stopped before calling %s" % fn.__name__)
-        ret = fn(*args, **kwargs)
-        if not self.isProcessingStop():
-            if self._shouldRaiseStopException():
-                if is_macro_th:
-                    self.setProcessingStop(True)
-                self.executor._waitStopDone()
-                raise StopException("stopped after calling %s" % fn.__name__)
+        profiler = get_current_profiler()
+        if profiler is None:
+            if self._stopped and not self._processingStop:
+                _raiseStopException(self, "before", fn_name)
+            ret = fn(*args, **kwargs)
+            if self._stopped and not self._processingStop:
+                _raiseStopException(self, "after", fn_name)
+            return ret
+        t0 = _clock()
+        if self._stopped and not self._processingStop:
+            _raiseStopException(self, "before", fn_name)
+        t1 = _clock()
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            t2 = _clock()
+            profiler.record("api", fn_name, t2 - t1)
+        if self._stopped and not self._processingStop:
+            _raiseStopException(self, "after", fn_name)
+        profiler.record("stop_check", fn_name, t1 - t0 + _clock() - t2)
         return ret
     return new_fn
 
@@ -28,7 +28,8 @@
 __all__ = ["addctrllib", "addmaclib", "commit_ctrllib", "defctrl", "defelem",
            "defm", "defmeas", "edctrlcls", "edctrllib", "prdef",
            "relctrlcls", "relctrllib", "rellib", "relmac", "relmaclib",
-           "send2ctrl", "udefctrl", "udefelem", "udefmeas", "sar_info"]
+           "send2ctrl", "udefctrl", "udefelem", "udefmeas", "sar_info",
+           "macroprofile"]
 
 __docformat__ = 'restructuredtext'
 
@@ -36,6 +37,8 @@ import sys
 import traceback
 import array
 
+from taurus.console.list import List
+
 from sardana.macroserver.msexception import UnknownMacroLibrary
 from sardana.macroserver.msparameter import WrongParam
 from sardana.macroserver.macro import Macro, Type, ParamRepeat, Table, LibraryError
@@ -548,3 +551,67 @@ class sar_info(Macro):
         self.output("-----------")
         for line in table.genOutput():
             self.output(line)
+
+
+class macroprofile(Macro):
+    """Controls the profiler of the macros executed by this door and reports
+    its results.
+
+    While the profiler is on, the wall time of each macro, hook, Macro API
+    call (including ``checkPoint`` and ``pausePoint``), stop check and Pool
+    call done by the macros is accumulated. Times are inclusive e.g. the time
+    of a macro includes the time of its hooks and sub-macros.
+
+    Examples::
+
+        macroprofile on
+        ascan mot01 0 10 100 0.1
+        macroprofile show pool
+        macroprofile off
+    """
+
+    param_def = [
+        ['action', Type.String, 'show', 'on, off, reset or show'],
+        ['category', Type.String, 'all',
+         'category to show: macro, hook, api, stop_check, pool or all']
+    ]
+
+    def run(self, action, category):
+        executor = self.getExecutor()
+        action = action.lower()
+        if action == "on":
+            executor.enableProfiler(True)
+            self.output("Macro profiling enabled")
+        elif action == "off":
+            self.show(executor.getProfiler(), category)
+            executor.enableProfiler(False)
+            self.output("Macro profiling disabled")
+        elif action == "reset":
+            profiler = executor.getProfiler()
+            if profiler is not None:
+                profiler.reset()
+        elif action == "show":
+            self.show(executor.getProfiler(), category)
+        else:
+            raise ValueError("action must be one of: on, off, reset, show")
+
+    def show(self, profiler, category):
+        if profiler is None:
+            self.output("Macro profiling is disabled. "
+                        "Use 'macroprofile on' to enable it")
+            return
+        if category.lower() == "all":
+            category = None
+        stats = profiler.get_stats(category)
+        if len(stats) == 0:
+            self.output("No profiling data")
+            return
+        out = List(['Category', 'Name', 'Count', 'Total [s]', 'Mean [ms]',
+                    'Max [ms]'])
+        for stat in stats:
+            out.appendRow([stat.category, stat.name, str(stat.count),
+                           "%.6f" % stat.total,
+                           "%.3f" % (stat.total / stat.count * 1e3),
+                           "%.3f" % (stat.max * 1e3)])
+        for line in out.genOutput():
+            self.output(line)
@@ -78,6 +78,32 @@ def getCallable(repr):
         return lambda: None
 
 
+def _calculate_trajectory(moveable_node, positions):
+    '''Function to calculate a trajectory on the physical motors level.
+    Pseudo motors positions are converted with one call per pseudo motor
+    for the whole trajectory.
+    :param moveable_node: (BaseNode) node representing a moveable.
+                          Can be a BranchNode representing a PseudoMotor,
+                          or a LeafNode representing a PhysicalMotor).
+    :param positions: (list<float>) positions of the moveable
+
+    :return: (list<list<float>>) a list (one item per position) of lists
+             of physical positions. List order is important and preserved.'''
+    if isinstance(moveable_node, BranchNode):
+        moveable = moveable_node.data
+        physical_positions = moveable.calcPhysicalBulk(positions)
+        trajectory = [[] for _ in positions]
+        for i, child_node in enumerate(moveable_node.children):
+            child_positions = [point[i] for point in physical_positions]
+            child_trajectory = _calculate_trajectory(child_node,
+                                                     child_positions)
+            for point, child_point in zip(trajectory, child_trajectory):
+                point += child_point
+    else:
+        trajectory = [[position] for position in positions]
+    return trajectory
+
+
 # TODO: remove starts
 def _calculate_positions(moveable_node, start, end):
     '''Function to calculate starting and ending positions on the physical
@@ -90,25 +116,8 @@ def _calculate_positions(moveable_node, start, end):
 
     :return: (list<(float,float)>) a list of tuples comprising starting
              and ending positions. List order is important and preserved.'''
-    start_positions = []
-    end_positions = []
-    if isinstance(moveable_node, BranchNode):
-        pseudo_node = moveable_node
-        moveable = pseudo_node.data
-        moveable_nodes = moveable_node.children
-        starts = moveable.calcPhysical(start)
-        ends = moveable.calcPhysical(end)
-        for moveable_node, start, end in zip(moveable_nodes, starts,
-                                             ends):
-            _start_positions, _end_positions = _calculate_positions(
-                moveable_node,
-                start, end)
-            start_positions += _start_positions
-            end_positions += _end_positions
-    else:
-        start_positions = [start]
-        end_positions = [end]
-
+    start_positions, end_positions = _calculate_trajectory(moveable_node,
+                                                           [start, end])
     return start_positions, end_positions
 
 
@@ -259,17 +268,19 @@ class aNscan(Hookable):
                                                 + self.latency_time)
         step["positions"] = []
         step["start_positions"] = []
-        starts = self.starts
+        # calculate the physical trajectories of all the waypoints at once
+        trajectories = []
+        for i, moveable_tree in enumerate(moveables_trees):
+            positions = [self.starts[i]]
+            positions += [waypoint[i] for waypoint in self.waypoints]
+            trajectory = _calculate_trajectory(moveable_tree.root(),
+                                               positions)
+            trajectories.append(trajectory)
         for point_no, waypoint in enumerate(self.waypoints):
-            for start, end, moveable_tree in zip(starts, waypoint,
-                                                 moveables_trees):
-                moveable_root = moveable_tree.root()
-                start_positions, end_positions = _calculate_positions(
-                    moveable_root, start, end)
-                step["start_positions"] += start_positions
-                step["positions"] += end_positions
-                step["waypoint_id"] = point_no
-                starts = waypoint
+            for trajectory in trajectories:
+                step["start_positions"] += trajectory[point_no]
+                step["positions"] += trajectory[point_no + 1]
+            step["waypoint_id"] = point_no
             yield step
 
     def _period_generator(self):
@@ -1006,23 +1017,20 @@ class scanhist(Macro):
     ]
 
     def run(self, scan_number):
-        try:
-            hist = self.getEnv("ScanHistory")
-        except UnknownEnv:
-            print("No scan recorded in history")
-            return
         if scan_number < 0:
+            try:
+                hist = self.getEnv("ScanHistory")
+            except UnknownEnv:
+                print("No scan recorded in history")
+                return
             self.show_all(hist)
         else:
-            self.show_one(hist, scan_number)
+            self.show_one(scan_number)
 
-    def show_one(self, hist, scan_number):
-        item = None
-        for h in hist:
-            if h['serialno'] == scan_number:
-                item = h
-                break
-        if item is None:
+    def show_one(self, scan_number):
+        # indexed lookup, also of the scans not shown in ScanHistory
+        h = self.getMacroServer().get_scan_history(scan_number)
+        if h is None:
             self.warning("Could not find scan number %s", scan_number)
             return
 
@@ -1787,22 +1795,30 @@ class meshct(Macro, Hookable):
         step["active_time"] = self.nb_points * (self.integ_time
                                                 + self.latency_time)
 
+        # calculate the physical trajectories of all the waypoints at once
+        trajectories = []
+        for j, moveable_tree in enumerate(moveables_trees):
+            positions = []
+            for start, waypoint in zip(self.starts_points, self.waypoints):
+                positions += [start[j], waypoint[j]]
+            trajectory = _calculate_trajectory(moveable_tree.root(),
+                                               positions)
+            trajectories.append(trajectory)
+
         points1, _ = self.nr_intervs + 1
         for i, waypoint in enumerate(self.waypoints):
             self.point_id = points1 * i
             step["waypoint_id"] = i
+            # every second line goes backwards in the bidirectional mode
+            step["reversed"] = self.bidirectional_mode and i % 2 == 1
             self.starts = self.starts_points[i]
             self.finals = waypoint
             step["positions"] = []
             step["start_positions"] = []
 
-            for start, end, moveable_tree in zip(self.starts, self.finals,
-                                                 moveables_trees):
-                moveable_root = moveable_tree.root()
-                start_positions, end_positions = _calculate_positions(
-                    moveable_root, start, end)
-                step["start_positions"] += start_positions
-                step["positions"] += end_positions
+            for trajectory in trajectories:
+                step["start_positions"] += trajectory[2 * i]
+                step["positions"] += trajectory[2 * i + 1]
 
             yield step
 
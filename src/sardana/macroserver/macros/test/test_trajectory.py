@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Tests for the trajectory calculation of the continuous scan macros"""
+
+import json
+
+from taurus.external import unittest
+
+from sardana.util.tree import BranchNode, LeafNode, Tree
+from sardana.taurus.core.tango.sardana.pool import PseudoMotor, Pool
+from sardana.macroserver.mstypemanager import TypeManager
+
+
+class FakeMacroServer(object):
+    name = "FakeMacroServer"
+
+# the parameter types used by the scan macros definitions must be registered
+# before importing them
+TYPE_MANAGER = TypeManager(FakeMacroServer())
+
+from sardana.macroserver.macros.scan import aNscan, \
+    _calculate_trajectory  # noqa
+
+
+class _SlitPool(Pool):
+    """Pool answering the bulk calculations of a slit (gap and offset)
+    pseudo motor controller without a Tango device"""
+
+    def __init__(self):
+        self.calls = []
+
+    def command_inout(self, cmd_name, argin):
+        self.calls.append(cmd_name)
+        positions = json.loads(argin)["positions"]
+        if cmd_name != "CalcAllPhysicalBulk":
+            raise ValueError("unexpected command %s" % cmd_name)
+        # positions of the gap pseudo motor -> top and bottom blades
+        return json.dumps([[gap / 2., gap / 2.] for gap in positions])
+
+
+def _pseudo_motor(name, pool):
+    pseudo_motor = PseudoMotor.__new__(PseudoMotor)
+    pseudo_motor.getPoolObj = lambda: pool
+    pseudo_motor.getName = lambda: name
+    return pseudo_motor
+
+
+def _slit_node(pool):
+    node = BranchNode(_pseudo_motor("gap", pool))
+    node.addChild(LeafNode("top"))
+    node.addChild(LeafNode("bottom"))
+    return node
+
+
+class _GScan(object):
+
+    def __init__(self, trees):
+        self._trees = trees
+
+    def get_moveables_trees(self):
+        return self._trees
+
+
+class CalculateTrajectoryTestCase(unittest.TestCase):
+
+    def test_physical_motor(self):
+        trajectory = _calculate_trajectory(LeafNode("mot01"), [0., 1.])
+        self.assertEqual(trajectory, [[0.], [1.]])
+
+    def test_pseudo_motor(self):
+        pool = _SlitPool()
+        trajectory = _calculate_trajectory(_slit_node(pool), [0., 2., 4.])
+        self.assertEqual(trajectory, [[0., 0.], [1., 1.], [2., 2.]])
+        # one call for the whole trajectory
+        self.assertEqual(pool.calls, ["CalcAllPhysicalBulk"])
+
+    def test_waypoint_generator(self):
+        pool = _SlitPool()
+        trees = [Tree(_slit_node(pool)), Tree(LeafNode("mot01"))]
+        scan = aNscan.__new__(aNscan)
+        scan._gScan = _GScan(trees)
+        scan.getHooks = lambda hint=None: []
+        scan.starts = [0., 10.]
+        scan.waypoints = [[4., 12.]]
+        scan.nb_points = 2
+        scan.integ_time = 0.1
+        scan.latency_time = 0
+        steps = [(step["waypoint_id"], list(step["start_positions"]),
+                  list(step["positions"]))
+                 for step in scan._waypoint_generator_hwtime()]
+        self.assertEqual(steps, [(0, [0., 0., 10.], [2., 2., 12.])])
+        self.assertEqual(pool.calls, ["CalcAllPhysicalBulk"])
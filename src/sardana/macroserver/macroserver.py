@@ -146,6 +146,8 @@ class MacroServer(MSContainer, MSObject, SardanaElementManager, SardanaIDManager
         self._pools = CaselessDict()
         self._max_parallel_macros = self.MaxParalellMacros
         self._path_id = None
+        # scan setup metadata e.g. instruments of the channels
+        self._scan_setup_cache = {}
 
         MSContainer.__init__(self)
         MSObject.__init__(self, full_name=full_name, name=name, id=InvalidId,
@@ -208,6 +210,18 @@ class MacroServer(MSContainer, MSObject, SardanaElementManager, SardanaIDManager
         """
         self.macro_manager.setMacroPath([p.rstrip(os.sep) for p in macro_path])
 
+    def set_library_index(self, file_name):
+        """Sets the file where the signature of the macro libraries is stored
+        between runs. Macro libraries which did not change since they were
+        indexed are not imported until they are first used.
+
+        :param file_name:
+            index file name (None means the index is kept only in memory)
+        :type file_name:
+            :obj:`str`
+        """
+        self.macro_manager.setLibraryIndex(file_name)
+
     # --------------------------------------------------------------------------
     # Recorder path related methods
     # --------------------------------------------------------------------------
@@ -336,8 +350,22 @@ class MacroServer(MSContainer, MSObject, SardanaElementManager, SardanaIDManager
     def on_pool_elements_changed(self, evt_src, evt_type, evt_value):
         if evt_type not in CHANGE_EVT_TYPES:
             return
+        self.clear_scan_setup_cache()
         self.fire_event(EventType("PoolElementsChanged"), evt_value)
 
+    def get_scan_setup_cache(self):
+        """Returns the cache of the scan setup metadata e.g. the instruments
+        of the channels, so consecutive scans do not need to query them
+        again. It is cleared whenever the elements of the pools change.
+
+        :return: the scan setup metadata cache
+        :rtype: dict"""
+        return self._scan_setup_cache
+
+    def clear_scan_setup_cache(self):
+        """Clears the cache of the scan setup metadata"""
+        self._scan_setup_cache.clear()
+
     # --------------------------------------------------------------------------
     # Door related methods
     # --------------------------------------------------------------------------
@@ -706,6 +734,27 @@ class MacroServer(MSContainer, MSObject, SardanaElementManager, SardanaIDManager
         self.fire_event(EventType("EnvironmentChanged"), evt)
         return ret
 
+    def add_scan_history(self, entry, max_size=None):
+        """Appends an entry to the scan history (``ScanHistory`` environment
+        variable) and notifies the change.
+
+        :param entry: scan history entry
+        :type entry: :obj:`dict`
+        :param max_size: number of the most recent entries exposed in the
+                         ``ScanHistory`` environment variable
+        :type max_size: :obj:`int`"""
+        env_man = self.environment_manager
+        key = env_man.ScanHistory
+        evt_type = "change" if env_man.hasEnv(key) else "new"
+        history = env_man.addScanHistory(entry, max_size=max_size)
+        evt = {evt_type: {key: history}}
+        self.fire_event(EventType("EnvironmentChanged"), evt)
+
+    def get_scan_history(self, serialno=None):
+        return self.environment_manager.getScanHistory(serialno=serialno)
+
+    get_scan_history.__doc__ = EnvironmentManager.getScanHistory.__doc__
+
     def has_env(self, key, macro_name=None, door_name=None):
         return self.environment_manager.hasEnv(key,
                                                macro_name=macro_name, door_name=door_name)
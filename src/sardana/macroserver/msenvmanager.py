@@ -39,6 +39,7 @@ from taurus.core.util.containers import CaselessDict
 
 from sardana.macroserver.msmanager import MacroServerManager
 from sardana.macroserver.msexception import UnknownEnv
+from sardana.macroserver.msscanhistory import ScanHistoryStore
 from sardana import sardanacustomsettings
 import collections
 
@@ -70,8 +71,14 @@ def _dbm_shelve(filename, backend):
 class EnvironmentManager(MacroServerManager):
     """The MacroServer environment manager class. It is designed to be a
     singleton for the entire application.
+
+    The scan history (``ScanHistory`` environment variable) is not stored
+    in the environment database but in a dedicated, append-only,
+    :class:`~sardana.macroserver.msscanhistory.ScanHistoryStore`.
     """
 
+    ScanHistory = "ScanHistory"
+
     def __init__(self, macro_server, environment_db=None):
         MacroServerManager.__init__(self, macro_server)
         if environment_db is not None:
@@ -110,6 +117,9 @@ class EnvironmentManager(MacroServerManager):
         #  - value: environment value
         self._global_env = None
 
+        # scan history store (memory only until the environment db is set)
+        self._scan_history = ScanHistoryStore()
+
         self._initEnv()
 
         MacroServerManager.reInit(self)
@@ -128,6 +138,7 @@ class EnvironmentManager(MacroServerManager):
 
     def _clearEnv(self):
         self._env = self._macro_env = self._global_env = self._door_env = None
+        self._scan_history.close()
 
     def setEnvironmentDb(self, f_name):
         """Sets up a new environment from a file"""
@@ -162,12 +173,75 @@ class EnvironmentManager(MacroServerManager):
 
         self.info("Environment is being stored in %s", f_name)
 
+        self._initScanHistory(f_name + ".scanhistory")
+
         # fill the three environment caches
         try:
             self._fillEnvironmentCaches(self._env)
         except:
             self.error("Failed to fill local enviroment cache")
             self.debug("Details:", exc_info=1)
+        self._updateScanHistoryCache()
+
+    def _initScanHistory(self, f_name):
+        """Opens the scan history store and moves to it the scan history
+        stored in the environment db by the previous versions"""
+        self._scan_history.close()
+        self._scan_history = store = ScanHistoryStore(f_name)
+        key = self.ScanHistory
+        if key not in self._env:
+            return
+        try:
+            if len(store) == 0:
+                self.info("Moving %s to %s", key, f_name)
+                store.reset(self._env[key])
+            del self._env[key]
+            self._env.sync()
+        except Exception:
+            self.error("Failed to move %s to %s", key, f_name)
+            self.debug("Details:", exc_info=1)
+
+    def _updateScanHistoryCache(self):
+        history = self._scan_history.get_history()
+        # the environment was already cleaned up
+        if self._global_env is None:
+            return history
+        if history:
+            self._global_env[self.ScanHistory] = history
+        else:
+            self._global_env.pop(self.ScanHistory, None)
+        return history
+
+    def addScanHistory(self, entry, max_size=None):
+        """Appends an entry to the scan history. The cost does not depend
+        on the history length.
+
+        :param entry: scan history entry
+        :type entry: :obj:`dict`
+        :param max_size: number of the most recent entries exposed in the
+                         ``ScanHistory`` environment variable
+                         [default: None, meaning do not change it]
+        :type max_size: :obj:`int`
+
+        :return: the most recent scan history entries
+        :rtype: list<dict>"""
+        if max_size is not None:
+            self._scan_history.max_size = max_size
+        self._scan_history.append(entry)
+        return self._updateScanHistoryCache()
+
+    def getScanHistory(self, serialno=None):
+        """Gets the scan history.
+
+        :param serialno: scan serial number (ScanID) [default: None,
+                         meaning the most recent entries]
+        :type serialno: :obj:`int`
+
+        :return: the most recent scan history entries or the entry of the
+                 given scan (None if it is not found)"""
+        if serialno is None:
+            return self._scan_history.get_history()
+        return self._scan_history.get_entry(serialno)
 
     def _fillEnvironmentCaches(self, env):
         # fill the three environment caches
@@ -310,7 +384,10 @@ class EnvironmentManager(MacroServerManager):
         """Gets the complete environment for the given macro and/or door. If
         both are None the the complete environment is returned"""
         if macro_name is None and door_name is None:
-            return dict(self._env)
+            env = dict(self._env)
+            if self.ScanHistory in self._global_env:
+                env[self.ScanHistory] = self._global_env[self.ScanHistory]
+            return env
         elif not door_name is None and macro_name is None:
             return self.getDoorEnv(door_name)
         elif door_name and macro_name:
@@ -458,12 +535,22 @@ class EnvironmentManager(MacroServerManager):
         return d, key
 
     def _setOneEnv(self, key, value):
+        if key == self.ScanHistory:
+            self._scan_history.reset(value or ())
+            self._updateScanHistoryCache()
+            return
         self._env[key] = value
         self._env.sync()
         d, key = self._getCacheForKey(key)
         d[key] = value
 
     def _unsetOneEnv(self, key):
+        if key == self.ScanHistory:
+            if not len(self._scan_history):
+                raise UnknownEnv("Unknown environment %s" % key)
+            self._scan_history.reset()
+            self._updateScanHistoryCache()
+            return
         if key not in self._env:
             raise UnknownEnv("Unknown environment %s" % key)
         del self._env[key]
@@ -56,13 +56,16 @@ from taurus.core.util.log import Logger
 from taurus.core.util.codecs import CodecFactory
 
 from sardana.sardanadefs import ElementType
+from sardana.sardanaevent import EventType
 from sardana.sardanamodulemanager import ModuleManager
+from sardana.sardanalibindex import LibraryIndex, LazyLibrary, LazyCode
+from sardana.util.profiler import startup_trace
 from sardana.sardanaexception import format_exception_only_str
 from sardana.sardanautils import is_pure_str, is_non_str_seq, recur_map
 
 from sardana.macroserver.msmanager import MacroServerManager
 from sardana.macroserver.msmetamacro import MACRO_TEMPLATE, MacroLibrary, \
-    MacroClass, MacroFunction
+    MacroClass, MacroFunction, LazyMacroLibrary
 from sardana.macroserver.msparameter import ParamDecoder, FlatParamDecoder, \
     WrongParam
 from sardana.macroserver.macro import Macro, MacroFunc, ExecMacroHook, \
@@ -70,7 +73,7 @@ from sardana.macroserver.macro import Macro, MacroFunc, ExecMacroHook, \
 from sardana.macroserver.msexception import UnknownMacroLibrary, \
     LibraryError, UnknownMacro, MissingEnv, AbortException, StopException, \
     MacroServerException, UnknownEnv
-from sardana.util.parser import ParamParser
+from sardana.util.profiler import Profiler, set_current_profiler
 
 # These classes are imported from the "client" part of sardana, if finally
 # both the client and the server side needs them, place them in some
@@ -178,6 +181,9 @@ class MacroManager(MacroServerManager):
         # elements are absolute paths
         self._macro_path = []
 
+        # signature of the macro libraries (by default kept only in memory)
+        self._lib_index = LibraryIndex()
+
         # list<str>
         # overwritten macros (macros with the same name defined in
         # different modules)
@@ -198,18 +204,38 @@ class MacroManager(MacroServerManager):
         #    ModuleManager().unloadModules(self._modules.keys())
 
         self._macro_path = None
+        self._lib_index = None
         self._macro_dict = None
         self._modules = None
         self._overwritten_macros = None
 
         MacroServerManager.cleanUp(self)
 
+    def setLibraryIndex(self, file_name):
+        """Sets the file where the signature of the macro libraries is
+        stored between server runs (see
+        :class:`~sardana.sardanalibindex.LibraryIndex`). Macro libraries
+        which did not change since they were indexed are not imported until
+        they are first used.
+
+        Must be called before :meth:`~MacroManager.setMacroPath`.
+
+        :param file_name: the index file name [default: None, meaning the
+                          index is kept only in memory]
+        :type file_name: :obj:`str`"""
+        self._lib_index = LibraryIndex(file_name)
+
+    def getLibraryIndex(self):
+        return self._lib_index
+
     def setMacroPath(self, macro_path):
         """Registers a new list of macro directories in this manager.
-        Warning: as a consequence all the macro modules will be reloaded.
-        This means that if any reference to an old macro object was kept it will
-        refer to an old module (which could possibly generate problems of type
-        class A != class A)."""
+        Warning: as a consequence all the macro modules which changed since
+        they were loaded will be reloaded. This means that if any reference to
+        an old macro object was kept it will refer to an old module (which
+        could possibly generate problems of type class A != class A).
+        Macro libraries found in the library index which did not change are
+        not imported until they are first used."""
         p = []
         for item in macro_path:
             p.extend(item.split(os.pathsep))
@@ -226,12 +252,58 @@ class MacroManager(MacroServerManager):
 
         macro_file_names = self._findMacroLibNames()
         for mod_name, file_name in macro_file_names.items():
+            old_lib = self._modules.get(mod_name)
+            if old_lib is not None and old_lib.file_path == file_name \
+                    and self._lib_index.is_unchanged(file_name):
+                continue
+            if old_lib is None and self._addLazyMacroLib(mod_name, file_name):
+                continue
             dir_name = os.path.dirname(file_name)
             path = [dir_name]
             try:
-                self.reloadMacroLib(mod_name, path)
+                self._reloadMacroLib(mod_name, path)
             except:
                 pass
+        self._lib_index.save()
+
+    def _addLazyMacroLib(self, module_name, file_name):
+        """Registers a placeholder for the given macro library if it did not
+        change since it was indexed. Returns True if the placeholder was
+        registered or False if the library must be imported now."""
+        info = self._lib_index.get(file_name)
+        if info is None or \
+                info['library']['manager'] != self.macro_server.name:
+            return False
+        macro_names = [macro['name'] for macro in info['elements']]
+        overwritten = False
+        for macro_name in macro_names:
+            macro = self._macro_dict.get(macro_name)
+            if macro is None:
+                continue
+            # the precedence of overwritten macros is decided by the
+            # loading order: import the libraries involved now
+            overwritten = True
+            if isinstance(macro, LazyCode):
+                macro.lib.resolve()
+        if overwritten:
+            return False
+        macro_lib = LazyMacroLibrary(info, self._loadLazyMacroLib)
+        for macro in macro_lib.get_macros():
+            self._macro_dict[macro.name] = macro
+        if macro_lib.has_macros():
+            self._modules[module_name] = macro_lib
+        return True
+
+    def _loadLazyMacroLib(self, lazy_lib):
+        self.debug("Loading macro library %s on first use", lazy_lib.name)
+        macro_lib = self.reloadMacroLib(lazy_lib.name, [lazy_lib.path])
+        # the library may have changed since the placeholder was registered
+        if not macro_lib.has_errors():
+            evt = lazy_lib.get_changes(macro_lib)
+            if evt is not None:
+                self.macro_server.fire_event(EventType("ElementsChanged"),
+                                             evt)
+        return macro_lib
 
     def getMacroPath(self):
         return self._macro_path
@@ -427,7 +499,7 @@ class MacroManager(MacroServerManager):
             module_names.append(module_name)
         self.reloadMacroLibs(module_names, path=path)
 
-    def reloadMacroLibs(self, module_names, path=None):
+    def reloadMacroLibs(self, module_names, path=None, force=True):
         """Reloads the given lib(=module) names
 
         :raises: MacroServerExceptionList in case the reload process is not
@@ -436,12 +508,23 @@ class MacroManager(MacroServerManager):
         :param module_names: a list of module names
         :param path: a list of absolute path to search for libraries
                      (optional, default=None, means the current MacroPath
-                     will be used)"""
+                     will be used)
+        :param force: reload also the libraries which did not change since
+                      they were loaded (optional, default=True)"""
         ret = []
-        for module_name in module_names:
-            m = self.reloadMacroLib(module_name, path=path)
-            if m:
-                ret.append(m)
+        try:
+            for module_name in module_names:
+                if not force:
+                    m = self._modules.get(module_name)
+                    if m is not None and m.file_path is not None \
+                            and self._lib_index.is_unchanged(m.file_path):
+                        ret.append(m)
+                        continue
+                m = self._reloadMacroLib(module_name, path=path)
+                if m:
+                    ret.append(m)
+        finally:
+            self._lib_index.save()
         return ret
 
     def reloadLib(self, module_name, path=None):
@@ -473,6 +556,16 @@ class MacroManager(MacroServerManager):
             a list of absolute path to search for libraries [default: None,
             means the current MacroPath will be used]
         :return: the MacroLibrary object for the reloaded macro library"""
+        try:
+            return self._reloadMacroLib(module_name, path=path)
+        finally:
+            self._lib_index.save()
+
+    def _reloadMacroLib(self, module_name, path=None):
+        with startup_trace.measure("macro libraries", module_name):
+            return self._loadMacroLib(module_name, path=path)
+
+    def _loadMacroLib(self, module_name, path=None):
         path = path or self.getMacroPath()
         mod_manager = ModuleManager()
         m, exc_info = None, None
@@ -540,6 +633,10 @@ class MacroManager(MacroServerManager):
                     self.error("Error adding macro %s", macro.__name__)
                     self.debug("Details:", exc_info=1)
                     macro_errors[macro.__name__] = str(e)
+        if exc_info is None and not macro_errors:
+            self._lib_index.add_library(macro_lib, self.getMacroPath())
+        elif macro_lib.file_path is not None:
+            self._lib_index.remove(macro_lib.file_path)
         try:
             if macro_lib.has_macros():
                 self._modules[module_name] = macro_lib
@@ -667,6 +764,8 @@ class MacroManager(MacroServerManager):
 
     def getMacro(self, macro_name):
         ret = self._macro_dict.get(macro_name)
+        if isinstance(ret, LazyCode):
+            ret = ret.resolve()
         if ret is None:
             raise UnknownMacro("Unknown macro %s" % macro_name)
         return ret
@@ -681,20 +780,26 @@ class MacroManager(MacroServerManager):
         self._macro_dict.pop(macro_name)
 
     def getMacroLib(self, name):
+        ret = None
         if os.path.isabs(name):
             abs_file_name = name
             for lib in list(self._modules.values()):
                 if lib.file_path == abs_file_name:
-                    return lib
+                    ret = lib
+                    break
         elif name.count(os.path.extsep):
             file_name = name
             for lib in list(self._modules.values()):
                 if lib.file_name == file_name:
-                    return lib
-        module_name = name
-        ret = self._modules.get(module_name)
+                    ret = lib
+                    break
+        if ret is None:
+            module_name = name
+            ret = self._modules.get(module_name)
         if ret is None:
-            raise UnknownMacroLibrary("Unknown macro library %s" % module_name)
+            raise UnknownMacroLibrary("Unknown macro library %s" % name)
+        if isinstance(ret, LazyLibrary):
+            ret = ret.resolve()
         return ret
 
     def getMacroCode(self, macro_name):
@@ -721,7 +826,7 @@ class MacroManager(MacroServerManager):
         params_def = macro.get_parameter()
         # merge params to a single, space separated, string (spock like)
         macro_params_str = " ".join(macro_params_raw)
-        param_parser = ParamParser(params_def)
+        param_parser = macro.get_param_parser()
         # parse string with macro params to the correct list representation
         macro_params = param_parser.parse(macro_params_str)
         return createMacroNode(macro_name, params_def, macro_params)
@@ -1084,6 +1189,8 @@ class MacroExecutor(Logger):
         # reserved objects
         self._stop_done = None
         self._abort_done = None
+        # profiler of the macros executed by this executor, None if disabled
+        self._profiler = None
 
         name = "%s.%s" % (str(door), self.__class__.__name__)
         self._macro_status_codec = CodecFactory().getCodec('json')
@@ -1103,6 +1210,32 @@ class MacroExecutor(Logger):
     def macro_manager(self):
         return self.macro_server.macro_manager
 
+    def getProfiler(self):
+        """Get the macro execution profiler.
+
+        :return: profiler or None if profiling is disabled
+        :rtype: :class:`~sardana.util.profiler.Profiler` or None
+        """
+        return self._profiler
+
+    def enableProfiler(self, enable=True):
+        """Enable (or disable) profiling of the macros executed by this
+        executor. While enabled, the wall time of each macro, hook,
+        Macro API call (including ``checkPoint`` and ``pausePoint``), stop
+        check and Pool call done in the macro thread is recorded.
+        Re-enabling keeps the already accumulated statistics.
+
+        :param enable: True to enable, False to disable
+        :type enable: :obj:`bool`
+        """
+        if enable:
+            if self._profiler is None:
+                self._profiler = Profiler()
+        else:
+            self._profiler = None
+        # apply immediately if called from the macro thread
+        set_current_profiler(self._profiler)
+
     def getGeneralHooks(self):
         """Get data structure containing definition of the general hooks.
 
@@ -1207,9 +1340,8 @@ class MacroExecutor(Logger):
             hook_info = [hook_name]
             if len(hook_info_tokens) == 2:
                 hook_params_raw = hook_info_tokens[1]
-                hook_param_def = self.macro_manager.getMacro(
-                    hook_name).get_parameter()
-                param_parser = ParamParser(hook_param_def)
+                param_parser = self.macro_manager.getMacro(
+                    hook_name).get_param_parser()
                 hook_params = param_parser.parse(hook_params_raw)
                 hook_info += hook_params
             hook = ExecMacroHook(macro_obj, hook_info)
@@ -1558,6 +1690,10 @@ class MacroExecutor(Logger):
             self.sendMacroStatusStop()
             raise StopException("stopped between macros (before %s)" % name)
         macro_exp, tb, result = None, None, None
+        profiler = self._profiler
+        set_current_profiler(profiler)
+        if profiler is not None:
+            start_time = time.perf_counter()
         try:
             self.debug("[START] runMacro %s" % desc)
             self._macro_pointer = macro_obj
@@ -1594,6 +1730,9 @@ class MacroExecutor(Logger):
                         'traceback': traceback.format_exc()}
             macro_exp = MacroServerException(exp_pars)
         finally:
+            if profiler is not None:
+                profiler.record("macro", name,
+                                time.perf_counter() - start_time)
             self.returnObjs(self._macro_pointer)
 
         # make sure the macro's on_abort is called and that a proper macro
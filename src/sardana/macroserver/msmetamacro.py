@@ -26,7 +26,8 @@
 """This module contains the class definition for the MacroServer meta macro
 information"""
 
-__all__ = ["MACRO_TEMPLATE", "MacroLibrary", "MacroClass", "MacroFunction"]
+__all__ = ["MACRO_TEMPLATE", "MacroLibrary", "MacroClass", "MacroFunction",
+           "LazyMacroLibrary"]
 
 __docformat__ = 'restructuredtext'
 
@@ -35,7 +36,9 @@ import operator
 
 from sardana import InvalidId, ElementType
 from sardana.sardanameta import SardanaLibrary, SardanaClass, SardanaFunction
+from sardana.sardanalibindex import LazyLibrary
 from sardana.macroserver.msparameter import Type, ParamRepeat
+from sardana.util.parser import ParamParser
 import collections
 
 MACRO_TEMPLATE = """class @macro_name@(Macro):
@@ -111,6 +114,20 @@ class MacroLibrary(SardanaLibrary):
         return ret
 
 
+class LazyMacroLibrary(LazyLibrary):
+    """Placeholder of a :class:`MacroLibrary` which has not been imported
+    yet (see :class:`~sardana.sardanalibindex.LazyLibrary`)"""
+
+    get_macro = LazyLibrary.get_meta
+    get_macros = LazyLibrary.get_metas
+    has_macro = LazyLibrary.has_meta
+    has_macros = LazyLibrary.has_metas
+
+    @property
+    def macros(self):
+        return dict(self._metas)
+
+
 class Parameterizable(object):
     """Helper class to handle parameter and result definition for a
     :class:`~sardana.macroserver.msmetamacro.MacroClass` or a
@@ -119,6 +136,7 @@ class Parameterizable(object):
     def __init__(self):
         self._parameter = self.build_parameter()
         self._result = self.build_result()
+        self._param_parser = None
 
     def get_parameter_definition(self):
         raise NotImplementedError
@@ -135,6 +153,18 @@ class Parameterizable(object):
     def get_result(self):
         return self._result
 
+    def get_param_parser(self):
+        """Returns the parser of the parameters string (created on first use
+        and reused until the macro is reloaded)
+
+        :return: the parameters parser
+        :rtype: :class:`~sardana.util.parser.ParamParser`"""
+        param_parser = self._param_parser
+        if param_parser is None:
+            param_parser = ParamParser(self.get_parameter())
+            self._param_parser = param_parser
+        return param_parser
+
     def build_parameter(self):
         try:
             built_param = self._build_parameter(
@@ -49,6 +49,7 @@ from sardana.macroserver.scan.recorder import DataRecorder
 from sardana.macroserver.msmetarecorder import RecorderLibrary, \
     RecorderClass
 from sardana.macroserver.msexception import UnknownRecorder, LibraryError
+from sardana.util.profiler import startup_trace
 
 _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -248,6 +249,11 @@ class RecorderManager(MacroServerManager):
         :param path:
             a list of absolute path to search for libraries [default: None,
             means the current RecorderPath will be used]"""
+        with startup_trace.measure("recorder libraries", module_name):
+            return self._reloadRecorderLib(module_name, path=path)
+
+    def _reloadRecorderLib(self, module_name, path=None):
+        """internal method"""
         path = path or self.getRecorderPath()
         # reverse the path order:
         # more priority elements last. This way if there are repeated elements
@@ -0,0 +1,223 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains the class definition for the MacroServer scan
+history store"""
+
+__all__ = ["ScanHistoryStore"]
+
+__docformat__ = 'restructuredtext'
+
+import os
+import json
+import threading
+import collections
+
+from taurus.core.util.log import Logger
+
+
+class ScanHistoryStore(Logger):
+    """Append-only store of the scan history entries (dictionaries with,
+    at least, the *serialno* key).
+
+    Entries are appended, one JSON document per line, to the file (if
+    given) and indexed by their serial number, so adding an entry does not
+    depend on the history length. The most recent entries are kept in
+    memory.
+
+    The file retains at least the *max_entries* most recent entries: when
+    it grows to twice this number it is compacted i.e. rewritten with only
+    them, so the file size and the time to load it are bounded while the
+    cost of the compaction is amortized among the appends.
+
+    :param file_name: file where to store the entries (None means memory
+                      only)
+    :type file_name: :obj:`str`
+    :param max_size: number of the most recent entries kept in memory
+    :type max_size: :obj:`int`
+    :param max_entries: number of the most recent entries retained in the
+                        file (None means all of them)
+    :type max_entries: :obj:`int`
+    """
+
+    MaxSize = 20
+
+    MaxEntries = 10000
+
+    def __init__(self, file_name=None, max_size=None, max_entries=MaxEntries):
+        Logger.__init__(self, "ScanHistoryStore")
+        if max_size is None:
+            max_size = self.MaxSize
+        self._file_name = file_name
+        self._file = None
+        self._lock = threading.RLock()
+        self._recent = collections.deque(maxlen=max_size)
+        # serial number -> offset of the entry in the file
+        self._index = {}
+        # number of lines (entries) in the file
+        self._nb_lines = 0
+        self._max_entries = max_entries
+        self._load()
+
+    def _load(self):
+        if self._file_name is None or not os.path.exists(self._file_name):
+            return
+        with open(self._file_name, "rb") as f:
+            offset = 0
+            for line in f:
+                self._nb_lines += 1
+                try:
+                    entry = json.loads(line.decode("utf-8"))
+                except ValueError:
+                    # e.g. last line truncated by a crash
+                    self.warning("Skipping corrupted scan history entry at"
+                                 " %d of %s", offset, self._file_name)
+                else:
+                    self._index[entry.get("serialno")] = offset
+                    self._recent.append(entry)
+                offset += len(line)
+        if self._must_compact():
+            self._compact()
+
+    def _must_compact(self):
+        max_entries = self._max_entries
+        return max_entries is not None and self._nb_lines >= 2 * max_entries
+
+    def _compact(self):
+        """Rewrites the file with only the *max_entries* most recent
+        entries"""
+        self.close()
+        with open(self._file_name, "rb") as f:
+            lines = collections.deque(maxlen=self._max_entries)
+            for line in f:
+                try:
+                    entry = json.loads(line.decode("utf-8"))
+                except ValueError:
+                    continue
+                lines.append((entry.get("serialno"), line))
+        tmp_file_name = self._file_name + ".tmp"
+        index = {}
+        offset = 0
+        with open(tmp_file_name, "wb") as f:
+            for serialno, line in lines:
+                index[serialno] = offset
+                f.write(line)
+                offset += len(line)
+        os.replace(tmp_file_name, self._file_name)
+        self._index = index
+        self._nb_lines = len(lines)
+
+    def _get_file(self):
+        if self._file is None:
+            self._file = open(self._file_name, "ab")
+        return self._file
+
+    def _write(self, entry):
+        if self._file_name is None:
+            return
+        f = self._get_file()
+        line = json.dumps(entry).encode("utf-8") + b"\n"
+        offset = f.tell()
+        f.write(line)
+        f.flush()
+        self._index[entry.get("serialno")] = offset
+        self._nb_lines += 1
+        if self._must_compact():
+            self._compact()
+
+    def get_max_size(self):
+        return self._recent.maxlen
+
+    def set_max_size(self, max_size):
+        with self._lock:
+            if max_size == self._recent.maxlen:
+                return
+            self._recent = collections.deque(self._recent, maxlen=max_size)
+
+    max_size = property(get_max_size, set_max_size)
+
+    def append(self, entry):
+        """Appends an entry to the history.
+
+        :param entry: scan history entry (must be JSON serializable)
+        :type entry: :obj:`dict`"""
+        with self._lock:
+            # normalize the entry so it is equal to the one read from file
+            entry = json.loads(json.dumps(entry))
+            self._write(entry)
+            self._recent.append(entry)
+
+    def get_history(self):
+        """Returns the most recent entries (the oldest first).
+
+        :return: scan history entries
+        :rtype: list<dict>"""
+        with self._lock:
+            return list(self._recent)
+
+    def get_entry(self, serialno):
+        """Returns the entry of the given scan (also if it is not any more
+        among the most recent ones).
+
+        :param serialno: scan serial number (ScanID)
+        :type serialno: :obj:`int`
+        :return: scan history entry or None if it is not found
+        :rtype: :obj:`dict`"""
+        with self._lock:
+            for entry in reversed(self._recent):
+                if entry.get("serialno") == serialno:
+                    return entry
+            offset = self._index.get(serialno)
+            if offset is None:
+                return None
+            if self._file is not None:
+                self._file.flush()
+            with open(self._file_name, "rb") as f:
+                f.seek(offset)
+                return json.loads(f.readline().decode("utf-8"))
+
+    def __len__(self):
+        return len(self._recent)
+
+    def reset(self, entries=()):
+        """Replaces all the entries of the history (also the ones stored in
+        the file).
+
+        :param entries: new scan history entries (the oldest first)
+        :type entries: seq<dict>"""
+        with self._lock:
+            self.close()
+            self._recent.clear()
+            self._index.clear()
+            self._nb_lines = 0
+            if self._file_name is not None and \
+                    os.path.exists(self._file_name):
+                os.remove(self._file_name)
+            for entry in entries:
+                self.append(entry)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -25,7 +25,7 @@
 
 """This is the macro server scan data output recorder module"""
 
-__all__ = ["SPSRecorder", "ShmRecorder"]
+__all__ = ["SPSRecorder", "ShmRecorder", "PosixShmRecorder"]
 
 __docformat__ = 'restructuredtext'
 
@@ -320,3 +320,72 @@ class ShmRecorder(DataRecorder):
         if not self.isInitialized():
             return
         self.putenv('ended', time.ctime(recordlist.getEnvironValue('endtime')))
+
+
+class PosixShmRecorder(BaseSharedMemoryRecorder):
+    """Writes the scan records in a self-describing ring buffer in POSIX
+    shared memory so local processes can read the live scan without copying.
+    Scalar and 1D numeric columns are recorded. See
+    :mod:`sardana.util.shmring` for the layout and the reader API.
+
+    .. note:: Requires Python >= 3.8.
+    """
+
+    #: default number of rows of the ring buffer
+    capacity = 4096
+
+    def __init__(self, name=None, capacity=None, **kwpars):
+        """ @param[in] name shared memory segment name
+            @param[in] capacity number of rows of the ring buffer
+            @param[in] pars keyword extra parameters
+        """
+        BaseSharedMemoryRecorder.__init__(self, **kwpars)
+        try:
+            from sardana.util import shmring
+            shmring._check_available()
+            self.shmring = shmring
+        except Exception:
+            raise Exception("POSIX shared memory is not available")
+        self.name = name
+        if capacity is not None:
+            self.capacity = capacity
+        self.writer = None
+
+    def isInitialized(self):
+        return self.name is not None
+
+    def _startRecordList(self, recordlist):
+        if not self.isInitialized():
+            return
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        env = recordlist.getEnviron()
+        columns = []
+        for col in env['datadesc']:
+            shape = tuple(col.shape)
+            if len(shape) > 1:
+                continue
+            try:
+                dtype = numpy.dtype(col.dtype)
+            except TypeError:
+                continue
+            if dtype.kind not in 'biufc':
+                continue
+            columns.append(dict(name=col.name, label=col.label,
+                                dtype=dtype.str, shape=shape))
+        info = {'title': env['title'],
+                'serialno': env['serialno'],
+                'started': env['starttime'].ctime()}
+        self.writer = self.shmring.ShmRingWriter(self.name, columns,
+                                                 self.capacity, info=info)
+
+    def _writeRecord(self, record):
+        if self.writer is None:
+            return
+        self.writer.append(record.data)
+
+    def _endRecordList(self, recordlist):
+        if self.writer is None:
+            return
+        self.writer.end()
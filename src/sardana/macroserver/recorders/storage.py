@@ -48,6 +48,16 @@ from sardana.macroserver.scan.recorder import (BaseFileRecorder,
 from taurus.core.util.containers import chunks
 
 
+def _format_array(data):
+    '''Formats the items of a 1D array as a list of strings. Integers are
+    converted to Python ints what is much faster than formatting numpy
+    scalars and gives the same result.'''
+    data = numpy.asarray(data)
+    if data.dtype.kind in 'iub':
+        data = data.tolist()
+    return list(map(str, data))
+
+
 class FIO_FileRecorder(BaseFileRecorder):
     """ Saves data to a file """
 
@@ -99,6 +109,7 @@ class FIO_FileRecorder(BaseFileRecorder):
         self.setFileName(self.base_filename)
 
         envRec = recordlist.getEnviron()
+        self._setSyncPolicyFromEnviron(envRec)
 
         self.sampleTime = envRec['estimatedtime'] / \
             (envRec['total_scan_intervals'] + 1)
@@ -173,27 +184,21 @@ class FIO_FileRecorder(BaseFileRecorder):
         outLine = " Col %d %s %s\n" % (i, 'timestamp', 'DOUBLE')
         self.fd.write(outLine)
 
-        self.fd.flush()
-        os.fsync(self.fd.fileno())
+        self._sync()
 
     def _writeRecord(self, record):
         if self.filename is None:
             return
         nan, ctNames, fd = float('nan'), self.ctNames, self.fd
-        outstr = ''
-        for c in ctNames:
-            if c == "timestamp" or c == "point_nb":
-                continue
-            outstr += ' ' + str(record.data.get(c, nan))
+        data = record.data
+        values = [str(data.get(c, nan)) for c in ctNames
+                  if c != "timestamp" and c != "point_nb"]
         #
         # 11.9.2012 timestamp to the end
         #
-        outstr += ' ' + str(record.data.get('timestamp', nan))
-        outstr += '\n'
-
-        fd.write(outstr)
-        fd.flush()
-        os.fsync(self.fd.fileno())
+        values.append(str(data.get('timestamp', nan)))
+        fd.write(' ' + ' '.join(values) + '\n')
+        self._syncRecord()
 
         if len(self.mcaNames) > 0:
             self._writeMcaFile(record)
@@ -205,7 +210,7 @@ class FIO_FileRecorder(BaseFileRecorder):
         envRec = recordlist.getEnviron()
         end_time = envRec['endtime'].ctime()
         self.fd.write("! Acquisition ended at %s\n" % end_time)
-        self.fd.flush()
+        self._sync()
         self.fd.close()
 
     def _writeMcaFile(self, record):
@@ -249,20 +254,13 @@ class FIO_FileRecorder(BaseFileRecorder):
             #
             # the MCA arrays me be of different size. the short ones are extended by zeros.
             #
-            lMax = len(record.data[self.mcaNames[0]])
-            for mca in self.mcaNames:
-                if len(record.data[mca]) > lMax:
-                    lMax = len(record.data[mca])
-
-            for i in range(0, lMax):
-                line = ""
-                for mca in self.mcaNames:
-                    if i > (len(record.data[mca]) - 1):
-                        line = line + " 0"
-                    else:
-                        line = line + " " + str(record.data[mca][i])
-                line = line + "\n"
-                fd.write(line)
+            columns = [_format_array(record.data[mca])
+                       for mca in self.mcaNames]
+            lMax = max(len(column) for column in columns)
+            for column in columns:
+                column.extend(["0"] * (lMax - len(column)))
+            lines = [" " + " ".join(row) + "\n" for row in zip(*columns)]
+            fd.write("".join(lines))
 
             fd.close()
         else:
@@ -313,6 +311,7 @@ class SPEC_FileRecorder(BaseFileRecorder):
             return
 
         env = recordlist.getEnviron()
+        self._setSyncPolicyFromEnviron(env)
 
         # datetime object
         start_time = env['starttime']
@@ -393,8 +392,7 @@ class SPEC_FileRecorder(BaseFileRecorder):
 
         self.fd = io.open(self.filename, 'a', newline='\n')
         self.fd.write(str(header % data))
-        self.fd.flush()
-        os.fsync(self.fd.fileno())
+        self._sync()
 
     def _prepareMultiLines(self, character, sep, items_list):
         '''Translate list of lists of items into multiple line string
@@ -456,35 +454,28 @@ class SPEC_FileRecorder(BaseFileRecorder):
             return
         nan, names, fd = float('nan'), self.names, self.fd
 
-        d = []
+        lines = []
         for oned_name in self.oned_names:
             data = record.data.get(oned_name)
             # TODO: The method astype of numpy does not work properly on the
             # beamline, we found difference between the data saved on h5 and
-            # spec. For that reason we implement the it by hand.
-            #str_data = ' '.join(data.astype(str))
-            str_data = ''
+            # spec. For that reason every item is formatted with str.
             if numpy.iterable(data):
-                for i in data:
-                    str_data += '%s ' % i
+                str_data = ' '.join(_format_array(data) + [''])
             else:
-                str_data += '%s' % data
-            outstr = '@A %s' % str_data
-            outstr += '\n'
-            fd.write(str(outstr))
+                str_data = '%s' % data
+            lines.append('@A %s\n' % str_data)
 
+        d = []
         for c in names:
             data = record.data.get(c)
             if data is None:
                 data = nan
             d.append(str(data))
-        outstr = ' '.join(d)
-        outstr += '\n'
+        lines.append(' '.join(d) + '\n')
 
-        fd.write(str(outstr))
-
-        fd.flush()
-        os.fsync(self.fd.fileno())
+        fd.write(''.join(lines))
+        self._syncRecord()
 
     def _endRecordList(self, recordlist):
         if self.filename is None:
@@ -493,7 +484,7 @@ class SPEC_FileRecorder(BaseFileRecorder):
         env = recordlist.getEnviron()
         end_time = env['endtime'].ctime()
         self.fd.write(str("#C Acquisition ended at %s\n" % end_time))
-        self.fd.flush()
+        self._sync()
         self.fd.close()
 
     def _addCustomData(self, value, name, **kwargs):
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module contains tests for SPEC and FIO recorders."""
+
+import os
+import tempfile
+from datetime import datetime
+from unittest import mock
+
+import numpy
+from taurus.external.unittest import TestCase
+
+from sardana.macroserver.scan import ColumnDesc
+from sardana.macroserver.recorders.storage import SPEC_FileRecorder
+from sardana.macroserver.recorders.test.test_h5storage import (RecordList,
+                                                               Record)
+
+COL1_NAME = "col1"
+MCA_NAME = "mca1"
+
+
+class TestSPEC_FileRecorder(TestCase):
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir_name, "test.spec")
+        self.env = {
+            "serialno": 0,
+            "starttime": None,
+            "title": "test",
+            "user": "user",
+            "datadesc": [
+                ColumnDesc(name=COL1_NAME, label=COL1_NAME, dtype="float64",
+                           shape=tuple()),
+                ColumnDesc(name=MCA_NAME, label=MCA_NAME, dtype="float64",
+                           shape=(4,))
+            ],
+            "endtime": None
+        }
+        self.record_list = RecordList(self.env)
+
+    def _scan(self, nb_records):
+        recorder = SPEC_FileRecorder(filename=self.path)
+        self.env["starttime"] = datetime.now()
+        with mock.patch("os.fsync") as fsync:
+            recorder._startRecordList(self.record_list)
+            for i in range(nb_records):
+                data = {COL1_NAME: 0.5 * i,
+                        MCA_NAME: numpy.arange(4, dtype="int32") + i}
+                recorder._writeRecord(Record(data, i))
+            self.env["endtime"] = datetime.now()
+            recorder._endRecordList(self.record_list)
+        return fsync.call_count
+
+    def test_records(self):
+        """Test the format of the records"""
+        self._scan(2)
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+        idx = lines.index("#L col1")
+        self.assertListEqual(lines[idx + 1:idx + 5],
+                             ["@A 0 1 2 3 ", "0.0", "@A 1 2 3 4 ", "0.5"])
+
+    def test_sync_every_record(self):
+        """Test that by default each record is synchronized with the disk"""
+        # header, records and end
+        self.assertEqual(self._scan(5), 1 + 5 + 1)
+
+    def test_sync_every_n_records(self):
+        """Test synchronization every N records"""
+        self.env["ScanFileSync"] = 2
+        self.assertEqual(self._scan(5), 1 + 2 + 1)
+
+    def test_sync_end(self):
+        """Test synchronization only at the end of the scan"""
+        self.env["ScanFileSync"] = "end"
+        self.assertEqual(self._scan(5), 1 + 1)
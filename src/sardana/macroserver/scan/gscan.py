@@ -610,6 +610,12 @@ class GScan(Logger):
                     kwargs.update({'program': macro.getDoorName(),
                                    'array': "%s_1D" % array_prefix,
                                    'shape': (cols, 99)})
+        elif shm.lower() == 'posix':
+            # a single ring buffer holds both, scalar and 1D, columns
+            if eid != 0:
+                return
+            door_name = macro.getDoorName().replace('/', '_')
+            kwargs['name'] = "%s_%s" % (door_name, mg.getName())
         try:
             shmRecorder = SharedMemoryRecorder(shm, macro, **kwargs)
         except Exception:
@@ -664,24 +670,7 @@ class GScan(Logger):
         channels_info = self.measurement_group.getChannelsEnabledInfo()
         counters = []
         for ci in channels_info:
-            full_name = ci.full_name
-            try:
-                # Use DeviceProxy instead of taurus to avoid crashes in Py3
-                # See: tango-controls/pytango#292
-                # channel = taurus.Device(full_name)
-                channel = PyTango.DeviceProxy(full_name)
-                instrument = channel.instrument
-            except Exception:
-                # full_name of external channels is the name of the attribute
-                # external channels are not assigned to instruments
-                instrument = ''
-            try:
-                instrumentFullName = self.macro.findObjs(
-                    instrument, type_class=Type.Instrument)[0].getFullName()
-            except InterruptException:
-                raise
-            except Exception:
-                instrumentFullName = ''
+            instrumentFullName = self._getChannelInstrument(ci.full_name)
             # substitute the axis placeholder by the corresponding moveable.
             plotAxes = []
             i = 0
@@ -738,6 +727,12 @@ class GScan(Logger):
         except UnknownEnv:
             env['DataCompressionRank'] = -1
 
+        # set the scan file durability policy
+        try:
+            env['ScanFileSync'] = self.macro.getEnv('ScanFileSync')
+        except UnknownEnv:
+            env['ScanFileSync'] = None
+
         # set the sample information
         # @todo: use the instrument API to get this info
         try:
@@ -773,8 +768,12 @@ class GScan(Logger):
         except Exception:
             env['ScanDir'] = None
         env['estimatedtime'], env['total_scan_intervals'] = self._estimate()
-        env['instrumentlist'] = self.macro.findObjs(
-            '.*', type_class=Type.Instrument)
+        cache = self._getScanSetupCache()
+        try:
+            env['instrumentlist'] = cache['instrumentlist']
+        except KeyError:
+            env['instrumentlist'] = cache['instrumentlist'] = \
+                self.macro.findObjs('.*', type_class=Type.Instrument)
 
         # env.update(self._getExperimentConfiguration) #add all the info from
         # the experiment configuration to the environment
@@ -784,6 +783,50 @@ class GScan(Logger):
         # Give the environment to the ScanData
         self.data.setEnviron(env)
 
+    def _getScanSetupCache(self):
+        """Returns the MacroServer cache of the scan setup metadata or an
+        empty dictionary if it is not available (e.g. macro executed
+        outside of the MacroServer)"""
+        try:
+            return self.macro.getMacroServer().get_scan_setup_cache()
+        except Exception:
+            return {}
+
+    def _getChannelInstrument(self, full_name):
+        """Returns the instrument full name of the channel or empty string
+        if it is not assigned to any instrument. Uses the scan setup
+        metadata cache to avoid querying the channel in consecutive
+        scans. Only the successfully read instruments are cached, so
+        a channel which could not be queried (e.g. timeout) is queried
+        again in the next scan."""
+        cache = self._getScanSetupCache()
+        key = ('instrument', full_name)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        try:
+            # Use DeviceProxy instead of taurus to avoid crashes in Py3
+            # See: tango-controls/pytango#292
+            # channel = taurus.Device(full_name)
+            channel = PyTango.DeviceProxy(full_name)
+            instrument = channel.instrument
+        except Exception:
+            # full_name of external channels is the name of the attribute
+            # external channels are not assigned to instruments
+            instrument = None
+        if instrument is None:
+            return ''
+        try:
+            instrumentFullName = self.macro.findObjs(
+                instrument, type_class=Type.Instrument)[0].getFullName()
+        except InterruptException:
+            raise
+        except Exception:
+            instrumentFullName = ''
+        cache[key] = instrumentFullName
+        return instrumentFullName
+
     def takeSnapshot(self, elements=[]):
         """reads the current values of the given elements
 
@@ -968,10 +1011,6 @@ class GScan(Logger):
             env['delaytime'] = total_time - acq_time - env['motiontime']
 
         self.data.end()
-        try:
-            scan_history = self.macro.getEnv('ScanHistory')
-        except UnknownEnv:
-            scan_history = []
 
         scan_file = env['ScanFile']
         if isinstance(scan_file, str):
@@ -985,10 +1024,9 @@ class GScan(Logger):
                        ScanFile=scan_file, ScanDir=env['ScanDir'],
                        endstatus=ScanEndStatus.whatis(env['endstatus']),
                        channels=names)
-        scan_history.append(history)
-        while len(scan_history) > self.MAX_SCAN_HISTORY:
-            scan_history.pop(0)
-        self.macro.setEnv('ScanHistory', scan_history)
+        # append-only store: the cost does not depend on the history length
+        self.macro.getMacroServer().add_scan_history(
+            history, max_size=self.MAX_SCAN_HISTORY)
 
     def scan(self):
         for _ in self.step_scan():
@@ -1411,18 +1449,64 @@ class CScan(GScan):
     def set_all_waypoints_finished(self, v):
         self._all_waypoints_finished = v
 
+    @staticmethod
+    def _get_motor_pool(motor):
+        """Return the Pool of a physical motor or None for other moveables
+        """
+        try:
+            if motor.getType() == "Motor":
+                return motor.getPoolObj()
+        except AttributeError:
+            pass
+        return None
+
+    def _get_motors_pars(self, motors, parameters):
+        """Read axis parameters of motors with one call per Pool.
+
+        :param motors: motors to be read
+        :param parameters: (seq<str>) parameter names
+        :return: (dict) map of motors and maps of parameter names and
+            values; motors which parameters could not be read in bulk
+            (e.g. Pool not supporting it) are not present
+        """
+        pools = OrderedDict()
+        for motor in motors:
+            pool = self._get_motor_pool(motor)
+            if pool is None:
+                continue
+            pools.setdefault(pool, []).append(motor)
+        ret = {}
+        for pool, pool_motors in list(pools.items()):
+            names = [motor.getName() for motor in pool_motors]
+            try:
+                pars = pool.getAxisPars(names, parameters)
+            except Exception:
+                self.macro.debug("Error when reading %s of %s in bulk",
+                                 parameters, names, exc_info=True)
+                continue
+            for motor, name in zip(pool_motors, names):
+                ret[motor] = pars[name]
+        return ret
+
     def _backup_motor(self):
         """Backup motors initial state (velocity, acceleration and
         deceleration).
         """
         self._backup = backup = []
+        pars = ("velocity", "acceleration", "deceleration")
+        motors_pars = self._get_motors_pars(self._physical_moveables, pars)
         for moveable in self._physical_moveables:
             # first backup all motor parameters
             motor = moveable
             try:
-                velocity = motor.getVelocity()
-                accel_time = motor.getAcceleration()
-                decel_time = motor.getDeceleration()
+                if motor in motors_pars:
+                    motor_pars = motors_pars[motor]
+                    velocity, accel_time, decel_time = \
+                        [motor_pars[par] for par in pars]
+                else:
+                    velocity = motor.getVelocity()
+                    accel_time = motor.getAcceleration()
+                    decel_time = motor.getDeceleration()
                 motor_backup = dict(moveable=moveable, velocity=velocity,
                                     acceleration=accel_time,
                                     deceleration=decel_time)
@@ -1439,6 +1523,7 @@ class CScan(GScan):
         """Restore changed motors to initial state (velocity, acceleration and
         deceleration).
         """
+        motors_attributes = OrderedDict()
         for motor_backup in self._backup:
             if motor_backup is None:
                 continue
@@ -1446,11 +1531,12 @@ class CScan(GScan):
             attributes = OrderedDict(velocity=motor_backup["velocity"],
                                      acceleration=motor_backup["acceleration"],
                                      deceleration=motor_backup["deceleration"])
-            try:
-                self.configure_motor(motor, attributes)
-            except ScanException as e:
-                msg = "Error when restoring motor's backup (%s)" % e
-                raise ScanException(msg)
+            motors_attributes[motor] = attributes
+        try:
+            self.configure_motors(motors_attributes)
+        except ScanException as e:
+            msg = "Error when restoring motor's backup (%s)" % e
+            raise ScanException(msg)
 
     def do_restore(self):
         # Restore motor backups (vel, acc, ...) first so the macro's
@@ -1465,15 +1551,17 @@ class CScan(GScan):
         if motors is None:
             motors = [b.get('moveable') for b in self._backup if b is not None]
 
+        motors_attributes = OrderedDict()
         for motor in motors:
             attributes = OrderedDict(velocity=self.get_max_top_velocity(motor),
                                      acceleration=self.get_min_acc_time(motor),
                                      deceleration=self.get_min_dec_time(motor))
-            try:
-                self.configure_motor(motor, attributes)
-            except ScanException as e:
-                msg = "Error when setting fast motion (%s)" % e
-                raise ScanException(msg)
+            motors_attributes[motor] = attributes
+        try:
+            self.configure_motors(motors_attributes)
+        except ScanException as e:
+            msg = "Error when setting fast motion (%s)" % e
+            raise ScanException(msg)
 
     def get_max_top_velocity(self, motor):
         """Helper method to find the maximum top velocity for the motor.
@@ -1595,6 +1683,82 @@ class CScan(GScan):
                     (param, motor.name, value)
                 raise ScanException(msg)
 
+    def _is_in_range(self, motor, attributes):
+        """Checks if the attribute values are within the ranges of the
+        motor attributes (as they would be checked by the motor device when
+        writing them with :meth:`~CScan.configure_motor`).
+
+        :param motor: (Motor or Moveable) motor to be configured
+        :param attributes: (OrderedDict) dictionary with attribute names (keys)
+            and attribute values (values)
+        :return: (bool) False if any of the values is out of range or the
+            ranges could not be checked
+        """
+        for param, value in list(attributes.items()):
+            try:
+                attr = motor._getAttrEG(param).getAttribute()
+                min_value, max_value = attr.getRange()
+            except Exception:
+                return False
+            for limit, out_of_range in ((min_value, operator.lt),
+                                        (max_value, operator.gt)):
+                try:
+                    limit = limit.magnitude
+                except AttributeError:
+                    pass
+                try:
+                    limit = float(limit)
+                except (TypeError, ValueError):
+                    continue
+                if out_of_range(value, limit):
+                    return False
+        return True
+
+    def configure_motors(self, motors_attributes):
+        """Configure multiple motors with one call per Pool. Falls back to
+        :meth:`~CScan.configure_motor` for the motors which values are out
+        of the attribute ranges, for the motors which could not be
+        configured in bulk and for all the motors of a Pool which does not
+        support configuring them in bulk, so the errors are reported as in
+        :meth:`~CScan.configure_motor`.
+
+        .. note:: Contrary to :meth:`~CScan.configure_motor`, the values
+            configured in bulk are not memorized by the motor devices. The
+            scan restores the backup of the motors at the end, so the
+            memorized values are still valid unless the Pool is restarted
+            during the scan.
+
+        :param motors_attributes: (OrderedDict) dictionary with motors (keys)
+            and dictionaries of attribute names and values (values) as
+            accepted by :meth:`~CScan.configure_motor`
+        """
+        pools = OrderedDict()
+        for motor, attributes in list(motors_attributes.items()):
+            pool = self._get_motor_pool(motor)
+            if pool is not None and not self._is_in_range(motor, attributes):
+                pool = None
+            pools.setdefault(pool, []).append((motor, attributes))
+        for pool, pool_motors in list(pools.items()):
+            if pool is not None:
+                elements_pars = OrderedDict()
+                for motor, attributes in pool_motors:
+                    elements_pars[motor.getName()] = attributes
+                try:
+                    errors = pool.setAxisPars(elements_pars)
+                except Exception:
+                    self.macro.debug("Error when configuring %s in bulk",
+                                     list(elements_pars.keys()),
+                                     exc_info=True)
+                else:
+                    if errors:
+                        self.macro.debug("Error when configuring in bulk: %s",
+                                         errors)
+                    pool_motors = [(motor, attributes)
+                                   for motor, attributes in pool_motors
+                                   if motor.getName() in errors]
+            for motor, attributes in pool_motors:
+                self.configure_motor(motor, attributes)
+
 
 class CSScan(CScan):
     """Continuous scan controlled by software"""
@@ -2131,6 +2295,11 @@ class CTScan(CScan, CAcquisition):
                            in strict order after finishing the move
       - 'hooks' : (deprecated, use post-acq-hooks instead)
       - 'waypoint_id' : a hashable identifing the waypoint
+      - 'reversed' : (optional) whether the waypoint is scanned in the
+                     reverse direction of the scan e.g. every second line
+                     of a bidirectional (snake) mesh scan - its records are
+                     placed in the reverse order so the scan data keeps the
+                     scan order (default: False)
       - 'check_func' : (optional) a list of callable objects.
                        callable(moveables, counters)
       - 'extravalues': (optional) a dictionary containing the values for
@@ -2246,40 +2415,23 @@ class CTScan(CScan, CAcquisition):
 
         return ideal_paths, acc_time, active_time
 
-    def _go_through_waypoints(self):
-        """Internal, unprotected method to go through the different waypoints.
-           It controls all the three objects: motion, trigger and measurement
-           group."""
-        macro = self.macro
-        motion = self._physical_motion
-        waypoints = self.steps
-        measurement_group = self.measurement_group
-
-        self.macro.debug("_go_through_waypoints() entering...")
-
-        compatible, channels = \
-            self.is_measurement_group_compatible(measurement_group)
-
-        if not compatible:
-            self.debug("Non compatible channels are: %s" % channels)
-            msg = "Measurement group %s is not compatible with %s" %\
-                  (measurement_group.getName(), macro.getName())
-            raise ScanException(msg)
+    def _is_prepare_once(self):
+        """Whether the measurement group should be prepared once for all the
+        waypoints sharing the same synchronization (``ContScanPrepareOnce``
+        environment variable) instead of once per waypoint."""
+        try:
+            return bool(self.macro.getEnv('ContScanPrepareOnce'))
+        except UnknownEnv:
+            return False
 
-        # add listener of data events
-        measurement_group.subscribeValueBuffer(self.value_buffer_changed)
-        # add listener of value ref events
-        measurement_group.subscribeValueRefBuffer(
-            self.value_ref_buffer_changed)
-        # initializing mntgrp subscription control variables
-        self.__mntGrpSubscribed = True
+    def _calculate_waypoints(self, waypoints):
+        """Generator calculating, for each waypoint, the motion paths and
+        the synchronization description. It also validates the positions.
 
-        self.data.initial_data = {}
+        :param waypoints: waypoints as iterated from the :attr:`steps`
+        :return: generator of dictionaries with the waypoint information
+        """
         last_positions = None
-        self.macro.warning(
-            "Motor positions and relative timestamp (dt) columns contains"
-            " theoretical values"
-        )
         for i, waypoint in waypoints:
             self.macro.debug("Waypoint iteration...")
 
@@ -2294,11 +2446,6 @@ class CTScan(CScan, CAcquisition):
             waypoint_info = self.prepare_waypoint(waypoint, start_positions)
             motion_paths, delta_start, acq_duration = waypoint_info
 
-            self.acq_duration = acq_duration
-
-            # execute pre-move hooks
-            for hook in waypoint.get('pre-move-hooks', []):
-                hook()
             # parepare list of start and final positions for the motion object
             start_pos, final_pos = [], []
             for path in motion_paths:
@@ -2320,10 +2467,6 @@ class CTScan(CScan, CAcquisition):
                           'is out of range (%f, %f)' % (min_pos, max_pos)
                     raise ScanException(msg)
 
-            if macro.isStopped():
-                self.on_waypoints_end()
-                return
-
             # at least one motor must have different start and final positions
             if all(self.macro.starts == self.macro.finals):
                 if len(self.macro.starts) > 1:
@@ -2333,22 +2476,7 @@ class CTScan(CScan, CAcquisition):
                     msg = "Scan start and end must be different."
                 raise ScanException(msg)
 
-            # Set the index offset used in CAcquisition class.
-            self._index_offset = i * self.macro.nb_points
-
-            startTimestamp = time.time()
-
-            # extra pre configuration
-            if hasattr(macro, 'getHooks'):
-                for hook in macro.getHooks('pre-configuration'):
-                    hook()
-            self.macro.checkPoint()
-
-            # TODO: let a pseudomotor specify which motor should be used as
-            # source
             MASTER = 0
-            moveable = moveables[MASTER].full_name
-            self.measurement_group.setMoveable(moveable)
             path = motion_paths[MASTER]
             repeats = self.macro.nb_points
             active_time = self.macro.integ_time
@@ -2369,31 +2497,179 @@ class CTScan(CScan, CAcquisition):
                  SynchParam.Total: {SynchDomain.Position: total_position,
                                     SynchDomain.Time: total_time},
                  SynchParam.Repeats: repeats}]
-            self.debug('Synchronization: %s' % synch)
-            measurement_group.setSynchronization(synch)
-            self.macro.checkPoint()
 
-            # extra post configuration
-            if hasattr(macro, 'getHooks'):
-                for hook in macro.getHooks('post-configuration'):
-                    hook()
-            self.macro.checkPoint()
+            # the macros may reuse the waypoint and change their starts and
+            # finals while iterating, keep a copy of the current ones
+            yield dict(index=i, waypoint=dict(waypoint),
+                       motion_paths=motion_paths, delta_start=delta_start,
+                       acq_duration=acq_duration, start_pos=start_pos,
+                       final_pos=final_pos, synchronization=synch,
+                       starts=np.array(self.macro.starts, copy=True),
+                       finals=np.array(self.macro.finals, copy=True),
+                       prepare=True, nb_starts=None)
 
-            endTimestamp = time.time()
-            self.debug("Configuration took %s time." %
-                       repr(endTimestamp - startTimestamp))
-            ############
-            # try to go as fast as possile to start position
-            self._setFastMotions(moveables)
-            # move to start position
-            self.macro.debug("Moving to start position: %s" % repr(start_pos))
-            motion.move(start_pos)
+    @staticmethod
+    def _group_waypoints(waypoints_info):
+        """Group consecutive waypoints with the same synchronization
+        description so the measurement group is configured and prepared
+        only once (with as many starts as waypoints) per group.
+
+        :param waypoints_info: waypoints information as calculated by
+            :meth:`~CTScan._calculate_waypoints` (updated in place)
+        """
+        first = None
+        for info in waypoints_info:
+            if (first is not None
+                    and info["synchronization"] == first["synchronization"]):
+                info["prepare"] = False
+                first["nb_starts"] += 1
+            else:
+                info["prepare"] = True
+                info["nb_starts"] = 1
+                first = info
+
+    @staticmethod
+    def _is_motors_config_kept(prev_info, info, motors_attributes):
+        """Whether the motors configuration of the previous waypoint can be
+        kept for moving to the start position of the current one and for
+        scanning it.
+
+        This is the case when the scan motors require the same
+        configuration as in the previous waypoint and their move to the
+        start position is not longer than their acceleration and deceleration
+        ramps (they would not profit from the fast motions), e.g. in
+        bidirectional scans.
+        """
+        if prev_info is None:
+            return False
+        prev_paths = {path.moveable: path
+                      for path in prev_info["motion_paths"]}
+        for path in info["motion_paths"]:
+            motor = path.moveable
+            if motor not in motors_attributes:
+                continue
+            prev_path = prev_paths.get(motor)
+            if prev_path is None:
+                return False
+            if (prev_path.max_vel != path.max_vel
+                    or prev_path.max_vel_time != path.max_vel_time
+                    or prev_path.min_vel_time != path.min_vel_time):
+                return False
+            ramps = 0.5 * path.max_vel * (path.max_vel_time +
+                                          path.min_vel_time)
+            distance = abs(path.initial_user_pos - prev_path.final_user_pos)
+            if distance > ramps:
+                return False
+        return True
+
+    def _go_through_waypoints(self):
+        """Internal, unprotected method to go through the different waypoints.
+           It controls all the three objects: motion, trigger and measurement
+           group."""
+        macro = self.macro
+        motion = self._physical_motion
+        waypoints = self.steps
+        measurement_group = self.measurement_group
+
+        self.macro.debug("_go_through_waypoints() entering...")
+
+        compatible, channels = \
+            self.is_measurement_group_compatible(measurement_group)
+
+        if not compatible:
+            self.debug("Non compatible channels are: %s" % channels)
+            msg = "Measurement group %s is not compatible with %s" %\
+                  (measurement_group.getName(), macro.getName())
+            raise ScanException(msg)
+
+        # add listener of data events
+        measurement_group.subscribeValueBuffer(self.value_buffer_changed)
+        # add listener of value ref events
+        measurement_group.subscribeValueRefBuffer(
+            self.value_ref_buffer_changed)
+        # initializing mntgrp subscription control variables
+        self.__mntGrpSubscribed = True
+
+        self.data.initial_data = {}
+        self.macro.warning(
+            "Motor positions and relative timestamp (dt) columns contains"
+            " theoretical values"
+        )
+        prepare_once = self._is_prepare_once()
+        waypoints_info = self._calculate_waypoints(waypoints)
+        if prepare_once:
+            # calculate all the waypoints up front so the measurement group
+            # can be prepared once for all the lines sharing the same
+            # synchronization
+            waypoints_info = list(waypoints_info)
+            self._group_waypoints(waypoints_info)
+        positions = None
+        prev_info = None
+        for info in waypoints_info:
+            i = info["index"]
+            waypoint = info["waypoint"]
+            positions = waypoint['positions']
+            motion_paths = info["motion_paths"]
+            delta_start = info["delta_start"]
+            start_pos = info["start_pos"]
+            final_pos = info["final_pos"]
+            synch = info["synchronization"]
+            moveables = self._physical_moveables
+
+            self.acq_duration = info["acq_duration"]
+
+            # execute pre-move hooks
+            for hook in waypoint.get('pre-move-hooks', []):
+                hook()
 
             if macro.isStopped():
                 self.on_waypoints_end()
                 return
 
+            # Set the index offset used in CAcquisition class.
+            self._index_offset = i * self.macro.nb_points
+            if waypoint.get('reversed', False):
+                # keep the scan order of the records
+                self.data.addReversedRange(
+                    self._index_offset,
+                    self._index_offset + self.macro.nb_points)
+
+            if info["prepare"]:
+                startTimestamp = time.time()
+
+                # extra pre configuration
+                if hasattr(macro, 'getHooks'):
+                    for hook in macro.getHooks('pre-configuration'):
+                        hook()
+                self.macro.checkPoint()
+
+                # TODO: let a pseudomotor specify which motor should be used
+                # as source
+                MASTER = 0
+                moveable = moveables[MASTER].full_name
+                self.measurement_group.setMoveable(moveable)
+                self.debug('Synchronization: %s' % synch)
+                measurement_group.setSynchronization(synch)
+                nb_starts = info["nb_starts"]
+                if nb_starts is not None:
+                    self.debug("Preparing measurement group for %d starts",
+                               nb_starts)
+                    measurement_group.setNbStarts(nb_starts)
+                    measurement_group.prepare()
+                self.macro.checkPoint()
+
+                # extra post configuration
+                if hasattr(macro, 'getHooks'):
+                    for hook in macro.getHooks('post-configuration'):
+                        hook()
+                self.macro.checkPoint()
+
+                endTimestamp = time.time()
+                self.debug("Configuration took %s time." %
+                           repr(endTimestamp - startTimestamp))
+
             # prepare motor(s) to move with their maximum velocity
+            motors_attributes = OrderedDict()
             for path in motion_paths:
                 motor = path.moveable
                 self.macro.debug("Motor: %s" % motor.getName())
@@ -2410,8 +2686,32 @@ class CTScan(CScan, CAcquisition):
                 # TODO: think of not attaching them to the waypoint at all
                 if path.initial_user_pos == path.final_user_pos:
                     continue
+                motors_attributes[motor] = attributes
+
+            keep_motors_config = (prepare_once and
+                                  self._is_motors_config_kept(
+                                      prev_info, info, motors_attributes))
+            ############
+            if keep_motors_config:
+                # the scan motors are already configured and their move to
+                # the start position is too short to profit from the fast
+                # motions, go fast only with the rest of them
+                self._setFastMotions([m for m in moveables
+                                      if m not in motors_attributes])
+            else:
+                # try to go as fast as possile to start position
+                self._setFastMotions(moveables)
+            # move to start position
+            self.macro.debug("Moving to start position: %s" % repr(start_pos))
+            motion.move(start_pos)
+
+            if macro.isStopped():
+                self.on_waypoints_end()
+                return
+
+            if not keep_motors_config:
                 try:
-                    self.configure_motor(motor, attributes)
+                    self.configure_motors(motors_attributes)
                 except ScanException as e:
                     msg = "Error when configuring scan motion (%s)" % e
                     raise ScanException(msg)
@@ -2430,15 +2730,17 @@ class CTScan(CScan, CAcquisition):
             initial_data = self.data.initial_data
 
             motors = self.macro.motors
-            starts = self.macro.starts
-            finals = self.macro.finals
+            starts = info["starts"]
+            finals = info["finals"]
             nb_points = self.macro.nb_points
             theoretical_positions = generate_positions(motors, starts, finals,
                                                        nb_points)
             theoretical_timestamps = generate_timestamps(synch, dt_timestamp)
             for index, data in list(theoretical_positions.items()):
                 data.update(theoretical_timestamps[index])
-                initial_data[index + self._index_offset] = data
+                record_index = self.data.getRecordIndex(
+                    index + self._index_offset)
+                initial_data[record_index] = data
             # TODO: this changes the initial data on-the-fly - seems like not
             # the best practice
             self.data.initial_data = initial_data
@@ -2501,8 +2803,7 @@ class CTScan(CScan, CAcquisition):
             for hook in waypoint.get('post-move-hooks', []):
                 hook()
 
-            if start_positions is None:
-                last_positions = positions
+            prev_info = info
 
         self.on_waypoints_end(positions)
 
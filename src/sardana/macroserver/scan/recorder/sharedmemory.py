@@ -46,6 +46,8 @@ def SharedMemoryRecorder(type, macro, **pars):
     rec_manager = macro.getMacroServer().recorder_manager
     if type == 'sps':
         klass = rec_manager.getRecorderClass('SPSRecorder')
+    elif type == 'posix':
+        klass = rec_manager.getRecorderClass('PosixShmRecorder')
     else:
         raise Exception('SharedMemory %s is not supported.' % type)
     return klass(**pars)
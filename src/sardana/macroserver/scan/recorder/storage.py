@@ -57,6 +57,71 @@ class BaseFileRecorder(DataRecorder):
         DataRecorder.__init__(self, **pars)
         self.filename = None
         self.fd = None
+        self._sync_records = 1
+        self._sync_period = None
+        self._unsynced_records = 0
+        self._last_sync = time.time()
+
+    def setSyncPolicy(self, policy):
+        '''Sets when the written records are synchronized with the disk
+        (``os.fsync``). The records are always flushed to the operating
+        system after being written.
+
+        :param policy: None or 1 (default) to synchronize after every record,
+                       an integer N to synchronize every N records, a dict with
+                       the keys ``records`` and/or ``period`` (seconds) to
+                       synchronize every N records or T seconds, whatever
+                       comes first, or ``"end"`` to synchronize only at the
+                       end of the scan
+        :type policy: None, int, dict or str'''
+        records, period = 1, None
+        if isinstance(policy, str):
+            if policy.lower() != 'end':
+                raise ValueError("Invalid sync policy: %s" % policy)
+            records = None
+        elif isinstance(policy, dict):
+            records = policy.get('records')
+            period = policy.get('period')
+        elif policy is not None:
+            records = int(policy)
+        if records is not None and records < 1:
+            raise ValueError("Invalid sync policy: %s" % policy)
+        self._sync_records = records
+        self._sync_period = period
+        self._unsynced_records = 0
+        self._last_sync = time.time()
+
+    def _setSyncPolicyFromEnviron(self, env):
+        '''Sets the sync policy from the ScanFileSync scan environment'''
+        try:
+            self.setSyncPolicy(env.get('ScanFileSync'))
+        except (ValueError, TypeError):
+            self.warning("Invalid ScanFileSync: %s. Synchronizing every "
+                         "record", env.get('ScanFileSync'))
+            self.setSyncPolicy(None)
+
+    def _syncRecord(self):
+        '''To be called after writing each record. Flushes the file and
+        synchronizes it with the disk if it is due according to the sync
+        policy.'''
+        fd = self.fd
+        fd.flush()
+        self._unsynced_records += 1
+        records, period = self._sync_records, self._sync_period
+        if records is not None and self._unsynced_records >= records:
+            self._sync()
+        elif period is not None and time.time() - self._last_sync >= period:
+            self._sync()
+
+    def _sync(self):
+        '''Flushes the file and synchronizes it with the disk'''
+        fd = self.fd
+        if fd is None or fd.closed:
+            return
+        fd.flush()
+        os.fsync(fd.fileno())
+        self._unsynced_records = 0
+        self._last_sync = time.time()
 
     def getFileName(self):
         return self.filename
@@ -30,6 +30,7 @@ __all__ = ["ColumnDesc", "MoveableDesc", "Record", "RecordEnvironment",
 
 import copy
 import math
+import bisect
 
 from taurus.core.util.singleton import Singleton
 from taurus import Device, Attribute, getSchemeFromName, Factory
@@ -312,6 +313,9 @@ class RecordList(dict):
         # currentIndex indicates the place in the records list
         # where the next completed record will be written
         self.currentIndex = 0
+        # ranges of indexes which data is acquired in the reverse order
+        self._reversed_starts = []
+        self._reversed_stops = []
 
     # make it pickable
     def __getstate__(self):
@@ -342,6 +346,8 @@ class RecordList(dict):
         self.channelLabels = []
         self.currentIndex = 0
         self._mylabel = []
+        self._reversed_starts = []
+        self._reversed_stops = []
 
         for dataDesc in self.getEnvironValue('datadesc'):
             if isinstance(dataDesc, MoveableDesc):
@@ -356,6 +362,42 @@ class RecordList(dict):
         ####
         self.datahandler.startRecordList(self)
 
+    def addReversedRange(self, start, stop):
+        """Declare that the data of the records from start (included) to stop
+        (excluded) is acquired in the reverse order e.g. the lines scanned
+        backwards in a bidirectional (snake) scan. The data acquired with
+        these indexes is placed in the reverse order so the record list
+        (and the recorders) keep the scan order.
+
+        The ranges must be declared in increasing order, before their data
+        is added, and must not overlap.
+
+        :param start: index of the first record
+        :type start: int
+        :param stop: index after the last record
+        :type stop: int
+        """
+        self._reversed_starts.append(start)
+        self._reversed_stops.append(stop)
+
+    def getRecordIndex(self, idx):
+        """Get index of the record where the data acquired with the given
+        index is placed (see :meth:`~RecordList.addReversedRange`). It is
+        also the acquisition index of the data placed in the given record.
+
+        :param idx: acquisition index
+        :type idx: int
+        :return: record index
+        :rtype: int
+        """
+        pos = bisect.bisect_right(self._reversed_starts, idx) - 1
+        if pos >= 0:
+            start = self._reversed_starts[pos]
+            stop = self._reversed_stops[pos]
+            if idx < stop:
+                return start + stop - 1 - idx
+        return idx
+
     def initRecord(self):
         '''Init a dummy record and add it to the records list.
         A dummy record has:
@@ -452,7 +494,11 @@ class RecordList(dict):
         rawData = data.get('value') or data.get('value_ref')
 
 
-        maxIdx = max(idxs)
+        if self._reversed_starts:
+            recordIdxs = [self.getRecordIndex(idx) for idx in idxs]
+        else:
+            recordIdxs = idxs
+        maxIdx = max(recordIdxs)
         recordsLen = len(self.records)
         # Calculate missing records
         missingRecords = recordsLen - (maxIdx + 1)
@@ -460,12 +506,17 @@ class RecordList(dict):
         if missingRecords < 0:
             missingRecords = abs(missingRecords)
             self.initRecords(missingRecords)
-        for idx, value in zip(idxs, rawData):
-            rc = self.records[idx]
-            rc.setRecordNo(idx)
+        for idx, recordIdx, value in zip(idxs, recordIdxs, rawData):
+            rc = self.records[recordIdx]
+            rc.setRecordNo(recordIdx)
             rc.data[label] = value
+            # columnIndexDict follows the acquisition order
             self.columnIndexDict[label] = idx + 1
-        self.tryToAdd(idx, label)
+        if self._reversed_starts:
+            # data acquired in the reverse order may complete the records
+            # placed after it
+            maxIdx = len(self.records) - 1
+        self.tryToAdd(maxIdx, label)
 
     def tryToAdd(self, idx, label):
         start = self.currentIndex
@@ -481,11 +532,14 @@ class RecordList(dict):
                     self.applyZeroOrderInterpolation(rc)
                 self.datahandler.addRecord(self, rc)
                 self.currentIndex += 1
+            else:
+                break
 
     def isRecordCompleted(self, recordno):
         rc = self.records[recordno]
+        idx = self.getRecordIndex(self.currentIndex)
         for label in self.channelLabels:
-            if self.columnIndexDict[label] <= self.currentIndex:
+            if self.columnIndexDict[label] <= idx:
                 return False
         rc.completed = 1
         return True
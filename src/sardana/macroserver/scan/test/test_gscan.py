@@ -111,3 +111,196 @@ class CTScanTestCase(unittest.TestCase):
             msg = 'Final positions do not match. (expected={0}, got={1})'.format(
                 expected["final_pos"], path.final_pos)
             self.assertEqual(path.final_pos, expected["final_pos"], msg)
+
+
+class CTScanWaypointsTestCase(unittest.TestCase):
+    """Tests of the CTScan preparation of the measurement group and
+    configuration of the motors once for multiple waypoints"""
+
+    @staticmethod
+    def _path(moveable, initial, final, max_vel=10., acc=0.1, dec=0.1):
+        from types import SimpleNamespace
+        return SimpleNamespace(moveable=moveable, initial_user_pos=initial,
+                               final_user_pos=final, max_vel=max_vel,
+                               max_vel_time=acc, min_vel_time=dec)
+
+    def test_group_waypoints(self):
+        """Verify that consecutive waypoints with the same synchronization
+        are prepared once with as many starts as waypoints."""
+        from sardana.macroserver.scan.gscan import CTScan
+        synchs = [[{"total": 1}], [{"total": 1}], [{"total": 2}],
+                  [{"total": 1}], [{"total": 1}], [{"total": 1}]]
+        infos = [dict(synchronization=synch, prepare=True, nb_starts=None)
+                 for synch in synchs]
+        CTScan._group_waypoints(infos)
+        self.assertEqual([info["prepare"] for info in infos],
+                         [True, False, True, True, False, False])
+        self.assertEqual([info["nb_starts"] for info in infos if
+                          info["prepare"]], [2, 1, 3])
+
+    def test_motors_config_kept(self):
+        """Verify that the motors configuration is kept only if it does
+        not change and the move to the start position is within the
+        motors ramps."""
+        from sardana.macroserver.scan.gscan import CTScan
+        mot = "mot01"
+        attributes = {mot: {}}
+        prev_info = dict(motion_paths=[self._path(mot, -0.5, 10.5)])
+        # bidirectional: start close to the previous end
+        info = dict(motion_paths=[self._path(mot, 10.4, -0.5)])
+        self.assertTrue(CTScan._is_motors_config_kept(prev_info, info,
+                                                      attributes))
+        # first waypoint
+        self.assertFalse(CTScan._is_motors_config_kept(None, info,
+                                                       attributes))
+        # unidirectional: long move back to the start
+        info = dict(motion_paths=[self._path(mot, -0.5, 10.5)])
+        self.assertFalse(CTScan._is_motors_config_kept(prev_info, info,
+                                                       attributes))
+        # different velocity
+        info = dict(motion_paths=[self._path(mot, 10.4, -0.5, max_vel=5.)])
+        self.assertFalse(CTScan._is_motors_config_kept(prev_info, info,
+                                                       attributes))
+
+
+class ScanSetupCacheTestCase(unittest.TestCase):
+    """Tests of the cache of the scan setup metadata"""
+
+    def test_channel_instrument(self):
+        """Verify that the channel instruments are queried only once until
+        the cache is cleared."""
+        from unittest import mock
+        from sardana.macroserver.scan import gscan
+        from sardana.macroserver.scan.gscan import GScan
+        cache = {}
+        macro = mock.Mock()
+        macro.getMacroServer.return_value.get_scan_setup_cache.\
+            return_value = cache
+        macro.findObjs.return_value = [mock.Mock()]
+        macro.findObjs.return_value[0].getFullName.return_value = "/slit"
+        scan = GScan.__new__(GScan)
+        scan._macro = lambda: macro
+        # Type members are created by the MacroServer type manager
+        with mock.patch.object(gscan, "Type"), \
+                mock.patch.object(gscan.PyTango, "DeviceProxy") as proxy:
+            proxy.return_value.instrument = "/slit"
+            for _ in range(2):
+                self.assertEqual(scan._getChannelInstrument("ct01"), "/slit")
+            self.assertEqual(proxy.call_count, 1)
+            cache.clear()
+            self.assertEqual(scan._getChannelInstrument("ct01"), "/slit")
+            self.assertEqual(proxy.call_count, 2)
+
+    def test_channel_instrument_error(self):
+        """Verify that the channel instrument is not cached if the channel
+        could not be queried e.g. due to a timeout."""
+        from unittest import mock
+        from sardana.macroserver.scan import gscan
+        from sardana.macroserver.scan.gscan import GScan
+        cache = {}
+        macro = mock.Mock()
+        macro.getMacroServer.return_value.get_scan_setup_cache.\
+            return_value = cache
+        macro.findObjs.return_value = [mock.Mock()]
+        macro.findObjs.return_value[0].getFullName.return_value = "/slit"
+        scan = GScan.__new__(GScan)
+        scan._macro = lambda: macro
+        with mock.patch.object(gscan, "Type"), \
+                mock.patch.object(gscan.PyTango, "DeviceProxy") as proxy:
+            proxy.side_effect = gscan.PyTango.DevFailed()
+            self.assertEqual(scan._getChannelInstrument("ct01"), "")
+            self.assertEqual(cache, {})
+            proxy.side_effect = None
+            proxy.return_value.instrument = "/slit"
+            self.assertEqual(scan._getChannelInstrument("ct01"), "/slit")
+            self.assertEqual(scan._getChannelInstrument("ct01"), "/slit")
+            self.assertEqual(proxy.call_count, 2)
+
+
+class MotorsBackupTestCase(unittest.TestCase):
+    """Tests of the backup, restore and configuration of the continuous
+    scan motors with one call per Pool"""
+
+    def setUp(self):
+        from unittest import mock
+        from sardana.macroserver.scan.gscan import CScan
+        self.pool = mock.Mock()
+        self.pool.setAxisPars.return_value = {}
+        self.mot01 = self._motor("mot01", self.pool)
+        self.mot02 = self._motor("mot02", self.pool)
+        # motor of a Pool not supporting the axis parameters in bulk
+        other_pool = mock.Mock()
+        other_pool.getAxisPars.side_effect = Exception("not supported")
+        other_pool.setAxisPars.side_effect = Exception("not supported")
+        self.mot03 = self._motor("mot03", other_pool)
+        self.scan = scan = CScan.__new__(CScan)
+        scan._macro = lambda: mock.Mock()
+        scan.debug = mock.Mock()
+        scan._physical_moveables = [self.mot01, self.mot02, self.mot03]
+        self.configure_motor = mock.patch.object(CScan,
+                                                 "configure_motor").start()
+        self.addCleanup(mock.patch.stopall)
+
+    def _motor(self, name, pool, range_=(0, 100)):
+        from unittest import mock
+        motor = mock.Mock()
+        motor.getType.return_value = "Motor"
+        motor.getName.return_value = name
+        motor.getPoolObj.return_value = pool
+        motor.getVelocity.return_value = 3.
+        motor.getAcceleration.return_value = 0.3
+        motor.getDeceleration.return_value = 0.4
+        attr = motor._getAttrEG.return_value.getAttribute.return_value
+        attr.getRange.return_value = range_
+        return motor
+
+    def _backup(self):
+        self.pool.getAxisPars.return_value = {
+            "mot01": {"velocity": 1., "acceleration": 0.1,
+                      "deceleration": 0.2},
+            "mot02": {"velocity": 2., "acceleration": 0.2,
+                      "deceleration": 0.3}}
+        self.scan._backup_motor()
+
+    def test_backup(self):
+        """Verify that the motors parameters are read with one call per Pool
+        and one by one for the motors of a Pool not supporting it."""
+        self._backup()
+        self.pool.getAxisPars.assert_called_once_with(
+            ["mot01", "mot02"], ("velocity", "acceleration", "deceleration"))
+        backup = [(b["moveable"], b["velocity"], b["acceleration"],
+                   b["deceleration"]) for b in self.scan._backup]
+        self.assertEqual(backup, [(self.mot01, 1., 0.1, 0.2),
+                                  (self.mot02, 2., 0.2, 0.3),
+                                  (self.mot03, 3., 0.3, 0.4)])
+        self.assertFalse(self.mot01.getVelocity.called)
+
+    def test_restore(self):
+        """Verify that the motors parameters are restored with one call per
+        Pool and one by one for the motors of a Pool not supporting it."""
+        self._backup()
+        self.scan._restore_motors()
+        self.pool.setAxisPars.assert_called_once_with(
+            {"mot01": {"velocity": 1., "acceleration": 0.1,
+                       "deceleration": 0.2},
+             "mot02": {"velocity": 2., "acceleration": 0.2,
+                       "deceleration": 0.3}})
+        self.configure_motor.assert_called_once_with(
+            self.mot03, {"velocity": 3., "acceleration": 0.3,
+                         "deceleration": 0.4})
+
+    def test_configure_fallback(self):
+        """Verify that only the motors which could not be configured in bulk
+        or which values are out of range are configured one by one."""
+        from collections import OrderedDict
+        self.pool.setAxisPars.return_value = {
+            "mot02": {"velocity": "velocity out of range"}}
+        mot04 = self._motor("mot04", self.pool, range_=(0, 1))
+        motors_attributes = OrderedDict()
+        for motor in (self.mot01, self.mot02, mot04):
+            motors_attributes[motor] = OrderedDict(velocity=5.)
+        self.scan.configure_motors(motors_attributes)
+        self.pool.setAxisPars.assert_called_once_with(
+            {"mot01": {"velocity": 5.}, "mot02": {"velocity": 5.}})
+        configured = [c[0][0] for c in self.configure_motor.call_args_list]
+        self.assertEqual(configured, [self.mot02, mot04])
@@ -167,3 +167,47 @@ class ScanDataTestCase(unittest.TestCase):
 
     def tearDown(self):
         unittest.TestCase.tearDown(self)
+
+
+class ReversedRangeTestCase(unittest.TestCase):
+    """Verify that the data acquired in the reverse order (e.g. bidirectional
+    scans) is placed so the records keep the scan order.
+    """
+
+    def setUp(self):
+        unittest.TestCase.setUp(self)
+        self.records = []
+        data_handler = DataHandler()
+        data_handler.addRecord = lambda rl, rc: self.records.append(rc)
+        env = createScanDataEnvironment(["ch1"])
+        self.scan_data = ScanData(environment=env,
+                                  data_handler=data_handler)
+        self.scan_data.start()
+
+    def test_reversed_range(self):
+        scan_data = self.scan_data
+        # first line acquired in the scan order
+        scan_data.addData({"label": "ch1", "index": [0, 1, 2],
+                           "value": [0., 1., 2.]})
+        self.assertEqual(len(self.records), 3)
+        # second line acquired backwards, in two chunks
+        scan_data.addReversedRange(3, 6)
+        self.assertEqual(scan_data.getRecordIndex(3), 5)
+        self.assertEqual(scan_data.getRecordIndex(6), 6)
+        scan_data.addData({"label": "ch1", "index": [3, 4],
+                           "value": [5., 4.]})
+        # records of the line are written once the whole line is acquired
+        self.assertEqual(len(self.records), 3)
+        scan_data.addData({"label": "ch1", "index": [5], "value": [3.]})
+        self.assertEqual(len(self.records), 6)
+        # third line acquired in the scan order again
+        scan_data.addData({"label": "ch1", "index": [6], "value": [6.]})
+        scan_data.end()
+        self.assertEqual([rc.data["ch1"] for rc in self.records],
+                         [0., 1., 2., 3., 4., 5., 6.])
+        self.assertEqual([rc.recordno for rc in self.records],
+                         list(range(7)))
+
+    def tearDown(self):
+        unittest.TestCase.tearDown(self)
+        self.scan_data = None
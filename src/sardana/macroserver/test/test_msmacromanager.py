@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import os
+import sys
+import shutil
+import tempfile
+
+from taurus.external.unittest import TestCase
+
+from sardana.sardanamodulemanager import ModuleManager
+from sardana.macroserver.macroserver import MacroServer
+from sardana.macroserver.msmetamacro import MacroClass, LazyMacroLibrary
+
+
+_MACRO_LIB_NAME = "libindex_test_macros"
+
+_MACRO_LIB_CODE = '''
+from sardana.macroserver.macro import Macro, Type
+
+
+class libindex_test_macro(Macro):
+    """Macro used to test the library index"""
+
+    param_def = [["value", Type.Integer, 1, "a value"]]
+
+    def run(self, value):
+        pass
+'''
+
+
+class MacroManagerLibraryIndexTestCase(TestCase):
+    """Tests of the incremental and lazy loading of the macro libraries"""
+
+    ms_fullname = "macroserver/demo1/1"
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.index_file_name = os.path.join(self.dir_name, "index.json")
+        self.lib_file_name = os.path.join(self.dir_name,
+                                          _MACRO_LIB_NAME + ".py")
+        with open(self.lib_file_name, "w") as f:
+            f.write(_MACRO_LIB_CODE)
+
+    def tearDown(self):
+        ModuleManager().unloadModule(_MACRO_LIB_NAME)
+        shutil.rmtree(self.dir_name)
+
+    def _create_macro_server(self):
+        name = self.ms_fullname.split("/")[1]
+        macro_server = MacroServer(self.ms_fullname, name, recorder_path=[])
+        macro_server.set_library_index(self.index_file_name)
+        macro_server.set_macro_path([self.dir_name])
+        return macro_server
+
+    def test_incremental(self):
+        macro_server = self._create_macro_server()
+        manager = macro_server.macro_manager
+        lib = manager.getMacroLib(_MACRO_LIB_NAME)
+        manager.setMacroPath([self.dir_name])
+        self.assertIs(manager.getMacroLib(_MACRO_LIB_NAME), lib)
+        with open(self.lib_file_name, "a") as f:
+            f.write("\n# changed\n")
+        manager.setMacroPath([self.dir_name])
+        self.assertIsNot(manager.getMacroLib(_MACRO_LIB_NAME), lib)
+
+    def test_lazy(self):
+        self._create_macro_server()
+        # simulate a server restart
+        ModuleManager().unloadModule(_MACRO_LIB_NAME)
+        macro_server = self._create_macro_server()
+        manager = macro_server.macro_manager
+        lib = manager.getMacroLibs()[_MACRO_LIB_NAME]
+        self.assertIsInstance(lib, LazyMacroLibrary)
+        self.assertNotIn(_MACRO_LIB_NAME, sys.modules)
+        macro = macro_server.get_macros()["libindex_test_macro"]
+        info = macro.serialize()
+        self.assertEqual(info["parameters"][0]["name"], "value")
+        self.assertNotIn(_MACRO_LIB_NAME, sys.modules)
+        macro = manager.getMacro("libindex_test_macro")
+        self.assertIsInstance(macro, MacroClass)
+        self.assertIn(_MACRO_LIB_NAME, sys.modules)
+        self.assertEqual(macro.serialize(), info)
+
+    def test_lazy_changed(self):
+        """Verify that the elements changed event is fired when a library
+        changed after its placeholder was registered."""
+        self._create_macro_server()
+        ModuleManager().unloadModule(_MACRO_LIB_NAME)
+        macro_server = self._create_macro_server()
+        events = []
+
+        def listener(src, evt_type, evt_value):
+            events.append((evt_type.name, evt_value))
+
+        macro_server.add_listener(listener)
+        manager = macro_server.macro_manager
+        manager.getMacro("libindex_test_macro")
+        self.assertEqual(events, [])
+        # index the library with one more macro
+        ModuleManager().unloadModule(_MACRO_LIB_NAME)
+        with open(self.lib_file_name, "a") as f:
+            f.write(_MACRO_LIB_CODE.replace("libindex_test_macro",
+                                            "libindex_test_macro2"))
+        self._create_macro_server()
+        ModuleManager().unloadModule(_MACRO_LIB_NAME)
+        macro_server = self._create_macro_server()
+        macro_server.add_listener(listener)
+        # remove the macro after the placeholder registration
+        with open(self.lib_file_name, "w") as f:
+            f.write(_MACRO_LIB_CODE)
+        manager = macro_server.macro_manager
+        self.assertIsInstance(manager.getMacroLibs()[_MACRO_LIB_NAME],
+                              LazyMacroLibrary)
+        manager.getMacro("libindex_test_macro")
+        self.assertEqual(len(events), 1)
+        evt_name, evt_value = events[0]
+        self.assertEqual(evt_name, "ElementsChanged")
+        self.assertEqual(evt_value["new"], [])
+        self.assertEqual([e.name for e in evt_value["change"]],
+                         [_MACRO_LIB_NAME])
+        self.assertEqual([e.name for e in evt_value["del"]],
+                         ["libindex_test_macro2"])
@@ -0,0 +1,157 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import os
+import shelve
+import shutil
+import tempfile
+
+from taurus.external import unittest
+
+from sardana.macroserver.macroserver import MacroServer
+from sardana.macroserver.msscanhistory import ScanHistoryStore
+
+
+def _entry(serialno):
+    return dict(serialno=serialno, title="ascan mot01 0 1 1 0.1",
+                ScanFile=["test.h5"], startts=1.0, endts=2.0)
+
+
+class ScanHistoryStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.dir_name, "env.scanhistory")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_name)
+
+    def test_append(self):
+        """Verify that only the most recent entries are kept in memory but
+        all of them can be found by the serial number."""
+        store = ScanHistoryStore(self.file_name, max_size=3)
+        for serialno in range(1, 6):
+            store.append(_entry(serialno))
+        history = store.get_history()
+        self.assertEqual([h["serialno"] for h in history], [3, 4, 5])
+        self.assertEqual(store.get_entry(1), _entry(1))
+        self.assertIsNone(store.get_entry(6))
+        store.close()
+
+    def test_load(self):
+        """Verify that the entries are loaded from the file and that a
+        corrupted entry is skipped."""
+        store = ScanHistoryStore(self.file_name, max_size=3)
+        for serialno in range(1, 5):
+            store.append(_entry(serialno))
+        store.close()
+        with open(self.file_name, "a") as f:
+            f.write('{"serialno": 5, "tit')
+        store = ScanHistoryStore(self.file_name, max_size=3)
+        history = store.get_history()
+        self.assertEqual([h["serialno"] for h in history], [2, 3, 4])
+        self.assertEqual(store.get_entry(1), _entry(1))
+        store.close()
+
+    def test_compact(self):
+        """Verify that the file retains only the most recent entries."""
+        store = ScanHistoryStore(self.file_name, max_size=2, max_entries=3)
+        for serialno in range(1, 6):
+            store.append(_entry(serialno))
+        # not compacted yet
+        self.assertEqual(store.get_entry(1), _entry(1))
+        store.append(_entry(6))
+        self.assertIsNone(store.get_entry(3))
+        self.assertEqual(store.get_entry(4), _entry(4))
+        store.append(_entry(7))
+        self.assertEqual(store.get_entry(4), _entry(4))
+        store.close()
+        with open(self.file_name) as f:
+            self.assertEqual(len(f.readlines()), 4)
+        store = ScanHistoryStore(self.file_name, max_size=2, max_entries=3)
+        history = store.get_history()
+        self.assertEqual([h["serialno"] for h in history], [6, 7])
+        self.assertEqual(store.get_entry(5), _entry(5))
+        store.close()
+
+    def test_reset(self):
+        store = ScanHistoryStore(self.file_name)
+        store.append(_entry(1))
+        store.reset([_entry(2)])
+        self.assertEqual(store.get_history(), [_entry(2)])
+        self.assertIsNone(store.get_entry(1))
+        store.close()
+
+
+class ScanHistoryEnvironmentTestCase(unittest.TestCase):
+    """Tests of the ScanHistory environment variable"""
+
+    ms_fullname = "macroserver/demo1/1"
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.env_db = os.path.join(self.dir_name, "env")
+
+    def tearDown(self):
+        self.macro_server.environment_manager.cleanUp()
+        shutil.rmtree(self.dir_name)
+
+    def _create_macro_server(self):
+        name = self.ms_fullname.split("/")[1]
+        self.macro_server = MacroServer(self.ms_fullname, name,
+                                        macro_path=[], recorder_path=[],
+                                        environment_db=self.env_db)
+        return self.macro_server
+
+    def test_add_scan_history(self):
+        ms = self._create_macro_server()
+        self.assertFalse(ms.has_env("ScanHistory"))
+        for serialno in range(1, 4):
+            ms.add_scan_history(_entry(serialno), max_size=2)
+        self.assertEqual(ms.get_env("ScanHistory"), [_entry(2), _entry(3)])
+        self.assertEqual(ms.get_env()["ScanHistory"], [_entry(2), _entry(3)])
+        self.assertEqual(ms.get_scan_history(1), _entry(1))
+        ms.unset_env("ScanHistory")
+        self.assertFalse(ms.has_env("ScanHistory"))
+        self.assertIsNone(ms.get_scan_history(1))
+
+    def test_add_scan_history_cleaned_up(self):
+        """Verify that a scan finishing after the environment clean up does
+        not fail."""
+        env_man = self._create_macro_server().environment_manager
+        env_man._clearEnv()
+        history = env_man.addScanHistory(_entry(1))
+        self.assertEqual(history, [_entry(1)])
+
+    def test_migration(self):
+        """Verify that the scan history stored in the environment db by the
+        previous versions is moved to the scan history store."""
+        env = shelve.open(self.env_db)
+        env["ScanHistory"] = [_entry(1), _entry(2)]
+        env["ScanID"] = 2
+        env.close()
+        ms = self._create_macro_server()
+        self.assertEqual(ms.get_env("ScanHistory"), [_entry(1), _entry(2)])
+        self.assertEqual(ms.get_env("ScanID"), 2)
+        env_man = ms.environment_manager
+        self.assertNotIn("ScanHistory", env_man._env)
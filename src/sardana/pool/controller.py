@@ -29,7 +29,7 @@ __all__ = ["DataAccess", "SardanaValue", "Type", "Access", "Description",
            "DefaultValue", "FGet", "FSet",
            "Memorized", "MemorizedNoInit", "NotMemorized", "MaxDimSize",
            "Controller", "Readable", "Startable", "Stopable", "Loadable",
-           "Referable", "Synchronizer",
+           "Referable", "Synchronizer", "StateNotifier",
            "MotorController", "CounterTimerController", "ZeroDController",
            "OneDController", "TwoDController", "TriggerGateController",
            "PseudoMotorController", "PseudoCounterController",
@@ -428,6 +428,42 @@ class Controller(object):
         .. versionadded:: 1.0"""
         return self.GetPar(axis, parameter)
 
+    def SetAxisPars(self, axes_pars):
+        """**Controller API**. Override if necessary.
+        Called to set several parameters of several axes at once e.g. when
+        configuring the motors of a continuous scan. Default implementation
+        calls :meth:`~Controller.SetAxisPar` for each axis and parameter, in
+        the given order. Override it if the hardware allows to set them
+        more efficiently.
+
+        :param axes_pars: map where keys are axes and values are maps of
+                          parameter names and values
+        :type axes_pars: dict<int, dict<str, object>>"""
+        for axis, pars in axes_pars.items():
+            for parameter, value in pars.items():
+                self.SetAxisPar(axis, parameter, value)
+
+    def GetAxisPars(self, axes, parameters):
+        """**Controller API**. Override if necessary.
+        Called to get several parameters of several axes at once. Default
+        implementation calls :meth:`~Controller.GetAxisPar` for each axis and
+        parameter. Override it if the hardware allows to get them more
+        efficiently.
+
+        :param axes: sequence of axes
+        :type axes: seq<int>
+        :param parameters: sequence of parameter names
+        :type parameters: seq<str>
+        :return: map where keys are axes and values are maps of parameter
+                 names and values
+        :rtype: dict<int, dict<str, object>>"""
+        ret = {}
+        for axis in axes:
+            ret[axis] = pars = {}
+            for parameter in parameters:
+                pars[parameter] = self.GetAxisPar(axis, parameter)
+        return ret
+
     def SetAxisExtraPar(self, axis, parameter, value):
         """**Controller API**. Override if necessary.
         Called to set a parameter with a value on the given axis. Default
@@ -744,6 +780,30 @@ class Referable(object):
         raise NotImplementedError("RefOne must be defined in the controller")
 
 
+class StateNotifier(object):
+    """A StateNotifier interface. A controller which is able to detect when
+    its axes change state (e.g. a motion or an acquisition finishes) should
+    implement this interface and call
+    :meth:`~StateNotifier.NotifyStateChange` so the Pool actions can react
+    immediately instead of waiting for the next state poll. Polling remains
+    active as a fallback.
+
+    .. note::
+        The StateNotifier class has been included in Sardana on a provisional
+        basis. Backwards incompatible changes (up to and including removal
+        of the class) may occur if deemed necessary by the core developers.
+    """
+
+    def NotifyStateChange(self, axis):
+        """**Controller API**. Call it (from any thread) whenever the given
+        axis changes its state, in particular when it reaches a final state.
+        Do **NOT** override it.
+
+        :param int axis: axis number
+        """
+        self._getPoolController().notify_state_change(axis)
+
+
 class Synchronizer(object):
     """A Synchronizer interface. A controller for which its axis are 'Able to
     Synchronize' should implement this interface
@@ -1217,7 +1277,10 @@ class PseudoMotorController(PseudoController):
     - optional:
         - write :meth:`~PseudoMotorController.CalcAllPseudo` and
           :meth:`~PseudoMotorController.CalcAllPhysical` if great performance
-          gain can be achived"""
+          gain can be achived
+        - write :meth:`~PseudoMotorController.CalcAllPseudoBulk` and
+          :meth:`~PseudoMotorController.CalcAllPhysicalBulk` if the
+          calculation can be vectorized over many points e.g. trajectories"""
 
     #: a sequence of strings describing the role of each pseudo motor axis in
     #: this controller
@@ -1286,6 +1349,57 @@ class PseudoMotorController(PseudoController):
             ret.append(pos)
         return ret
 
+    def CalcAllPseudoBulk(self, physical_pos, curr_pseudo_pos):
+        """**Pseudo Motor Controller API**. Override if necessary.
+           Calculates the positions of all pseudo motors for a sequence of
+           physical motor positions e.g. a trajectory.
+           Default implementation does a loop calling
+           :meth:`PseudoMotorController.CalcAllPseudo` for each point. The
+           pseudo positions calculated for one point are passed as the current
+           pseudo positions for the next one.
+
+           :param sequence<sequence<float>> physical_pos: a sequence of
+                                                          physical motor
+                                                          positions (one
+                                                          sequence per point)
+           :param sequence<float> curr_pseudo_pos: a sequence containing the
+                                                   current pseudo motor
+                                                   positions
+           :return: a sequence of pseudo motor positions (one sequence per
+                    point, each with one position for each pseudo motor role)
+           :rtype: sequence<sequence<float>>"""
+        ret = []
+        for point_physical_pos in physical_pos:
+            curr_pseudo_pos = self.CalcAllPseudo(point_physical_pos,
+                                                 curr_pseudo_pos)
+            ret.append(curr_pseudo_pos)
+        return ret
+
+    def CalcAllPhysicalBulk(self, pseudo_pos, curr_physical_pos):
+        """**Pseudo Motor Controller API**. Override if necessary.
+           Calculates the positions of all motors for a sequence of pseudo
+           motor positions e.g. a trajectory.
+           Default implementation does a loop calling
+           :meth:`PseudoMotorController.CalcAllPhysical` for each point. The
+           physical positions calculated for one point are passed as the
+           current physical positions for the next one.
+
+           :param sequence<sequence<float>> pseudo_pos: a sequence of pseudo
+                                                        motor positions (one
+                                                        sequence per point)
+           :param sequence<float> curr_physical_pos: a sequence containing the
+                                                     current physical motor
+                                                     positions
+           :return: a sequence of motor positions (one sequence per point,
+                    each with one position for each motor role)
+           :rtype: sequence<sequence<float>>"""
+        ret = []
+        for point_pseudo_pos in pseudo_pos:
+            curr_physical_pos = self.CalcAllPhysical(point_pseudo_pos,
+                                                     curr_physical_pos)
+            ret.append(curr_physical_pos)
+        return ret
+
     def CalcPseudo(self, axis, physical_pos, curr_pseudo_pos):
         """**Pseudo Motor Controller API**. Override is **MANDATORY**.
            Calculate pseudo motor position given the physical motor positions
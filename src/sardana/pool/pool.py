@@ -115,6 +115,25 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
 
     Default_DriftCorrection = True
 
+    #: Default value representing if the controllers are started (and
+    #: stopped) concurrently
+    Default_ParallelCtrlStart = False
+
+    #: Default value representing the time (s) during which the concurrent
+    #: hardware reads of the idle elements of a controller are collected
+    #: in order to do a single read (0 means no coalescing)
+    Default_ReadCoalesceWindow = 0
+
+    #: Default value representing the time (s) during which the hardware
+    #: reads of the idle elements are served from the cache (0 means no
+    #: cache)
+    Default_ReadCacheTTL = 0
+
+    #: axis parameters which value is cached by the elements (and
+    #: propagated as events) when set or get in bulk
+    CachedAxisPars = ("velocity", "acceleration", "deceleration",
+                      "base_rate", "step_per_unit")
+
     def __init__(self, full_name, name=None):
         self._path_id = None
         self._motion_loop_states_per_position = self.Default_MotionLoop_StatesPerPosition
@@ -122,6 +141,9 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
         self._acq_loop_states_per_value = self.Default_AcqLoop_StatesPerValue
         self._acq_loop_sleep_time = self.Default_AcqLoop_SleepTime
         self._drift_correction = self.Default_DriftCorrection
+        self._parallel_ctrl_start = self.Default_ParallelCtrlStart
+        self._read_coalesce_window = self.Default_ReadCoalesceWindow
+        self._read_cache_ttl = self.Default_ReadCacheTTL
         self._remote_log_handler = None
 
         # dict<str, dict<str, str>>
@@ -262,6 +284,39 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
                                 set_drift_correction,
                                 doc="drift correction")
 
+    def set_parallel_ctrl_start(self, parallel_ctrl_start):
+        self._parallel_ctrl_start = parallel_ctrl_start
+
+    def get_parallel_ctrl_start(self):
+        return self._parallel_ctrl_start
+
+    parallel_ctrl_start = property(get_parallel_ctrl_start,
+                                   set_parallel_ctrl_start,
+                                   doc="start (and stop) controllers "
+                                       "concurrently")
+
+    def set_read_coalesce_window(self, read_coalesce_window):
+        self._read_coalesce_window = read_coalesce_window
+
+    def get_read_coalesce_window(self):
+        return self._read_coalesce_window
+
+    read_coalesce_window = property(get_read_coalesce_window,
+                                    set_read_coalesce_window,
+                                    doc="time (s) during which the concurrent "
+                                        "reads of idle elements are merged")
+
+    def set_read_cache_ttl(self, read_cache_ttl):
+        self._read_cache_ttl = read_cache_ttl
+
+    def get_read_cache_ttl(self):
+        return self._read_cache_ttl
+
+    read_cache_ttl = property(get_read_cache_ttl,
+                              set_read_cache_ttl,
+                              doc="time (s) during which the reads of idle "
+                                  "elements are served from the cache")
+
     @property
     def monitor(self):
         return self._monitor
@@ -276,6 +331,9 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
             mod_man.remove_python_path(self._path_id)
         self._path_id = mod_man.add_python_path(path)
 
+    def set_library_index(self, file_name):
+        self.ctrl_manager.setLibraryIndex(file_name)
+
     def set_path(self, path):
         self.ctrl_manager.setControllerPath(path, reload=False)
 
@@ -657,6 +715,70 @@ class Pool(PoolContainer, PoolObject, SardanaElementManager, SardanaIDManager):
             msg_init = "Elements which could not be aborted:\n"
             raise Exception(msg_init + msg)
 
+    def get_elements_pars(self, elements, names):
+        """Gets axis parameters (e.g. velocity, acceleration) of multiple
+        elements with one call per controller. The cached values of the
+        elements are updated.
+
+        :param elements: sequence of elements
+        :type elements: seq<:class:`~sardana.pool.poolelement.PoolElement`>
+        :param names: sequence of parameter names
+        :type names: seq<str>
+        :return: map where keys are elements and values are maps of
+                 parameter names and values
+        :rtype: dict<PoolElement, dict<str, object>>"""
+        ctrl_elements = {}
+        for element in elements:
+            ctrl_elements.setdefault(element.controller, []).append(element)
+        ret = {}
+        for ctrl, ctrl_elems in ctrl_elements.items():
+            axes = [element.axis for element in ctrl_elems]
+            axes_pars = ctrl.get_axes_pars(axes, names)
+            for element in ctrl_elems:
+                ret[element] = pars = axes_pars[element.axis]
+                for name, value in pars.items():
+                    self._cache_element_par(element, name, value)
+        return ret
+
+    def set_elements_pars(self, elements_pars):
+        """Sets axis parameters (e.g. velocity, acceleration) of multiple
+        elements with one call per controller. The cached values of the
+        elements are updated. The parameters of an element are set in the
+        given order.
+
+        :param elements_pars: map where keys are elements and values are
+                              maps of parameter names and values
+        :type elements_pars: dict<PoolElement, dict<str, object>>
+        :return: parameters that could not be set (the rest of them are set
+                 anyway) together with the exception information
+        :rtype: list<tuple(PoolElement, str, object, exc_info)>"""
+        ctrl_pars = {}
+        for element, pars in elements_pars.items():
+            axes_pars = ctrl_pars.setdefault(element.controller, [])
+            for name, value in pars.items():
+                axes_pars.append((element.axis, name, value))
+        ret = []
+        for ctrl, axes_pars in ctrl_pars.items():
+            errors = ctrl.set_axes_pars(axes_pars)
+            failed = set()
+            for axis, name, value, exc_info in errors:
+                element = ctrl.get_element(axis=axis)
+                failed.add((axis, name))
+                ret.append((element, name, value, exc_info))
+            for axis, name, value in axes_pars:
+                if (axis, name) in failed:
+                    continue
+                element = ctrl.get_element(axis=axis)
+                self._cache_element_par(element, name, value)
+        return ret
+
+    def _cache_element_par(self, element, name, value):
+        if name.lower() not in self.CachedAxisPars:
+            return
+        cache = getattr(element, "_set_" + name.lower(), None)
+        if cache is not None:
+            cache(value)
+
     # --------------------------------------------------------------------------
     # (Re)load code
     # --------------------------------------------------------------------------
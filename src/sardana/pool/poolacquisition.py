@@ -439,12 +439,9 @@ class PoolAcquisition(PoolAction):
         self._synch_args = ActionArgs(synch_args, synch_kwargs)
 
         # Load the configuration to the timerable controllers
-        # TODO: apply the configuration only if necessary
-        # Checking only the "changed" flag is not enough, one needs to check
-        # if the controllers were not used with different measurement groups
-        # configurations meanwhile (see: sardana-org/sardana#1171) in this
-        # case the configuration must be applied even if it was not changed
-        # if config.changed:
+        # The controllers keep a fingerprint of the parameters already set
+        # (by any measurement group or channel, see: sardana-org/sardana#1171)
+        # so only the parameters which changed are applied
         ctrls = ctrls_hw + ctrls_sw_start + ctrls_sw
 
         for ctrl in ctrls:
@@ -452,23 +449,23 @@ class PoolAcquisition(PoolAction):
             if not pool_ctrl.is_online():
                 raise RuntimeError('The controller {0} is '
                                    'offline'.format(pool_ctrl.name))
-            pool_ctrl.set_ctrl_par('acquisition_mode', acq_mode)
+            pool_ctrl.update_ctrl_par('acquisition_mode', acq_mode)
             pool_ctrl.operator = self.main_element
-            pool_ctrl.set_ctrl_par('timer', ctrl.timer.axis)
-            pool_ctrl.set_ctrl_par('monitor', ctrl.monitor.axis)
+            pool_ctrl.update_ctrl_par('timer', ctrl.timer.axis)
+            pool_ctrl.update_ctrl_par('monitor', ctrl.monitor.axis)
             synch = config.get_acq_synch_by_controller(pool_ctrl)
-            pool_ctrl.set_ctrl_par('synchronization', synch)
+            pool_ctrl.update_ctrl_par('synchronization', synch)
 
             if ctrl.is_referable():
                 for channel in ctrl.get_channels():
                     value_ref_enabled = channel.value_ref_enabled
-                    pool_ctrl.set_axis_par(channel.axis,
-                                           "value_ref_enabled",
-                                           value_ref_enabled)
+                    pool_ctrl.update_axis_par(channel.axis,
+                                              "value_ref_enabled",
+                                              value_ref_enabled)
                     if value_ref_enabled:
-                        pool_ctrl.set_axis_par(channel.axis,
-                                               "value_ref_pattern",
-                                               channel.value_ref_pattern)
+                        pool_ctrl.update_axis_par(channel.axis,
+                                                  "value_ref_pattern",
+                                                  channel.value_ref_pattern)
 
         config.changed = False
 
@@ -620,6 +617,21 @@ class PoolAcquisition(PoolAction):
         ret.update(self._0d_acq.get_pool_controllers())
         return ret
 
+    def get_start_skew(self):
+        """Returns the maximum skew between the first and the last controller
+        started by any of the sub-actions during the last acquisition.
+
+        :return: skew (in seconds) or None if it was not measured
+        :rtype: float"""
+        skews = [action.get_start_skew() for action in (self._hw_acq,
+                                                        self._sw_acq,
+                                                        self._sw_start_acq,
+                                                        self._synch)]
+        skews = [skew for skew in skews if skew is not None]
+        if len(skews) == 0:
+            return None
+        return max(skews)
+
     def read_value(self, ret=None, serial=False):
         """Reads value information of all elements involved in this action
 
@@ -854,11 +866,60 @@ class PoolAcquisitionBase(PoolAction):
                     self.warning(msg)
             ctrl.LoadAll()
 
+        def load_ctrl(ctrl):
+            # TODO find solution for master now sardana only use timer
+            load(ctrl.timer, value, repetitions, latency)
+
+        def pre_start_all(ctrl):
+            pool_ctrl = ctrl.element
+            pool_ctrl.ctrl.PreStartAll()
+
+        ctrl_channels = {}
+
+        def start_one(ctrl):
+            channels = ctrl.get_channels(enabled=True)
+            started = ctrl_channels[ctrl] = []
+            # make sure that the master timer/monitor is started as the
+            # last one
+            channels.remove(ctrl.master)
+            channels.append(ctrl.master)
+            for channel in channels:
+                axis = channel.axis
+                pool_ctrl = ctrl.element
+                ret = pool_ctrl.ctrl.PreStartOne(axis, value)
+                if not ret:
+                    msg = ("%s.PreStartOne(%d) returns False" %
+                           (ctrl.name, axis))
+                    raise Exception(msg)
+                try:
+                    pool_ctrl = ctrl.element
+                    pool_ctrl.ctrl.StartOne(axis, value)
+                except Exception as e:
+                    self.debug(e, exc_info=True)
+                    channel.set_state(State.Fault, propagate=2)
+                    msg = ("%s.StartOne(%d) failed" %
+                           (ctrl.name, axis))
+                    raise Exception(msg)
+                started.append(channel)
+
+        start_times = []
+
+        def start_all(ctrl):
+            try:
+                pool_ctrl = ctrl.element
+                start_times.append(time.time())
+                pool_ctrl.ctrl.StartAll()
+            except Exception as e:
+                channels = ctrl.get_channels(enabled=True)
+                self.debug(e, exc_info=True)
+                for channel in channels:
+                    channel.set_state(State.Fault, propagate=2)
+                msg = ("%s.StartAll() failed" % ctrl.name)
+                raise Exception(msg)
+
         with ActionContext(self):
             # PreLoadAll, PreLoadOne, LoadOne and LoadAll
-            for ctrl in ctrls:
-                # TODO find solution for master now sardana only use timer
-                load(ctrl.timer, value, repetitions, latency)
+            self.for_each_ctrl(load_ctrl, ctrls)
 
             # TODO: remove when the action allows to use tango attributes
             try:
@@ -867,54 +928,27 @@ class PoolAcquisitionBase(PoolAction):
                 pass
 
             # PreStartAll on all enabled controllers
-            for ctrl in ctrls:
-                pool_ctrl = ctrl.element
-                pool_ctrl.ctrl.PreStartAll()
+            self.for_each_ctrl(pre_start_all, ctrls)
 
             # PreStartOne & StartOne on all enabled elements
-            for ctrl in ctrls:
-                channels = ctrl.get_channels(enabled=True)
-
-                # make sure that the master timer/monitor is started as the
-                # last one
-                channels.remove(ctrl.master)
-                channels.append(ctrl.master)
-                for channel in channels:
-                    axis = channel.axis
-                    pool_ctrl = ctrl.element
-                    ret = pool_ctrl.ctrl.PreStartOne(axis, value)
-                    if not ret:
-                        msg = ("%s.PreStartOne(%d) returns False" %
-                               (ctrl.name, axis))
-                        raise Exception(msg)
-                    try:
-                        pool_ctrl = ctrl.element
-                        pool_ctrl.ctrl.StartOne(axis, value)
-                    except Exception as e:
-                        self.debug(e, exc_info=True)
-                        channel.set_state(State.Fault, propagate=2)
-                        msg = ("%s.StartOne(%d) failed" %
-                               (ctrl.name, axis))
-                        raise Exception(msg)
-
-                    self._channels.append(channel)
+            try:
+                self.for_each_ctrl(start_one, ctrls)
+            finally:
+                for ctrl in ctrls:
+                    self._channels.extend(ctrl_channels.get(ctrl, []))
 
             # set the state of all elements to  and inform their listeners
             for channel in self._channels:
                 channel.set_state(State.Moving, propagate=2)
 
-            # StartAll on all enabled controllers
-            for ctrl in ctrls:
-                try:
-                    pool_ctrl = ctrl.element
-                    pool_ctrl.ctrl.StartAll()
-                except Exception as e:
-                    channels = ctrl.get_channels(enabled=True)
-                    self.debug(e, exc_info=True)
-                    for channel in channels:
-                        channel.set_state(State.Fault, propagate=2)
-                    msg = ("%s.StartAll() failed" % ctrl.name)
-                    raise Exception(msg)
+            # StartAll on all enabled controllers, the one with the master
+            # channel is started after all the others
+            if master is not None:
+                self.for_each_ctrl(start_all, ctrls[:-1])
+                start_all(ctrls[-1])
+            else:
+                self.for_each_ctrl(start_all, ctrls)
+            self._set_start_times(start_times)
 
     def _set_pool_ctrl_dict_loop(self, ctrls):
         ctrl_channels = {}
@@ -1026,7 +1060,7 @@ class PoolAcquisitionHardware(PoolAcquisitionBase):
                     else:
                         acquirable.extend_value_buffer(value)
 
-            time.sleep(nap)
+            self.wait_state_change(nap)
             i += 1
 
         with ActionContext(self):
@@ -1128,7 +1162,7 @@ class PoolAcquisitionSoftware(PoolAcquisitionBase):
                 for acquirable, value in list(values.items()):
                     acquirable.put_value(value)
 
-            time.sleep(nap)
+            self.wait_state_change(nap)
             i += 1
 
         for slave in self._slaves:
@@ -1242,7 +1276,7 @@ class PoolAcquisitionSoftwareStart(PoolAcquisitionBase):
                         acquirable.put_value_ref(value)
                     else:
                         acquirable.extend_value_ref_buffer(value_ref)
-            time.sleep(nap)
+            self.wait_state_change(nap)
             i += 1
 
         with ActionContext(self):
@@ -1341,7 +1375,7 @@ class PoolCTAcquisition(PoolAcquisitionBase):
                 for acquirable, value in list(values.items()):
                     acquirable.put_value(value)
 
-            time.sleep(nap)
+            self.wait_state_change(nap)
             i += 1
 
         for slave in self._slaves:
@@ -1371,6 +1405,10 @@ class PoolCTAcquisition(PoolAcquisitionBase):
 
 class Pool0DAcquisition(PoolAction):
 
+    #: maximum time (in seconds) the samples read in the acquisition loop
+    #: are kept before being accumulated in block
+    BlockTime = 0.1
+
     def __init__(self, main_element, name="0DAcquisition"):
         self._channels = None
         self._index = None
@@ -1432,14 +1470,40 @@ class Pool0DAcquisition(PoolAction):
             states[element] = None
             values[element] = None
 
+        # samples are kept in lists and accumulated in blocks so the
+        # accumulation is calculated with vectorized reductions
+        blocks = {}
+        for element in values:
+            blocks[element] = [], []
+
+        def put_blocks():
+            for acquirable, (block_values, block_timestamps) in \
+                    blocks.items():
+                if len(block_values) == 0:
+                    continue
+                acquirable.put_current_value_block(
+                    block_values, block_timestamps, values[acquirable],
+                    propagate=0)
+                del block_values[:]
+                del block_timestamps[:]
+
         nap = self._acq_sleep_time
+        block_time = self.BlockTime
+        block_start = time.time()
         while True:
             self.read_value(ret=values)
-            for acquirable, value in list(values.items()):
-                acquirable.put_current_value(value, propagate=0)
+            for acquirable, value in values.items():
+                block_values, block_timestamps = blocks[acquirable]
+                block_values.append(value.value)
+                block_timestamps.append(value.timestamp)
             if self._stopped or self._aborted:
                 break
-            time.sleep(nap)
+            now = time.time()
+            if now - block_start >= block_time:
+                put_blocks()
+                block_start = now
+            self.wait_state_change(nap)
+        put_blocks()
 
         for element in self._channels:
             value = element.accumulated_value.value_obj
@@ -32,6 +32,7 @@ __all__ = ["PoolActionItem", "OperationInfo", "ActionContext", "PoolAction",
 __docformat__ = 'restructuredtext'
 
 import sys
+import time
 import weakref
 import traceback
 import threading
@@ -213,6 +214,9 @@ class PoolAction(Logger):
         self._running = False
         self._state_info = OperationInfo()
         self._value_info = OperationInfo()
+        self._state_change_event = threading.Event()
+        self._state_notifier_ctrls = []
+        self._start_skew = None
 
     def get_main_element(self):
         """Returns the main element for this action
@@ -343,7 +347,11 @@ class PoolAction(Logger):
                 with OperationContext(self) as context:
                     self.start_action(*args, **kwargs)
                     self._started = False
-                    self.action_loop()
+                    self._connect_state_notifiers()
+                    try:
+                        self.action_loop()
+                    finally:
+                        self._disconnect_state_notifiers()
             finally:
                 self._started = False
                 self._running = False
@@ -410,21 +418,96 @@ class PoolAction(Logger):
     def stop_action(self, *args, **kwargs):
         """Stop procedure for this action."""
         self._stopped = True
-        for pool_ctrl, elements in list(self._pool_ctrl_dict.items()):
+
+        def stop(item):
+            pool_ctrl, elements = item
             pool_ctrl.stop_elements(elements)
 
+        self.for_each_ctrl(stop, list(self._pool_ctrl_dict.items()))
+
     def abort_action(self, *args, **kwargs):
         """Aborts procedure for this action"""
         self._aborted = True
-        for pool_ctrl, elements in list(self._pool_ctrl_dict.items()):
+
+        def abort(item):
+            pool_ctrl, elements = item
             pool_ctrl.abort_elements(elements)
 
+        self.for_each_ctrl(abort, list(self._pool_ctrl_dict.items()))
+
     def emergency_break(self):
         """Tries to execute a stop. If it fails try an abort"""
         self._stopped = True
-        for pool_ctrl, elements in list(self._pool_ctrl_dict.items()):
+
+        def emergency_break(item):
+            pool_ctrl, elements = item
             pool_ctrl.emergency_break(elements)
 
+        self.for_each_ctrl(emergency_break,
+                           list(self._pool_ctrl_dict.items()))
+
+    def is_parallel_ctrl_start(self):
+        """Determines if the controllers are started (and stopped)
+        concurrently. It is configured globally in the pool.
+
+        :return: True if controllers are started concurrently
+        :rtype: bool"""
+        return self.pool.parallel_ctrl_start
+
+    def for_each_ctrl(self, func, ctrls):
+        """Executes func for each of the given controllers. If the
+        parallel controller start is enabled, executes them concurrently and
+        returns when all of them finished, so consecutive calls act as
+        phases separated by a barrier. Otherwise executes them serially in
+        the given order.
+
+        :param func: callable receiving one controller
+        :type func: callable
+        :param ctrls: controllers (or any other per controller objects)
+        :type ctrls: seq
+        :raises: the first exception raised by func"""
+        if len(ctrls) < 2 or not self.is_parallel_ctrl_start():
+            for ctrl in ctrls:
+                func(ctrl)
+            return
+        errors = []
+        phase_info = OperationInfo()
+
+        def run(ctrl):
+            try:
+                func(ctrl)
+            except Exception:
+                errors.append(sys.exc_info())
+            finally:
+                phase_info.finish_one()
+
+        th_pool = get_thread_pool()
+        with phase_info:
+            phase_info.init(len(ctrls))
+            for ctrl in ctrls:
+                th_pool.add(run, None, ctrl)
+            phase_info.wait()
+        if errors:
+            _, exc_value, _ = errors[0]
+            raise exc_value
+
+    def get_start_skew(self):
+        """Returns the skew between the first and the last controller
+        started (StartAll) during the last start of this action.
+
+        :return: skew (in seconds) or None if it was not measured
+        :rtype: float"""
+        return self._start_skew
+
+    def _set_start_times(self, start_times):
+        """Internal method. Calculates the start skew from the start time of
+        each controller"""
+        if len(start_times) == 0:
+            self._start_skew = None
+            return
+        self._start_skew = max(start_times) - min(start_times)
+        self.debug("Controllers start skew: %f s", self._start_skew)
+
     def was_stopped(self):
         """Determines if the action has been stopped from outside
 
@@ -450,12 +533,50 @@ class PoolAction(Logger):
 
     def _asynch_action_loop(self, context):
         """Internal method. Asynchronous action loop"""
+        self._connect_state_notifiers()
         try:
             self.action_loop()
         finally:
+            self._disconnect_state_notifiers()
             context.exit()
             self._running = False
 
+    def _connect_state_notifiers(self):
+        """Internal method. Subscribes to the state change notifications of
+        the controllers involved in this action which support them"""
+        self._state_change_event.clear()
+        ctrls = [pool_ctrl for pool_ctrl in self._pool_ctrl_dict
+                 if pool_ctrl.is_state_notifier()]
+        for pool_ctrl in ctrls:
+            pool_ctrl.add_state_change_event(self._state_change_event)
+        self._state_notifier_ctrls = ctrls
+
+    def _disconnect_state_notifiers(self):
+        """Internal method. Unsubscribes from the state change notifications
+        of the controllers"""
+        for pool_ctrl in self._state_notifier_ctrls:
+            pool_ctrl.remove_state_change_event(self._state_change_event)
+        self._state_notifier_ctrls = []
+
+    def wait_state_change(self, timeout):
+        """Waits until any of the controllers involved in this action notifies
+        a state change or until the timeout expires, whatever happens first.
+        If none of the controllers notifies state changes it simply sleeps
+        for the timeout.
+
+        :param timeout: maximum time to wait (in seconds)
+        :type timeout: float
+        :return: True if a state change was notified or False otherwise
+        :rtype: bool"""
+        if not self._state_notifier_ctrls:
+            time.sleep(timeout)
+            return False
+        event = self._state_change_event
+        notified = event.wait(timeout)
+        if notified:
+            event.clear()
+        return notified
+
     def action_loop(self):
         """Action loop for this action. Default implementation raises
         NotImplementedError
@@ -239,6 +239,9 @@ class PoolBaseChannel(PoolElement):
             value
         :rtype:
             :class:`~sardana.sardanavalue.SardanaValue`"""
+        coalescer = self.get_read_coalescer()
+        if coalescer is not None:
+            return coalescer.read_value(self)
         return self.acquisition.read_value()[self]
 
     def put_value(self, value, propagate=1):
@@ -47,8 +47,9 @@ from sardana.sardanautils import is_non_str_seq, is_number
 
 from sardana.pool.poolextension import translate_ctrl_value
 from sardana.pool.poolbaseelement import PoolBaseElement
-from sardana.pool.controller import Referable, Access, DataAccess,\
-    Description, Type
+from sardana.pool.poolreadcoalescer import PoolReadCoalescer
+from sardana.pool.controller import Controller, Referable, StateNotifier, \
+    Access, DataAccess, Description, Type
 
 
 class PoolBaseController(PoolBaseElement):
@@ -64,6 +65,7 @@ class PoolBaseController(PoolBaseElement):
         self._element_names = CaselessDict()
         self._pending_element_names = CaselessDict()
         self._operator = None
+        self._state_change_events = set()
         kwargs['elem_type'] = ElementType.Controller
         super(PoolBaseController, self).__init__(**kwargs)
 
@@ -224,6 +226,39 @@ class PoolBaseController(PoolBaseElement):
         """
         raise NotImplementedError
 
+    def is_state_notifier(self):
+        """Determines if the controller notifies about the state changes
+        of its axes.
+
+        :return: True if controller notifies state changes
+        :rtype: bool"""
+        return False
+
+    def add_state_change_event(self, event):
+        """Registers an event which will be set whenever the controller
+        notifies a state change of any of its axes.
+
+        :param event: event to be set on state change notifications
+        :type event: :class:`threading.Event`"""
+        self._state_change_events.add(event)
+
+    def remove_state_change_event(self, event):
+        """Unregisters an event previously registered with
+        :meth:`add_state_change_event`.
+
+        :param event: event to be unregistered
+        :type event: :class:`threading.Event`"""
+        self._state_change_events.discard(event)
+
+    def notify_state_change(self, axis):
+        """Notifies that the given axis changed its state. Called by the
+        controller plugin (may be called from any thread).
+
+        :param axis: axis number
+        :type axis: int"""
+        for event in list(self._state_change_events):
+            event.set()
+
     def get_status(self, cache=True, propagate=1):
         """Returns the status for this object. If cache is True (default) it
         returns the current status stored in cache (it will force an update if
@@ -293,6 +328,12 @@ class PoolController(PoolBaseController):
         self._lib_name = kwargs.pop('library')
         self._class_name = kwargs.pop('klass')
         self._properties = kwargs.pop('properties')
+        self._read_coalescer = None
+        # fingerprint of the controller and axis parameters set so far
+        # dict<str or tuple(int, str), object>
+        # key - parameter name or (axis, parameter name)
+        # value - last value set
+        self._applied_pars = {}
         super(PoolController, self).__init__(**kwargs)
         self.re_init()
 
@@ -340,6 +381,8 @@ class PoolController(PoolBaseController):
         return ctrl
 
     def _init(self):
+        # a new controller object does not have any parameter set
+        self._applied_pars.clear()
         if self._ctrl_info is None:
             if self._lib_info is not None:
                 self._ctrl_error = self._lib_info.get_error()
@@ -405,12 +448,27 @@ class PoolController(PoolBaseController):
     def is_referable(self):
         return isinstance(self.ctrl, Referable)
 
+    def is_state_notifier(self):
+        return isinstance(self.ctrl, StateNotifier)
+
     def is_pseudo(self):
         for t in self._ctrl_info.types:
             if t in TYPE_PSEUDO_ELEMENTS:
                 return True
         return False
 
+    def get_read_coalescer(self):
+        """Returns the object merging the concurrent hardware reads of the
+        idle elements of this controller
+
+        :return: the read coalescer
+        :rtype: :class:`~sardana.pool.poolreadcoalescer.PoolReadCoalescer`"""
+        if self._read_coalescer is None:
+            self._read_coalescer = PoolReadCoalescer(self)
+        return self._read_coalescer
+
+    read_coalescer = property(get_read_coalescer)
+
     def is_online(self):
         return self._ctrl_error is None and self._ctrl is not None
 
@@ -419,6 +477,7 @@ class PoolController(PoolBaseController):
 
     def set_ctrl(self, ctrl):
         self._ctrl = ctrl
+        self._applied_pars.clear()
 
     ctrl = property(fget=get_ctrl, fset=set_ctrl,
                     doc="actual controller object")
@@ -496,6 +555,9 @@ class PoolController(PoolBaseController):
     def set_ctrl_attr(self, name, value):
         ctrl_info = self.ctrl_info
         attr_info = ctrl_info.ctrl_attributes[name]
+        # the attribute may be the same as a parameter set with
+        # update_ctrl_par, in any case its value is unknown from now on
+        self._applied_pars.pop(name, None)
         if hasattr(self.ctrl, attr_info.fset):
             return getattr(self.ctrl, attr_info.fset)(value)
         else:
@@ -522,7 +584,7 @@ class PoolController(PoolBaseController):
 
     @check_ctrl
     def set_ctrl_par(self, name, value):
-        return self.ctrl.SetCtrlPar(name, value)
+        return self._set_par(name, self.ctrl.SetCtrlPar, name, value)
 
     @check_ctrl
     def get_ctrl_par(self, name):
@@ -530,12 +592,116 @@ class PoolController(PoolBaseController):
 
     @check_ctrl
     def set_axis_par(self, axis, name, value):
-        return self.ctrl.SetAxisPar(axis, name, value)
+        return self._set_par((axis, name), self.ctrl.SetAxisPar, axis, name,
+                             value)
+
+    def _set_par(self, key, setter, *args):
+        applied_pars = self._applied_pars
+        applied_pars.pop(key, None)
+        ret = setter(*args)
+        applied_pars[key] = args[-1]
+        return ret
+
+    def _is_par_applied(self, key, value):
+        try:
+            applied = self._applied_pars[key]
+        except KeyError:
+            return False
+        return type(applied) is type(value) and applied == value
+
+    def update_ctrl_par(self, name, value):
+        """Sets the controller parameter only if it differs from the last
+        value set with :meth:`set_ctrl_par` (or this method) since the
+        controller object was created.
+
+        :param name: parameter name
+        :type name: :obj:`str`
+        :param value: parameter value
+        :type value: :obj:`object`
+        :return: True if the parameter was set, False if it was skipped
+        :rtype: :obj:`bool`"""
+        if self._is_par_applied(name, value):
+            return False
+        self.set_ctrl_par(name, value)
+        return True
+
+    def update_axis_par(self, axis, name, value):
+        """Sets the axis parameter only if it differs from the last value set
+        with :meth:`set_axis_par` (or this method) since the controller
+        object was created.
+
+        :param axis: axis number
+        :type axis: :obj:`int`
+        :param name: parameter name
+        :type name: :obj:`str`
+        :param value: parameter value
+        :type value: :obj:`object`
+        :return: True if the parameter was set, False if it was skipped
+        :rtype: :obj:`bool`"""
+        if self._is_par_applied((axis, name), value):
+            return False
+        self.set_axis_par(axis, name, value)
+        return True
 
     @check_ctrl
     def get_axis_par(self, axis, name):
         return self.ctrl.GetAxisPar(axis, name)
 
+    @check_ctrl
+    def get_axes_pars(self, axes, names):
+        """Gets axis parameters of multiple axes at once with the controller
+        :meth:`~sardana.pool.controller.Controller.GetAxisPars`.
+
+        :param axes: sequence of axes
+        :type axes: seq<int>
+        :param names: sequence of parameter names
+        :type names: seq<str>
+        :return: map where keys are axes and values are maps of parameter
+                 names and values
+        :rtype: dict<int, dict<str, object>>"""
+        return self.ctrl.GetAxisPars(axes, names)
+
+    @check_ctrl
+    def set_axes_pars(self, axes_pars):
+        """Sets axis parameters of multiple axes at once e.g. when restoring
+        the memorized values at startup. If the controller implements
+        :meth:`~sardana.pool.controller.Controller.SetAxisPars` all the
+        parameters are set with a single call. Otherwise, or if it fails,
+        they are set one by one.
+
+        :param axes_pars: sequence of (axis, parameter name, value)
+        :type axes_pars: seq<tuple(int, str, object)>
+        :return: parameters that could not be set together with the
+                 exception information
+        :rtype: list<tuple(int, str, object, exc_info)>"""
+        ctrl = self.ctrl
+        applied_pars = self._applied_pars
+        for axis, name, _ in axes_pars:
+            applied_pars.pop((axis, name), None)
+        if type(ctrl).SetAxisPars is not Controller.SetAxisPars:
+            pars = {}
+            for axis, name, value in axes_pars:
+                pars.setdefault(axis, {})[name] = value
+            try:
+                ctrl.SetAxisPars(pars)
+            except Exception:
+                self.warning("SetAxisPars failed. Setting the parameters "
+                             "one by one")
+                self.debug("Details:", exc_info=1)
+            else:
+                for axis, name, value in axes_pars:
+                    applied_pars[(axis, name)] = value
+                return []
+        errors = []
+        for axis, name, value in axes_pars:
+            try:
+                ctrl.SetAxisPar(axis, name, value)
+            except Exception:
+                errors.append((axis, name, value, sys.exc_info()))
+            else:
+                applied_pars[(axis, name)] = value
+        return errors
+
     # END API WHICH ACCESSES CONTROLLER API ----------------------------------
 
     # START API WHICH ACCESSES CRITICAL CONTROLLER API (like StateOne) -------
@@ -1087,6 +1253,35 @@ class PoolPseudoMotorController(PoolController):
             value = SardanaValue(exc_info=sys.exc_info())
         return value
 
+    @check_ctrl
+    def calc_all_pseudo_bulk(self, physical_pos, curr_pseudo_pos):
+        ctrl = self.ctrl
+        try:
+            ctrl_value = ctrl.CalcAllPseudoBulk(physical_pos, curr_pseudo_pos)
+            if ctrl_value is None:
+                msg = '%s.CalcAllPseudoBulk() return error: Expected value, ' \
+                      'got None instead' % (self.name,)
+                raise ValueError(msg)
+            value = translate_ctrl_value(ctrl_value)
+        except:
+            value = SardanaValue(exc_info=sys.exc_info())
+        return value
+
+    @check_ctrl
+    def calc_all_physical_bulk(self, pseudo_pos, curr_physical_pos):
+        ctrl = self.ctrl
+        try:
+            ctrl_value = ctrl.CalcAllPhysicalBulk(pseudo_pos,
+                                                  curr_physical_pos)
+            if ctrl_value is None:
+                msg = '%s.CalcAllPhysicalBulk() return error: Expected ' \
+                      'value, got None instead' % (self.name,)
+                raise ValueError(msg)
+            value = translate_ctrl_value(ctrl_value)
+        except:
+            value = SardanaValue(exc_info=sys.exc_info())
+        return value
+
     @check_ctrl
     def calc_pseudo(self, axis, physical_pos, curr_pseudo_pos):
         ctrl = self.ctrl
@@ -47,10 +47,14 @@ from taurus.core import ManagerState
 from taurus.core.util.log import Logger
 from taurus.core.util.singleton import Singleton
 
+from sardana.sardanaevent import EventType
 from sardana.sardanamodulemanager import ModuleManager
+from sardana.sardanalibindex import LibraryIndex, LazyLibrary, LazyCode
+from sardana.util.profiler import startup_trace
 from sardana.pool import controller
 from sardana.pool.poolexception import UnknownController
-from sardana.pool.poolmetacontroller import ControllerLibrary, ControllerClass
+from sardana.pool.poolmetacontroller import ControllerLibrary, ControllerClass, \
+    LazyControllerLibrary
 
 CONTROLLER_TEMPLATE = '''
 
@@ -106,6 +110,10 @@ class ControllerManager(Singleton, Logger):
         #: elements are absolute paths
         self._controller_path = []
 
+        #: signature of the controller libraries (by default kept only in
+        #: memory)
+        self._lib_index = LibraryIndex()
+
         l = []
         for _, klass in inspect.getmembers(controller, inspect.isclass):
             if not issubclass(klass, controller.Controller):
@@ -124,6 +132,7 @@ class ControllerManager(Singleton, Logger):
         #    ModuleManager().unloadModules(self._modules.keys())
 
         self._controller_path = None
+        self._lib_index = None
         self._controller_dict = None
         self._modules = None
 
@@ -135,14 +144,33 @@ class ControllerManager(Singleton, Logger):
     def get_pool(self):
         return self._pool
 
+    def setLibraryIndex(self, file_name):
+        """Sets the file where the signature of the controller libraries is
+        stored between server runs (see
+        :class:`~sardana.sardanalibindex.LibraryIndex`). Controller libraries
+        which did not change since they were indexed are not imported until
+        they are first used.
+
+        Must be called before :meth:`~ControllerManager.setControllerPath`.
+
+        :param str file_name: the index file name [default: None, meaning the
+                              index is kept only in memory]"""
+        self._lib_index = LibraryIndex(file_name)
+
+    def getLibraryIndex(self):
+        return self._lib_index
+
     def setControllerPath(self, controller_path, reload=True):
         """Registers a new list of controller directories in this manager.
+        Controller libraries found in the library index which did not change
+        are not imported until they are first used.
 
         :param seq<str> controller_path: a sequence of absolute paths where this
                                          manager should look for controllers
 
         .. warning::
-            as a consequence all the controller modules will be reloaded.
+            as a consequence all the controller modules which changed since
+            they were loaded will be reloaded.
             This means that if any reference to an old controller object was
             kept it will refer to an old module (which could possibly generate
             problems of type class A != class A)."""
@@ -165,12 +193,64 @@ class ControllerManager(Singleton, Logger):
         controller_file_names = self._findControllerLibNames()
 
         for mod_name, file_name in controller_file_names.items():
+            old_lib = self._modules.get(mod_name)
+            if old_lib is not None and old_lib.file_path == file_name \
+                    and not old_lib.has_errors() \
+                    and self._lib_index.is_unchanged(file_name):
+                continue
+            if old_lib is None and \
+                    self._addLazyControllerLib(mod_name, file_name):
+                continue
             dir_name = os.path.dirname(file_name)
             path = [dir_name]
             try:
-                self.reloadControllerLib(mod_name, path, reload=reload)
+                self._reloadControllerLib(mod_name, path, reload=reload)
             except Exception:
                 pass
+        self._lib_index.save()
+
+    def _addLazyControllerLib(self, module_name, file_name):
+        """internal method"""
+        info = self._lib_index.get(file_name)
+        pool = self.get_pool()
+        if info is None or pool is None or \
+                info['library']['manager'] != pool.name:
+            return False
+        ctrl_names = [ctrl['name'] for ctrl in info['elements']]
+        overwritten = False
+        for ctrl_name in ctrl_names:
+            ctrl = self._controller_dict.get(ctrl_name)
+            if ctrl is None:
+                continue
+            # the precedence of controllers with the same name is decided by
+            # the loading order: import the libraries involved now
+            overwritten = True
+            if isinstance(ctrl, LazyCode):
+                ctrl.lib.resolve()
+        if overwritten:
+            return False
+        controller_lib = LazyControllerLibrary(info,
+                                               self._loadLazyControllerLib)
+        for ctrl in controller_lib.get_controllers():
+            self._controller_dict[ctrl.name] = ctrl
+        if controller_lib.has_metas():
+            self._modules[module_name] = controller_lib
+        return True
+
+    def _loadLazyControllerLib(self, lazy_lib):
+        """internal method"""
+        self.debug("Loading controller library %s on first use",
+                   lazy_lib.name)
+        controller_lib = self.reloadControllerLib(lazy_lib.name,
+                                                  [lazy_lib.path],
+                                                  reload=False)
+        # the library may have changed since the placeholder was registered
+        pool = self.get_pool()
+        if pool is not None and not controller_lib.has_errors():
+            evt = lazy_lib.get_changes(controller_lib)
+            if evt is not None:
+                pool.fire_event(EventType("ElementsChanged"), evt)
+        return controller_lib
 
     def getControllerPath(self):
         """Returns the current sequence of absolute paths used to look for
@@ -364,7 +444,8 @@ class ControllerManager(Singleton, Logger):
             module_names.append(module_name)
         self.reloadControllerLibs(module_names, path=path)
 
-    def reloadControllerLibs(self, module_names, path=None, reload=True):
+    def reloadControllerLibs(self, module_names, path=None, reload=True,
+                             force=True):
         """Reloads the given library(=module) names
 
         :raises: :exc:`sardana.pool.poolexception.UnknownController`
@@ -374,18 +455,27 @@ class ControllerManager(Singleton, Logger):
         :param seq<str> module_names: a list of module names
         :param seq<str> path: a list of absolute path to search for libraries
                               [default: None, meaning the current ControllerPath
-                              will be used]"""
+                              will be used]
+        :param bool force: reload also the libraries which did not change
+                           since they were loaded [default: True]"""
         ret = []
         for module_name in module_names:
+            if not force:
+                m = self._modules.get(module_name)
+                if m is not None and not m.has_errors() \
+                        and self._lib_index.is_unchanged(m.file_path):
+                    ret.append(m)
+                    continue
             try:
-                m = self.reloadControllerLib(module_name, path, reload=reload)
+                m = self._reloadControllerLib(module_name, path,
+                                              reload=reload)
                 if m:
                     ret.append(m)
             except:
                 self.info("Failed to reload controller library %s", module_name)
                 self.debug("Failed to reload controller library %s details",
                            module_name, exc_info=1)
-
+        self._lib_index.save()
         return ret
 
     def reloadControllerLib(self, module_name, path=None, reload=True):
@@ -404,6 +494,20 @@ class ControllerManager(Singleton, Logger):
         :return: the ControllerLib object for the reloaded controller lib
         :rtype: sardana.pool.poolmetacontroller.ControllerLibrary
         """
+        try:
+            return self._reloadControllerLib(module_name, path=path,
+                                             reload=reload)
+        finally:
+            self._lib_index.save()
+
+    def _reloadControllerLib(self, module_name, path=None, reload=True):
+        """internal method"""
+        with startup_trace.measure("controller libraries", module_name):
+            return self._loadControllerLib(module_name, path=path,
+                                           reload=reload)
+
+    def _loadControllerLib(self, module_name, path=None, reload=True):
+        """internal method"""
         path = path or self.getControllerPath()
         # reverse the path order:
         # more priority elements last. This way if there are repeated elements
@@ -448,6 +552,12 @@ class ControllerManager(Singleton, Logger):
             if lib_contains_controllers:
                 self._modules[module_name] = controller_lib
 
+        if controller_lib.has_errors():
+            if controller_lib.file_path is not None:
+                self._lib_index.remove(controller_lib.file_path)
+        else:
+            self._lib_index.add_library(controller_lib,
+                                        self.getControllerPath())
         return controller_lib
 
     def addController(self, controller_lib, klass):
@@ -506,6 +616,8 @@ class ControllerManager(Singleton, Logger):
 
     def getControllerMetaClass(self, controller_name):
         ret = self._controller_dict.get(controller_name)
+        if isinstance(ret, LazyCode):
+            ret = ret.resolve()
         if ret is None:
             raise UnknownController("Unknown controller %s" % controller_name)
         return ret
@@ -517,18 +629,25 @@ class ControllerManager(Singleton, Logger):
         return ret
 
     def getControllerLib(self, name):
+        ret = None
         if os.path.isabs(name):
             abs_file_name = name
             for lib in list(self._modules.values()):
                 if lib.file_path == abs_file_name:
-                    return lib
+                    ret = lib
+                    break
         elif name.count(os.path.extsep):
             file_name = name
             for lib in list(self._modules.values()):
                 if lib.file_name == file_name:
-                    return lib
-        module_name = name
-        return self._modules.get(module_name)
+                    ret = lib
+                    break
+        if ret is None:
+            module_name = name
+            ret = self._modules.get(module_name)
+        if isinstance(ret, LazyLibrary):
+            ret = ret.resolve()
+        return ret
 
     def getControllerClass(self, controller_name):
         return self.getControllerMetaClass(controller_name).klass
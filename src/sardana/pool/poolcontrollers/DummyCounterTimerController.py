@@ -23,10 +23,12 @@
 
 import time
 import copy
+import threading
 
 from sardana import State
 from sardana.pool import AcqSynch
-from sardana.pool.controller import CounterTimerController, Type, Description
+from sardana.pool.controller import CounterTimerController, StateNotifier, \
+    Type, Description
 
 
 class Channel(object):
@@ -39,7 +41,7 @@ class Channel(object):
         self.buffer_values = []
 
 
-class DummyCounterTimerController(CounterTimerController):
+class DummyCounterTimerController(CounterTimerController, StateNotifier):
     """This class is the Tango Sardana CounterTimer controller for tests"""
 
     gender = "Simulation"
@@ -79,6 +81,8 @@ class DummyCounterTimerController(CounterTimerController):
         self.__synchronizer_obj = None
         # flag whether the controller was armed for hardware synchronization
         self._armed = False
+        # timer simulating the end of acquisition interrupt of the hardware
+        self._acq_timer = None
 
     def AddDevice(self, axis):
         idx = axis - 1
@@ -130,6 +134,32 @@ class DummyCounterTimerController(CounterTimerController):
             self._armed = True
         else:
             self.start_time = time.time()
+            self._startAcqTimer()
+
+    def _startAcqTimer(self):
+        self._cancelAcqTimer()
+        if self.integ_time is None:
+            return
+        if self._synchronization == AcqSynch.SoftwareTrigger:
+            duration = self.integ_time
+        elif self._synchronization == AcqSynch.SoftwareStart:
+            duration = self.estimated_duration
+        else:
+            return
+        axes = list(self.counting_channels.keys())
+        self._acq_timer = timer = threading.Timer(
+            duration, self._notifyStateChange, [axes])
+        timer.daemon = True
+        timer.start()
+
+    def _cancelAcqTimer(self):
+        timer, self._acq_timer = self._acq_timer, None
+        if timer is not None:
+            timer.cancel()
+
+    def _notifyStateChange(self, axes):
+        for axis in axes:
+            self.NotifyStateChange(axis)
 
     def StateOne(self, axis):
         self._log.debug('StateOne(%d): entering...' % axis)
@@ -270,6 +300,9 @@ class DummyCounterTimerController(CounterTimerController):
         now = time.time()
         elapsed_time = now - self.start_time
         self._finish(elapsed_time, axis)
+        if not self.counting_channels:
+            self._cancelAcqTimer()
+        self.NotifyStateChange(axis)
 
     def GetCtrlPar(self, par):
         if par == 'synchronization':
@@ -338,9 +371,12 @@ class DummyCounterTimerController(CounterTimerController):
         """Callback for dummy trigger/gate function generator events
         e.g. start, active passive
         """
-        # for the moment only react on first trigger
-        if type_.name.lower() == "active" and value == 0:
+        # for the moment only react on first trigger (it may be already
+        # late if the function generator skipped some events)
+        if type_.name.lower() == "active" and self._armed:
             self._armed = False
             for axis, channel in self.counting_channels.items():
                 channel.is_counting = True
             self.start_time = time.time()
+            if self.integ_time is not None:
+                self.start_time -= value * self.acq_cycle_time
@@ -22,10 +22,11 @@
 ##############################################################################
 
 import time
+import threading
 from math import pow, sqrt
 
 from sardana import State, SardanaValue
-from sardana.pool.controller import MotorController
+from sardana.pool.controller import MotorController, StateNotifier
 from sardana.pool.controller import DefaultValue, Description, FGet, FSet, Type
 
 
@@ -700,7 +701,7 @@ class DiscreteDummyMotorController(BasicDummyMotorController):
         return int(pos)
 
 
-class DummyMotorController(BasicDummyMotorController):
+class DummyMotorController(BasicDummyMotorController, StateNotifier):
     """This class represents a dummy Sardana motor controller."""
 
     ctrl_features = []
@@ -749,6 +750,35 @@ class DummyMotorController(BasicDummyMotorController):
         BasicDummyMotorController.__init__(self, inst, props, *args, **kwargs)
         self._lowerLS = float("-inf")
         self._upperLS = float("+inf")
+        self._motion_timers = {}
+
+    def StartAll(self):
+        BasicDummyMotorController.StartAll(self)
+        # simulate the end of motion interrupt of the hardware
+        t = time.time()
+        for idx, motion in enumerate(self.m):
+            if motion is None or motion not in self.motions:
+                continue
+            axis = idx + 1
+            self._cancelMotionTimer(axis)
+            if not motion.isInMotion(t):
+                self.NotifyStateChange(axis)
+                continue
+            timer = threading.Timer(max(motion.final_instant - t, 0),
+                                    self.NotifyStateChange, [axis])
+            timer.daemon = True
+            self._motion_timers[axis] = timer
+            timer.start()
+
+    def AbortOne(self, axis):
+        BasicDummyMotorController.AbortOne(self, axis)
+        self._cancelMotionTimer(axis)
+        self.NotifyStateChange(axis)
+
+    def _cancelMotionTimer(self, axis):
+        timer = self._motion_timers.pop(axis, None)
+        if timer is not None:
+            timer.cancel()
 
     def GetAxisAttributes(self, axis):
         return MotorController.GetAxisAttributes(self, axis)
@@ -95,6 +95,7 @@ class DummyOneDController(OneDController):
     def __init__(self, inst, props, *args, **kwargs):
         OneDController.__init__(self, inst, props, *args, **kwargs)
         self._repetitions = 1
+        self._latency_time = 0
         self.channels = self.MaxDevice * [None, ]
         self.reset()
 
@@ -174,7 +175,7 @@ class DummyOneDController(OneDController):
         elif self._synchronization in (AcqSynch.HardwareTrigger,
                                        AcqSynch.HardwareGate):
             if self.integ_time is not None:
-                n = t // self.integ_time
+                n = int(t // (self.integ_time + self._latency_time))
                 cp = 0
                 if n > self._repetitions:
                     cp = n - self._repetitions
@@ -248,7 +249,7 @@ class DummyOneDController(OneDController):
     def StartAll(self):
         self.start_time = time.time()
 
-    def LoadOne(self, axis, value, repetitions):
+    def LoadOne(self, axis, value, repetitions, latency_time):
         idx = axis - 1
         if value > 0:
             self.integ_time = value
@@ -257,6 +258,7 @@ class DummyOneDController(OneDController):
             self.integ_time = None
             self.monitor_count = -value
         self._repetitions = repetitions
+        self._latency_time = latency_time
 
     def AbortOne(self, axis):
         now = time.time()
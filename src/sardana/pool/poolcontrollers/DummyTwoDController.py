@@ -22,15 +22,10 @@
 ##############################################################################
 
 import re
-import sys
 import time
 import copy
 
 import numpy
-try:
-    import h5py
-except ImportError:
-    pass
 
 from sardana import State
 from sardana.pool import AcqSynch
@@ -83,8 +78,11 @@ def generate_ref(pattern, idx):
 
 def save_img(img, path, dataset_name):
     msg = None
-    if "h5py" not in sys.modules:
-        msg = "Not able to store h5 file (h5py is not available)"
+    # h5py is imported on first use so the Pool startup does not pay for it
+    try:
+        import h5py
+    except ImportError:
+        return "Not able to store h5 file (h5py is not available)"
     try:
         h5f = h5py.File(path, "w")
         h5f.create_dataset(dataset_name, data=img)
@@ -431,12 +429,13 @@ class BasicDummyTwoDController(TwoDController):
         """Callback for dummy trigger/gate function generator events
         e.g. start, active passive
         """
-        # for the moment only react on first trigger
-        if type_.name.lower() == "active" and value == 0:
+        # for the moment only react on first trigger (it may be already
+        # late if the function generator skipped some events)
+        if type_.name.lower() == "active" and self._armed:
             self._armed = False
             for axis, channel in self.counting_channels.items():
                 channel.is_counting = True
-            self.start_time = time.time()
+            self.start_time = time.time() - value * self.acq_cycle_time
 
 
 class DummyTwoDController(BasicDummyTwoDController, Referable):
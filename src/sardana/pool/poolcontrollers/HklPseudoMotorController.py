@@ -48,8 +48,9 @@ import PyTango
 
 from itertools import chain
 
-from gi.repository import GLib
-from gi.repository import Hkl
+# the Hkl introspection data are loaded on first use (see _import_hkl)
+# so the Pool startup does not pay for it if no diffractometer is defined
+import gi  # noqa
 
 from taurus.core.util.codecs import CodecFactory
 
@@ -60,10 +61,22 @@ from sardana.pool.controller import Memorize, Memorized, MemorizedNoInit, NotMem
 
 ReadOnly = DataAccess.ReadOnly
 ReadWrite = DataAccess.ReadWrite
-USER = Hkl.UnitEnum.USER
+Hkl = None
+USER = None
 DEFAULT_CRYSTAL = "default_crystal"
 
 
+def _import_hkl():
+    """Imports the Hkl library (once)"""
+    global Hkl, USER
+    if Hkl is not None:
+        return
+    from gi.repository import GLib  # noqa
+    from gi.repository import Hkl as _Hkl
+    USER = _Hkl.UnitEnum.USER
+    Hkl = _Hkl
+
+
 from taurus.core.util.log import Logger
 
 logger = Logger.getLogger("ControllerManager")
@@ -336,6 +349,7 @@ class DiffracBasis(PseudoMotorController):
         staff.
         @param properties of the controller
         """
+        _import_hkl()
         PseudoMotorController.__init__(self, inst, props, *args, **kwargs)
 
         # Comment out if memorized crystal (memcrystal)
@@ -415,19 +429,31 @@ class DiffracBasis(PseudoMotorController):
         self.energy_device = None
         self.lambda_to_e = 12398.424  # Amstrong * eV
 
-    def _solutions(self, values, curr_physical_position):
+    def _motor_limits(self):
+        # read the motor min and max (None if not defined)
+        limits = []
+        for role in self.motor_roles:
+            motor = self.GetMotor(role)
+            try:
+                config = PyTango.AttributeProxy(motor.get_full_name() + '/position').get_config()  # noqa
+                limits.append((float(config.min_value),
+                               float(config.max_value)))
+            except ValueError:
+                limits.append(None)
+        return limits
+
+    def _solutions(self, values, curr_physical_position, limits=None):
         # set all the motor min and max to restrain the solutions
         # with only valid positions.
-        for role, current in zip(self.motor_roles, curr_physical_position):
-            motor = self.GetMotor(role)
+        if limits is None:
+            limits = self._motor_limits()
+        for role, current, limit in zip(self.motor_roles,
+                                         curr_physical_position, limits):
             axis = self.geometry.axis_get(role)
             axis.value_set(current, USER)
-            try:
-                config = PyTango.AttributeProxy(motor.get_full_name() + '/position').get_config()  # noqa
-                mini, maxi = float(config.min_value), float(config.max_value)
+            if limit is not None:
+                mini, maxi = limit
                 axis.min_max_set(mini, maxi, USER)
-            except ValueError:
-                pass
             self.geometry.axis_set(role, axis)
 
         # computation and select the expected solution
@@ -439,7 +465,7 @@ class DiffracBasis(PseudoMotorController):
     def CalcPseudo(self, axis, physical_pos, curr_pseudo_pos):
         return self.CalcAllPseudo(physical_pos, curr_pseudo_pos)[axis - 1]
 
-    def CalcAllPhysical(self, pseudo_pos, curr_physical_pos):
+    def _engine_values(self, pseudo_pos):
         # TODO it should work with all the kind of engine ? or only
         # with the hkl engine ? What I understand from this is that
         # the pseudos values contain all the values from all the
@@ -485,12 +511,9 @@ class DiffracBasis(PseudoMotorController):
             elif engine_name == "petra3_p23_6c_emergence":
                 values = [pseudo_pos[11]]
 
-        # getWavelength updates wavelength in the library in case automatic
-        # energy update is set. Needed before computing trajectories.
-
-        self.getWavelength()
+        return values
 
-        solutions = self._solutions(values, curr_physical_pos)
+    def _select_solution(self, solutions):
         if self.selected_trajectory > len(list(solutions.items())):
             self.selected_trajectory = len(list(solutions.items())) - 1
         for i, item in enumerate(solutions.items()):
@@ -500,6 +523,31 @@ class DiffracBasis(PseudoMotorController):
         # TODO why replace this by a tuple ?
         return tuple(angles)
 
+    def CalcAllPhysical(self, pseudo_pos, curr_physical_pos):
+        values = self._engine_values(pseudo_pos)
+
+        # getWavelength updates wavelength in the library in case automatic
+        # energy update is set. Needed before computing trajectories.
+
+        self.getWavelength()
+
+        solutions = self._solutions(values, curr_physical_pos)
+        return self._select_solution(solutions)
+
+    def CalcAllPhysicalBulk(self, pseudo_pos, curr_physical_pos):
+        # the wavelength and the motor limits are retrieved only once
+        # for the whole trajectory and the solution of each point seeds
+        # the computation of the next one
+        self.getWavelength()
+        limits = self._motor_limits()
+        ret = []
+        for point_pseudo_pos in pseudo_pos:
+            values = self._engine_values(point_pseudo_pos)
+            solutions = self._solutions(values, curr_physical_pos, limits)
+            curr_physical_pos = self._select_solution(solutions)
+            ret.append(curr_physical_pos)
+        return ret
+
     def CalcAllPseudo(self, physical_pos, curr_pseudo_pos):
         # TODO howto avoid this nb_ph_axes, does the length of the
         # physical values are not equal to the expected len of the
@@ -510,6 +558,9 @@ class DiffracBasis(PseudoMotorController):
 
         self.getWavelength()
 
+        return self._pseudo_values(physical_pos)
+
+    def _pseudo_values(self, physical_pos):
         # write the physical motor into the geometry
         self.geometry.axis_values_set(physical_pos[:self.nb_ph_axes], USER)
         self.engines.get()
@@ -521,6 +572,12 @@ class DiffracBasis(PseudoMotorController):
 
         return tuple(values)
 
+    def CalcAllPseudoBulk(self, physical_pos, curr_pseudo_pos):
+        # the wavelength is updated only once for the whole trajectory
+        self.getWavelength()
+        return [self._pseudo_values(point_physical_pos)
+                for point_physical_pos in physical_pos]
+
     def getCrystal(self):
         return self.sample.name_get()
 
@@ -28,6 +28,8 @@ __all__ = ["Slit"]
 
 __docformat__ = 'restructuredtext'
 
+import numpy
+
 from sardana import DataAccess
 from sardana.pool.controller import PseudoMotorController
 from sardana.pool.controller import DefaultValue, Description, Access, Type
@@ -83,6 +85,23 @@ class Slit(PseudoMotorController):
         return (self.sign * gap,
                 self.sign * (physical_pos[0] - gap / 2))
 
+    def CalcAllPseudoBulk(self, physical_pos, curr_pseudo_pos):
+        """Calculates the positions of all pseudo motors for a sequence of
+           physical motor positions in a vectorized way."""
+        physical_pos = numpy.asarray(physical_pos, dtype=float).reshape(-1, 2)
+        gap = physical_pos[:, 1] + physical_pos[:, 0]
+        offset = physical_pos[:, 0] - gap / 2
+        return (self.sign * numpy.column_stack((gap, offset))).tolist()
+
+    def CalcAllPhysicalBulk(self, pseudo_pos, curr_physical_pos):
+        """Calculates the positions of all motors for a sequence of pseudo
+           motor positions in a vectorized way."""
+        pseudo_pos = numpy.asarray(pseudo_pos, dtype=float).reshape(-1, 2)
+        half_gap = pseudo_pos[:, 0] / 2
+        offset = pseudo_pos[:, 1]
+        sl2t, sl2b = offset + half_gap, half_gap - offset
+        return (self.sign * numpy.column_stack((sl2t, sl2b))).tolist()
+
     # def CalcAllPhysical(self, pseudo_pos, curr_physical_pos):
     #    """Calculates the positions of all motors that belong to the pseudo
     #       motor system from the positions of the pseudo motors."""
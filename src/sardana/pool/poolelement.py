@@ -78,6 +78,37 @@ class PoolElement(PoolBaseElement):
         self._action_cache = action_cache
         action_cache.add_element(self)
 
+    def get_read_coalescer(self):
+        """Returns the controller's read coalescer if it can be used to read
+        this element i.e. it is enabled, the element is not involved in any
+        operation and the controller is not a pseudo controller.
+
+        :return: the read coalescer or None
+        :rtype: :class:`~sardana.pool.poolreadcoalescer.PoolReadCoalescer`"""
+        if self.is_in_operation():
+            return None
+        ctrl = self.controller
+        if ctrl is None or not ctrl.is_online() or ctrl.is_pseudo():
+            return None
+        coalescer = ctrl.read_coalescer
+        if not coalescer.is_enabled():
+            return None
+        return coalescer
+
+    def set_operation(self, operation):
+        PoolBaseElement.set_operation(self, operation)
+        # results read before or during the operation are no longer valid
+        ctrl = self.controller
+        if ctrl is not None and ctrl.is_online() and not ctrl.is_pseudo():
+            ctrl.read_coalescer.invalidate(self)
+
+    def read_state_info(self):
+        coalescer = self.get_read_coalescer()
+        if coalescer is None:
+            return PoolBaseElement.read_state_info(self)
+        ctrl_state_info = coalescer.read_state_info(self)
+        return self._from_ctrl_state_info(ctrl_state_info)
+
     def get_source(self):
         return "{0}/{1}".format(self.full_name, self.get_default_acquisition_channel())
 
@@ -28,7 +28,8 @@ for"""
 
 __all__ = ["CONTROLLER_TEMPLATE", "CTRL_TYPE_MAP", "TYPE_MAP", "TYPE_MAP_OBJ",
            "TypeData", "DTYPE_MAP", "DACCESS_MAP", "DataInfo",
-           "ControllerLibrary", "ControllerClass"]
+           "ControllerLibrary", "ControllerClass", "LazyControllerLibrary",
+           "LazyControllerClass"]
 
 __docformat__ = 'restructuredtext'
 
@@ -41,6 +42,7 @@ from sardana import DataType, DataFormat, DataAccess, \
     to_dtype_dformat, to_daccess, \
     ElementType, TYPE_ELEMENTS, InvalidId
 from sardana.sardanameta import SardanaLibrary, SardanaClass
+from sardana.sardanalibindex import LazyLibrary, LazyCode
 from sardana.pool.poolmotor import PoolMotor
 from sardana.pool.poolpseudomotor import PoolPseudoMotor
 from sardana.pool.poolmotorgroup import PoolMotorGroup
@@ -377,3 +379,45 @@ class ControllerClass(SardanaClass):
     @property
     def organization(self):
         return self.klass.organization
+
+
+class LazyControllerClass(LazyCode):
+    """Placeholder of a :class:`ControllerClass` which library has not been
+    imported yet (see :class:`~sardana.sardanalibindex.LazyCode`)"""
+
+    __lt__ = ControllerClass.__lt__
+
+    @property
+    def types(self):
+        return [ElementType[name] for name in self._info['types']]
+
+    @property
+    def type_names(self):
+        return list(self._info['types'])
+
+    @property
+    def gender(self):
+        return self._info['gender']
+
+    @property
+    def model(self):
+        return self._info['model']
+
+    @property
+    def organization(self):
+        return self._info['organization']
+
+
+class LazyControllerLibrary(LazyLibrary):
+    """Placeholder of a :class:`ControllerLibrary` which has not been imported
+    yet (see :class:`~sardana.sardanalibindex.LazyLibrary`)"""
+
+    CodeClass = LazyControllerClass
+
+    get_controller = LazyLibrary.get_meta
+    get_controllers = LazyLibrary.get_metas
+    has_controller = LazyLibrary.has_meta
+
+    @property
+    def controllers(self):
+        return dict(self._metas)
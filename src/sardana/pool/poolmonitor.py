@@ -33,17 +33,63 @@ import time
 import threading
 
 from taurus.core.util.log import Logger
+from taurus.core.util.threadpool import ThreadPool
 
 from sardana import ElementType, TYPE_PSEUDO_ELEMENTS
 
 from sardana.pool.poolobject import PoolObject
 
 
+class _CtrlSchedule(object):
+    """Internal class. Polling schedule and statistics of one controller"""
+
+    def __init__(self, ctrl_id, period):
+        self.ctrl_id = ctrl_id
+        self.period = period
+        self.elem_ids = []
+        self.next_time = 0
+        self.busy = False
+        self.errors = 0
+        self.nb_cycles = 0
+        self.nb_overruns = 0
+        self.cycle_time = None
+        self.max_cycle_time = 0
+
+    def get_interval(self, max_backoff):
+        """Returns the time to the next read: the period multiplied by a
+        factor which doubles with every consecutive error up to
+        *max_backoff*"""
+        factor = min(2 ** self.errors, max_backoff)
+        return self.period * factor
+
+    def get_statistics(self):
+        return dict(period=self.period, busy=self.busy, errors=self.errors,
+                    nb_cycles=self.nb_cycles, nb_overruns=self.nb_overruns,
+                    cycle_time=self.cycle_time,
+                    max_cycle_time=self.max_cycle_time)
+
+
 class PoolMonitor(Logger, threading.Thread):
+    """Periodically reads the state of the idle elements of all the physical
+    controllers.
+
+    Every controller has its own schedule: the state is read every *period*
+    seconds (see :meth:`set_ctrl_period`) and, on consecutive errors, the
+    period is doubled up to :attr:`MAX_BACKOFF` times. The reads of the
+    different controllers run concurrently in a pool of at most
+    :attr:`MAX_THREADS` threads so a hung controller does not delay the
+    others. A controller which is still being read when its next read is due
+    is counted as an overrun (see :meth:`get_statistics`)."""
 
     MIN_THREADS = 1
     MAX_THREADS = 10
 
+    #: maximum factor applied to the period of a failing controller
+    MAX_BACKOFF = 8
+
+    #: maximum time (s) to wait for the running reads when stopping
+    JOIN_TIMEOUT = 3.0
+
     def __init__(self, pool, name='PoolMonitor', period=5.0, min_sleep=1.0,
                  auto_start=True):
         Logger.__init__(self, name)
@@ -52,11 +98,14 @@ class PoolMonitor(Logger, threading.Thread):
         self._period = period
         self._min_sleep = min_sleep
         self._pool = pool
-        self._stop = False
+        self._stop_requested = False
         self._pause = threading.Event()
+        self._wakeup = threading.Event()
         self._thread_pool = None
-        self._ctrl_ids = []
-        self._elem_ids = []
+        self._schedules_lock = threading.Lock()
+        # dict<int, _CtrlSchedule>
+        self._schedules = {}
+        self._ctrl_periods = {}
         pool.add_listener(self.on_pool_changed)
         if not auto_start:
             self.pause()
@@ -68,76 +117,176 @@ class PoolMonitor(Logger, threading.Thread):
             pool = self._pool
             pool_ctrls = pool.get_elements_by_type(ElementType.Controller)
             pool_ctrls.sort(key=PoolObject.get_id)
-            ctrl_ids = []
-            elem_ids = []
-            for pool_ctrl in pool_ctrls:
-                if not pool_ctrl.is_online():
-                    continue
-                types = set(pool_ctrl.get_ctrl_types())
-                if types.isdisjoint(TYPE_PSEUDO_ELEMENTS):
-                    ctrl_ids.append(pool_ctrl.id)
-                    elem_ids.extend(list(pool_ctrl.get_element_ids().keys()))
-            elem_ids.sort()
-            self._elem_ids = elem_ids
-            self._ctrl_ids = ctrl_ids
+            with self._schedules_lock:
+                old_schedules = self._schedules
+                schedules = {}
+                for pool_ctrl in pool_ctrls:
+                    if not pool_ctrl.is_online():
+                        continue
+                    types = set(pool_ctrl.get_ctrl_types())
+                    if not types.isdisjoint(TYPE_PSEUDO_ELEMENTS):
+                        continue
+                    ctrl_id = pool_ctrl.id
+                    schedule = old_schedules.get(ctrl_id)
+                    if schedule is None:
+                        period = self._ctrl_periods.get(ctrl_id,
+                                                        self._period)
+                        schedule = _CtrlSchedule(ctrl_id, period)
+                    schedule.elem_ids = \
+                        sorted(pool_ctrl.get_element_ids().keys())
+                    schedules[ctrl_id] = schedule
+                self._schedules = schedules
+
+    def get_period(self):
+        """Returns the default polling period (s)"""
+        return self._period
+
+    def set_period(self, period):
+        """Sets the default polling period (s). It applies to all the
+        controllers which period was not explicitly set with
+        :meth:`set_ctrl_period`"""
+        self._period = period
+        with self._schedules_lock:
+            for ctrl_id, schedule in self._schedules.items():
+                if ctrl_id not in self._ctrl_periods:
+                    schedule.period = period
+        self._wakeup.set()
+
+    period = property(get_period, set_period, doc="default polling period")
+
+    def set_ctrl_period(self, ctrl, period=None):
+        """Sets the polling period (s) of the given controller.
+
+        :param ctrl: the controller
+        :type ctrl: :class:`~sardana.pool.poolcontroller.PoolController`
+        :param period: the period or None to use the default one
+        :type period: float"""
+        ctrl_id = ctrl.id
+        if period is None:
+            self._ctrl_periods.pop(ctrl_id, None)
+            period = self._period
+        else:
+            self._ctrl_periods[ctrl_id] = period
+        with self._schedules_lock:
+            schedule = self._schedules.get(ctrl_id)
+            if schedule is not None:
+                schedule.period = period
+                schedule.next_time = 0
+        self._wakeup.set()
+
+    def get_ctrl_period(self, ctrl):
+        """Returns the polling period (s) of the given controller"""
+        return self._ctrl_periods.get(ctrl.id, self._period)
+
+    def get_statistics(self):
+        """Returns the polling statistics per controller.
+
+        :return: a map where keys are controller names and values are maps
+                 with: *period*, *busy*, *errors* (consecutive errors),
+                 *nb_cycles*, *nb_overruns*, *cycle_time* (duration of the
+                 last read) and *max_cycle_time*
+        :rtype: dict<str, dict>"""
+        pool = self._pool
+        statistics = {}
+        with self._schedules_lock:
+            schedules = list(self._schedules.values())
+        for schedule in schedules:
+            ctrl = pool.get_element_by_id(schedule.ctrl_id)
+            statistics[ctrl.name] = schedule.get_statistics()
+        return statistics
+
+    def _get_thread_pool(self):
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPool(name=self.log_name + ".TP",
+                                           parent=self,
+                                           Psize=self.MIN_THREADS, Qsize=0)
+        return self._thread_pool
 
     def update_state_info(self):
-        """Update state information of every element."""
+        """Update state information of every element. The controllers are
+        read concurrently and the call returns when all of them finished."""
+        with self._schedules_lock:
+            schedules = list(self._schedules.values())
+        th_pool = self._get_thread_pool()
+        th_pool.size = max(th_pool.size,
+                           min(len(schedules), self.MAX_THREADS))
+        done = []
+        for schedule in schedules:
+            if schedule.busy:
+                continue
+            schedule.busy = True
+            event = threading.Event()
+            done.append(event)
+            th_pool.add(self._update_ctrl, None, schedule, event)
+        for event in done:
+            event.wait()
 
+    def _update_ctrl(self, schedule, event=None):
+        """Internal method. Reads the state of the controller idle elements
+        and reschedules the next read"""
+        start = time.time()
+        try:
+            error = self._update_ctrl_state_info(schedule)
+        except:
+            self.warning("Unable to update state of controller %s",
+                         schedule.ctrl_id)
+            self.debug("Details:", exc_info=1)
+            error = True
+        finally:
+            finish = time.time()
+            cycle_time = finish - start
+            if error:
+                schedule.errors += 1
+            else:
+                schedule.errors = 0
+            schedule.nb_cycles += 1
+            schedule.cycle_time = cycle_time
+            schedule.max_cycle_time = max(schedule.max_cycle_time,
+                                          cycle_time)
+            schedule.next_time = \
+                start + schedule.get_interval(self.MAX_BACKOFF)
+            schedule.busy = False
+            if event is not None:
+                event.set()
+            self._wakeup.set()
+
+    def _update_ctrl_state_info(self, schedule):
+        """Internal method. Reads the state of the controller idle elements.
+        Elements involved in an operation or locked by someone else block the
+        whole controller.
+
+        :return: True if an error occurred or False otherwise
+        :rtype: bool"""
         pool = self._pool
-        elems, ctrls, ctrl_items = [], [], {}
+        ctrl = pool.get_element_by_id(schedule.ctrl_id)
+        elems = []
         try:
-            blocked_ctrls = set()
-            for elem_id in self._elem_ids:
+            for elem_id in schedule.elem_ids:
                 elem = pool.get_element_by_id(elem_id)
-                ctrl = elem.controller
-                if elem.is_in_operation():
-                    blocked_ctrls.add(ctrl)
-                    continue
-                if ctrl in blocked_ctrls:
-                    continue
-                ret = elem.lock(blocking=False)
-                if ret:
-                    elems.append(elem)
-                    ctrl_elems = ctrl_items.get(ctrl)
-                    if ctrl_elems is None:
-                        ctrl_items[ctrl] = ctrl_elems = []
-                    ctrl_elems.append(elem)
-                else:
-                    blocked_ctrls.add(ctrl)
-
-            for ctrl, ctrl_elems in list(ctrl_items.items()):
-                ret = ctrl.lock(blocking=False)
-                if ret:
-                    ctrls.append(ctrl)
-                else:
-                    for elem in reversed(ctrl_elems):
-                        elem.unlock()
-                        elems.remove(elem)
-
-            self._update_state_info_serial(ctrl_items)
-        finally:
-            for ctrl in reversed(ctrls):
+                if elem.is_in_operation() or not elem.lock(blocking=False):
+                    return False
+                elems.append(elem)
+            if not elems or not ctrl.lock(blocking=False):
+                return False
+            try:
+                axes = [elem.axis for elem in elems]
+                state_infos, error = ctrl.raw_read_axis_states(axes)
+            finally:
                 ctrl.unlock()
+            if error:
+                self.info("State error in controller %s", ctrl.name)
+            for elem, state_info in list(state_infos.items()):
+                state_info = elem._from_ctrl_state_info(state_info)
+                elem.set_state_info(state_info)
+            return error
+        finally:
             for elem in reversed(elems):
                 elem.unlock()
 
-    def _update_state_info_serial(self, pool_ctrls):
-        for pool_ctrl, elems in list(pool_ctrls.items()):
-            self._update_ctrl_state_info(pool_ctrl, elems)
-
-    def _update_ctrl_state_info(self, pool_ctrl, elems):
-        axes = [elem.axis for elem in elems]
-        state_infos, exc_info = pool_ctrl.raw_read_axis_states(axes)
-        if len(exc_info):
-            self.info("STATE ERROR %s", exc_info)
-        for elem, state_info in list(state_infos.items()):
-            state_info = elem._from_ctrl_state_info(state_info)
-            elem.set_state_info(state_info)
-
     def stop(self):
+        self._stop_requested = True
         self.resume()
-        self._stop = True
+        self._wakeup.set()
 
     def pause(self):
         self._pause.clear()
@@ -146,19 +295,73 @@ class PoolMonitor(Logger, threading.Thread):
         self._pause.set()
 
     def monitor(self):
-        ret = self.update_state_info()
+        """Submits the read of the controllers which are due.
+
+        :return: time (s) to the next due controller
+        :rtype: float"""
+        now = time.time()
+        nap_time = self._period
+        due = []
+        with self._schedules_lock:
+            for schedule in self._schedules.values():
+                if schedule.next_time > now:
+                    nap_time = min(nap_time, schedule.next_time - now)
+                    continue
+                if schedule.busy:
+                    # previous read still running
+                    schedule.nb_overruns += 1
+                    schedule.next_time = now + schedule.period
+                    nap_time = min(nap_time, schedule.period)
+                    continue
+                due.append(schedule)
+        if due:
+            th_pool = self._get_thread_pool()
+            th_pool.size = max(th_pool.size,
+                               min(len(self._schedules), self.MAX_THREADS))
+            for schedule in due:
+                schedule.busy = True
+                # deadline to consider the read an overrun, it is
+                # rescheduled when the read finishes
+                schedule.next_time = now + schedule.period
+                th_pool.add(self._update_ctrl, None, schedule)
+        return nap_time
 
     def run(self):
-        nap_time = period = self._period
-        i, startup = 0, time.time()
         while True:
-            if self._stop:
-                break
-            time.sleep(nap_time)
             self._pause.wait()
-            self.monitor()
-            finish = time.time()
-            nap_time = -1
-            while nap_time < 0:
-                i += 1
-                nap_time = (startup + i * self._period) - finish
+            if self._stop_requested:
+                break
+            self._wakeup.clear()
+            nap_time = self.monitor()
+            self._wakeup.wait(nap_time)
+            if self._stop_requested:
+                break
+        if self._thread_pool is not None:
+            self._join_thread_pool(self.JOIN_TIMEOUT)
+
+    def _join_thread_pool(self, timeout):
+        """Internal method. Waits at most *timeout* seconds for the workers
+        of the thread pool to finish the running reads. The controllers
+        still being read (e.g. hung) are logged and their (daemon) workers
+        are abandoned."""
+        th_pool = self._thread_pool
+        th_pool.accept = False
+        workers = list(th_pool.workers)
+        for _ in workers:
+            th_pool.jobs.put(th_pool.NoJob)
+        deadline = time.time() + timeout
+        for worker in workers:
+            worker.join(max(0, deadline - time.time()))
+        with self._schedules_lock:
+            busy = [schedule.ctrl_id for schedule in self._schedules.values()
+                    if schedule.busy]
+        if not busy:
+            return
+        names = []
+        for ctrl_id in busy:
+            try:
+                names.append(self._pool.get_element_by_id(ctrl_id).name)
+            except Exception:
+                names.append(str(ctrl_id))
+        self.warning("Stopped while reading the state of: %s",
+                     ", ".join(names))
@@ -444,7 +444,7 @@ class PoolMotion(PoolAction):
                                    moveable.name)
                     moveable.put_dial_position(position_value)
             i += 1
-            time.sleep(nap)
+            self.wait_state_change(nap)
 
     def _state_error_occured(self, d):
         for _, (state_info, exc_info) in list(d.items()):
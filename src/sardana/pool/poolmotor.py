@@ -651,6 +651,9 @@ class PoolMotor(PoolElement):
             position
         :rtype:
             :class:`~sardana.sardanavalue.SardanaValue`"""
+        coalescer = self.get_read_coalescer()
+        if coalescer is not None:
+            return coalescer.read_value(self)
         return self.motion.read_dial_position(serial=True)[self]
 
     def put_dial_position(self, dial_position_value, propagate=1):
@@ -213,6 +213,65 @@ class Position(SardanaAttribute):
             result = SardanaValue(exc_info=sys.exc_info())
         return result
 
+    def calc_physical_bulk(self, new_positions):
+        """Calculates the physical positions for a sequence of points.
+
+        Each point may be either a position of this pseudo motor (the
+        sibling pseudo motors are assumed to stay at their current
+        positions) or a sequence with the positions of all the pseudo motors.
+
+        :param new_positions: sequence of points
+        :type new_positions: sequence<float or sequence<float>>
+        :return: a sequence of physical positions (one sequence per point)
+        :rtype: :class:`~sardana.sardanavalue.SardanaValue`"""
+        try:
+            obj = self.obj
+            curr_physical_positions = self.get_physical_positions()
+            siblings_positions = None
+            pseudo_positions = []
+            for new_position in new_positions:
+                if not isinstance(new_position, collections.Sequence):
+                    if siblings_positions is None:
+                        siblings_positions = obj.get_siblings_positions()
+                    positions = dict(siblings_positions)
+                    positions[obj] = new_position
+                    new_position = len(positions) * [None]
+                    for pseudo, position in list(positions.items()):
+                        new_position[pseudo.axis - 1] = position
+                pseudo_positions.append(new_position)
+            result = obj.controller.calc_all_physical_bulk(
+                pseudo_positions, curr_physical_positions)
+        except SardanaException as se:
+            result = SardanaValue(exc_info=se.exc_info)
+        except:
+            result = SardanaValue(exc_info=sys.exc_info())
+        return result
+
+    def calc_all_pseudo_bulk(self, physical_positions):
+        """Calculates the pseudo positions for a sequence of points.
+
+        :param physical_positions: sequence of physical positions (one
+                                   sequence per point)
+        :type physical_positions: sequence<sequence<float>>
+        :return: a sequence of pseudo positions (one sequence per point)
+        :rtype: :class:`~sardana.sardanavalue.SardanaValue`"""
+        try:
+            obj = self.obj
+            l_u = len(obj.get_user_elements())
+            for point in physical_positions:
+                l_p = len(point)
+                if l_p != l_u:
+                    raise IndexError("CalcAllPseudoBulk():: must give %d "
+                                     "physical positions per point (you "
+                                     "gave %d)" % (l_u, l_p))
+            result = obj.controller.calc_all_pseudo_bulk(physical_positions,
+                                                         None)
+        except SardanaException as se:
+            result = SardanaValue(exc_info=se.exc_info)
+        except:
+            result = SardanaValue(exc_info=sys.exc_info())
+        return result
+
     def on_change(self, evt_src, evt_type, evt_value):
         self.fire_read_event(propagate=evt_type.priority)
 
@@ -343,6 +402,13 @@ class PoolPseudoMotor(PoolBaseGroup, PoolElement):
     def calc_all_pseudo(self, physical_positions=None):
         return self.get_position_attribute().calc_all_pseudo(physical_positions=physical_positions)
 
+    def calc_physical_bulk(self, new_positions):
+        return self.get_position_attribute().calc_physical_bulk(new_positions)
+
+    def calc_all_pseudo_bulk(self, physical_positions):
+        return self.get_position_attribute().calc_all_pseudo_bulk(
+            physical_positions)
+
     def get_position_attribute(self):
         return self._position
 
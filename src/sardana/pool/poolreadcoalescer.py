@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module is part of the Python Pool library. It defines the class
+responsible for coalescing the hardware reads of the idle elements of a
+controller"""
+
+__all__ = ["PoolReadCoalescer"]
+
+__docformat__ = 'restructuredtext'
+
+import sys
+import time
+import weakref
+import threading
+
+from taurus.core.util.log import Logger
+
+
+class _ReadBatch(object):
+    """A group of elements which hardware read is done in one go"""
+
+    def __init__(self):
+        self.elements = set()
+        self.results = {}
+        self.exc_info = None
+        self.done = threading.Event()
+
+
+class PoolReadCoalescer(Logger):
+    """Merges the concurrent single element reads (state or value) of the
+    idle elements of a controller into a single multi-axis read.
+
+    The first request (the leader) waits for the configured window
+    (:attr:`~sardana.pool.pool.Pool.read_coalesce_window`), collecting the
+    elements requested by the concurrent requests (the followers), and
+    then executes one :meth:`~sardana.pool.poolcontroller.PoolController.raw_read_axis_states`
+    or :meth:`~sardana.pool.poolcontroller.PoolController.raw_read_axis_values`
+    for all of them. The results are served to all the requests and are
+    kept in a cache during the configured time to live
+    (:attr:`~sardana.pool.pool.Pool.read_cache_ttl`)."""
+
+    State = "state"
+    Value = "value"
+
+    def __init__(self, pool_ctrl):
+        name = "{0}.ReadCoalescer".format(pool_ctrl.name)
+        Logger.__init__(self, name)
+        self._pool_ctrl = weakref.ref(pool_ctrl)
+        self._lock = threading.Lock()
+        self._pending = {self.State: None, self.Value: None}
+        # dict<str, dict<PoolElement, tuple<float, object>>>
+        self._cache = {self.State: {}, self.Value: {}}
+
+    def get_pool_controller(self):
+        return self._pool_ctrl()
+
+    pool_controller = property(get_pool_controller)
+
+    def is_enabled(self):
+        """Returns True if either the read window or the cache time to live
+        are configured"""
+        pool = self.pool_controller.pool
+        return pool.read_coalesce_window > 0 or pool.read_cache_ttl > 0
+
+    def invalidate(self, element=None):
+        """Discards the cached results of the given element or of all the
+        elements if None is given.
+
+        :param element: the element or None (default) for all the elements
+        :type element: :class:`~sardana.pool.poolelement.PoolElement`"""
+        with self._lock:
+            for cache in self._cache.values():
+                if element is None:
+                    cache.clear()
+                else:
+                    cache.pop(element, None)
+
+    def read_state_info(self, element):
+        """Reads the state information of the given element.
+
+        :param element: the element
+        :type element: :class:`~sardana.pool.poolelement.PoolElement`
+        :return: the controller state information as returned by
+                 :meth:`~sardana.pool.poolcontroller.PoolController.raw_read_axis_states`
+        :rtype: tuple<state info, exc_info>"""
+        return self._read(self.State, element)
+
+    def read_value(self, element):
+        """Reads the value of the given element.
+
+        :param element: the element
+        :type element: :class:`~sardana.pool.poolelement.PoolElement`
+        :return: the element value
+        :rtype: :class:`~sardana.sardanavalue.SardanaValue`"""
+        return self._read(self.Value, element)
+
+    def _read(self, kind, element):
+        pool = self.pool_controller.pool
+        ttl = pool.read_cache_ttl
+        with self._lock:
+            if ttl > 0:
+                cached = self._cache[kind].get(element)
+                if cached is not None and time.time() - cached[0] < ttl:
+                    return cached[1]
+            batch = self._pending[kind]
+            leader = batch is None
+            if leader:
+                batch = self._pending[kind] = _ReadBatch()
+            batch.elements.add(element)
+        if leader:
+            window = pool.read_coalesce_window
+            if window > 0:
+                time.sleep(window)
+            # close the batch: from now on new requests start a new one
+            with self._lock:
+                self._pending[kind] = None
+            try:
+                self._read_batch(kind, batch, ttl)
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+        if batch.exc_info is not None:
+            exc_type, exc_value, exc_tb = batch.exc_info
+            raise exc_value.with_traceback(exc_tb)
+        return batch.results[element]
+
+    def _read_batch(self, kind, batch, ttl):
+        pool_ctrl = self.pool_controller
+        axes = [element.axis for element in batch.elements]
+        timestamp = time.time()
+        pool_ctrl.lock()
+        try:
+            if kind == self.State:
+                results, error = pool_ctrl.raw_read_axis_states(axes)
+                if error:
+                    pool_ctrl.warning("Read state error")
+            else:
+                results = pool_ctrl.raw_read_axis_values(axes)
+        except:
+            batch.exc_info = sys.exc_info()
+            return
+        finally:
+            pool_ctrl.unlock()
+        batch.results = results
+        if ttl <= 0:
+            return
+        with self._lock:
+            cache = self._cache[kind]
+            for element, result in results.items():
+                if kind == self.State:
+                    error = result[1] is not None
+                else:
+                    error = result.error
+                if not error:
+                    cache[element] = timestamp, result
@@ -151,21 +151,44 @@ class PoolSynchronization(PoolAction):
          :obj:`~sardana.pool.pooldefs.SynchDomain.Time` or
          :obj:`~sardana.pool.pooldefs.SynchDomain.Position`
         """
+        def synch(ctrl):
+            pool_ctrl = ctrl.element
+            pool_ctrl.ctrl.PreSynchAll()
+            for channel in ctrl.get_channels(enabled=True):
+                axis = channel.axis
+                ret = pool_ctrl.ctrl.PreSynchOne(axis, synchronization)
+                if not ret:
+                    msg = ("%s.PreSynchOne(%d) returns False" %
+                           (ctrl.name, axis))
+                    raise Exception(msg)
+                pool_ctrl.ctrl.SynchOne(axis, synchronization)
+            pool_ctrl.ctrl.SynchAll()
+
+        def pre_start_all(ctrl):
+            pool_ctrl = ctrl.element
+            pool_ctrl.ctrl.PreStartAll()
+
+        def start_one(ctrl):
+            pool_ctrl = ctrl.element
+            for channel in ctrl.get_channels(enabled=True):
+                axis = channel.axis
+                ret = pool_ctrl.ctrl.PreStartOne(axis)
+                if not ret:
+                    raise Exception("%s.PreStartOne(%d) returns False"
+                                    % (pool_ctrl.name, axis))
+                pool_ctrl.ctrl.StartOne(axis)
+
+        start_times = []
+
+        def start_all(ctrl):
+            pool_ctrl = ctrl.element
+            start_times.append(time.time())
+            pool_ctrl.ctrl.StartAll()
+
         with ActionContext(self):
 
             # loads synchronization description
-            for ctrl in ctrls:
-                pool_ctrl = ctrl.element
-                pool_ctrl.ctrl.PreSynchAll()
-                for channel in ctrl.get_channels(enabled=True):
-                    axis = channel.axis
-                    ret = pool_ctrl.ctrl.PreSynchOne(axis, synchronization)
-                    if not ret:
-                        msg = ("%s.PreSynchOne(%d) returns False" %
-                               (ctrl.name, axis))
-                        raise Exception(msg)
-                    pool_ctrl.ctrl.SynchOne(axis, synchronization)
-                pool_ctrl.ctrl.SynchAll()
+            self.for_each_ctrl(synch, ctrls)
 
             # attaching listener (usually acquisition action)
             # to the software trigger gate generator
@@ -197,20 +220,10 @@ class PoolSynchronization(PoolAction):
                 get_thread_pool().add(self._synch_soft.run)
 
             # PreStartAll on all controllers
-            for ctrl in ctrls:
-                pool_ctrl = ctrl.element
-                pool_ctrl.ctrl.PreStartAll()
+            self.for_each_ctrl(pre_start_all, ctrls)
 
             # PreStartOne & StartOne on all elements
-            for ctrl in ctrls:
-                pool_ctrl = ctrl.element
-                for channel in ctrl.get_channels(enabled=True):
-                    axis = channel.axis
-                    ret = pool_ctrl.ctrl.PreStartOne(axis)
-                    if not ret:
-                        raise Exception("%s.PreStartOne(%d) returns False"
-                                        % (pool_ctrl.name, axis))
-                    pool_ctrl.ctrl.StartOne(axis)
+            self.for_each_ctrl(start_one, ctrls)
 
             # set the state of all elements to inform their listeners
             self._channels = []
@@ -220,9 +233,8 @@ class PoolSynchronization(PoolAction):
                     self._channels.append(channel)
 
             # StartAll on all controllers
-            for ctrl in ctrls:
-                pool_ctrl = ctrl.element
-                pool_ctrl.ctrl.StartAll()
+            self.for_each_ctrl(start_all, ctrls)
+            self._set_start_times(start_times)
 
     def is_triggering(self, states):
         """Determines if we are synchronizing or not based on the states
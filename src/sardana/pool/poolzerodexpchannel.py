@@ -43,9 +43,20 @@ from sardana.pool.poolacquisition import Pool0DAcquisition
 
 
 class BaseAccumulation(object):
+    """Accumulation of the 0D samples acquired during an acquisition.
+
+    Samples are stored in a buffer which grows (doubling its capacity) when
+    it gets full, so the accumulation is not limited in the number of
+    samples. Samples may be appended one by one (:meth:`append`) or in
+    blocks (:meth:`append_block`), in which case the accumulated value is
+    calculated with vectorized reductions."""
+
+    #: initial capacity of the buffer (number of samples)
+    InitialSize = 16384
 
     def __init__(self):
-        self.buffer = numpy.zeros(shape=(2, 16384), dtype=numpy.float64)
+        self.buffer = numpy.zeros(shape=(2, self.InitialSize),
+                                  dtype=numpy.float64)
         self.clear()
 
     def clear(self):
@@ -59,19 +70,60 @@ class BaseAccumulation(object):
     def get_time_buffer(self):
         return self.buffer[1][:self.nb_points]
 
+    def _reserve(self, nb_points):
+        """Ensure the buffer can store nb_points more samples"""
+        needed = self.nb_points + nb_points
+        capacity = self.buffer.shape[1]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        buff = numpy.zeros(shape=(2, capacity), dtype=numpy.float64)
+        buff[:, :self.nb_points] = self.buffer[:, :self.nb_points]
+        self.buffer = buff
+
     def append(self, value, timestamp=None):
         if timestamp is None:
             timestamp = time.time()
+        self._reserve(1)
         idx = self.nb_points
         self.nb_points += 1
         self.buffer[0][idx] = value
         self.buffer[1][idx] = timestamp
         self.update_value(value, timestamp)
 
+    def append_block(self, values, timestamps):
+        """Append a block of samples.
+
+        :param values: sample values (None or NaN for invalid samples)
+        :type values: sequence<float>
+        :param timestamps: sample timestamps
+        :type timestamps: sequence<float>
+        """
+        nb_points = len(values)
+        if nb_points == 0:
+            return
+        self._reserve(nb_points)
+        idx = self.nb_points
+        self.nb_points += nb_points
+        values_buff = self.buffer[0][idx:self.nb_points]
+        timestamps_buff = self.buffer[1][idx:self.nb_points]
+        values_buff[:] = values
+        timestamps_buff[:] = timestamps
+        self.update_block(values_buff, timestamps_buff)
+
     def update_value(self, value, timestamp):
         self.value = value
         self.timestamp = timestamp
 
+    def update_block(self, values, timestamps):
+        value = values[-1]
+        if numpy.isnan(value):
+            value = None
+        else:
+            value = float(value)
+        BaseAccumulation.update_value(self, value, float(timestamps[-1]))
+
 
 LastAccumulation = BaseAccumulation
 
@@ -88,6 +140,13 @@ class SumAccumulation(BaseAccumulation):
             self.sum += value
             self.value = self.sum
 
+    def update_block(self, values, timestamps):
+        BaseAccumulation.update_block(self, values, timestamps)
+        valid = ~numpy.isnan(values)
+        if valid.any():
+            self.sum += float(values[valid].sum())
+            self.value = self.sum
+
 
 class AverageAccumulation(SumAccumulation):
 
@@ -101,6 +160,15 @@ class AverageAccumulation(SumAccumulation):
             self.nb_valid_points += 1
             self.value = self.sum / self.nb_valid_points
 
+    def update_block(self, values, timestamps):
+        BaseAccumulation.update_block(self, values, timestamps)
+        valid = ~numpy.isnan(values)
+        nb_valid_points = int(numpy.count_nonzero(valid))
+        if nb_valid_points > 0:
+            self.sum += float(values[valid].sum())
+            self.nb_valid_points += nb_valid_points
+            self.value = self.sum / self.nb_valid_points
+
 
 class IntegralAccumulation(BaseAccumulation):
 
@@ -123,6 +191,26 @@ class IntegralAccumulation(BaseAccumulation):
             self.value = self.sum / total_dt
             self.last_value = value, timestamp
 
+    def update_block(self, values, timestamps):
+        valid = ~numpy.isnan(values)
+        values, timestamps = values[valid], timestamps[valid]
+        if len(values) == 0:
+            return
+        self.timestamp = float(timestamps[-1])
+        if self.last_value is None:
+            self.start_time = float(timestamps[0])
+            self.value = float(values[0])
+        else:
+            # include the trapezoid from the last sample of previous block
+            last_value, last_timestamp = self.last_value
+            values = numpy.concatenate(((last_value,), values))
+            timestamps = numpy.concatenate(((last_timestamp,), timestamps))
+        if len(values) > 1:
+            self.sum += float(numpy.sum(numpy.diff(timestamps) *
+                                        (values[:-1] + values[1:]) / 2))
+            self.value = self.sum / (self.timestamp - self.start_time)
+        self.last_value = float(values[-1]), self.timestamp
+
 
 def get_accumulation_class(ctype):
     return globals()[ctype + "Accumulation"]
@@ -207,6 +295,12 @@ class Value(SardanaAttribute):
             evt_type = EventType(self.name, priority=propagate)
             self.fire_event(evt_type, self)
 
+    def append_buffer_block(self, values, timestamps, propagate=1):
+        self.accumulation.append_block(values, timestamps)
+        if propagate > 0:
+            evt_type = EventType(self.name, priority=propagate)
+            self.fire_event(evt_type, self)
+
     def update(self, cache=True, propagate=1):
         # it is the Pool0DAcquisition action which is allowed to update
         raise Exception("0D Value can not be updated from outside"
@@ -295,6 +389,28 @@ class Pool0DExpChannel(PoolBaseChannel):
             acc_val_attr = self.get_accumulated_value_attribute()
             acc_val_attr.append_buffer(value, propagate=propagate)
 
+    def put_current_value_block(self, values, timestamps, last_value,
+                                propagate=1):
+        """Put a block of current values acquired by the acquisition.
+        The current value is set to the last value of the block and all
+        the values are accumulated at once.
+
+        :param values: the sample values (None or NaN for invalid samples)
+        :type values: sequence<float>
+        :param timestamps: the sample timestamps
+        :type timestamps: sequence<float>
+        :param last_value: the last value of the block
+        :type last_value: :class:`~sardana.sardanavalue.SardanaValue`
+        :param propagate:
+            0 for not propagating, 1 to propagate, 2 propagate with priority
+        :type propagate: int"""
+        curr_val_attr = self.get_current_value_attribute()
+        curr_val_attr.set_value(last_value, propagate=propagate)
+        if self.is_in_operation():
+            acc_val_attr = self.get_accumulated_value_attribute()
+            acc_val_attr.append_buffer_block(values, timestamps,
+                                             propagate=propagate)
+
     def get_current_value(self, cache=True, propagate=1):
         """Returns the counter value.
 
@@ -39,3 +39,7 @@ from .test_poolcountertimer import *  # NOQA
 from .test_poolsynchronization import *  # NOQA
 from .test_synchronization import *  # NOQA
 from .test_poolmotion import *  # NOQA
+from .test_poolpseudomotor import *  # NOQA
+from .test_poolaction import *  # NOQA
+from .test_poolmonitor import *  # NOQA
+from .test_poolreadcoalescer import *  # NOQA
@@ -31,6 +31,7 @@ from sardana.pool.test import (FakePool, createPoolController, createCtrlConf,
                                createPoolCounterTimer, createPoolTriggerGate,
                                createPoolMotor, createElemConf,
                                createPoolZeroDExpChannel,
+                               createPoolOneDExpChannel,
                                createPoolTwoDExpChannel,
                                createPoolPseudoCounter, createPoolPseudoMotor)
 
@@ -66,6 +67,15 @@ class BasePoolTestCase(object):
         self.pool.add_element(elem_obj)
         return elem_obj
 
+    def createOneDElement(self, ctrl_obj, name, axis):
+        e_cfg = createElemConf(self.pool, axis, name)
+        elem_obj = createPoolOneDExpChannel(self.pool, ctrl_obj, e_cfg)
+        ctrl_obj.add_element(elem_obj)
+        # OneD elements
+        self.oneds[name] = elem_obj
+        self.pool.add_element(elem_obj)
+        return elem_obj
+
     def createTwoDElement(self, ctrl_obj, name, axis):
         e_cfg = createElemConf(self.pool, axis, name)
         elem_obj = createPoolTwoDExpChannel(self.pool, ctrl_obj, e_cfg)
@@ -128,6 +138,7 @@ class BasePoolTestCase(object):
         self.ctrls = {}
         self.cts = {}
         self.zerods = {}
+        self.oneds = {}
         self.twods = {}
         self.tgs = {}
         self.mots = {}
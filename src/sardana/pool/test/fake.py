@@ -36,6 +36,9 @@ class FakePool(object):
     motion_loop_sleep_time = 0.1
     motion_loop_states_per_position = 10
     drift_correction = True
+    parallel_ctrl_start = False
+    read_coalesce_window = 0
+    read_cache_ttl = 0
 
     def __init__(self, poolpath=[], loglevel=None):
         self.ctrl_manager = ControllerManager()
@@ -54,9 +57,19 @@ class FakePool(object):
     def get_element(self, id):
         return self.elements[id]
 
+    def get_element_by_id(self, id):
+        return self.elements[id]
+
     def get_element_by_full_name(self, full_name):
         return self.elements_by_full_name[full_name]
 
+    def get_elements_by_type(self, t):
+        return [elem for elem in self.elements.values()
+                if elem.get_type() == t]
+
+    def add_listener(self, listener):
+        pass
+
     def get_free_id(self):
         while True:
             try:
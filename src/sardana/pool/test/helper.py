@@ -24,7 +24,8 @@
 ##############################################################################
 
 __all__ = ['createPoolController', 'createPoolCounterTimer',
-           'createPoolZeroDExpChannel', 'createPoolTwoDExpChannel',
+           'createPoolZeroDExpChannel', 'createPoolOneDExpChannel',
+           'createPoolTwoDExpChannel',
            'createPoolTriggerGate',
            'createPoolMotor', 'createPoolPseudoCounter',
            'createPoolPseudoMotor', 'createPoolMeasurementGroup',
@@ -40,6 +41,7 @@ from sardana.pool.poolcontroller import PoolController,\
     PoolPseudoMotorController, PoolPseudoCounterController
 from sardana.pool.poolcountertimer import PoolCounterTimer
 from sardana.pool.poolzerodexpchannel import Pool0DExpChannel
+from sardana.pool.poolonedexpchannel import Pool1DExpChannel
 from sardana.pool.pooltwodexpchannel import Pool2DExpChannel
 from sardana.pool.pooltriggergate import PoolTriggerGate
 from sardana.pool.poolmotor import PoolMotor
@@ -108,6 +110,15 @@ def createPoolZeroDExpChannel(pool, poolcontroller, conf):
     return Pool0DExpChannel(**kwargs)
 
 
+def createPoolOneDExpChannel(pool, poolcontroller, conf):
+    '''Method to create a OneDExpChannel using a configuration dictionary
+    '''
+    kwargs = copy.deepcopy(conf)
+    kwargs['pool'] = pool
+    kwargs['ctrl'] = poolcontroller
+    return Pool1DExpChannel(**kwargs)
+
+
 def createPoolTwoDExpChannel(pool, poolcontroller, conf):
     '''Method to create a ZeroDExpChannel using a configuration dictionary
     '''
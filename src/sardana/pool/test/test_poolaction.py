@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import threading
+
+from taurus.external.unittest import TestCase
+
+from sardana.pool.poolaction import PoolAction
+from sardana.pool.test import FakePool, FakeElement
+
+
+class PoolActionForEachCtrlTestCase(TestCase):
+    """Unit tests of the controllers fan out of PoolAction"""
+
+    def setUp(self):
+        self.pool = FakePool()
+        self.element = FakeElement(self.pool)
+        self.action = PoolAction(self.element)
+
+    def test_serial(self):
+        """Verify that the controllers are called serially in order."""
+        self.pool.parallel_ctrl_start = False
+        called = []
+        self.action.for_each_ctrl(called.append, [1, 2, 3])
+        self.assertListEqual(called, [1, 2, 3])
+
+    def test_parallel(self):
+        """Verify that the controllers are called concurrently and that
+        the call returns when all of them finished."""
+        self.pool.parallel_ctrl_start = True
+        ctrls = [1, 2, 3]
+        barrier = threading.Barrier(len(ctrls), timeout=5)
+        called = []
+
+        def func(ctrl):
+            # fails with BrokenBarrierError if not called concurrently
+            barrier.wait()
+            called.append(ctrl)
+
+        self.action.for_each_ctrl(func, ctrls)
+        self.assertListEqual(sorted(called), ctrls)
+
+    def test_parallel_error(self):
+        """Verify that the exception of any of the controllers is raised."""
+        self.pool.parallel_ctrl_start = True
+
+        def func(ctrl):
+            if ctrl == 2:
+                raise RuntimeError("failed")
+
+        with self.assertRaises(RuntimeError):
+            self.action.for_each_ctrl(func, [1, 2, 3])
+
+    def test_start_skew(self):
+        """Verify the start skew calculation."""
+        self.assertIsNone(self.action.get_start_skew())
+        self.action._set_start_times([10., 10.5, 10.2])
+        self.assertAlmostEqual(self.action.get_start_skew(), .5)
+
+    def tearDown(self):
+        self.pool.parallel_ctrl_start = False
+        self.action = None
+        self.element = None
+        self.pool = None
@@ -24,8 +24,10 @@
 ##############################################################################
 
 from taurus.external import unittest
+from unittest import mock
 from sardana.pool.test import (FakePool, createPoolController,
-                               dummyPoolCTCtrlConf01)
+                               dummyPoolCTCtrlConf01, BasePoolTestCase)
+from sardana.pool.pool import Pool
 from sardana.pool.poolcontroller import PoolController
 
 
@@ -44,6 +46,132 @@ class PoolControllerTestCase(unittest.TestCase):
               'PoolController instance'
         self.assertIsInstance(self.pc, PoolController, msg)
 
+    def test_update_ctrl_par(self):
+        """Verify that a controller (or axis) parameter is set only if it
+        changed since it was last set (also with set_axes_pars) and after the
+        controller re-initialization"""
+        self.assertTrue(self.pc.update_ctrl_par("synchronization", 1))
+        self.assertFalse(self.pc.update_ctrl_par("synchronization", 1))
+        self.assertTrue(self.pc.update_ctrl_par("synchronization", 2))
+        self.pc.set_ctrl_par("synchronization", 1)
+        self.assertFalse(self.pc.update_ctrl_par("synchronization", 1))
+        self.pc.re_init()
+        self.assertTrue(self.pc.update_ctrl_par("synchronization", 1))
+        # axis parameters set with the bulk set_axes_pars (e.g. memorized
+        # restore) are set again by update_axis_par if they changed
+        pc = self.pc
+        ctrl = pc.ctrl
+        name = "value_ref_pattern"
+        with mock.patch.object(ctrl, "SetAxisPar"):
+            self.assertTrue(pc.update_axis_par(1, name, "a"))
+            self.assertFalse(pc.update_axis_par(1, name, "a"))
+            # controller without SetAxisPars: parameters set one by one
+            self.assertEqual(pc.set_axes_pars([(1, name, "b")]), [])
+            self.assertTrue(pc.update_axis_par(1, name, "a"))
+            # the value written by set_axes_pars is known as applied
+            self.assertEqual(pc.set_axes_pars([(1, name, "b")]), [])
+            self.assertFalse(pc.update_axis_par(1, name, "b"))
+        with mock.patch.object(type(ctrl), "SetAxisPars") as set_axes_pars:
+            self.assertEqual(pc.set_axes_pars([(1, name, "c")]), [])
+            set_axes_pars.assert_called_once_with({1: {name: "c"}})
+        with mock.patch.object(ctrl, "SetAxisPar") as set_axis_par:
+            self.assertTrue(pc.update_axis_par(1, name, "a"))
+            self.assertFalse(pc.update_axis_par(1, name, "a"))
+            set_axis_par.side_effect = Exception("failed")
+            errors = pc.set_axes_pars([(1, name, "d")])
+            self.assertEqual(len(errors), 1)
+            # the failed parameter is not known as applied anymore
+            set_axis_par.side_effect = None
+            self.assertTrue(pc.update_axis_par(1, name, "a"))
+        # controller attributes written with the attribute setter or with
+        # SetCtrlPar invalidate the parameter set by update_ctrl_par
+        name = "Synchronizer"
+        with mock.patch.object(ctrl, "SetCtrlPar"):
+            self.assertTrue(pc.update_ctrl_par(name, "a"))
+            pc.set_ctrl_attr(name, "b")
+            self.assertTrue(pc.update_ctrl_par(name, "a"))
+            with mock.patch.object(ctrl, "setSynchronizer",
+                                   create=True) as set_synchronizer:
+                pc.set_ctrl_attr(name, "b")
+                set_synchronizer.assert_called_once_with("b")
+            self.assertTrue(pc.update_ctrl_par(name, "a"))
+            self.assertFalse(pc.update_ctrl_par(name, "a"))
+
     def tearDown(self):
         unittest.TestCase.tearDown(self)
         self.pc = None
+
+
+class PoolMotorControllerTestCase(BasePoolTestCase, unittest.TestCase):
+    """Integration tests of PoolController with a dummy motor controller"""
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        self.ctrl = self.createController("motctrl01",
+                                          "DummyMotorController",
+                                          "DummyMotorController")
+        self.createMotorElement(self.ctrl, "mot01", 1)
+        self.createMotorElement(self.ctrl, "mot02", 2)
+
+    def test_set_axes_pars(self):
+        """Verify that axis parameters of multiple axes are set at once and
+        that the wrong ones are reported."""
+        axes_pars = [(1, "velocity", 10.), (2, "velocity", 20.),
+                     (2, "acceleration", 0.5), (3, "velocity", 30.)]
+        errors = self.ctrl.set_axes_pars(axes_pars)
+        self.assertEqual(self.ctrl.get_axis_par(1, "velocity"), 10.)
+        self.assertEqual(self.ctrl.get_axis_par(2, "velocity"), 20.)
+        self.assertEqual(self.ctrl.get_axis_par(2, "acceleration"), 0.5)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][:3], (3, "velocity", 30.))
+
+    def test_get_axes_pars(self):
+        """Verify that axis parameters of multiple axes are get at once."""
+        self.ctrl.set_axes_pars([(1, "velocity", 10.), (2, "velocity", 20.)])
+        axes_pars = self.ctrl.get_axes_pars([1, 2], ["velocity"])
+        self.assertEqual(axes_pars, {1: {"velocity": 10.},
+                                     2: {"velocity": 20.}})
+
+    def test_set_axes_pars_bulk(self):
+        """Verify that the controller SetAxisPars is used when implemented
+        and that the parameters are set one by one if it fails."""
+        klass = type(self.ctrl.ctrl)
+        axes_pars = [(1, "velocity", 10.), (2, "velocity", 20.),
+                     (2, "acceleration", 0.5)]
+        with mock.patch.object(klass, "SetAxisPars") as set_axis_pars:
+            errors = self.ctrl.set_axes_pars(axes_pars)
+            set_axis_pars.assert_called_once_with(
+                {1: {"velocity": 10.},
+                 2: {"velocity": 20., "acceleration": 0.5}})
+            self.assertEqual(errors, [])
+            set_axis_pars.side_effect = Exception("bulk not supported")
+            errors = self.ctrl.set_axes_pars(axes_pars)
+        self.assertEqual(errors, [])
+        self.assertEqual(self.ctrl.get_axis_par(2, "acceleration"), 0.5)
+
+    def test_set_elements_pars(self):
+        """Verify that the Pool sets the axis parameters of the elements
+        and returns the ones which could not be set."""
+        klass = type(self.ctrl.ctrl)
+        set_axis_par = klass.SetAxisPar
+
+        def SetAxisPar(ctrl, axis, name, value):
+            if axis == 2 and name == "velocity":
+                raise ValueError("velocity out of range")
+            set_axis_par(ctrl, axis, name, value)
+
+        mot01, mot02 = self.mots["mot01"], self.mots["mot02"]
+        elements_pars = {mot01: {"velocity": 10.},
+                         mot02: {"velocity": 20., "acceleration": 0.5}}
+        # the fake pool does not implement it
+        pool = Pool.__new__(Pool)
+        with mock.patch.object(klass, "SetAxisPar", SetAxisPar):
+            errors = pool.set_elements_pars(elements_pars)
+        self.assertEqual([error[:3] for error in errors],
+                         [(mot02, "velocity", 20.)])
+        self.assertEqual(self.ctrl.get_axis_par(1, "velocity"), 10.)
+        self.assertEqual(self.ctrl.get_axis_par(2, "acceleration"), 0.5)
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
+        self.ctrl = None
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import threading
+
+from taurus.external import unittest
+
+from sardana.sardanaevent import EventType
+from sardana.pool.poolmonitor import PoolMonitor
+from sardana.pool.test import BasePoolTestCase
+
+
+class PoolMonitorTestCase(BasePoolTestCase, unittest.TestCase):
+    """Integration tests of PoolMonitor with dummy controllers"""
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        self.monitor = PoolMonitor(self.pool, period=60, auto_start=False)
+        self.monitor.on_pool_changed(self.pool, EventType("ElementCreated"),
+                                     None)
+        self.hung_ctrl = self.ctrls["_test_mot_ctrl_1"]
+        self.release = threading.Event()
+        raw_read_axis_states = self.hung_ctrl.raw_read_axis_states
+
+        def read_axis_states(axes=None, ctrl_states=None):
+            self.release.wait(10)
+            return raw_read_axis_states(axes, ctrl_states)
+
+        self.hung_ctrl.raw_read_axis_states = read_axis_states
+
+    def test_hung_controller(self):
+        """Verify that a hung controller does not delay the others and that
+        its overruns are reported."""
+        statistics = self.monitor.get_statistics()
+        self.monitor.monitor()
+        for ctrl in self.ctrls.values():
+            if ctrl is self.hung_ctrl or ctrl.name not in statistics:
+                continue
+            schedule = self.monitor._schedules[ctrl.id]
+            while schedule.busy:
+                threading.Event().wait(0.01)
+        statistics = self.monitor.get_statistics()
+        hung_stats = statistics.pop(self.hung_ctrl.name)
+        self.assertTrue(hung_stats["busy"])
+        self.assertEqual(hung_stats["nb_cycles"], 0)
+        for name, stats in statistics.items():
+            self.assertEqual(stats["nb_cycles"], 1, name)
+        # make the hung controller read due again
+        self.monitor._schedules[self.hung_ctrl.id].next_time = 0
+        self.monitor.monitor()
+        hung_stats = self.monitor.get_statistics()[self.hung_ctrl.name]
+        self.assertEqual(hung_stats["nb_overruns"], 1)
+        self.release.set()
+
+    def test_backoff(self):
+        """Verify that the period of a failing controller is increased."""
+        self.release.set()
+
+        def read_axis_states(axes=None, ctrl_states=None):
+            raise RuntimeError("failed")
+
+        self.hung_ctrl.raw_read_axis_states = read_axis_states
+        schedule = self.monitor._schedules[self.hung_ctrl.id]
+        self.monitor.update_state_info()
+        self.assertEqual(schedule.errors, 1)
+        self.assertEqual(schedule.get_interval(PoolMonitor.MAX_BACKOFF), 120)
+        self.monitor.update_state_info()
+        self.assertEqual(schedule.get_interval(PoolMonitor.MAX_BACKOFF), 240)
+
+    def test_stop_hung_controller(self):
+        """Verify that stopping does not wait for a hung controller longer
+        than the join timeout."""
+        self.monitor.JOIN_TIMEOUT = 0.1
+        self.monitor.monitor()
+        self.monitor.stop()
+        self.monitor.join(5)
+        self.assertFalse(self.monitor.is_alive())
+        statistics = self.monitor.get_statistics()
+        self.assertTrue(statistics[self.hung_ctrl.name]["busy"])
+
+    def tearDown(self):
+        self.release.set()
+        self.monitor.stop()
+        self.monitor.join()
+        BasePoolTestCase.tearDown(self)
+        self.monitor = None
@@ -22,6 +22,7 @@
 # along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
 ##
 ##############################################################################
+import time
 
 from taurus.external import unittest
 
@@ -30,6 +31,7 @@ from sardana.sardanadefs import State
 from sardana.pool.test import (FakePool, createPoolController,
                                createPoolMotor, dummyPoolMotorCtrlConf01,
                                dummyMotorConf01, dummyMotorConf02)
+from sardana.pool.test.base import BasePoolTestCase
 
 
 class PoolMotionTestCase(unittest.TestCase):
@@ -121,3 +123,37 @@ class PoolMotionTestCase(unittest.TestCase):
         self.cfg = None
         self.dummy_mot = None
         unittest.TestCase.tearDown(self)
+
+
+class PoolMotionStateNotifierTestCase(BasePoolTestCase, unittest.TestCase):
+    """Integration tests of PoolMotion with controllers notifying the state
+    changes"""
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        self.motctrl = self.createController("motctrl01",
+                                             "DummyMotorController",
+                                             "DummyMotorController")
+        self.mot = self.createMotorElement(self.motctrl, "mot01", 1)
+        ctrl = self.motctrl.ctrl
+        ctrl.SetAxisPar(1, "acceleration", 0.01)
+        ctrl.SetAxisPar(1, "deceleration", 0.01)
+
+    def test_end_of_motion_notified(self):
+        """Verify that the motion loop does not wait for the next state poll
+        when the controller notifies the end of motion."""
+        self.assertTrue(self.motctrl.is_state_notifier())
+        motion = self.mot.motion
+        items = self.mot.calculate_motion(1)
+        start = time.time()
+        motion.run(items=items, synch=True, motion_sleep_time=5)
+        elapsed = time.time() - start
+        self.assertLess(elapsed, 2)
+        self.assertEqual(self.mot.get_state(cache=False), State.On)
+        self.assertAlmostEqual(self.mot.get_position(cache=False).value, 1)
+        self.assertEqual(len(self.motctrl._state_change_events), 0)
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
+        self.motctrl = None
+        self.mot = None
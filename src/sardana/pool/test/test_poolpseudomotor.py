@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+from taurus.external.unittest import TestCase
+
+from sardana.pool.controller import PseudoMotorController
+from sardana.pool.test.base import BasePoolTestCase
+
+
+class PseudoMotorTestCase(BasePoolTestCase, TestCase):
+    """TestCase with PseudoMotor integration tests."""
+
+    def setUp(self):
+        """Create Slit gap and offset pseudo motors based on two dummy
+        motors"""
+        BasePoolTestCase.setUp(self)
+        motctrl = self.createController("motctrl1", "DummyMotorController",
+                                        "DummyMotorController")
+        mot1 = self.createMotorElement(motctrl, "mot1", 1)
+        mot2 = self.createMotorElement(motctrl, "mot2", 2)
+        mot1.set_position(1)
+        mot2.set_position(3)
+        self.pmctrl = self.createController("pmctrl1", "Slit", "Slit")
+        elements = (mot1.id, mot2.id)
+        self.gap = self.createPMElement(self.pmctrl, "gap", 1, elements)
+        self.offset = self.createPMElement(self.pmctrl, "offset", 2,
+                                           elements)
+
+    def test_calc_physical_bulk(self):
+        """Test that the bulk calculation of the physical positions gives
+        the same results as the calculation point by point."""
+        positions = [[2, 0], [4, 1], [6, -1]]
+        result = self.gap.calc_physical_bulk(positions)
+        self.assertFalse(result.error)
+        self.assertEqual(len(result.value), len(positions))
+        for point, physical in zip(positions, result.value):
+            expected = self.gap.calc_physical(point).value
+            self.assertSequenceEqual(list(physical), list(expected))
+
+    def test_calc_physical_bulk_siblings(self):
+        """Test that scalar points of the bulk calculation use the current
+        positions of the sibling pseudo motors."""
+        result = self.gap.calc_physical_bulk([2, 4])
+        self.assertFalse(result.error)
+        for gap, physical in zip([2, 4], result.value):
+            expected = self.gap.calc_physical(gap).value
+            self.assertSequenceEqual(list(physical), list(expected))
+
+    def test_calc_all_pseudo_bulk(self):
+        """Test that the bulk calculation of the pseudo positions gives the
+        same results as the calculation point by point."""
+        positions = [[1, 1], [2, 0], [0.5, 1.5]]
+        result = self.gap.calc_all_pseudo_bulk(positions)
+        self.assertFalse(result.error)
+        for point, pseudo in zip(positions, result.value):
+            expected = self.gap.calc_all_pseudo(point).value
+            self.assertSequenceEqual(list(pseudo), list(expected))
+
+    def test_calc_all_physical_bulk_fallback(self):
+        """Test the default (looping) implementation of the bulk
+        calculation against the vectorized one."""
+        ctrl = self.pmctrl.ctrl
+        positions = [[2, 0], [4, 1], [6, -1]]
+        expected = ctrl.CalcAllPhysicalBulk(positions, [1, 3])
+        result = PseudoMotorController.CalcAllPhysicalBulk(ctrl, positions,
+                                                           [1, 3])
+        for physical, expected_physical in zip(result, expected):
+            self.assertSequenceEqual(list(physical), list(expected_physical))
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import threading
+
+from taurus.external import unittest
+
+from sardana.pool.test import BasePoolTestCase
+
+
+class PoolReadCoalescerTestCase(BasePoolTestCase, unittest.TestCase):
+    """Integration tests of the read coalescer with a dummy motor
+    controller"""
+
+    def setUp(self):
+        BasePoolTestCase.setUp(self)
+        self.ctrl = self.createController("motctrl01",
+                                          "DummyMotorController",
+                                          "DummyMotorController")
+        self.motors = [self.createMotorElement(self.ctrl, "mot%02d" % axis,
+                                               axis)
+                       for axis in range(1, 5)]
+        self.reads = []
+        raw_read_axis_states = self.ctrl.raw_read_axis_states
+
+        def read_axis_states(axes=None, ctrl_states=None):
+            self.reads.append(sorted(axes))
+            return raw_read_axis_states(axes, ctrl_states)
+
+        self.ctrl.raw_read_axis_states = read_axis_states
+
+    def _read_concurrently(self):
+        threads = [threading.Thread(target=motor.read_state_info)
+                   for motor in self.motors]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_disabled(self):
+        """Verify that by default each element is read on its own."""
+        self._read_concurrently()
+        self.assertEqual(len(self.reads), len(self.motors))
+
+    def test_coalesce(self):
+        """Verify that concurrent reads are merged into a single one."""
+        self.pool.read_coalesce_window = 0.2
+        self._read_concurrently()
+        self.assertListEqual(self.reads, [[1, 2, 3, 4]])
+
+    def test_cache(self):
+        """Verify that the cached results are served and that they are
+        discarded when the element gets involved in an operation."""
+        self.pool.read_cache_ttl = 60
+        motor = self.motors[0]
+        state_info = motor.read_state_info()
+        self.assertEqual(motor.read_state_info(), state_info)
+        self.assertEqual(len(self.reads), 1)
+        motor.set_operation(motor.get_action_cache())
+        motor.clear_operation()
+        motor.read_state_info()
+        self.assertEqual(len(self.reads), 2)
+
+    def tearDown(self):
+        BasePoolTestCase.tearDown(self)
+        self.ctrl = None
+        self.motors = None
@@ -0,0 +1,78 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import numpy
+
+from taurus.external import unittest
+
+from sardana.pool.poolzerodexpchannel import get_accumulation_class
+
+
+class AccumulationTestCase(unittest.TestCase):
+    """Unittest of the 0D accumulations"""
+
+    def setUp(self):
+        self.values = [1., None, 3., 2., 5., None, 4.]
+        self.timestamps = [0., 0.5, 1., 1.5, 3., 3.5, 4.]
+
+    def _accumulate(self, ctype, block_size):
+        acc = get_accumulation_class(ctype)()
+        for i in range(0, len(self.values), block_size):
+            acc.append_block(self.values[i:i + block_size],
+                             self.timestamps[i:i + block_size])
+        return acc
+
+    def test_block(self):
+        """Verify that accumulating in blocks gives the same value as
+        accumulating sample by sample."""
+        for ctype in ("Last", "Sum", "Average"):
+            acc = get_accumulation_class(ctype)()
+            for value, timestamp in zip(self.values, self.timestamps):
+                acc.append(value, timestamp)
+            for block_size in (1, 2, 3, 7):
+                block_acc = self._accumulate(ctype, block_size)
+                msg = "wrong %s value (block size %d)" % (ctype, block_size)
+                self.assertAlmostEqual(block_acc.value, acc.value, msg=msg)
+                numpy.testing.assert_array_equal(
+                    block_acc.get_time_buffer(), acc.get_time_buffer())
+
+    def test_integral(self):
+        # trapezoids of the valid samples divided by the total time
+        expected = (1 * (1 + 3) / 2 + 0.5 * (3 + 2) / 2 +
+                    1.5 * (2 + 5) / 2 + 1 * (5 + 4) / 2) / 4
+        for block_size in (1, 2, 3, 7):
+            acc = self._accumulate("Integral", block_size)
+            self.assertAlmostEqual(acc.value, expected)
+
+    def test_grow(self):
+        """Verify that the buffer grows when it gets full."""
+        acc = get_accumulation_class("Average")()
+        nb_points = acc.InitialSize * 2 + 10
+        acc.append_block(numpy.ones(nb_points - 1),
+                         numpy.arange(nb_points - 1))
+        acc.append(3., nb_points)
+        self.assertEqual(len(acc.get_value_buffer()), nb_points)
+        self.assertEqual(acc.get_time_buffer()[-1], nb_points)
+        self.assertAlmostEqual(acc.value, (nb_points + 2.) / nb_points)
+        acc.clear()
+        self.assertEqual(len(acc.get_value_buffer()), 0)
@@ -73,6 +73,8 @@ class _SardanaServer(object):
 
     def __init__(self):
         self.server_state = State.Invalid
+        #: callables executed once all the server devices were created
+        self.post_init_hooks = []
 
     def __repr__(self):
         return "SardanaServer()"
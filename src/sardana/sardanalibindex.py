@@ -0,0 +1,510 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module is part of the Python Sardana library. It defines the
+persistent index of the sardana libraries (macro, controller, ...) and the
+placeholders used to expose a library which has not been imported yet"""
+
+__all__ = ["LibraryIndex", "LazyLibrary", "LazyCode"]
+
+__docformat__ = 'restructuredtext'
+
+import os
+import sys
+import json
+import types
+import hashlib
+import threading
+
+from taurus.core.util.log import Logger
+
+from sardana import ElementType
+
+
+class LibraryIndex(Logger):
+    """An index of the signature of the sardana libraries.
+
+    Each entry is keyed by the absolute file path of the library and
+    contains the file modification time, size and SHA-1 hash together with
+    the serialized information of the library and its elements, as it was
+    the last time the library was inspected. The same signature is kept for
+    the library dependencies i.e. the modules located in the library path
+    which the library uses (e.g. a module with the helper functions of
+    several macro libraries). It allows to know if a library changed
+    without importing it.
+
+    If a file name is given the index is persistent i.e. it is loaded from
+    and :meth:`~LibraryIndex.save` stores it in that (JSON) file."""
+
+    #: version of the file format
+    Version = 2
+
+    def __init__(self, file_name=None):
+        Logger.__init__(self, self.__class__.__name__)
+        self._file_name = file_name
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+        if file_name is not None:
+            self.load()
+
+    def get_file_name(self):
+        """Returns the file name where this index is stored.
+
+        :return: the file name or None if the index is not persistent
+        :rtype: :obj:`str`"""
+        return self._file_name
+
+    def load(self):
+        """Loads the index from its file. A missing, corrupted or
+        incompatible file results in an empty index."""
+        entries = {}
+        try:
+            with open(self._file_name) as f:
+                data = json.load(f)
+            if data.get('version') == self.Version:
+                entries = data['libraries']
+        except FileNotFoundError:
+            pass
+        except Exception:
+            self.warning("Failed to load library index %s", self._file_name)
+            self.debug("Details:", exc_info=1)
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+
+    def save(self):
+        """Stores the index in its file (if the index is persistent and it
+        changed since it was loaded or last saved)."""
+        if self._file_name is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(version=self.Version, libraries=self._entries)
+            tmp_file_name = self._file_name + ".tmp"
+            try:
+                dir_name = os.path.dirname(self._file_name)
+                if dir_name and not os.path.isdir(dir_name):
+                    os.makedirs(dir_name)
+                with open(tmp_file_name, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_file_name, self._file_name)
+                self._dirty = False
+            except Exception:
+                self.warning("Failed to save library index %s",
+                             self._file_name)
+                self.debug("Details:", exc_info=1)
+
+    @staticmethod
+    def get_hash(file_path):
+        """Returns the SHA-1 hash of the given file contents.
+
+        :param file_path: the file path
+        :type file_path: :obj:`str`
+        :return: the hexadecimal digest
+        :rtype: :obj:`str`"""
+        with open(file_path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    @classmethod
+    def get_signature(cls, file_path):
+        """Returns the signature of the given file: its modification time,
+        size and SHA-1 hash.
+
+        :param file_path: the file path
+        :type file_path: :obj:`str`
+        :return: a dict with the 'mtime', 'size' and 'hash'
+        :rtype: :obj:`dict`"""
+        stat = os.stat(file_path)
+        return dict(mtime=stat.st_mtime, size=stat.st_size,
+                    hash=cls.get_hash(file_path))
+
+    @staticmethod
+    def get_dependencies(module, path):
+        """Returns the files of the modules which the given module uses,
+        directly or through other dependencies, and which are located in
+        the given path. The modules are found in the module namespace
+        (imported modules and objects defined in other modules).
+
+        :param module: the library module
+        :type module: module
+        :param path: the directories where the dependencies are looked for
+        :type path: seq<str>
+        :return: the absolute file paths of the dependencies
+        :rtype: set<str>"""
+        dir_names = tuple(os.path.join(os.path.abspath(dir_name), "")
+                          for dir_name in path)
+        deps = set()
+        seen = {module.__name__}
+        modules = [module]
+        while modules:
+            for obj in list(vars(modules.pop()).values()):
+                if isinstance(obj, types.ModuleType):
+                    dep = obj
+                else:
+                    try:
+                        dep = sys.modules.get(obj.__module__)
+                    except Exception:
+                        continue
+                if dep is None or dep.__name__ in seen:
+                    continue
+                seen.add(dep.__name__)
+                file_path = getattr(dep, "__file__", None)
+                if file_path is None:
+                    continue
+                file_path = os.path.abspath(file_path)
+                if file_path.startswith(dir_names):
+                    deps.add(file_path)
+                    modules.append(dep)
+        module_file_path = getattr(module, "__file__", None)
+        if module_file_path is not None:
+            deps.discard(os.path.abspath(module_file_path))
+        return deps
+
+    def _is_unchanged(self, file_path, signature):
+        """internal method: checks the file against its signature and
+        updates the signature modification time if only it changed"""
+        try:
+            stat = os.stat(file_path)
+            if stat.st_size != signature['size']:
+                return False
+            if stat.st_mtime == signature['mtime']:
+                return True
+            if self.get_hash(file_path) != signature['hash']:
+                return False
+        except OSError:
+            return False
+        signature['mtime'] = stat.st_mtime
+        self._dirty = True
+        return True
+
+    def is_unchanged(self, file_path):
+        """Returns True if the given library is in the index and neither the
+        file nor its dependencies changed since it was indexed or False
+        otherwise.
+
+        The modification time and the size are checked first. If only the
+        modification time differs (e.g. the file was touched or checked out
+        again) the file contents hash decides.
+
+        :param file_path: the library absolute file path
+        :type file_path: :obj:`str`
+        :return: True if the library did not change or False otherwise
+        :rtype: bool"""
+        file_path = os.path.abspath(file_path)
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is None:
+                return False
+            if not self._is_unchanged(file_path, entry):
+                return False
+            for dep_path, signature in entry['dependencies'].items():
+                if not self._is_unchanged(dep_path, signature):
+                    return False
+            return True
+
+    def get(self, file_path):
+        """Returns the information of the given library if it did not
+        change since it was indexed.
+
+        :param file_path: the library absolute file path
+        :type file_path: :obj:`str`
+        :return: a dict with the serialized 'library' and its 'elements' or
+                 None if the library is not indexed or it changed
+        :rtype: :obj:`dict`"""
+        if not self.is_unchanged(file_path):
+            return None
+        return self._entries[os.path.abspath(file_path)]['info']
+
+    def add_library(self, lib, path=None):
+        """Indexes the given library: its file signature, the signature of
+        its dependencies and the serialized information of the library and
+        its elements. Libraries which information can not be encoded in
+        JSON are not indexed.
+
+        :param lib: the library
+        :type lib: :class:`~sardana.sardanameta.SardanaLibrary`
+        :param path: the directories where the library dependencies are
+                     looked for [default: None, meaning the library
+                     directory]
+        :type path: seq<str>"""
+        file_path = lib.file_path
+        if file_path is None:
+            return
+        if path is None:
+            path = [lib.path]
+        try:
+            info = dict(library=lib.serialize(),
+                        elements=[meta.serialize()
+                                  for meta in lib.get_metas()])
+            info = json.loads(json.dumps(info))
+            entry = self.get_signature(file_path)
+            entry['info'] = info
+            deps = {}
+            if lib.module is not None:
+                for dep_path in self.get_dependencies(lib.module, path):
+                    deps[dep_path] = self.get_signature(dep_path)
+            entry['dependencies'] = deps
+        except Exception:
+            self.debug("Library %s can not be indexed", lib.name,
+                       exc_info=1)
+            self.remove(file_path)
+            return
+        with self._lock:
+            self._entries[os.path.abspath(file_path)] = entry
+            self._dirty = True
+
+    def remove(self, file_path):
+        """Removes the given library from the index.
+
+        :param file_path: the library absolute file path
+        :type file_path: :obj:`str`"""
+        with self._lock:
+            if self._entries.pop(os.path.abspath(file_path), None) is not None:
+                self._dirty = True
+
+
+class LazyCode(object):
+    """Placeholder of a sardana class or function which library has not been
+    imported yet. It answers the basic information and the serialization
+    from the :class:`LibraryIndex` information. Any other member access
+    imports the library and is forwarded to the real object."""
+
+    def __init__(self, lib, info):
+        self._lib = lib
+        self._info = info
+        self.name = info['name']
+        self.full_name = info['full_name']
+        self.description = info.get('description')
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, self.name)
+
+    def __lt__(self, o):
+        return self.name < o.name
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        meta = self.resolve()
+        if meta is None:
+            raise AttributeError(name)
+        return getattr(meta, name)
+
+    @property
+    def lib(self):
+        return self._lib
+
+    @property
+    def module_name(self):
+        return self._lib.name
+
+    @property
+    def file_path(self):
+        return self._lib.file_path
+
+    @property
+    def file_name(self):
+        return self._lib.file_name
+
+    @property
+    def path(self):
+        return self._lib.path
+
+    def get_name(self):
+        return self.name
+
+    def get_full_name(self):
+        return self.full_name
+
+    def get_module_name(self):
+        return self.module_name
+
+    def get_type(self):
+        return ElementType[self._info['type']]
+
+    def get_brief_description(self, max_chars=60):
+        desc = self.description.replace('\n', ' ')
+        if len(desc) > (max_chars - 5):
+            desc = desc[:max_chars - 5] + '[...]'
+        return desc
+
+    def serialize(self, *args, **kwargs):
+        kwargs.update(self._info)
+        return kwargs
+
+    def resolve(self):
+        """Imports the library (if not done yet) and returns the real object
+        or None if it does not exist anymore.
+
+        :return: the real object
+        :rtype: :class:`~sardana.sardanameta.SardanaCode`"""
+        return self._lib.resolve().get_meta(self.name)
+
+
+class LazyLibrary(object):
+    """Placeholder of a sardana library which has not been imported yet.
+    It answers the basic information and the serialization of the library
+    and of its elements (see :class:`LazyCode`) from the
+    :class:`LibraryIndex` information. Any other member access imports the
+    library (with the given *loader*) and is forwarded to the real library.
+
+    :param info: the library information from the :class:`LibraryIndex`
+    :type info: :obj:`dict`
+    :param loader: a callable receiving this placeholder which imports the
+                   library and returns the real library
+    :type loader: callable"""
+
+    CodeClass = LazyCode
+
+    def __init__(self, info, loader):
+        lib_info = info['library']
+        self._info = lib_info
+        self._loader = loader
+        self._real = None
+        self._lock = threading.Lock()
+        self.name = lib_info['name']
+        self.full_name = lib_info['full_name']
+        self.file_path = lib_info['file_path']
+        self.file_name = lib_info['file_name']
+        self.path = lib_info['path']
+        self.description = lib_info['description']
+        self.exc_info = None
+        self._metas = metas = {}
+        for meta_info in info['elements']:
+            meta = self.CodeClass(self, meta_info)
+            metas[meta.name] = meta
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, self.name)
+
+    def __lt__(self, o):
+        return self.full_name < o.full_name
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    @property
+    def module_name(self):
+        return self.name
+
+    def get_name(self):
+        return self.name
+
+    def get_module_name(self):
+        return self.name
+
+    def get_file_path(self):
+        return self.file_path
+
+    def get_file_name(self):
+        return self.file_name
+
+    def get_description(self):
+        return self.description
+
+    def get_type(self):
+        return ElementType[self._info['type']]
+
+    def has_errors(self):
+        return False
+
+    def get_error(self):
+        return None
+
+    def get_meta(self, meta_name):
+        return self._metas.get(meta_name)
+
+    def get_metas(self):
+        return list(self._metas.values())
+
+    def has_meta(self, meta_name):
+        return meta_name in self._metas
+
+    def has_metas(self):
+        return len(self._metas) > 0
+
+    def serialize(self, *args, **kwargs):
+        kwargs.update(self._info)
+        return kwargs
+
+    def get_changes(self, lib):
+        """Compares the information of this placeholder with the given real
+        library e.g. when the library or its dependencies changed after the
+        placeholder was registered.
+
+        :param lib: the real library
+        :type lib: :class:`~sardana.sardanameta.SardanaLibrary`
+        :return: a dict with the 'new', 'change' and 'del' elements (as
+                 expected by the ``ElementsChanged`` event) or None if the
+                 library did not change
+        :rtype: :obj:`dict`"""
+        def encode(obj):
+            try:
+                return json.loads(json.dumps(obj.serialize()))
+            except Exception:
+                return None
+        metas = {meta.name: meta for meta in lib.get_metas()}
+        new, changed, deleted = [], [], []
+        for name, meta in metas.items():
+            lazy_meta = self._metas.get(name)
+            if lazy_meta is None:
+                new.append(meta)
+            elif encode(meta) != lazy_meta._info:
+                changed.append(meta)
+        for name, lazy_meta in self._metas.items():
+            if name not in metas:
+                deleted.append(lazy_meta)
+        if not (new or changed or deleted) and encode(lib) == self._info:
+            return None
+        changed.insert(0, lib)
+        return {"new": new, "change": changed, "del": deleted}
+
+    def is_resolved(self):
+        """Returns True if the library has already been imported.
+
+        :return: True if the library has already been imported
+        :rtype: bool"""
+        return self._real is not None
+
+    def resolve(self):
+        """Imports the library (if not done yet) and returns the real
+        library.
+
+        :return: the real library
+        :rtype: :class:`~sardana.sardanameta.SardanaLibrary`"""
+        with self._lock:
+            if self._real is None:
+                self._real = self._loader(self)
+            return self._real
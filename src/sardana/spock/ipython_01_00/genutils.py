@@ -40,7 +40,8 @@ __all__ = ['page', 'arg_split', 'get_gui_mode', 'get_pylab_mode',
            'print_dev_from_class', 'from_name_to_tango', 'clean_up',
            'get_taurus_core_version', 'get_taurus_core_version_number',
            'check_requirements', 'get_door', 'get_macro_server',
-           'expose_magic', 'unexpose_magic', 'expose_variable',
+           'expose_magic', 'unexpose_magic', 'expose_lazy_magic',
+           'unexpose_lazy_magic', 'expose_variable',
            'expose_variables', 'unexpose_variable',
            'create_spock_profile', 'check_for_upgrade', 'get_args',
            'start', 'mainloop', 'run',
@@ -57,6 +58,7 @@ import socket
 import IPython
 import IPython.core.magic
 from IPython.core.page import page
+from IPython.core.error import TryNext
 from IPython.core.profiledir import ProfileDirError, ProfileDir
 from IPython.core.application import BaseIPythonApplication
 from IPython.core.interactiveshell import InteractiveShell
@@ -696,6 +698,94 @@ def unexpose_magic(name):
             expose_magic(name, magic_fn.old_magic, magic_fn.old_completer)
 
 
+class _LazyLineMagics(dict):
+    """Line magics of the IPython magics manager where the lazy magics
+    (see :func:`expose_lazy_magic`) are created on first access. The lazy
+    magic names are listed (e.g. when completing the magic names) from
+    an index of names without creating the magic functions."""
+
+    def __init__(self, magics):
+        dict.__init__(self, magics)
+        # dict<str, callable>
+        # key - magic name
+        # value - factory of the magic function
+        self.lazy = {}
+
+    def resolve(self, name):
+        """Create the lazy magic"""
+        factory = self.lazy.pop(name, None)
+        if factory is not None:
+            expose_magic(name, factory())
+
+    def get(self, name, default=None):
+        if name in self.lazy:
+            self.resolve(name)
+        return dict.get(self, name, default)
+
+    def __getitem__(self, name):
+        if name in self.lazy:
+            self.resolve(name)
+        return dict.__getitem__(self, name)
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self.lazy
+
+    def __iter__(self):
+        for name in dict.__iter__(self):
+            yield name
+        for name in list(self.lazy):
+            yield name
+
+    def __len__(self):
+        return dict.__len__(self) + len(self.lazy)
+
+    def keys(self):
+        return list(self)
+
+
+def _lazy_macro_completer(self, event):
+    """Method called by the IPython autocompleter for any command. It
+    creates the lazy magic of the command (if not created yet) and then
+    determines the possible values for its arguments."""
+    line_magics = _get_lazy_line_magics()
+    if event.command.lstrip('%') not in line_magics.lazy:
+        raise TryNext()
+    line_magics.resolve(event.command.lstrip('%'))
+    return _macro_completer(self, event)
+
+
+def _get_lazy_line_magics():
+    magics = get_shell().magics_manager.magics
+    line_magics = magics['line']
+    if not isinstance(line_magics, _LazyLineMagics):
+        magics['line'] = line_magics = _LazyLineMagics(line_magics)
+        get_shell().set_hook('complete_command', _lazy_macro_completer,
+                             re_key='.*')
+    return line_magics
+
+
+def expose_lazy_magic(name, factory):
+    """Expose a magic which function is created with the given factory the
+    first time the magic is used (or its arguments are completed).
+
+    :param name: magic name
+    :type name: str
+    :param factory: callable without arguments returning the magic function
+    :type factory: callable
+    """
+    line_magics = _get_lazy_line_magics()
+    # replace the magic if it was already created
+    dict.pop(line_magics, name, None)
+    line_magics.lazy[name] = factory
+
+
+def unexpose_lazy_magic(name):
+    """Remove a magic exposed with :func:`expose_lazy_magic`"""
+    line_magics = _get_lazy_line_magics()
+    if line_magics.lazy.pop(name, None) is None:
+        dict.pop(line_magics, name, None)
+
+
 def expose_variable(name, value):
     get_shell().user_ns[name] = value
 
@@ -30,6 +30,7 @@ __all__ = ['GUIViewer', 'SpockBaseDoor', 'QSpockDoor', 'SpockDoor',
            'SpockMacroServer']
 
 import os
+import functools
 import ctypes
 import PyTango
 
@@ -37,7 +38,6 @@ from taurus.core import TaurusEventType, TaurusSWDevState, TaurusDevState
 
 from sardana.sardanautils import is_pure_str, is_non_str_seq
 from sardana.spock import genutils
-from sardana.util.parser import ParamParser
 from sardana.spock.inputhandler import SpockInputHandler, InputHandler
 from sardana import sardanacustomsettings
 
@@ -606,13 +606,30 @@ class SpockMacroServer(BaseMacroServer):
     def _addMacro(self, macro_info):
         macro_name = str(macro_info.name)
 
+        # IPython < 1 magic commands can not be created lazily
+        if genutils.get_ipython_version_list() < [1, 0]:
+            genutils.expose_magic(macro_name,
+                                  self._createMacroMagic(macro_info))
+        else:
+            # the magic is created on its first use so the startup and the
+            # macro reloads do not depend on the number of macros
+            factory = functools.partial(self._createMacroMagic, macro_info)
+            genutils.expose_lazy_magic(macro_name, factory)
+        self._local_magic[macro_name] = macro_info
+
+        return macro_info
+
+    @staticmethod
+    def _createMacroMagic(macro_info):
+        macro_name = str(macro_info.name)
+
         # IPython < 1 magic commands have different API
         if genutils.get_ipython_version_list() < [1, 0]:
             def macro_fn(shell, parameter_s='', name=macro_name):
                 door = genutils.get_door()
                 ms = genutils.get_macro_server()
-                params_def = ms.getMacroInfoObj(name).parameters
-                parameters = split_macro_parameters(parameter_s, params_def)
+                param_parser = ms.getMacroInfoObj(name).getParamParser()
+                parameters = param_parser.parse(parameter_s)
                 door.runMacro(macro_name, parameters, synch=True)
                 macro = door.getLastRunningMacro()
                 if macro is not None:  # maybe none if macro was aborted
@@ -621,8 +638,8 @@ class SpockMacroServer(BaseMacroServer):
             def macro_fn(parameter_s='', name=macro_name):
                 door = genutils.get_door()
                 ms = genutils.get_macro_server()
-                params_def = ms.getMacroInfoObj(name).parameters
-                parameters = split_macro_parameters(parameter_s, params_def)
+                param_parser = ms.getMacroInfoObj(name).getParamParser()
+                parameters = param_parser.parse(parameter_s)
                 door.runMacro(macro_name, parameters, synch=True)
                 macro = door.getLastRunningMacro()
                 if macro is not None:  # maybe none if macro was aborted
@@ -631,31 +648,13 @@ class SpockMacroServer(BaseMacroServer):
         macro_fn.__name__ = macro_name
         macro_fn.__doc__ = macro_info.doc + "\nWARNING: do not rely on the" \
                                             " file path below\n"
-
-        # register magic command
-        genutils.expose_magic(macro_name, macro_fn)
-        self._local_magic[macro_name] = macro_fn
-
-        return macro_info
+        return macro_fn
 
     def _removeMacro(self, macro_info):
         macro_name = macro_info.name
-        genutils.unexpose_magic(macro_name)
+        if genutils.get_ipython_version_list() < [1, 0]:
+            genutils.unexpose_magic(macro_name)
+        else:
+            genutils.unexpose_lazy_magic(macro_name)
         del self._local_magic[macro_name]
 
-
-def split_macro_parameters(parameters_s, params_def):
-    """Split string with macro parameters into a list with macro parameters.
-    Whitespaces are the separators between the parameters.
-
-    Repeat parameters are encapsulated in square brackets and its internal
-    repetitions, if composed from more than one item are also encapsulated
-    in brackets. In this case the output list contains lists internally.
-
-    :param parameters_s: input string containing parameters
-    :type parameters_s: string
-    :return:  parameters represented as a list (may contain internal lists
-    :rtype: list
-    """
-    parser = ParamParser(params_def)
-    return parser.parse(parameters_s)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""Tests for the lazy macro magics of spock"""
+
+from unittest import mock
+
+from IPython.core.interactiveshell import InteractiveShell
+from taurus.external import unittest
+
+from sardana.spock.ipython_01_00 import genutils
+
+
+class _MacroInfo(object):
+
+    def hasParams(self):
+        return True
+
+    def getPossibleParams(self, idx):
+        return [{"type": "Motor"}]
+
+
+class _MacroServer(object):
+
+    def getMacroInfoObj(self, macro_name):
+        return _MacroInfo()
+
+    def getElementNamesWithInterface(self, interface):
+        return ["mot01"]
+
+
+class LazyMagicTestCase(unittest.TestCase):
+    """Verify the lazy magics with an IPython shell: the magic function is
+    created only once, when the magic is used or its arguments are
+    completed, and not when the magics are listed."""
+
+    def setUp(self):
+        self.shell = InteractiveShell.instance()
+        self.created = []
+        patchers = [mock.patch.object(genutils, "get_shell",
+                                      return_value=self.shell),
+                    mock.patch.object(genutils, "get_macro_server",
+                                      return_value=_MacroServer())]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.names = "_lazy_mac1", "_lazy_mac2"
+        for name in self.names:
+            genutils.expose_lazy_magic(name, self._factory(name))
+            self.addCleanup(genutils.unexpose_lazy_magic, name)
+
+    def _factory(self, name):
+        def factory():
+            self.created.append(name)
+
+            def magic(parameter_s=''):
+                return "%s %s" % (name, parameter_s)
+            return magic
+        return factory
+
+    def _line_magics(self):
+        return self.shell.magics_manager.magics["line"]
+
+    def test_list(self):
+        line_magics = self._line_magics()
+        for name in self.names:
+            self.assertIn(name, line_magics)
+        self.assertTrue(set(self.names).issubset(list(line_magics)))
+        lsmagic = self.shell.magics_manager.lsmagic()["line"]
+        self.assertTrue(set(self.names).issubset(lsmagic))
+        _, matches = self.shell.Completer.complete(line_buffer="%_lazy_m",
+                                                   cursor_pos=8)
+        self.assertEqual(matches, ["%_lazy_mac1", "%_lazy_mac2"])
+        self.assertEqual(self.created, [])
+
+    def test_lookup(self):
+        name = self.names[0]
+        self.assertEqual(self.shell.run_line_magic(name, "1 2"),
+                         "_lazy_mac1 1 2")
+        self.assertEqual(self.shell.run_line_magic(name, "3"),
+                         "_lazy_mac1 3")
+        self.assertIsNotNone(self.shell.find_line_magic(name))
+        self.assertIn(name, self._line_magics())
+        self.assertEqual(self.created, [name])
+
+    def test_complete(self):
+        name = self.names[1]
+        line = name + " "
+        for _ in range(2):
+            _, matches = self.shell.Completer.complete(line_buffer=line,
+                                                       cursor_pos=len(line))
+            self.assertEqual(matches, ["mot01"])
+        self.assertEqual(self.shell.run_line_magic(name, "1"),
+                         "_lazy_mac2 1")
+        self.assertEqual(self.created, [name])
+        # other commands are completed as usual
+        completer = self.shell.Completer
+        use_jedi, completer.use_jedi = completer.use_jedi, False
+        self.addCleanup(setattr, completer, "use_jedi", use_jedi)
+        self.shell.user_ns["_lazy_variable"] = 1
+        self.addCleanup(self.shell.user_ns.pop, "_lazy_variable")
+        _, matches = completer.complete(line_buffer="len(_lazy_v",
+                                        cursor_pos=11)
+        self.assertEqual(matches, ["_lazy_variable"])
+
+    def test_unexpose(self):
+        resolved, unresolved = self.names
+        self.shell.run_line_magic(resolved, "")
+        for name in self.names:
+            genutils.unexpose_lazy_magic(name)
+        line_magics = self._line_magics()
+        for name in self.names:
+            self.assertNotIn(name, line_magics)
+            self.assertNotIn(name, list(line_magics))
+            self.assertIsNone(self.shell.find_line_magic(name))
+        self.assertEqual(self.created, [resolved])
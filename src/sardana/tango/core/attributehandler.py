@@ -25,13 +25,15 @@
 
 """This is the main macro server module"""
 
-__all__ = ["AttributeLogHandler", "AttributeBufferedLogHandler"]
+__all__ = ["AttributeLogHandler", "AttributeBufferedLogHandler",
+           "AttributeLogBatcher"]
 
 __docformat__ = 'restructuredtext'
 
 import logging
 import weakref
 import operator
+import threading
 
 from taurus.core.util.containers import LIFO
 import collections
@@ -85,4 +87,156 @@ class AttributeLogHandler(logging.Handler):
     def finish(self):
         pass
 
-AttributeBufferedLogHandler = AttributeLogHandler
+
+class AttributeLogBatcher(object):
+    """Sends the log lines of one or more
+    :class:`AttributeBufferedLogHandler` in batches, from a background
+    thread, every *flush_period* seconds or as soon as *flush_size* lines
+    are pending, whichever comes first.
+
+    The lines are sent in the order they were logged: consecutive lines of
+    the same handler are merged in a single event. If more than
+    *max_pending* lines are pending, the oldest records are dropped and a
+    notice with the number of dropped lines is sent instead, so a verbose
+    logging can not flood the device with events.
+
+    :param flush_period: maximum time (in seconds) a line is pending
+    :type flush_period: float
+    :param flush_size: number of pending lines which triggers a flush
+    :type flush_size: int
+    :param max_pending: maximum number of pending lines
+    :type max_pending: int
+    :param name: name of the flushing thread
+    :type name: str
+    """
+
+    DroppedMsg = "<%d log lines dropped>"
+
+    def __init__(self, flush_period=0.05, flush_size=1000, max_pending=10000,
+                 name="AttributeLogBatcher"):
+        self._flush_period = flush_period
+        self._flush_size = flush_size
+        self._max_pending = max(max_pending, 1)
+        # deque<tuple<AttributeLogHandler, list<str>>>
+        self._pending = collections.deque()
+        self._nb_pending = 0
+        self._nb_dropped = 0
+        self._dropped_handler = None
+        self._finished = False
+        self._cond = threading.Condition()
+        # serializes the flushes of the thread and of the explicit calls
+        self._flush_lock = threading.Lock()
+        self._name = name
+        self._thread = None
+        self.start()
+
+    def start(self):
+        """Start the flushing thread (if it is not running)"""
+        with self._cond:
+            if self._thread is not None and not self._finished:
+                return
+            self._finished = False
+            self._thread = threading.Thread(target=self._run,
+                                            name=self._name)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def append(self, handler, lines):
+        """Append lines to be sent by the given handler"""
+        with self._cond:
+            self._pending.append((handler, lines))
+            self._nb_pending += len(lines)
+            while (self._nb_pending > self._max_pending
+                   and len(self._pending) > 1):
+                handler, dropped = self._pending.popleft()
+                self._nb_pending -= len(dropped)
+                self._nb_dropped += len(dropped)
+                self._dropped_handler = handler
+            if self._nb_pending >= self._flush_size:
+                self._cond.notify()
+
+    def get_nb_dropped(self):
+        """Number of lines dropped since the last flush"""
+        return self._nb_dropped
+
+    def flush(self):
+        """Send the pending lines (in the calling thread)"""
+        with self._flush_lock:
+            with self._cond:
+                pending = self._pending
+                if len(pending) == 0:
+                    return
+                self._pending = collections.deque()
+                self._nb_pending = 0
+                if self._nb_dropped > 0:
+                    msg = self.DroppedMsg % self._nb_dropped
+                    pending.appendleft((self._dropped_handler, [msg]))
+                    self._nb_dropped = 0
+                    self._dropped_handler = None
+            handler, lines = None, None
+            for record_handler, record_lines in pending:
+                if record_handler is handler:
+                    lines.extend(record_lines)
+                    continue
+                if handler is not None:
+                    handler.sendText(lines)
+                handler, lines = record_handler, list(record_lines)
+            handler.sendText(lines)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if (not self._finished
+                        and self._nb_pending < self._flush_size):
+                    self._cond.wait(self._flush_period)
+                finished = self._finished
+            try:
+                self.flush()
+            except Exception:
+                logging.getLogger(__name__).debug("Failed to send log lines",
+                                                  exc_info=1)
+            if finished:
+                break
+
+    def finish(self):
+        """Send the pending lines and stop the flushing thread. Lines
+        appended afterwards are sent when the thread is started again
+        (see :meth:`start`)"""
+        with self._cond:
+            if self._finished:
+                return
+            self._finished = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not threading.current_thread():
+            thread.join()
+
+
+class AttributeBufferedLogHandler(AttributeLogHandler):
+    """Log handler which, instead of sending each record as a change event
+    of the attribute, passes it to an :class:`AttributeLogBatcher`, shared
+    by the handlers of the different attributes of the device to preserve
+    the order of the records."""
+
+    def __init__(self, dev, attr_name, level=logging.NOTSET,
+                 max_buff_size=0, batcher=None):
+        AttributeLogHandler.__init__(self, dev, attr_name, level=level,
+                                     max_buff_size=max_buff_size)
+        if batcher is None:
+            batcher = AttributeLogBatcher(name=attr_name + "LogBatcher")
+        self._batcher = batcher
+
+    @property
+    def batcher(self):
+        return self._batcher
+
+    def emit(self, record):
+        output = self.getRecordMessage(record)
+        self.appendBuffer(output)
+        self._batcher.append(self, output)
+
+    def sync(self):
+        self._batcher.flush()
+
+    def finish(self):
+        self._batcher.finish()
@@ -0,0 +1,133 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import logging
+import time
+import threading
+import unittest
+
+from sardana.tango.core.attributehandler import AttributeLogBatcher, \
+    AttributeBufferedLogHandler
+
+
+class _FakeMultiAttr(object):
+
+    def get_attr_by_name(self, name):
+        return name
+
+
+class _FakeDevice(object):
+    """Device recording the attribute events"""
+
+    def __init__(self):
+        self.events = []
+        self.lock = threading.Lock()
+
+    def get_device_attr(self):
+        return _FakeMultiAttr()
+
+    def set_attribute(self, attr, value):
+        with self.lock:
+            self.events.append((attr, value))
+
+
+class AttributeBufferedLogHandlerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dev = _FakeDevice()
+        self.logger = logging.getLogger("test_attributehandler")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.handlers = []
+
+    def tearDown(self):
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+            handler.finish()
+
+    def _add_handlers(self, batcher):
+        for name, level in (("Info", logging.INFO),
+                            ("Debug", logging.DEBUG)):
+            handler = AttributeBufferedLogHandler(self.dev, name,
+                                                  batcher=batcher)
+            handler.addFilter(lambda record, level=level:
+                              record.levelno == level)
+            self.logger.addHandler(handler)
+            self.handlers.append(handler)
+
+    def test_order(self):
+        """Verify that the records are sent in batches and in order"""
+        batcher = AttributeLogBatcher(flush_period=10)
+        self._add_handlers(batcher)
+        self.logger.info("i1")
+        self.logger.info("i2")
+        self.logger.debug("d1\nd2")
+        self.logger.info("i3")
+        self.assertEqual(self.dev.events, [])
+        batcher.flush()
+        self.assertEqual(self.dev.events, [("Info", ["i1", "i2"]),
+                                           ("Debug", ["d1", "d2"]),
+                                           ("Info", ["i3"])])
+
+    def test_flush_size(self):
+        """Verify that the records are sent when the size threshold is
+        reached"""
+        # the period is long enough to never be the cause of a flush
+        batcher = AttributeLogBatcher(flush_period=3600, flush_size=3)
+        self._add_handlers(batcher)
+        for i in range(3):
+            self.logger.debug(str(i))
+        for _ in range(500):
+            if self.dev.events:
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.dev.events, [("Debug", ["0", "1", "2"])])
+        # below the threshold nothing is sent until finish
+        self.logger.debug("3")
+        time.sleep(0.1)
+        self.assertEqual(len(self.dev.events), 1)
+        batcher.finish()
+        self.assertEqual(self.dev.events, [("Debug", ["0", "1", "2"]),
+                                           ("Debug", ["3"])])
+
+    def test_drop_oldest(self):
+        """Verify that the oldest records are dropped under overload"""
+        batcher = AttributeLogBatcher(flush_period=10, max_pending=3)
+        self._add_handlers(batcher)
+        for i in range(5):
+            self.logger.debug(str(i))
+        self.assertEqual(batcher.get_nb_dropped(), 2)
+        batcher.flush()
+        self.assertEqual(self.dev.events,
+                         [("Debug", [AttributeLogBatcher.DroppedMsg % 2,
+                                     "2", "3", "4"])])
+
+    def test_restart(self):
+        """Verify that records logged after finish are sent after start"""
+        batcher = AttributeLogBatcher(flush_period=0.01)
+        self._add_handlers(batcher)
+        batcher.finish()
+        self.logger.info("i1")
+        batcher.start()
+        batcher.finish()
+        self.assertEqual(self.dev.events, [("Info", ["i1"])])
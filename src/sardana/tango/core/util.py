@@ -65,6 +65,7 @@ from sardana import State, SardanaServer, DataType, DataFormat, InvalidId, \
 from sardana.sardanaexception import SardanaException, AbortException
 from sardana.sardanavalue import SardanaValue
 from sardana.util.wrap import wraps
+from sardana.util.profiler import startup_trace, get_process_uptime
 from sardana.pool.poolmetacontroller import DataInfo
 
 
@@ -619,6 +620,12 @@ def prepare_cmdline(parser=None, args=None):
                  "%default]"
     help_rfoo = "rconsole port number. [default: %default meaning rconsole " \
                 "NOT active]"
+    help_strace = "record the duration of the server startup phases " \
+                  "(module imports, library loading, element creation, " \
+                  "memorized attributes restore...) and log them with " \
+                  "info level when the server is ready [default: %default]"
+    help_ftrace = "file name where the startup trace is written in JSON " \
+                  "format. Implies --startup-trace [default: %default]"
     parser.add_option("--log-level", dest="log_level", metavar="LOG_LEVEL",
                       help=help_olog, type="choice",
                       choices=log_level_choices, default="warning")
@@ -635,6 +642,11 @@ def prepare_cmdline(parser=None, args=None):
                       metavar="RCONSOLE_PORT", help=help_rfoo, type="int",
                       default=0)
 
+    parser.add_option("--startup-trace", dest="startup_trace",
+                      action="store_true", help=help_strace, default=False)
+    parser.add_option("--startup-trace-file", dest="startup_trace_file",
+                      help=help_ftrace, type="str", default=None)
+
     res = list(parser.parse_args(proc_args))
     tango_args = res[1][:2] + tango_args
     res.append(tango_args)
@@ -1173,7 +1185,16 @@ def run_tango_server(tango_util=None, start_time=None):
         util = Util.instance()
         SardanaServer.server_state = State.Init
         util.server_init()
+        for hook in SardanaServer.post_init_hooks:
+            try:
+                hook()
+            except Exception:
+                taurus.error("Error executing server post init hook %s",
+                             hook, exc_info=1)
+        SardanaServer.post_init_hooks = []
         SardanaServer.server_state = State.Running
+        if startup_trace.is_active():
+            report_startup_trace()
         if start_time is not None:
             import datetime
             dt = datetime.datetime.now() - start_time
@@ -1195,6 +1216,42 @@ def run_tango_server(tango_util=None, start_time=None):
     taurus.info("Exited")
 
 
+def prepare_startup_trace(options, start_time=None):
+    """Enables the :obj:`~sardana.util.profiler.startup_trace` if requested
+    in the command line. When the server is started from its entry point
+    (i.e. the start time is given) the time elapsed since the process was
+    created (the interpreter startup and the import of the server modules)
+    is accounted in the module imports phase. If the process creation time
+    is not available, only the time elapsed since the given start time
+    (the call to the entry point) is accounted."""
+    if not options.startup_trace and options.startup_trace_file is None:
+        return
+    if start_time is None:
+        startup_trace.enable(options.startup_trace_file)
+        return
+    elapsed = get_process_uptime()
+    if elapsed is not None:
+        item = "interpreter startup and server modules"
+    else:
+        import datetime
+        elapsed = (datetime.datetime.now() - start_time).total_seconds()
+        item = "server entry point"
+    startup_trace.enable(options.startup_trace_file, elapsed=elapsed)
+    startup_trace.record("module imports", item, elapsed)
+
+
+def report_startup_trace():
+    """Finishes the :obj:`~sardana.util.profiler.startup_trace`, logs its
+    report and writes it in the startup trace file (if any)"""
+    report = startup_trace.finish()
+    for line in startup_trace.format_report(report):
+        taurus.info(line)
+    try:
+        startup_trace.save(report)
+    except Exception:
+        taurus.warning("Failed to write the startup trace", exc_info=1)
+
+
 def run(prepare_func, args=None, tango_util=None, start_time=None, mode=None,
         name=None):
 
@@ -1245,6 +1302,8 @@ def run(prepare_func, args=None, tango_util=None, start_time=None, mode=None,
     except KeyboardInterrupt:
         pass
 
+    prepare_startup_trace(options, start_time=start_time)
+
     try:
         log_messages.extend(prepare_server(args, tango_args))
     except AbortException as e:
@@ -1266,7 +1325,8 @@ def run(prepare_func, args=None, tango_util=None, start_time=None, mode=None,
     if tango_util is None:
         tango_util = Util(tango_args)
 
-    prepare_func(tango_util)
+    with startup_trace.measure("module imports", "server classes"):
+        prepare_func(tango_util)
     prepare_taurus(options, args, tango_args)
     prepare_logging(options, args, tango_args, start_time=start_time,
                     log_messages=log_messages)
@@ -30,7 +30,7 @@ import threading
 from lxml import etree
 
 from PyTango import Util, DevFailed, Except, DevVoid, DevLong, \
-    DevLong64, DevString, DevState, DevEncoded, \
+    DevLong64, DevDouble, DevString, DevState, DevEncoded, \
     DevVarStringArray, ArgType, \
     READ, READ_WRITE, SCALAR, SPECTRUM
 
@@ -43,7 +43,8 @@ from sardana.macroserver.macro import Macro
 from sardana.macroserver.msdoor import BaseInputHandler
 from sardana.macroserver.msexception import MacroServerException
 from sardana.tango.core.util import throw_sardana_exception
-from sardana.tango.core.attributehandler import AttributeLogHandler
+from sardana.tango.core.attributehandler import AttributeLogHandler, \
+    AttributeBufferedLogHandler, AttributeLogBatcher
 from sardana.tango.core.SardanaDevice import SardanaDevice, SardanaDeviceClass
 from sardana.macroserver.msexception import InputCancelled
 
@@ -147,6 +148,7 @@ class Door(SardanaDevice):
         SardanaDevice.__init__(self, dclass, name)
         self._last_result = ()
         self._input_handler = None
+        self._log_batcher = None
 
     def init(self, name):
         SardanaDevice.init(self, name)
@@ -220,6 +222,9 @@ class Door(SardanaDevice):
                 macro_server.create_element(type="Door", name=name,
                                             full_name=full_name, id=self.Id)
             self._setupLogHandlers(levels)
+        elif self._log_batcher is not None:
+            # restart it after the Init command
+            self._log_batcher.start()
 
         multi_attr = self.get_device_attr()
 
@@ -240,9 +245,20 @@ class Door(SardanaDevice):
 
     def _setupLogHandlers(self, levels):
         self._handler_dict = {}
+        self._log_batcher = None
+        if self.LogFlushPeriod > 0:
+            self._log_batcher = AttributeLogBatcher(
+                flush_period=self.LogFlushPeriod,
+                max_pending=self.LogMaxPendingLines,
+                name=self.get_name() + "LogBatcher")
         for level in levels:
-            handler = AttributeLogHandler(self, level,
-                                          max_buff_size=self.MaxMsgBufferSize)
+            if self._log_batcher is None:
+                handler = AttributeLogHandler(
+                    self, level, max_buff_size=self.MaxMsgBufferSize)
+            else:
+                handler = AttributeBufferedLogHandler(
+                    self, level, max_buff_size=self.MaxMsgBufferSize,
+                    batcher=self._log_batcher)
             filter = LogFilter(level=getattr(self, level))
             handler.addFilter(filter)
             self.addLogHandler(handler)
@@ -259,6 +275,11 @@ class Door(SardanaDevice):
 
         name = event_type.name.lower()
 
+        # send the pending log lines before the macro state, status and
+        # result changes so the clients receive them in order
+        if self._log_batcher is not None and name != "recorddata":
+            self._log_batcher.flush()
+
         multi_attr = self.get_device_attr()
         try:
             attr = multi_attr.get_attr_by_name(name)
@@ -448,6 +469,17 @@ class DoorClass(SardanaDeviceClass):
              'Maximum size for the Output, Result, Error, Warning, Debug and '
              'Info buffers',
              [512]],
+        'LogFlushPeriod':
+            [DevDouble,
+             'Maximum time (in seconds) the log messages are kept before '
+             'sending them in a batch as a single event per log attribute. '
+             '0 means send each message immediately',
+             [0.05]],
+        'LogMaxPendingLines':
+            [DevLong,
+             'Maximum number of log lines waiting to be sent. If exceeded '
+             'the oldest ones are dropped',
+             [10000]],
         'MacroServerName':
             [DevString,
              'Name of the macro server device to connect to. [default: None, '
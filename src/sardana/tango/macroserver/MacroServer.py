@@ -87,6 +87,7 @@ class MacroServer(SardanaDevice):
 
         self.EnvironmentDb = self._calculate_name(self.EnvironmentDb)
         self.LogReportFilename = self._calculate_name(self.LogReportFilename)
+        self.LibraryIndex = self._calculate_name(self.LibraryIndex)
 
         macro_server = self.macro_server
         macro_server.set_python_path(self.PythonPath)
@@ -119,6 +120,7 @@ class MacroServer(SardanaDevice):
             self.debug("Details:", exc_info=1)
 
         macro_server.set_recorder_path(self.RecorderPath)
+        macro_server.set_library_index(self.LibraryIndex)
         macro_server.set_macro_path(self.MacroPath)
         macro_server.set_pool_names(self.PoolNames)
 
@@ -369,6 +371,14 @@ class MacroServerClass(SardanaDeviceClass):
             [DevString,
              "The environment database (usually a plain file).",
              os.path.join(DefaultEnvBaseDir, DefaultEnvRelDir)],
+        'LibraryIndex':
+            [DevString,
+             "File (absolute) where the signature of the macro libraries is "
+             "stored between runs. Macro libraries which did not change "
+             "since they were indexed are not imported until they are first "
+             "used [default: None, meaning all macro libraries are imported "
+             "at startup]",
+             None],
         'RConsolePort':
             [DevLong,
              "The rconsole port number",
@@ -37,6 +37,7 @@ from PyTango import DevFailed, Except, DevVoid, DevShort, \
     READ, READ_WRITE, SCALAR, SPECTRUM
 
 from taurus.core.util.log import DebugIt
+from taurus.core.util.containers import CaselessDict
 
 from sardana import State, SardanaServer
 from sardana.sardanautils import str_to_value
@@ -592,6 +593,43 @@ with this value is sent to clients using events.
             return False
         return True
 
+    #: memorized attributes which are axis parameters
+    AxisParAttributes = CaselessDict({'Acceleration': 'acceleration',
+                                      'Deceleration': 'deceleration',
+                                      'Base_rate': 'base_rate',
+                                      'Velocity': 'velocity',
+                                      'Step_per_unit': 'step_per_unit'})
+
+    def get_axis_pars_to_restore(self, restore_attributes, db_values):
+        multi_attribute = self.get_device_attr()
+        pars, rest = [], []
+        for attr_name in restore_attributes:
+            par_name = self.AxisParAttributes.get(attr_name)
+            props = db_values.get(attr_name)
+            if (par_name is None or props is None
+                    or "__value" not in props):
+                rest.append(attr_name)
+                continue
+            attribute = multi_attribute.get_w_attr_by_name(attr_name)
+            try:
+                value = self._get_attribute_value_from_db_value(
+                    attribute, props["__value"])
+            except Exception:
+                rest.append(attr_name)
+                continue
+            # step per unit is validated when written
+            if par_name == "step_per_unit" and value <= 0:
+                rest.append(attr_name)
+                continue
+            attribute.set_write_value(value)
+            pars.append((attr_name, par_name, value))
+        return pars, rest
+
+    def on_axis_pars_restored(self, pars):
+        motor = self.motor
+        for par_name, value in pars:
+            getattr(motor, "_set_" + par_name)(value, propagate=0)
+
     def get_attributes_to_restore(self):
         """Make sure position is the last attribute to restore"""
         restore_attributes = PoolElementDevice.get_attributes_to_restore(self)
@@ -44,7 +44,9 @@ from sardana import State, SardanaServer, ElementType, Interface, \
     TYPE_ACQUIRABLE_ELEMENTS, TYPE_PSEUDO_ELEMENTS
 from sardana.pool.pool import Pool as POOL
 from sardana.pool.poolmetacontroller import TYPE_MAP_OBJ
-from sardana.tango.core.util import get_tango_version_number
+from sardana.tango.core.util import get_tango_version_number, \
+    throw_sardana_exception
+from sardana.tango.pool.PoolDevice import startup_restore
 import collections
 
 
@@ -116,6 +118,7 @@ class Pool(PyTango.Device_4Impl, Logger):
         self.get_device_properties(self.get_device_class())
         p = self.pool
         p.set_python_path(self.PythonPath)
+        p.set_library_index(self.LibraryIndex)
         p.set_path(self.PoolPath)
         p.set_motion_loop_sleep_time(self.MotionLoop_SleepTime / 1000)
         p.set_motion_loop_states_per_position(
@@ -123,6 +126,11 @@ class Pool(PyTango.Device_4Impl, Logger):
         p.set_acq_loop_sleep_time(self.AcqLoop_SleepTime / 1000)
         p.set_acq_loop_states_per_value(self.AcqLoop_StatesPerValue)
         p.set_drift_correction(self.DriftCorrection)
+        p.set_parallel_ctrl_start(self.ParallelControllerStart)
+        p.set_read_coalesce_window(self.ReadCoalesceWindow / 1000)
+        p.set_read_cache_ttl(self.ReadCacheTTL / 1000)
+        if self.BulkRestore and SardanaServer.server_state == State.Init:
+            startup_restore.enable()
         if self.RemoteLog is None:
             p.clear_remote_logging()
         else:
@@ -975,6 +983,10 @@ class Pool(PyTango.Device_4Impl, Logger):
     def Abort(self):
         self.pool.abort()
 
+    def GetMonitorStatistics(self):
+        statistics = self.pool.monitor.get_statistics()
+        return json.dumps(statistics)
+
     def SendToController(self, stream):
         ctrl_name, stream = stream[:2]
         try:
@@ -983,6 +995,60 @@ class Pool(PyTango.Device_4Impl, Logger):
             ctrl = self.pool.get_element_by_full_name(ctrl_name)
         return ctrl.send_to_controller(stream)
 
+    def _get_pseudo_motor(self, name):
+        try:
+            pseudo_motor = self.pool.get_element_by_name(name)
+        except KeyError:
+            pseudo_motor = self.pool.get_element_by_full_name(name)
+        if pseudo_motor.get_type() != ElementType.PseudoMotor:
+            raise Exception("%s is not a pseudo motor" % name)
+        return pseudo_motor
+
+    def CalcAllPhysicalBulk(self, argin):
+        argin = json.loads(argin)
+        pseudo_motor = self._get_pseudo_motor(argin["pseudo_motor"])
+        result = pseudo_motor.calc_physical_bulk(argin["positions"])
+        if result.error:
+            throw_sardana_exception(result)
+        return json.dumps([list(map(float, point))
+                           for point in result.value])
+
+    def CalcAllPseudoBulk(self, argin):
+        argin = json.loads(argin)
+        pseudo_motor = self._get_pseudo_motor(argin["pseudo_motor"])
+        result = pseudo_motor.calc_all_pseudo_bulk(argin["positions"])
+        if result.error:
+            throw_sardana_exception(result)
+        return json.dumps([list(map(float, point))
+                           for point in result.value])
+
+    def _get_element(self, name):
+        try:
+            return self.pool.get_element_by_name(name)
+        except KeyError:
+            return self.pool.get_element_by_full_name(name)
+
+    def GetAxisPars(self, argin):
+        argin = json.loads(argin)
+        elements = [self._get_element(name) for name in argin["elements"]]
+        result = self.pool.get_elements_pars(elements, argin["parameters"])
+        result = {element.name: pars for element, pars in result.items()}
+        return json.dumps(result, default=float)
+
+    def SetAxisPars(self, argin):
+        argin = json.loads(argin)
+        elements_pars = {}
+        for name, pars in argin.items():
+            elements_pars[self._get_element(name)] = pars
+        errors = self.pool.set_elements_pars(elements_pars)
+        result = {}
+        for element, name, value, exc_info in errors:
+            self.warning("Error when setting %s.%s = %r", element.name, name,
+                         value)
+            self.debug("Details:", exc_info=exc_info)
+            result.setdefault(element.name, {})[name] = str(exc_info[1])
+        return json.dumps(result)
+
     def GetFile(self, name):
         p = self.pool
         manager = p.ctrl_manager
@@ -1284,6 +1350,131 @@ Aborts all elements managed by this Pool
     {1}
 """.format(ABORT_PAR_IN_DOC, ABORT_PAR_OUT_DOC)
 
+CALC_ALL_PHYSICAL_BULK_PAR_IN_DOC = """\
+A JSON encoded dict with:
+    * 'pseudo_motor': pseudo motor name
+    * 'positions': sequence of points. Each point is either a position of
+      the given pseudo motor (its siblings are assumed to stay at their
+      current positions) or a sequence with the positions of all the pseudo
+      motors of the controller
+"""
+
+CALC_ALL_PHYSICAL_BULK_PAR_OUT_DOC = """\
+A JSON encoded sequence of physical positions (one sequence per point)
+"""
+
+CALC_ALL_PHYSICAL_BULK_DOC = """\
+Calculates the physical positions for a whole trajectory of pseudo motor
+positions in one call.
+
+:param argin:
+    {0}
+:type argin: :obj:`str`
+:return:
+    {1}
+:rtype: :obj:`str`
+""".format(CALC_ALL_PHYSICAL_BULK_PAR_IN_DOC,
+           CALC_ALL_PHYSICAL_BULK_PAR_OUT_DOC)
+
+CALC_ALL_PSEUDO_BULK_PAR_IN_DOC = """\
+A JSON encoded dict with:
+    * 'pseudo_motor': pseudo motor name
+    * 'positions': sequence of physical positions (one sequence per point)
+"""
+
+CALC_ALL_PSEUDO_BULK_PAR_OUT_DOC = """\
+A JSON encoded sequence of pseudo positions (one sequence per point)
+"""
+
+CALC_ALL_PSEUDO_BULK_DOC = """\
+Calculates the pseudo positions for a whole trajectory of physical motor
+positions in one call.
+
+:param argin:
+    {0}
+:type argin: :obj:`str`
+:return:
+    {1}
+:rtype: :obj:`str`
+""".format(CALC_ALL_PSEUDO_BULK_PAR_IN_DOC, CALC_ALL_PSEUDO_BULK_PAR_OUT_DOC)
+
+GET_AXIS_PARS_PAR_IN_DOC = """\
+A JSON encoded dict with:
+    * 'elements': sequence of element names
+    * 'parameters': sequence of axis parameter names e.g. velocity
+"""
+
+GET_AXIS_PARS_PAR_OUT_DOC = """\
+A JSON encoded dict where keys are element names and values are dicts of
+parameter names and values
+"""
+
+GET_AXIS_PARS_DOC = """\
+Gets axis parameters of multiple elements with one controller call
+per controller.
+
+:param argin:
+    {0}
+:type argin: :obj:`str`
+:return:
+    {1}
+:rtype: :obj:`str`
+""".format(GET_AXIS_PARS_PAR_IN_DOC, GET_AXIS_PARS_PAR_OUT_DOC)
+
+SET_AXIS_PARS_PAR_IN_DOC = """\
+A JSON encoded dict where keys are element names and values are dicts of
+parameter names and values. Example::
+
+    {"mot01": {"velocity": 10, "acceleration": 0.1},
+     "mot02": {"velocity": 5}}
+"""
+
+SET_AXIS_PARS_PAR_OUT_DOC = """\
+A JSON encoded dict with the parameters which could not be set (the rest of
+them are set anyway) where keys are element names and values are dicts of
+parameter names and error messages. Example::
+
+    {"mot02": {"velocity": "velocity out of range"}}
+"""
+
+SET_AXIS_PARS_DOC = """\
+Sets axis parameters of multiple elements with one controller call
+per controller.
+
+.. note:: Contrary to writing the element attributes, the values are not
+          memorized.
+
+:param argin:
+    {0}
+:type argin: :obj:`str`
+:return:
+    {1}
+:rtype: :obj:`str`
+""".format(SET_AXIS_PARS_PAR_IN_DOC, SET_AXIS_PARS_PAR_OUT_DOC)
+
+GET_MONITOR_STATISTICS_PAR_IN_DOC = """\
+None
+"""
+
+GET_MONITOR_STATISTICS_PAR_OUT_DOC = """\
+A JSON encoded dict where keys are controller names and values are dicts
+with the polling statistics: period, busy, errors (consecutive errors),
+nb_cycles, nb_overruns, cycle_time (duration of the last read) and
+max_cycle_time. Example::
+
+    {"motctrl01": {"period": 5.0, "busy": false, "errors": 0,
+                   "nb_cycles": 12, "nb_overruns": 0,
+                   "cycle_time": 0.002, "max_cycle_time": 0.01}}
+"""
+
+GET_MONITOR_STATISTICS_DOC = """\
+Gets the statistics of the periodic read of the controllers state.
+
+:return:
+    {0}
+:rtype: :obj:`str`
+""".format(GET_MONITOR_STATISTICS_PAR_OUT_DOC)
+
 SEND_TO_CONTROLLER_PAR_IN_DOC = """\
 a sequence of two strings: <controller name>, <data>
 """
@@ -1313,6 +1504,11 @@ Pool.ReloadControllerClass.__doc__ = RELOAD_CONTROLLER_CLASS_INFO_DOC
 Pool.RenameElement.__doc__ = RENAME_ELEMENT_CLASS_INFO_DOC
 Pool.Stop.__doc__ = STOP_DOC
 Pool.Abort.__doc__ = ABORT_DOC
+Pool.CalcAllPhysicalBulk.__doc__ = CALC_ALL_PHYSICAL_BULK_DOC
+Pool.CalcAllPseudoBulk.__doc__ = CALC_ALL_PSEUDO_BULK_DOC
+Pool.GetAxisPars.__doc__ = GET_AXIS_PARS_DOC
+Pool.SetAxisPars.__doc__ = SET_AXIS_PARS_DOC
+Pool.GetMonitorStatistics.__doc__ = GET_MONITOR_STATISTICS_DOC
 
 
 class PoolClass(PyTango.DeviceClass):
@@ -1335,6 +1531,14 @@ class PoolClass(PyTango.DeviceClass):
              "list of directories to be appended to sys.path at startup (path "
              "separators can be '\n' or ':')",
              []],
+        'LibraryIndex':
+            [PyTango.DevString,
+             "File (absolute) where the signature of the controller libraries "
+             "is stored between runs. Controller libraries which did not "
+             "change since they were indexed are not imported until they are "
+             "first used [default: None, meaning all controller libraries are "
+             "imported at startup]",
+             None],
         'MotionLoop_SleepTime':
             [PyTango.DevLong,
              "Sleep time in the motion loop in mS [default: %dms]" %
@@ -1365,6 +1569,33 @@ class PoolClass(PyTango.DeviceClass):
              "overwritten at PseudoMotor level [default: %d]." %
              POOL.Default_DriftCorrection,
              POOL.Default_DriftCorrection],
+        'BulkRestore':
+            [PyTango.DevBoolean,
+             "At server startup restore the memorized attributes of all the "
+             "elements at once, after all of them are created, grouping "
+             "the axis parameters per controller [default: False].",
+             False],
+        'ParallelControllerStart':
+            [PyTango.DevBoolean,
+             "Start (and stop) the controllers involved in an acquisition or "
+             "synchronization concurrently, phase by phase, to reduce the "
+             "skew between them [default: %d]." %
+             POOL.Default_ParallelCtrlStart,
+             POOL.Default_ParallelCtrlStart],
+        'ReadCoalesceWindow':
+            [PyTango.DevLong,
+             "Time window in mS during which the concurrent reads of the "
+             "state or value of the idle elements of a controller are "
+             "merged into a single hardware read, 0 means no merging "
+             "[default: %dms]" % int(POOL.Default_ReadCoalesceWindow * 1000),
+             int(POOL.Default_ReadCoalesceWindow * 1000)],
+        'ReadCacheTTL':
+            [PyTango.DevLong,
+             "Time in mS during which the state or value read from the "
+             "hardware for an idle element is served from the cache, 0 "
+             "means no cache [default: %dms]" %
+             int(POOL.Default_ReadCacheTTL * 1000),
+             int(POOL.Default_ReadCacheTTL * 1000)],
         'InstrumentList':
             [PyTango.DevVarStringArray,
              "List of instruments (internal property)",
@@ -1450,6 +1681,21 @@ class PoolClass(PyTango.DeviceClass):
         'Abort':
             [[PyTango.DevVoid, ABORT_PAR_IN_DOC],
              [PyTango.DevVoid, ABORT_PAR_OUT_DOC]],
+        'CalcAllPhysicalBulk':
+            [[PyTango.DevString, CALC_ALL_PHYSICAL_BULK_PAR_IN_DOC],
+             [PyTango.DevString, CALC_ALL_PHYSICAL_BULK_PAR_OUT_DOC]],
+        'CalcAllPseudoBulk':
+            [[PyTango.DevString, CALC_ALL_PSEUDO_BULK_PAR_IN_DOC],
+             [PyTango.DevString, CALC_ALL_PSEUDO_BULK_PAR_OUT_DOC]],
+        'GetAxisPars':
+            [[PyTango.DevString, GET_AXIS_PARS_PAR_IN_DOC],
+             [PyTango.DevString, GET_AXIS_PARS_PAR_OUT_DOC]],
+        'SetAxisPars':
+            [[PyTango.DevString, SET_AXIS_PARS_PAR_IN_DOC],
+             [PyTango.DevString, SET_AXIS_PARS_PAR_OUT_DOC]],
+        'GetMonitorStatistics':
+            [[PyTango.DevVoid, GET_MONITOR_STATISTICS_PAR_IN_DOC],
+             [PyTango.DevString, GET_MONITOR_STATISTICS_PAR_OUT_DOC]],
         'SendToController':
             [[PyTango.DevVarStringArray, SEND_TO_CONTROLLER_PAR_IN_DOC],
              [PyTango.DevString, SEND_TO_CONTROLLER_PAR_OUT_DOC]],
@@ -25,7 +25,8 @@
 
 """Generic Tango Pool Device base classes"""
 
-__all__ = ["PoolDevice", "PoolDeviceClass",
+__all__ = ["StartupRestore", "startup_restore",
+           "PoolDevice", "PoolDeviceClass",
            "PoolElementDevice", "PoolElementDeviceClass",
            "PoolExpChannelDevice", "PoolExpChannelDeviceClass",
            "PoolGroupDevice", "PoolGroupDeviceClass"]
@@ -33,6 +34,7 @@ __all__ = ["PoolDevice", "PoolDeviceClass",
 __docformat__ = 'restructuredtext'
 
 import time
+import collections
 
 from PyTango import Util, DevVoid, DevLong64, DevBoolean, DevString,\
     DevDouble, DevEncoded, DevVarStringArray, DispLevel, DevState, SCALAR, \
@@ -41,15 +43,162 @@ from PyTango import Util, DevVoid, DevLong64, DevBoolean, DevString,\
 
 from taurus.core.util.containers import CaselessDict
 from taurus.core.util.codecs import CodecFactory
+from taurus.core.util.log import Logger
 
-from sardana import InvalidId, InvalidAxis, ElementType
+from sardana import State, SardanaServer, InvalidId, InvalidAxis, ElementType
 from sardana import sardanacustomsettings
+from sardana.sardanaevent import EventType
+from sardana.util.profiler import startup_trace
 from sardana.pool.poolmetacontroller import DataInfo
 from sardana.tango.core.SardanaDevice import SardanaDevice, SardanaDeviceClass
 from sardana.tango.core.util import GenericScalarAttr, GenericSpectrumAttr, \
     GenericImageAttr, to_tango_attr_info
 
 
+class StartupRestore(Logger):
+    """Restores the memorized attributes of all the pool element devices of
+    the server at once, when all of them were already created.
+
+    Memorized values of all the devices are prefetched with a few bulk
+    database queries, the devices are grouped per controller and the axis
+    parameters of each controller are applied in a batch
+    (see :meth:`~sardana.pool.poolcontroller.PoolController.set_axes_pars`).
+    The rest of the memorized attributes are written one by one, as in the
+    ``Restore`` command.
+    """
+
+    #: maximum number of devices per bulk database query
+    QueryChunkSize = 256
+
+    def __init__(self):
+        Logger.__init__(self, "StartupRestore")
+        self._enabled = False
+        self._devices = []
+
+    def enable(self):
+        """Enables the bulk restore for the current server startup. Must be
+        called before the element devices are created."""
+        if self._enabled:
+            return
+        self._enabled = True
+        self._devices = []
+        SardanaServer.post_init_hooks.append(self.run)
+
+    def is_active(self):
+        """Determines if the memorized attributes of the devices being
+        created will be restored by this object"""
+        return self._enabled and SardanaServer.server_state == State.Init
+
+    def register(self, device):
+        """Registers a pool element device to be restored"""
+        self._devices.append(device)
+
+    def prefetch(self, db, dev_names):
+        """Returns the memorized values of the given devices.
+
+        :param db: tango database
+        :type db: :class:`~PyTango.Database`
+        :param dev_names: device names
+        :type dev_names: seq<str>
+        :return: dictionary where keys are device names and values are
+                 dictionaries of attribute names and memorized values
+                 (in the format of ``get_device_attribute_property``)
+        :rtype: :class:`~taurus.core.util.containers.CaselessDict`"""
+        try:
+            return self._prefetch_bulk(db, dev_names)
+        except Exception:
+            self.info("Bulk query of memorized values failed. Falling back "
+                      "to query per device")
+            self.debug("Details:", exc_info=1)
+        db_values = CaselessDict()
+        for dev_name in dev_names:
+            attr_names = db.get_device_attribute_list(dev_name, "*")
+            props = db.get_device_attribute_property(dev_name,
+                                                     list(attr_names))
+            db_values[dev_name] = CaselessDict(props)
+        return db_values
+
+    def _prefetch_bulk(self, db, dev_names):
+        query = ("SELECT device, attribute, value FROM "
+                 "property_attribute_device WHERE name = '__value' AND "
+                 "device IN (%s) ORDER BY device, attribute, count")
+        db_values = CaselessDict()
+        for dev_name in dev_names:
+            db_values[dev_name] = CaselessDict()
+        chunk_size = self.QueryChunkSize
+        for i in range(0, len(dev_names), chunk_size):
+            chunk = dev_names[i:i + chunk_size]
+            names = ", ".join("'%s'" % name for name in chunk)
+            lvalue, svalue = db.command_inout("DbMySqlSelect",
+                                              query % names)
+            nb_fields = lvalue[-1]
+            for j in range(0, len(svalue), nb_fields):
+                dev_name, attr_name, value = svalue[j:j + nb_fields]
+                attr_values = db_values[dev_name].setdefault(attr_name, {})
+                attr_values.setdefault("__value", []).append(value)
+        return db_values
+
+    def run(self):
+        """Restores the memorized attributes of the registered devices"""
+        self._enabled = False
+        devices, self._devices = self._devices, []
+        if len(devices) == 0:
+            return
+        t0 = time.time()
+        db = Util.instance().get_database()
+        dev_names = [device.get_name() for device in devices]
+        with startup_trace.measure("memorized restore", "prefetch"):
+            db_values = self.prefetch(db, dev_names)
+        t1 = time.time()
+        self.info("Prefetched memorized values of %d devices in %.3fs",
+                  len(devices), t1 - t0)
+        ctrl_devices = collections.OrderedDict()
+        for device in devices:
+            ctrl = device.element.controller
+            ctrl_devices.setdefault(ctrl, []).append(device)
+        for ctrl, devices in ctrl_devices.items():
+            t2 = time.time()
+            with startup_trace.measure("memorized restore", ctrl.name):
+                self._restore_ctrl(ctrl, devices, db_values)
+            self.info("Restored %d devices of %s in %.3fs", len(devices),
+                      ctrl.name, time.time() - t2)
+        self.info("Restored memorized attributes in %.3fs", time.time() - t0)
+
+    def _restore_ctrl(self, ctrl, devices, db_values):
+        axes_pars, restore_data = [], []
+        for device in devices:
+            dev_values = db_values.get(device.get_name(), {})
+            restore_attributes = device.get_attributes_to_restore()
+            pars, restore_attributes = device.get_axis_pars_to_restore(
+                restore_attributes, dev_values)
+            axis = device.element.axis
+            axes_pars.extend([(axis, name, value) for _, name, value in pars])
+            restore_data.append((device, pars, restore_attributes))
+        failed = set()
+        if len(axes_pars) > 0:
+            errors = ctrl.set_axes_pars(axes_pars)
+            for axis, name, _, exc_info in errors:
+                self.debug("Could not restore %s of axis %d", name, axis,
+                           exc_info=exc_info)
+                failed.add((axis, name))
+        for device, pars, restore_attributes in restore_data:
+            axis = device.element.axis
+            restored, not_restored = [], []
+            for attr_name, name, value in pars:
+                if (axis, name) in failed:
+                    not_restored.append(attr_name)
+                else:
+                    restored.append((name, value))
+            device.on_axis_pars_restored(restored)
+            # failed axis parameters are retried with the attribute write
+            device.restore(not_restored + restore_attributes,
+                           db_values.get(device.get_name(), {}))
+
+
+#: the global object restoring the memorized attributes at server startup
+startup_restore = StartupRestore()
+
+
 class PoolDevice(SardanaDevice):
     """Base Tango Pool device class"""
 
@@ -64,7 +213,8 @@ class PoolDevice(SardanaDevice):
 
     def __init__(self, dclass, name):
         """Constructor"""
-        SardanaDevice.__init__(self, dclass, name)
+        with startup_trace.measure("element creation", dclass.get_name()):
+            SardanaDevice.__init__(self, dclass, name)
 
     def init(self, name):
         """initialize the device once in the object lifetime. Override when
@@ -117,6 +267,11 @@ class PoolDevice(SardanaDevice):
         class"""
         SardanaDevice.delete_device(self)
 
+    def _is_startup_restored(self):
+        """Determines if the memorized attributes of this device will be
+        restored by the :obj:`startup_restore`"""
+        return False
+
     def Abort(self):
         """The tango abort command. Aborts the active operation"""
         self.element.abort()
@@ -311,7 +466,8 @@ class PoolDevice(SardanaDevice):
             memorized = attr_info.memorized.lower()
             if memorized == 'true':
                 attr.set_memorized()
-                attr.set_memorized_init(True)
+                # startup restore will apply the memorized value
+                attr.set_memorized_init(not self._is_startup_restored())
             elif memorized == 'true_without_hard_applied':
                 attr.set_memorized()
                 attr.set_memorized_init(False)
@@ -330,6 +486,12 @@ class PoolDevice(SardanaDevice):
         :param write: write method for the attribute
         :param is_allowed: is allowed method"""
         dev_class = self.get_device_class()
+        if self._is_startup_restored() and len(data_info) > 1:
+            props = data_info[1]
+            if props.get('Memorized', '').lower() == 'true':
+                # startup restore will apply the memorized value
+                props = dict(props, Memorized='true_without_hard_applied')
+                data_info = [data_info[0], props] + list(data_info[2:])
         attr_data = AttrData(attr_name, dev_class.get_name(), data_info)
         attr = self.add_attribute(attr_data, read, write, is_allowed)
         return attr
@@ -455,10 +617,20 @@ class PoolDevice(SardanaDevice):
         This applies to memorized writable attributes which have a set point
         stored in the database"""
         restore_attributes, db_values = self.get_restore_data()
+        self.restore(restore_attributes, db_values)
+
+    def restore(self, restore_attributes, db_values):
+        """Restores the given attributes from the given database values.
+
+        :param restore_attributes: names of the attributes to restore
+        :type restore_attributes: seq<str>
+        :param db_values: attribute properties as returned by
+                          ``get_device_attribute_property``
+        :type db_values: dict"""
         multi_attribute = self.get_device_attr()
 
         for attr_name in restore_attributes:
-            props = db_values[attr_name]
+            props = db_values.get(attr_name)
             if props is None or not "__value" in props:
                 continue
             attribute = multi_attribute.get_w_attr_by_name(attr_name)
@@ -576,6 +748,9 @@ class PoolElementDevice(PoolDevice):
         class"""
         PoolDevice.init_device(self)
 
+        if startup_restore.is_active():
+            startup_restore.register(self)
+
         self.instrument = None
         self.ctrl = None
         try:
@@ -593,6 +768,33 @@ class PoolElementDevice(PoolDevice):
         except ValueError:
             pass
 
+    def _is_startup_restored(self):
+        return startup_restore.is_active()
+
+    def get_axis_pars_to_restore(self, restore_attributes, db_values):
+        """Splits the attributes to restore into the ones which can be
+        restored as axis parameters in a batch (see :obj:`StartupRestore`)
+        and the rest. Default implementation restores all of them with the
+        attribute write.
+
+        :param restore_attributes: names of the attributes to restore
+        :type restore_attributes: seq<str>
+        :param db_values: attribute properties as returned by
+                          ``get_device_attribute_property``
+        :type db_values: dict
+        :return: sequence of (attribute name, axis parameter name, value) and
+                 the sequence of names of the rest of the attributes
+        :rtype: tuple(seq<tuple(str, str, object)>, seq<str>)"""
+        return [], restore_attributes
+
+    def on_axis_pars_restored(self, pars):
+        """Called by :obj:`StartupRestore` after restoring the axis
+        parameters in a batch. Default implementation does nothing.
+
+        :param pars: sequence of (axis parameter name, value)
+        :type pars: seq<tuple(str, object)>"""
+        pass
+
     def read_Instrument(self, attr):
         """Read the value of the ``Instrument`` tango attribute.
         Returns the instrument full name or empty string if this element doesn't
@@ -624,6 +826,8 @@ class PoolElementDevice(PoolDevice):
         db = Util.instance().get_database()
         db.put_device_property(
             self.get_name(), {"Instrument_id": instrument.id})
+        # notify clients e.g. MacroServer caching the channels instruments
+        self.pool.fire_event(EventType("ElementChanged"), self.element)
 
     def get_dynamic_attributes(self):
         """Override of :class:`PoolDevice.get_dynamic_attributes`.
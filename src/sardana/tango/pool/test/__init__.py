@@ -29,3 +29,4 @@ from .base_sartest import SarTestTestCase  # noqa
 from .test_measurementgroup import *  # noqa
 from .test_Motor import *  # noqa
 from .test_persistence import *  # noqa
+from .test_startuprestore import *  # noqa
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+from unittest import mock
+
+import PyTango
+from taurus.external import unittest
+
+from sardana.tango.pool import PoolDevice
+from sardana.tango.pool.PoolDevice import StartupRestore
+
+
+class FakeDatabase(object):
+    """Tango database with the memorized values of the given devices"""
+
+    def __init__(self, values, bulk=True):
+        # {device name: {attribute name: [value, ...]}}
+        self.values = values
+        self.bulk = bulk
+        self.queries = []
+
+    def command_inout(self, cmd_name, query):
+        self.queries.append(query)
+        if not self.bulk:
+            raise PyTango.DevFailed()
+        svalue = []
+        for dev_name, attrs in sorted(self.values.items()):
+            if "'%s'" % dev_name not in query:
+                continue
+            for attr_name, values in sorted(attrs.items()):
+                for value in values:
+                    svalue.extend([dev_name, attr_name, value])
+        return [3], svalue
+
+    def get_device_attribute_list(self, dev_name, wildcard):
+        return list(self.values.get(dev_name, {}).keys())
+
+    def get_device_attribute_property(self, dev_name, attr_names):
+        attrs = self.values.get(dev_name, {})
+        return {name: {"__value": attrs[name]} for name in attr_names}
+
+
+class FakeController(object):
+
+    def __init__(self, name, failing=()):
+        self.name = name
+        self.failing = failing
+        self.axes_pars = []
+
+    def set_axes_pars(self, axes_pars):
+        self.axes_pars.append(axes_pars)
+        return [(axis, name, value, (None, Exception("failed"), None))
+                for axis, name, value in axes_pars
+                if (axis, name) in self.failing]
+
+
+class FakeDevice(object):
+    """Pool element device restoring the memorized ``Velocity`` as an axis
+    parameter and the rest of the attributes with the attribute write"""
+
+    def __init__(self, name, ctrl, axis):
+        self.name = name
+        self.element = mock.Mock(controller=ctrl, axis=axis)
+        self.restored_pars = None
+        self.restored_attrs = None
+
+    def get_name(self):
+        return self.name
+
+    def get_attributes_to_restore(self):
+        return ["Velocity", "Offset"]
+
+    def get_axis_pars_to_restore(self, restore_attributes, db_values):
+        pars, rest = [], []
+        for attr_name in restore_attributes:
+            props = db_values.get(attr_name)
+            if attr_name == "Velocity" and props is not None:
+                value = float(props["__value"][0])
+                pars.append((attr_name, "velocity", value))
+            else:
+                rest.append(attr_name)
+        return pars, rest
+
+    def on_axis_pars_restored(self, pars):
+        self.restored_pars = pars
+
+    def restore(self, restore_attributes, db_values):
+        self.restored_attrs = [(name, db_values[name]["__value"])
+                               for name in restore_attributes
+                               if name in db_values]
+
+
+class StartupRestoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.values = {"motor/ctrl01/1": {"Velocity": ["1.5"],
+                                          "Offset": ["0.1"]},
+                       "motor/ctrl01/2": {"Velocity": ["2.5"]},
+                       "motor/ctrl02/1": {"Velocity": ["3.5"],
+                                          "Offset": ["0.3"]}}
+        self.restore = StartupRestore()
+
+    def test_prefetch(self):
+        """Verify that the memorized values are queried in chunks of devices
+        and that all the devices are present in the result."""
+        db = FakeDatabase(self.values)
+        self.restore.QueryChunkSize = 2
+        dev_names = sorted(self.values) + ["motor/ctrl03/1"]
+        db_values = self.restore.prefetch(db, dev_names)
+        self.assertEqual(len(db.queries), 2)
+        self.assertEqual(db_values["MOTOR/CTRL01/1"]["velocity"],
+                         {"__value": ["1.5"]})
+        self.assertEqual(db_values["motor/ctrl02/1"]["Offset"],
+                         {"__value": ["0.3"]})
+        self.assertEqual(db_values["motor/ctrl03/1"], {})
+
+    def test_prefetch_fallback(self):
+        """Verify that the memorized values are queried per device when the
+        bulk query fails."""
+        db = FakeDatabase(self.values, bulk=False)
+        db_values = self.restore.prefetch(db, sorted(self.values))
+        self.assertEqual(len(db.queries), 1)
+        self.assertEqual(db_values["motor/ctrl01/1"]["Velocity"],
+                         {"__value": ["1.5"]})
+        self.assertEqual(db_values["motor/ctrl01/2"]["Velocity"],
+                         {"__value": ["2.5"]})
+        self.assertNotIn("Offset", db_values["motor/ctrl01/2"])
+
+    def _run(self, db, devices):
+        for device in devices:
+            self.restore.register(device)
+        with mock.patch.object(PoolDevice, "Util") as util:
+            util.instance.return_value.get_database.return_value = db
+            self.restore.run()
+
+    def _check_run(self, db):
+        ctrl01 = FakeController("ctrl01", failing=[(2, "velocity")])
+        ctrl02 = FakeController("ctrl02")
+        devices = [FakeDevice("motor/ctrl01/1", ctrl01, 1),
+                   FakeDevice("motor/ctrl02/1", ctrl02, 1),
+                   FakeDevice("motor/ctrl01/2", ctrl01, 2)]
+        self._run(db, devices)
+        # one batch of axis parameters per controller
+        self.assertEqual(ctrl01.axes_pars, [[(1, "velocity", 1.5),
+                                             (2, "velocity", 2.5)]])
+        self.assertEqual(ctrl02.axes_pars, [[(1, "velocity", 3.5)]])
+        dev01, dev02, dev03 = devices
+        self.assertEqual(dev01.restored_pars, [("velocity", 1.5)])
+        self.assertEqual(dev01.restored_attrs, [("Offset", ["0.1"])])
+        self.assertEqual(dev02.restored_pars, [("velocity", 3.5)])
+        self.assertEqual(dev02.restored_attrs, [("Offset", ["0.3"])])
+        # the failed axis parameter is retried with the attribute write
+        self.assertEqual(dev03.restored_pars, [])
+        self.assertEqual(dev03.restored_attrs, [("Velocity", ["2.5"])])
+
+    def test_run(self):
+        """Verify that the prefetched values are applied per controller and
+        that the axis parameters which failed are written one by one."""
+        db = FakeDatabase(self.values)
+        self._check_run(db)
+        self.assertEqual(len(db.queries), 1)
+
+    def test_run_fallback(self):
+        """Verify that the memorized values are restored when the bulk
+        database query fails."""
+        self._check_run(FakeDatabase(self.values, bulk=False))
@@ -159,6 +159,18 @@ class MacroInfo(object):
             return
         return self.parameters[idx]
 
+    def getParamParser(self):
+        """Gets the parser of the parameters string. It is created on first
+        use and reused by the subsequent calls.
+
+        :return: (ParamParser) the parameters parser
+        """
+        try:
+            return self._param_parser
+        except AttributeError:
+            self._param_parser = ParamParser(self.getParamList())
+            return self._param_parser
+
     def getPossibleParams(self, idx, parameters=None):
         """Gets the possible parameters for the given index
 
@@ -1283,9 +1295,9 @@ class SequenceNode(BranchNode):
                 plainTextParams = plainTextMacro.split(" ", 1)[1]
             except IndexError:
                 continue
-            paramsDef = macroInfo.parameters
             try:
-                macroParams = ParamParser(paramsDef).parse(plainTextParams)
+                macroParams = macroInfo.getParamParser().parse(
+                    plainTextParams)
             except ParseError as e:
                 msg = "{0} can not be parsed ({1})".format(plainTextMacro, e)
                 # TODO: think of using `raise from` syntax
@@ -41,6 +41,7 @@ __all__ = ["InterruptException", "StopException", "AbortException",
 __docformat__ = 'restructuredtext'
 
 import copy
+import json
 import operator
 import os
 import sys
@@ -65,6 +66,7 @@ from taurus.core.util.event import EventGenerator, AttributeEventWait, \
 from taurus.core.tango import TangoDevice, FROM_TANGO_TO_STR_TYPE
 
 from sardana import sardanacustomsettings
+from sardana.util.profiler import get_current_profiler
 from .sardana import BaseSardanaElementContainer, BaseSardanaElement
 from .motion import Moveable, MoveableSource
 
@@ -96,6 +98,44 @@ def _is_referable(channel):
     return "valueref" in list(map(str.lower, channel.get_attribute_list()))
 
 
+def _profiled_device_call(method_name):
+    """Create a method which calls the homonymous method of the device proxy
+    and, if a profiler is bound to the current thread, records its wall time
+    in the "pool" category (see :mod:`sardana.util.profiler`)."""
+
+    def call(self, *args, **kwargs):
+        method = TangoDevice.__getattr__(self, method_name)
+        profiler = get_current_profiler()
+        if profiler is None:
+            return method(*args, **kwargs)
+        name = "%s.%s" % (self.getSimpleName(), method_name)
+        if len(args) > 0 and isinstance(args[0], str):
+            name += " " + args[0]
+        return profiler.call("pool", name, method, *args, **kwargs)
+
+    call.__name__ = method_name
+    call.__doc__ = "Profiled DeviceProxy.%s" % method_name
+    return call
+
+
+class _ProfiledDeviceCalls(object):
+    """Mixin which exposes the device proxy calls done by the Pool client
+    objects to the thread's profiler"""
+
+    command_inout = _profiled_device_call("command_inout")
+    read_attribute = _profiled_device_call("read_attribute")
+    read_attributes = _profiled_device_call("read_attributes")
+    write_attribute = _profiled_device_call("write_attribute")
+    write_attributes = _profiled_device_call("write_attributes")
+
+
+def _to_json_friendly(position):
+    # positions may come as numpy scalars or arrays
+    if numpy.ndim(position) == 0:
+        return float(position)
+    return list(map(float, position))
+
+
 class InterruptException(Exception):
     pass
 
@@ -211,8 +251,13 @@ class TangoAttributeEG(Logger, EventGenerator):
     def __init__(self, attr):
         self._attr = attr
         self.call__init__(Logger, 'EG', attr)
-        event_name = '%s EG' % (attr.getParentObj().getNormalName())
+        parent = attr.getParentObj()
+        event_name = '%s EG' % (parent.getNormalName())
         self.call__init__(EventGenerator, event_name)
+        # name of the attribute calls in the profiler (same as the
+        # device proxy calls, see _ProfiledDeviceCalls)
+        self._profile_name = "%s.%%s %s" % (parent.getSimpleName(),
+                                            attr.getSimpleName())
 
         self._attr.addListener(self)
 
@@ -229,9 +274,19 @@ class TangoAttributeEG(Logger, EventGenerator):
             v = evt_value.value
         EventGenerator.fireEvent(self, v)
 
+    def _call(self, method_name, method, *args, **kwargs):
+        """Call the attribute method and, if a profiler is bound to the
+        current thread, record its wall time in the "pool" category"""
+        profiler = get_current_profiler()
+        if profiler is None:
+            return method(*args, **kwargs)
+        name = self._profile_name % method_name
+        return profiler.call("pool", name, method, *args, **kwargs)
+
     def read(self, force=False):
         try:
-            self.last_val = self._attr.read(cache=not force).value
+            self.last_val = self._call("read_attribute", self._attr.read,
+                                       cache=not force).value
         except:
             self.error("Read error")
             self.debug("Details:", exc_info=1)
@@ -246,7 +301,8 @@ class TangoAttributeEG(Logger, EventGenerator):
         return r
 
     def write(self, value):
-        self._attr.write(value, with_read=False)
+        self._call("write_attribute", self._attr.write, value,
+                   with_read=False)
 
     def __getattr__(self, name):
         return getattr(self._attr, name)
@@ -279,7 +335,7 @@ def get_pool_for_device(db, device):
             return Device(dev_name)
 
 
-class PoolElement(BaseElement, TangoDevice):
+class PoolElement(BaseElement, _ProfiledDeviceCalls, TangoDevice):
     """Base class for a Pool element device."""
 
     def __init__(self, name, **kwargs):
@@ -801,7 +857,7 @@ class ExpChannel(PoolElement):
         self.getValueRefEnabledObj().write(value_ref_enabled)
 
     def _start(self, *args, **kwargs):
-        self.Start()
+        self.command_inout("Start")
 
     def go(self, *args, **kwargs):
         """Count and report count result.
@@ -1146,6 +1202,25 @@ class PseudoMotor(PoolElement, Moveable):
     def readPosition(self, force=False):
         return [self.getPosition(force=force)]
 
+    def calcPhysicalBulk(self, positions):
+        """Calculates the physical positions for a sequence of positions of
+        this pseudo motor (or of all its sibling pseudo motors) in one call.
+
+        :param positions: sequence of points
+        :return: physical positions (one sequence per point)
+        :rtype: list<list<float>>"""
+        return self.getPoolObj().calcAllPhysicalBulk(self.getName(),
+                                                     positions)
+
+    def calcPseudoBulk(self, positions):
+        """Calculates the pseudo positions of this pseudo motor and its
+        siblings for a sequence of physical positions in one call.
+
+        :param positions: physical positions (one sequence per point)
+        :return: pseudo positions (one sequence per point)
+        :rtype: list<list<float>>"""
+        return self.getPoolObj().calcAllPseudoBulk(self.getName(), positions)
+
     def getMoveableSource(self):
         return self.getPoolObj()
 
@@ -2055,7 +2130,7 @@ class MeasurementGroup(PoolElement):
 
     def _start(self, *args, **kwargs):
         try:
-            self.Start()
+            self.command_inout("Start")
         except DevFailed as e:
             # TODO: Workaround for CORBA timeout on measurement group start
             # remove it whenever sardana-org/sardana#93 gets implemented
@@ -2231,7 +2306,7 @@ class Instrument(BaseElement):
         return self.klass
 
 
-class Pool(TangoDevice, MoveableSource):
+class Pool(_ProfiledDeviceCalls, TangoDevice, MoveableSource):
     """ Class encapsulating device Pool functionality."""
 
     def __init__(self, name, **kw):
@@ -2504,6 +2579,78 @@ class Pool(TangoDevice, MoveableSource):
         elements_info = self.getElementsInfo()
         return self._wait_for_element_in_container(elements_info, full_name)
 
+    def calcAllPhysicalBulk(self, pseudo_motor, positions):
+        """Calculates the physical positions for a sequence of pseudo motor
+        positions in one call to the Pool.
+
+        :param pseudo_motor: pseudo motor name
+        :type pseudo_motor: :obj:`str`
+        :param positions: sequence of points, each being either a position of
+                          the pseudo motor or a sequence with the positions
+                          of all the pseudo motors of its controller
+        :return: physical positions (one sequence per point)
+        :rtype: list<list<float>>"""
+        argin = {"pseudo_motor": pseudo_motor,
+                 "positions": [_to_json_friendly(p) for p in positions]}
+        result = self.command_inout("CalcAllPhysicalBulk", json.dumps(argin))
+        return json.loads(result)
+
+    def calcAllPseudoBulk(self, pseudo_motor, positions):
+        """Calculates the pseudo positions for a sequence of physical motor
+        positions in one call to the Pool.
+
+        :param pseudo_motor: pseudo motor name
+        :type pseudo_motor: :obj:`str`
+        :param positions: physical positions (one sequence per point)
+        :return: pseudo positions (one sequence per point)
+        :rtype: list<list<float>>"""
+        argin = {"pseudo_motor": pseudo_motor,
+                 "positions": [_to_json_friendly(p) for p in positions]}
+        result = self.command_inout("CalcAllPseudoBulk", json.dumps(argin))
+        return json.loads(result)
+
+    def getAxisPars(self, elements, parameters):
+        """Gets axis parameters of multiple elements with one call to the
+        Pool (and one call per controller within the Pool).
+
+        :param elements: element names
+        :type elements: seq<str>
+        :param parameters: axis parameter names e.g. velocity
+        :type parameters: seq<str>
+        :return: map where keys are element names and values are maps of
+                 parameter names and values
+        :rtype: dict<str, dict<str, object>>"""
+        argin = {"elements": list(elements), "parameters": list(parameters)}
+        result = self.command_inout("GetAxisPars", json.dumps(argin))
+        return json.loads(result)
+
+    def setAxisPars(self, elements_pars):
+        """Sets axis parameters of multiple elements with one call to the
+        Pool (and one call per controller within the Pool). The values are
+        not memorized.
+
+        :param elements_pars: map where keys are element names and values
+                              are maps of parameter names and values
+        :type elements_pars: dict<str, dict<str, object>>
+        :return: parameters which could not be set (the rest of them are set
+                 anyway): map where keys are element names and values are
+                 maps of parameter names and error messages
+        :rtype: dict<str, dict<str, str>>"""
+        result = self.command_inout("SetAxisPars",
+                                    json.dumps(elements_pars, default=float))
+        return json.loads(result)
+
+    def getMonitorStatistics(self):
+        """Gets the statistics of the periodic read of the controllers
+        state (see
+        :meth:`~sardana.pool.poolmonitor.PoolMonitor.get_statistics`).
+
+        :return: map where keys are controller names and values are maps
+                 with the polling statistics
+        :rtype: dict<str, dict>"""
+        result = self.command_inout("GetMonitorStatistics")
+        return json.loads(result)
+
 
 def registerExtensions():
     factory = Factory()
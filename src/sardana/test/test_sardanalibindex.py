@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import os
+import sys
+import types
+import shutil
+import tempfile
+
+from taurus.external.unittest import TestCase
+
+from sardana.sardanalibindex import LibraryIndex
+
+
+class LibraryIndexTestCase(TestCase):
+    """Unit tests for LibraryIndex class"""
+
+    def setUp(self):
+        self.dir_name = tempfile.mkdtemp()
+        self.file_name = os.path.join(self.dir_name, "index.json")
+        self.lib_file_name = os.path.join(self.dir_name, "lib.py")
+        with open(self.lib_file_name, "w") as f:
+            f.write("a = 1\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir_name)
+
+    def _add(self, index):
+        stat = os.stat(self.lib_file_name)
+        index._entries[self.lib_file_name] = dict(
+            mtime=stat.st_mtime, size=stat.st_size,
+            hash=index.get_hash(self.lib_file_name), info={"elements": []},
+            dependencies={})
+        index._dirty = True
+
+    def test_persistence(self):
+        index = LibraryIndex(self.file_name)
+        self.assertIsNone(index.get(self.lib_file_name))
+        self._add(index)
+        index.save()
+        index = LibraryIndex(self.file_name)
+        self.assertEqual(index.get(self.lib_file_name), {"elements": []})
+
+    def test_touched(self):
+        """A file which modification time changed but not its contents is
+        unchanged."""
+        index = LibraryIndex()
+        self._add(index)
+        stat = os.stat(self.lib_file_name)
+        os.utime(self.lib_file_name, (stat.st_atime, stat.st_mtime + 10))
+        self.assertTrue(index.is_unchanged(self.lib_file_name))
+
+    def test_changed(self):
+        index = LibraryIndex()
+        self._add(index)
+        stat = os.stat(self.lib_file_name)
+        with open(self.lib_file_name, "w") as f:
+            f.write("a = 2\n")
+        os.utime(self.lib_file_name, (stat.st_atime, stat.st_mtime + 10))
+        self.assertFalse(index.is_unchanged(self.lib_file_name))
+        self.assertIsNone(index.get(self.lib_file_name))
+
+    def test_corrupted(self):
+        with open(self.file_name, "w") as f:
+            f.write("{")
+        index = LibraryIndex(self.file_name)
+        self.assertIsNone(index.get(self.lib_file_name))
+
+    def test_dependencies(self):
+        """A library which dependency changed is changed."""
+        helper_file_name = os.path.join(self.dir_name, "libindex_helper.py")
+        with open(helper_file_name, "w") as f:
+            f.write("def f():\n    pass\n")
+        helper = types.ModuleType("libindex_helper")
+        helper.__file__ = helper_file_name
+        exec("def f():\n    pass\n", vars(helper))
+        module = types.ModuleType("libindex_lib")
+        module.__file__ = self.lib_file_name
+        module.f = helper.f
+        # modules outside of the library path are not dependencies
+        module.os = os
+        sys.modules[helper.__name__] = helper
+        self.addCleanup(sys.modules.pop, helper.__name__)
+        self.assertEqual(LibraryIndex.get_dependencies(module,
+                                                       [self.dir_name]),
+                         {helper_file_name})
+
+        class Library(object):
+            file_path = self.lib_file_name
+            path = self.dir_name
+
+            def __init__(self, module):
+                self.module = module
+
+            def serialize(self):
+                return {}
+
+            def get_metas(self):
+                return []
+
+        index = LibraryIndex()
+        index.add_library(Library(module))
+        self.assertTrue(index.is_unchanged(self.lib_file_name))
+        with open(helper_file_name, "a") as f:
+            f.write("a = 1\n")
+        self.assertFalse(index.is_unchanged(self.lib_file_name))
@@ -23,7 +23,6 @@
 
 import time
 import threading
-import math
 import copy
 import numpy
 import traceback
@@ -36,12 +35,12 @@ from taurus.core.util.log import Logger
 
 def strictly_increasing(l):
     """Check whether list l has strictly increasing values"""
-    return all(x < y for x, y in zip(l, l[1:]))
+    return bool(numpy.all(numpy.diff(l) > 0))
 
 
 def strictly_decreasing(l):
     """Check whether list l has strictly deacreasing values"""
-    return all(x > y for x, y in zip(l, l[1:]))
+    return bool(numpy.all(numpy.diff(l) < 0))
 
 
 class FunctionGenerator(EventGenerator, Logger):
@@ -56,6 +55,7 @@ class FunctionGenerator(EventGenerator, Logger):
     """
 
     MAX_NAP_TIME = 0.1
+    SPIN_TIME = 0.001
 
     def __init__(self, name="FunctionGenerator"):
         EventGenerator.__init__(self)
@@ -73,6 +73,14 @@ class FunctionGenerator(EventGenerator, Logger):
         self._stopped = False
         self._running = False
         self._start_time = None
+        self._active_array = numpy.array([])
+        self._passive_array = numpy.array([])
+        self._active_deadlines = None
+        self._passive_deadlines = None
+        self._active_search = None
+        self._latencies = numpy.array([])
+        self._nb_skipped = 0
+        self._statistics = None
         self._direction = None
         self._condition = None
         self._id = None
@@ -165,15 +173,36 @@ class FunctionGenerator(EventGenerator, Logger):
         self._position_event.set()
 
     def start(self):
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
         self._stopped = False
         self._started = True
         self._position = None
         self._start_fired = False
         self._position_event.clear()
         self._id = 0
+        self._prepare_deadlines()
         self.fire_event(EventType("state"), State.Moving)
 
+    def _prepare_deadlines(self):
+        """Precompute the events as arrays. In the time domain the events
+        are converted to absolute deadlines of the :func:`time.perf_counter`
+        clock so they are not affected by the system clock adjustments and
+        do not accumulate drift."""
+        self._active_array = numpy.array(self.active_events, dtype=float)
+        self._passive_array = numpy.array(self.passive_events, dtype=float)
+        self._active_deadlines = None
+        self._passive_deadlines = None
+        self._active_search = None
+        if self.initial_domain_in_use == SynchDomain.Time:
+            self._active_deadlines = self._active_array + self._start_time
+        elif self._direction is not None:
+            self._active_search = self._active_array * self._direction
+        if self.active_domain_in_use == SynchDomain.Time:
+            self._passive_deadlines = self._passive_array + self._start_time
+        self._latencies = numpy.full(len(self._active_array), numpy.nan)
+        self._nb_skipped = 0
+        self._statistics = None
+
     def stop(self):
         self._stopped = True
 
@@ -186,33 +215,65 @@ class FunctionGenerator(EventGenerator, Logger):
     def is_running(self):
         return self._running
 
+    def get_statistics(self):
+        """Returns statistics of the last run. Trigger latency is the delay
+        of the active events with respect to their scheduled time and
+        jitter is its standard deviation. Latencies are only measured
+        in the time domain.
+
+        :return: dictionary with the following keys: *nb_events*,
+            *nb_skipped*, *latency_mean*, *latency_max* and *jitter*
+            (times in seconds) or None if the generator did not run
+        :rtype: :obj:`dict`
+        """
+        return self._statistics
+
+    def _calc_statistics(self):
+        latencies = self._latencies
+        latencies = latencies[~numpy.isnan(latencies)]
+        statistics = {"nb_events": self._id, "nb_skipped": self._nb_skipped,
+                      "latency_mean": None, "latency_max": None,
+                      "jitter": None}
+        if len(latencies) > 0:
+            statistics["latency_mean"] = float(latencies.mean())
+            statistics["latency_max"] = float(latencies.max())
+            statistics["jitter"] = float(latencies.std())
+        return statistics
+
     def run(self):
         self._running = True
         try:
-            while len(self.active_events) > 0 and not self.is_stopped():
+            while (self._id < len(self._active_array)
+                   and not self.is_stopped()):
                 self.wait_active()
                 self.fire_active()
                 self.wait_passive()
                 self.fire_passive()
                 self._id += 1
         finally:
+            self._statistics = self._calc_statistics()
+            self.debug("Run statistics: %s", self._statistics)
             self._started = False
             self._running = False
             self._stopped = False
             self.fire_event(EventType("state"), State.On)
 
+    def sleep_until(self, deadline):
+        """Sleep until the deadline of the :func:`time.perf_counter` clock.
+        Sleep in naps of maximum :attr:`MAX_NAP_TIME` (to react on stop)
+        and spin the last :attr:`SPIN_TIME` before the deadline (to not
+        depend on the sleep accuracy of the OS)."""
+        while not self.is_stopped():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            if remaining > self.SPIN_TIME:
+                time.sleep(min(remaining - self.SPIN_TIME, self.MAX_NAP_TIME))
+
     def sleep(self, period):
         if period <= 0:
             return
-        necessary_naps = int(math.ceil(period / self.MAX_NAP_TIME))
-        if necessary_naps == 0:  # avoid zero ZeroDivisionError
-            nap = 0
-        else:
-            nap = period / necessary_naps
-        for _ in range(necessary_naps):
-            if self.is_stopped():
-                break
-            time.sleep(nap)
+        self.sleep_until(time.perf_counter() + period)
 
     def fire_start(self):
         self.fire_event(EventType("start"), self._id)
@@ -221,65 +282,56 @@ class FunctionGenerator(EventGenerator, Logger):
             msg = "start was fired with {0} delay".format(self._id)
             self.warning(msg)
 
+    def _wait_position(self, candidate):
+        """Wait until the position crosses the candidate event. The last
+        known position is checked first so a single position update which
+        crosses several events does not need to wait for the next one."""
+        while not self.is_stopped():
+            position = self._position
+            if position is not None and self._condition(position, candidate):
+                break
+            self._position_event.wait(self.MAX_NAP_TIME)
+            self._position_event.clear()
+
     def wait_active(self):
-        candidate = self.active_events[0]
         if self.initial_domain_in_use == SynchDomain.Time:
-            now = time.time()
-            candidate += self._start_time
-            self.sleep(candidate - now)
+            self.sleep_until(self._active_deadlines[self._id])
         else:
-            while True:
-                if self.is_stopped():
-                    break
-                if self._position_event.isSet():
-                    self._position_event.clear()
-                    now = self._position
-                    if self._condition(now, candidate):
-                        break
-                else:
-                    self._position_event.wait(self.MAX_NAP_TIME)
+            self._wait_position(self._active_array[self._id])
 
     def fire_active(self):
         # check if some events needs to be skipped
         i = 0
-        while i < len(self.active_events) - 1:
-            candidate = self.active_events[i + 1]
-            if self.initial_domain_in_use is SynchDomain.Time:
-                candidate += self._start_time
-                now = time.time()
-            elif self.initial_domain_in_use is SynchDomain.Position:
-                now = self._position
-            if self._condition(now, candidate):
-                i += 1
-            else:
-                break
+        if self.initial_domain_in_use is SynchDomain.Time:
+            now = time.perf_counter()
+            deadlines = self._active_deadlines
+            # index of the last event which deadline already passed
+            last = numpy.searchsorted(deadlines, now, side="right") - 1
+            if last >= self._id:
+                i = int(last) - self._id
+                self._latencies[last] = now - deadlines[last]
+        elif self.initial_domain_in_use is SynchDomain.Position:
+            # events multiplied by direction are always increasing
+            now = self._position * self._direction
+            last = numpy.searchsorted(self._active_search, now,
+                                      side="right") - 1
+            if last > self._id:
+                i = int(last) - self._id
         self._id += i
+        self._nb_skipped += i
         if not self._start_fired:
             self.fire_start()
         self.fire_event(EventType("active"), self._id)
-        self.active_events = self.active_events[i + 1:]
-        self.passive_events = self.passive_events[i:]
 
     def wait_passive(self):
         if self.active_domain_in_use == SynchDomain.Time:
-            now = time.time()
-            candidate = self._start_time + self.passive_events[0]
-            self.sleep(candidate - now)
+            self.sleep_until(self._passive_deadlines[self._id])
         else:
-            while True:
-                if self._position_event.isSet():
-                    self._position_event.clear()
-                    if self._condition(self._position, self.passive_events[0]):
-                        break
-                else:
-                    self._position_event.wait(self.MAX_NAP_TIME)
-                    if self.is_stopped():
-                        break
+            self._wait_position(self._passive_array[self._id])
 
     def fire_passive(self):
         self.fire_event(EventType("passive"), self._id)
-        self.set_passive_events(self.passive_events[1:])
-        if len(self.passive_events) == 0:
+        if self._id == len(self._passive_array) - 1:
             self.fire_end()
 
     def fire_end(self):
@@ -78,117 +78,153 @@ class ExcessParamValue(ParseError):
     pass
 
 
+#: characters which require the full tokenizer (otherwise the parameter
+#: values are just separated by whitespaces)
+_special_chars_pat = re.compile(r"[\[\]\"']")
+
+
+def tokenize(text):
+    """Tokenize the text in a list of (type, value) tuples (whitespaces
+    are discarded)"""
+    tokens = []
+    for m in master_pat.finditer(text):
+        toktype = m.lastgroup
+        if toktype == "WS":
+            continue
+        # quoted parameters must be returned without the quotes that's why
+        # we extract a given group, otherwise we would extract the whole match
+        tokens.append((toktype, m.group(toktype) or m.group()))
+    return tokens
+
+
+def compile_params_def(params_def):
+    """Compile the parameters definition in the structure used by the
+    :class:`ParamParser`: a tuple with one item per parameter, None for
+    normal parameters and a tuple with the compiled repeat parameter
+    definition and whether it is a single repeat for repeat parameters.
+
+    :param params_def: parameters definition
+    :type params_def: list<dict>
+    :return: compiled parameters definition
+    :rtype: tuple
+    """
+    program = []
+    for param_def in params_def or ():
+        if is_repeat_param(param_def):
+            repeat_param_def = param_def["type"]
+            param = (compile_params_def(repeat_param_def),
+                     is_repeat_param_single(repeat_param_def))
+        else:
+            param = None
+        program.append(param)
+    return tuple(program)
+
+
 class ParamParser:
-    """Implementation of a recursive descent parser. Use the ._accept() method
-    to test and accept the current lookahead token. Use the ._expect()
-    method to exactly match and discard the next token on the input
-    (or raise a SyntaxError if it doesn't match).
+    """Implementation of a recursive descent parser. The parameters
+    definition is compiled once (see :func:`compile_params_def`) so the same
+    parser can be reused (also concurrently) to parse many parameter
+    strings. Parameter strings without brackets and quotes of macros
+    without repeat parameters are split directly.
 
     Inspired on Python Cookbook 3 (chapter 2.19)
     """
 
     def __init__(self, params_def=None):
         self._params_def = params_def
+        self._program = program = compile_params_def(params_def)
+        self._flat = all(param is None for param in program)
 
     def parse(self, text):
-        self.tokens = generate_tokens(text)
-        self.tok = None             # Last symbol consumed
-        self.nexttok = None         # Next symbol tokenized
-        self._advance()             # Load first lookahead token
-        params = self._params()
-        self._end_check()
+        if self._flat and _special_chars_pat.search(text) is None:
+            values = text.split()
+            idx = min(len(values), len(self._program))
+            self._end_check(values, idx)
+            return values[:idx]
+        tokens = tokenize(text)
+        params, idx = self._params(tokens, 0, self._program)
+        if idx + 1 < len(tokens) or len(self._program) == 0:
+            self._end_check([value for _, value in tokens], idx)
         return params
 
-    def _advance(self):
-        """Advance one token ahead"""
-        self.tok, self.nexttok = self.nexttok, next(self.tokens, None)
-
-    def _accept(self, toktype):
-        """Test and consume the next token if it matches toktype"""
-        if self.nexttok and self.nexttok.type == toktype:
-            self._advance()
-            return True
-        else:
-            return False
+    # Grammar rules follow. Each of them receives the tokens and the index of
+    # the next token and returns the value and the index of the next token
+    # after consuming it
 
-    def _expect(self, toktype):
-        """Consume next token if it matches toktype or raise SyntaxError"""
-        if not self._accept(toktype):
-            raise ParseError("Expected " + toktype)
-
-    # Grammar rules follow
-
-    def _params(self, params_def=None, is_repeat=False):
-        """Interpret parameter values by iterating over generated tokens
+    def _params(self, tokens, idx, program, is_repeat=False):
+        """Interpret parameter values by iterating over the tokens
         according to parameters definition.
 
         It is used either at the macro level or a the repeat parameter
         repetition level.
 
-        :param params_def: parameters definition as used by the
-            :meth:`sardana.macroserver.msmetamacro.Parametrizable.get_parameter`
-            or by the
-            `attr:`sardana.taurus.core.tango.sardana.macro.MacroInfo.parameters`
-        :type params_def: list<dict>
-        :param end_check: whether to check if there are parameter values
-            exceeding parameters definition
-        :type end_check: bool
-        :return: parameter values
-        :rtype: list
+        :param tokens: tokens (as returned by :func:`tokenize`)
+        :type tokens: list<tuple>
+        :param idx: index of the next token
+        :type idx: int
+        :param program: compiled parameters definition
+        :type program: tuple
+        :param is_repeat: whether the parameters are a repetition of a repeat
+            parameter
+        :type is_repeat: bool
+        :return: parameter values and index of the next token
+        :rtype: tuple<list, int>
         """
-        params_def = params_def or self._params_def
-        len_params_def = len(params_def)
+        program = program or self._program
+        last_param_idx = len(program) - 1
+        nb_tokens = len(tokens)
         params = []
-        for param_idx, param_def in enumerate(params_def):
+        for param_idx, param in enumerate(program):
             # no next tokens means that the string being parsed had finished
-            if self.nexttok is None:
+            if idx >= nb_tokens:
                 break
-            if is_repeat_param(param_def):
-                is_last_param = False
-                if param_idx == len_params_def - 1:
-                    is_last_param = True
-                repeat_param_def = param_def["type"]
-                param_value = self._repeat_param(repeat_param_def,
-                                                 is_last_param)
+            if param is not None:
+                is_last_param = param_idx == last_param_idx
+                param_value, idx = self._repeat_param(tokens, idx, param,
+                                                      is_last_param)
             else:
                 try:
-                    param_value = self._param()
+                    param_value, idx = self._param(tokens, idx)
                 except UnrecognizedParamValue:
                     # this exception may occur if repeat is not complete -
                     # uses default values
                     if is_repeat:
-                        return params
+                        return params, idx
                     raise
             params.append(param_value)
-        return params
+        return params, idx
 
-    def _param(self):
+    def _param(self, tokens, idx):
         """Interpret normal parameter value. Respect quotes for string
         parameters.
 
-        :return: parameter value
-        :rtype: str
+        :return: parameter value and index of the next token
+        :rtype: tuple<str, int>
         """
-        if self._accept("LPAREN"):
-            # empty brackets will be interpreted as a default value
-            self._expect("RPAREN")
-            param = []
-        elif self._accept("QUOTEDPARAM"):
-            # quoted parameters allows using quotes escaped by \\
-            string = self.tok.value
-            string = string.replace('\\"', '"')
-            param = string
-        elif self._accept("SINGQUOTEDPARAM"):
-            param = self.tok.value
-        elif self._accept("PARAM"):
-            tok_value = self.tok.value
-            param = tok_value
-        else:
-            msg = "%s is not a valid param value" % self.tok.value
-            raise UnrecognizedParamValue(msg)
-        return param
-
-    def _repeat_param(self, repeat_param_def, is_last_param):
+        if idx < len(tokens):
+            toktype, value = tokens[idx]
+            if toktype == "PARAM" or toktype == "SINGQUOTEDPARAM":
+                return value, idx + 1
+            elif toktype == "QUOTEDPARAM":
+                # quoted parameters allows using quotes escaped by \\
+                return value.replace('\\"', '"'), idx + 1
+            elif toktype == "LPAREN":
+                # empty brackets will be interpreted as a default value
+                idx = self._expect(tokens, idx + 1, "RPAREN")
+                return [], idx
+        if idx == 0:
+            # nothing consumed yet: the parameter string is not valid at all
+            raise ParseError("%s is not a valid param value" % tokens[0][1])
+        msg = "%s is not a valid param value" % tokens[idx - 1][1]
+        raise UnrecognizedParamValue(msg)
+
+    def _expect(self, tokens, idx, toktype):
+        """Consume next token if it matches toktype or raise ParseError"""
+        if idx < len(tokens) and tokens[idx][0] == toktype:
+            return idx + 1
+        raise ParseError("Expected " + toktype)
+
+    def _repeat_param(self, tokens, idx, param, is_last_param):
         """Interpret repeat parameter.
 
         Accepts repeat parameters using the following rules:
@@ -198,80 +234,77 @@ class ParamParser:
         * non-enclosed in parenthesis one repetition of single repeat
         parameter at arbitrary position
 
-        :param repeat_param_def: repeat parameter definition
-        :type repeat_param_def: list<dict>
+        :param param: compiled repeat parameter definition
+        :type param: tuple
         :param is_last_param: whether this repeat parameter is the last in the
             definition
         :type is_last_param: bool
-        :return: repeat parameter value
-        :rtype: list
+        :return: repeat parameter value and index of the next token
+        :rtype: tuple<list, int>
         """
+        repeat_program, single = param
         repeats = []
 
-        if self._accept("LPAREN"):
+        if idx < len(tokens) and tokens[idx][0] == "LPAREN":
+            idx += 1
             while True:
-                repeat = self._repeat(repeat_param_def)
+                repeat, idx = self._repeat(tokens, idx, param)
                 if repeat is None:
                     break
                 repeats.append(repeat)
-            self._expect("RPAREN")
-        else:
-            single = is_repeat_param_single(repeat_param_def)
-            if is_last_param:
-                while True:
-                    repeat = []
-                    for _ in repeat_param_def:
-                        try:
-                            param = self._param()
-                        except UnrecognizedParamValue:
-                            return repeats
-                        if single:
-                            repeat = param
-                        else:
-                            repeat.append(param)
-                    repeats.append(repeat)
-            elif single:
-                param = self._param()
-                repeats = [param]
-        return repeats
-
-    def _repeat(self, repeat_param_def):
+            idx = self._expect(tokens, idx, "RPAREN")
+        elif is_last_param:
+            while True:
+                repeat = []
+                for _ in repeat_program:
+                    try:
+                        value, idx = self._param(tokens, idx)
+                    except UnrecognizedParamValue:
+                        return repeats, idx
+                    if single:
+                        repeat = value
+                    else:
+                        repeat.append(value)
+                repeats.append(repeat)
+        elif single:
+            value, idx = self._param(tokens, idx)
+            repeats = [value]
+        return repeats, idx
+
+    def _repeat(self, tokens, idx, param):
         """Interpret one repetition of the repeat parameter.
 
-        :param repeat_param_def: repeat parameter definition
-        :type repeat_param_def: list<dict>
-        :return: repeat value
-        :rtype: list or None
+        :param param: compiled repeat parameter definition
+        :type param: tuple
+        :return: repeat value (None if no repeat was found) and index of the
+            next token
+        :rtype: tuple<list or None, int>
         """
-        repeat = None
-        if self._accept("LPAREN"):
+        repeat_program, single = param
+        if idx < len(tokens) and tokens[idx][0] == "LPAREN":
+            idx += 1
             # empty brackets will be interpreted as a default value
-            if self._accept("RPAREN"):
-                repeat = []
-            else:
-                repeat = self._params(repeat_param_def, is_repeat=True)
-                # repetitions of single repeat parameters are not enclosed
-                # in parenthesis so remove it
-                if is_repeat_param_single(repeat_param_def):
-                    repeat = repeat[0]
-                self._expect("RPAREN")
-        else:
-            try:
-                repeat = self._param()
-            except UnrecognizedParamValue:
-                # no repeat found - return None
-                pass
-        return repeat
-
-    def _end_check(self):
+            if idx < len(tokens) and tokens[idx][0] == "RPAREN":
+                return [], idx + 1
+            repeat, idx = self._params(tokens, idx, repeat_program,
+                                       is_repeat=True)
+            # repetitions of single repeat parameters are not enclosed
+            # in parenthesis so remove it
+            if single:
+                repeat = repeat[0]
+            idx = self._expect(tokens, idx, "RPAREN")
+            return repeat, idx
+        try:
+            return self._param(tokens, idx)
+        except UnrecognizedParamValue:
+            # no repeat found - return None
+            return None, idx
+
+    def _end_check(self, values, idx):
         """Check if there are excessive tokens."""
         excess_tokens = ""
-        if len(self._params_def) == 0 and self.nexttok is not None:
-            excess_tokens += self.nexttok.value
-        while True:
-            self._advance()
-            if self.nexttok is None:
-                break
-            excess_tokens += self.nexttok.value
+        if len(self._program) == 0 and idx < len(values):
+            excess_tokens += values[idx]
+        excess_tokens += "".join(values[idx + 1:])
         if len(excess_tokens) > 0:
             raise ExcessParamValue("excess tokens are %s" % excess_tokens)
@@ -0,0 +1,303 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides a lightweight wall time profiler. A :class:`Profiler`
+accumulates the number of calls, the total and the maximum wall time of
+measured code sections, grouped by category and name. The profiler may be
+bound to the current thread so code executed on its behalf (e.g. the Taurus
+Pool elements used by a macro) can contribute to it without passing it
+around::
+
+    profiler = Profiler()
+    set_current_profiler(profiler)
+    with profiler.measure("pool", "mot01.write_attribute position"):
+        ...
+    for stat in profiler.get_stats():
+        print(stat)
+
+The :obj:`startup_trace` is a profiler of the server startup phases (module
+imports, library loading, element creation, etc.) which records only while
+enabled (see the ``--startup-trace`` server option).
+"""
+
+__all__ = ["Profiler", "ProfileStat", "get_current_profiler",
+           "set_current_profiler", "get_process_uptime", "StartupTrace",
+           "startup_trace"]
+
+__docformat__ = 'restructuredtext'
+
+import os
+import json
+import time
+import threading
+import collections
+from contextlib import contextmanager
+
+_clock = time.perf_counter
+
+ProfileStat = collections.namedtuple("ProfileStat",
+                                     "category name count total max")
+
+
+class Profiler(object):
+    """Accumulates wall time statistics of code sections.
+
+    Statistics are thread safe so a single profiler may be fed from
+    different threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # dict<(str, str), list>
+        # key - (category, name)
+        # value - [count, total, max]
+        self._stats = {}
+
+    def record(self, category, name, elapsed):
+        """Record one execution of the given code section.
+
+        :param category: section category e.g. "macro", "hook", "pool"
+        :type category: :obj:`str`
+        :param name: section name
+        :type name: :obj:`str`
+        :param elapsed: wall time in seconds
+        :type elapsed: :obj:`float`
+        """
+        key = category, name
+        with self._lock:
+            stat = self._stats.get(key)
+            if stat is None:
+                self._stats[key] = [1, elapsed, elapsed]
+                return
+            stat[0] += 1
+            stat[1] += elapsed
+            if elapsed > stat[2]:
+                stat[2] = elapsed
+
+    @contextmanager
+    def measure(self, category, name):
+        """Context manager which records the wall time of its block."""
+        start = _clock()
+        try:
+            yield
+        finally:
+            self.record(category, name, _clock() - start)
+
+    def call(self, category, name, fn, *args, **kwargs):
+        """Call the given function and record its wall time."""
+        start = _clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.record(category, name, _clock() - start)
+
+    def get_stats(self, category=None):
+        """Get the accumulated statistics sorted by total time (descending).
+
+        :param category: return only statistics of this category
+            [default: None, meaning all categories]
+        :type category: :obj:`str`
+        :return: statistics
+        :rtype: :obj:`list` <:class:`ProfileStat`>
+        """
+        with self._lock:
+            stats = [ProfileStat(c, n, *stat)
+                     for (c, n), stat in self._stats.items()
+                     if category is None or c == category]
+        stats.sort(key=lambda stat: stat.total, reverse=True)
+        return stats
+
+    def reset(self):
+        """Discard the accumulated statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+_local = threading.local()
+
+
+def get_current_profiler():
+    """Get the profiler bound to the current thread.
+
+    :return: profiler or None if profiling is not enabled for this thread
+    :rtype: :class:`Profiler` or None
+    """
+    return getattr(_local, "profiler", None)
+
+
+def set_current_profiler(profiler):
+    """Bind the profiler to the current thread.
+
+    :param profiler: profiler or None to disable profiling
+    :type profiler: :class:`Profiler` or None
+    """
+    _local.profiler = profiler
+
+
+def get_process_uptime():
+    """Get the time elapsed since the current process was created (including
+    the interpreter startup and all the module imports).
+
+    :return: elapsed time (in seconds) or None if it is not available (it
+             is only available on Linux)
+    :rtype: float or None
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            stat = f.read()
+        # the fields follow the command name which may contain spaces;
+        # the process start time (in clock ticks after the system boot) is
+        # the 22nd field
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - start_ticks / os.sysconf("SC_CLK_TCK"), 0)
+    except (IOError, OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupTrace(Profiler):
+    """Profiler of the server startup phases. The category of the measured
+    sections is the phase (e.g. "controller libraries") and the name is the
+    phase item (e.g. the library name).
+
+    Sections are recorded only between :meth:`enable` and :meth:`finish`,
+    so the instrumented code (e.g. library reload) costs nothing once the
+    server is running. Phases may nest e.g. a controller library loaded on
+    first use while creating an element is accounted in both phases."""
+
+    def __init__(self):
+        Profiler.__init__(self)
+        self._active = False
+        self._start = None
+        self._file_name = None
+        self._phases = []
+
+    def enable(self, file_name=None, elapsed=0):
+        """Start recording the startup phases.
+
+        :param file_name: name of the file where the report is written in
+            JSON format by :meth:`save` [default: None, meaning the report
+            is not written]
+        :type file_name: :obj:`str`
+        :param elapsed: time (in seconds) already elapsed since the server
+            was started
+        :type elapsed: :obj:`float`
+        """
+        self.reset()
+        self._phases = []
+        self._file_name = file_name
+        self._start = _clock() - elapsed
+        self._active = True
+
+    def is_active(self):
+        """Determines if the startup phases are being recorded"""
+        return self._active
+
+    def record(self, category, name, elapsed):
+        with self._lock:
+            if category not in self._phases:
+                self._phases.append(category)
+        Profiler.record(self, category, name, elapsed)
+
+    @contextmanager
+    def measure(self, category, name):
+        """Context manager which records the wall time of its block if the
+        trace is active."""
+        if not self._active:
+            yield
+            return
+        start = _clock()
+        try:
+            yield
+        finally:
+            self.record(category, name, _clock() - start)
+
+    def get_phases(self):
+        """Get the statistics of the phases in the order they were first
+        recorded.
+
+        :return: phases, each of them a dict with the name, count and
+            total (in seconds) and the statistics of the phase items
+            sorted by total time (descending)
+        :rtype: :obj:`list` <:obj:`dict`>
+        """
+        phases = []
+        for phase in self._phases:
+            stats = self.get_stats(phase)
+            items = [dict(name=stat.name, count=stat.count,
+                          total=stat.total, max=stat.max)
+                     for stat in stats]
+            phases.append(dict(name=phase,
+                               count=sum(stat.count for stat in stats),
+                               total=sum(stat.total for stat in stats),
+                               items=items))
+        return phases
+
+    def finish(self):
+        """Stop recording and get the report.
+
+        :return: report with the total time (in seconds) elapsed since the
+            server was started and the phases (see :meth:`get_phases`)
+        :rtype: :obj:`dict`
+        """
+        self._active = False
+        return dict(total=_clock() - self._start, phases=self.get_phases())
+
+    def save(self, report):
+        """Write the report in JSON format in the file given to
+        :meth:`enable` (if any).
+
+        :param report: report as returned by :meth:`finish`
+        :type report: :obj:`dict`
+        """
+        if self._file_name is None:
+            return
+        with open(self._file_name, "w") as f:
+            json.dump(report, f, indent=2)
+
+    @staticmethod
+    def format_report(report, max_items=5):
+        """Format the report as text lines with the phases and their
+        slowest items.
+
+        :param report: report as returned by :meth:`finish`
+        :type report: :obj:`dict`
+        :param max_items: maximum number of items per phase
+        :type max_items: :obj:`int`
+        :return: text lines
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        lines = ["Startup took %.3fs" % report["total"]]
+        for phase in report["phases"]:
+            lines.append("  %-40s %5d x %9.3fs" % (phase["name"],
+                                                  phase["count"],
+                                                  phase["total"]))
+            for item in phase["items"][:max_items]:
+                lines.append("    %-38s %5d x %9.3fs" % (item["name"],
+                                                        item["count"],
+                                                        item["total"]))
+        return lines
+
+
+#: the global object recording the server startup phases
+startup_trace = StartupTrace()
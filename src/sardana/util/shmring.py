@@ -0,0 +1,306 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+"""This module provides a self-describing ring buffer of scan records in
+POSIX shared memory. It is written by the
+:class:`~sardana.macroserver.recorders.sharedmemory.PosixShmRecorder` and
+can be read, without copying, by any local process with :class:`ShmRingReader`
+e.g.::
+
+    from sardana.util.shmring import ShmRingReader
+
+    reader = ShmRingReader("Door_01_mntgrp01")
+    seq = 0
+    while not reader.is_ended():
+        rows, seq = reader.read(seq)
+        print(rows["ct01"])
+    reader.close()
+
+The shared memory segment layout is:
+
+* a fixed header of 64 bytes: magic, version, state (running or ended),
+  sequence counter (number of rows written since the beginning of the
+  scan), capacity (number of rows), row size, data offset and descriptor
+  size
+* a JSON descriptor with the columns (name, label, dtype and shape) and
+  the scan information
+* the data: *capacity* rows of fixed size, laid out as a numpy aligned
+  structured array. Row *n* is stored at index *n % capacity*.
+
+.. note:: Requires Python >= 3.8 (:mod:`multiprocessing.shared_memory`).
+"""
+
+__all__ = ["ShmRingWriter", "ShmRingReader"]
+
+__docformat__ = 'restructuredtext'
+
+import json
+import struct
+
+import numpy
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+
+MAGIC = b"SARDSHM1"
+VERSION = 1
+
+STATE_RUNNING = 0
+STATE_ENDED = 1
+
+# magic, version, state, seq, capacity, itemsize, data offset, desc. size
+_HEADER = struct.Struct("<8sIIQQQQQ")
+_HEADER_SIZE = 64
+_STATE_OFFSET = 12
+_SEQ_OFFSET = 16
+_ALIGNMENT = 64
+
+
+def _check_available():
+    if shared_memory is None:
+        raise Exception("POSIX shared memory is not available (it requires "
+                        "Python >= 3.8)")
+
+
+def _align(size, alignment=_ALIGNMENT):
+    return (size + alignment - 1) // alignment * alignment
+
+
+def _row_dtype(columns):
+    fields = [(c["name"], numpy.dtype(c["dtype"]), tuple(c["shape"]))
+              for c in columns]
+    return numpy.dtype(fields, align=True)
+
+
+# names of the segments created by this process
+_created = set()
+
+
+def _attach(name):
+    """Attaches to an existing segment without registering it in the
+    resource tracker, otherwise the segment would be unlinked when the
+    reader process exits"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+        if name in _created:
+            # keep the registration of the writer of this process
+            return shm
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+class ShmRingWriter(object):
+    """Creates a shared memory ring buffer and appends rows to it.
+
+    :param name: shared memory segment name. An existing segment with the
+                 same name is unlinked.
+    :type name: str
+    :param columns: column descriptions, each one is a dict with *name*,
+                    *dtype* and *shape* and optionally *label*
+    :type columns: seq<dict>
+    :param capacity: number of rows
+    :type capacity: int
+    :param info: additional JSON serializable information e.g. scan title
+    :type info: dict"""
+
+    def __init__(self, name, columns, capacity, info=None):
+        _check_available()
+        columns = [dict(c, shape=list(c.get("shape", ())),
+                        dtype=numpy.dtype(c["dtype"]).str)
+                   for c in columns]
+        self._dtype = dtype = _row_dtype(columns)
+        desc = json.dumps(dict(columns=columns, info=info or {})).encode()
+        data_offset = _align(_HEADER_SIZE + len(desc))
+        size = data_offset + dtype.itemsize * capacity
+        try:
+            old = shared_memory.SharedMemory(name=name)
+            old.close()
+            old.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = shm = shared_memory.SharedMemory(name=name, create=True,
+                                                     size=size)
+        _created.add(name)
+        self._name = name
+        self._capacity = capacity
+        buf = shm.buf
+        _HEADER.pack_into(buf, 0, MAGIC, VERSION, STATE_RUNNING, 0, capacity,
+                          dtype.itemsize, data_offset, len(desc))
+        buf[_HEADER_SIZE:_HEADER_SIZE + len(desc)] = desc
+        self._state = numpy.ndarray((), numpy.uint32, buffer=buf,
+                                    offset=_STATE_OFFSET)
+        self._seq = numpy.ndarray((), numpy.uint64, buffer=buf,
+                                  offset=_SEQ_OFFSET)
+        self._rows = numpy.ndarray((capacity,), dtype, buffer=buf,
+                                   offset=data_offset)
+        self._fill = numpy.zeros((), dtype)
+        # list<tuple<str, int>> field name and size (0 for scalars)
+        self._fields = []
+        for field in dtype.names:
+            field_dtype = dtype[field]
+            if field_dtype.base.kind in "fc":
+                self._fill[field] = numpy.nan
+            size = int(numpy.prod(field_dtype.shape)) if field_dtype.shape \
+                else 0
+            self._fields.append((field, size))
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def seq(self):
+        return int(self._seq)
+
+    def append(self, data):
+        """Writes a row and publishes it by incrementing the sequence
+        counter. Missing columns are filled with NaN (integers with 0) and
+        shorter 1D values are padded.
+
+        :param data: map of column name to value
+        :type data: dict"""
+        seq = int(self._seq)
+        idx = seq % self._capacity
+        self._rows[idx] = self._fill
+        row = self._rows[idx]
+        for field, size in self._fields:
+            value = data.get(field)
+            if value is None:
+                continue
+            if size:
+                value = numpy.asarray(value).ravel()[:size]
+                row[field][:len(value)] = value
+            else:
+                row[field] = value
+        self._seq[...] = seq + 1
+
+    def end(self):
+        """Marks the ring buffer as ended (no more rows will be written)"""
+        self._state[...] = STATE_ENDED
+
+    def close(self, unlink=False):
+        """Releases the segment and optionally unlinks it"""
+        self._state = self._seq = self._rows = None
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+            _created.discard(self._name)
+
+
+class ShmRingReader(object):
+    """Attaches to a shared memory ring buffer created by
+    :class:`ShmRingWriter`.
+
+    :param name: shared memory segment name
+    :type name: str"""
+
+    def __init__(self, name):
+        _check_available()
+        self._shm = shm = _attach(name)
+        buf = shm.buf
+        magic, version, _, _, capacity, itemsize, data_offset, desc_size = \
+            _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            shm.close()
+            raise ValueError("%s is not a sardana shared memory ring buffer"
+                             % name)
+        desc = json.loads(bytes(buf[_HEADER_SIZE:_HEADER_SIZE + desc_size]))
+        self._name = name
+        self._capacity = capacity
+        self._columns = desc["columns"]
+        self._info = desc["info"]
+        self._dtype = dtype = _row_dtype(self._columns)
+        if dtype.itemsize != itemsize:
+            shm.close()
+            raise ValueError("Incompatible row layout in %s" % name)
+        self._state = numpy.ndarray((), numpy.uint32, buffer=buf,
+                                    offset=_STATE_OFFSET)
+        self._seq = numpy.ndarray((), numpy.uint64, buffer=buf,
+                                  offset=_SEQ_OFFSET)
+        self._rows = numpy.ndarray((capacity,), dtype, buffer=buf,
+                                   offset=data_offset)
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def columns(self):
+        """Column descriptions (name, label, dtype and shape)"""
+        return self._columns
+
+    @property
+    def info(self):
+        """Scan information e.g. title, serialno"""
+        return self._info
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def rows(self):
+        """Zero-copy view of the ring (row *n* is at *n % capacity*)"""
+        return self._rows
+
+    @property
+    def seq(self):
+        """Number of rows written since the beginning of the scan"""
+        return int(self._seq)
+
+    def is_ended(self):
+        """Returns True if the writer finished the scan"""
+        return int(self._state) == STATE_ENDED
+
+    def read(self, start=0):
+        """Returns a copy of the rows written from the given sequence number
+        on. Rows already overwritten by the writer are skipped.
+
+        :param start: sequence number of the first row to read
+        :type start: int
+        :return: the rows and the sequence number to continue reading from
+        :rtype: tuple<numpy.ndarray, int>"""
+        capacity = self._capacity
+        end = int(self._seq)
+        start = max(start, end - capacity)
+        indexes = numpy.arange(start, end) % capacity
+        rows = self._rows[indexes]
+        # drop the rows overwritten while copying
+        lost = int(self._seq) - capacity - start
+        if lost > 0:
+            rows = rows[lost:]
+        return rows, end
+
+    def close(self):
+        self._state = self._seq = self._rows = None
+        self._shm.close()
@@ -134,6 +134,25 @@ class FuncGeneratorTestCase(TestCase):
         self.assertTrue(self.listener.start, "Start event is missing")
         self.assertTrue(self.listener.end, "End event is missing")
 
+    def test_run_time_statistics(self):
+        self.func_generator.initial_domain = SynchDomain.Time
+        self.func_generator.set_configuration(configuration_positive)
+        self.func_generator.start()
+        self.thread_pool.add(self.func_generator.run, self._done)
+        self.event.wait(100)
+        while self.func_generator.is_running():
+            time.sleep(0.01)
+        statistics = self.func_generator.get_statistics()
+        # check only the consistency of the statistics, their values depend
+        # on the load of the machine
+        self.assertEqual(statistics["nb_events"], 10)
+        self.assertGreaterEqual(statistics["nb_skipped"], 0)
+        self.assertLess(statistics["nb_skipped"], statistics["nb_events"])
+        self.assertGreaterEqual(statistics["latency_mean"], 0)
+        self.assertLessEqual(statistics["latency_mean"],
+                             statistics["latency_max"])
+        self.assertGreaterEqual(statistics["jitter"], 0)
+
     def test_stop_time(self):
         self.func_generator.initial_domain = SynchDomain.Time
         self.func_generator.set_configuration(configuration_positive)
@@ -188,6 +207,28 @@ class FuncGeneratorTestCase(TestCase):
                                                                active_event_ids_ok)
         self.assertListEqual(active_event_ids, active_event_ids_ok, msg)
 
+    def test_run_position_skip(self):
+        position = Position()
+        position.add_listener(self.func_generator)
+        self.func_generator.initial_domain = SynchDomain.Position
+        self.func_generator.active_domain = SynchDomain.Position
+        self.func_generator.direction = 1
+        self.func_generator.set_configuration(configuration_positive)
+        self.func_generator.start()
+        self.thread_pool.add(self.func_generator.run, self._done)
+        while not self.func_generator.is_running():
+            time.sleep(0.1)
+        # each position update crosses several events
+        self.thread_pool.add(position.run, None, 0.05, 2.1, .5)
+        self.event.wait(3)
+        position.remove_listener(self.func_generator)
+        active_event_ids = self.listener.active_event_ids
+        active_event_ids_ok = [0, 2, 5, 7, 9]
+        msg = "Received active event ids: %s, expected: %s" % (
+            active_event_ids, active_event_ids_ok)
+        self.assertListEqual(active_event_ids, active_event_ids_ok, msg)
+        self.assertTrue(self.listener.end, "End event is missing")
+
     def test_configuration_position(self):
         self.func_generator.initial_domain = SynchDomain.Position
         self.func_generator.active_domain = SynchDomain.Position
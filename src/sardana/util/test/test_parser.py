@@ -27,7 +27,7 @@
 
 from taurus.external import unittest
 from taurus.test import insertTest
-from sardana.util.parser import ParamParser
+from sardana.util.parser import ParamParser, ParseError
 
 
 pt0_params_def = []
@@ -877,3 +877,21 @@ class ParamParserTestCase(unittest.TestCase):
         msg = "Parsing failed (result: %r; expected: %r)" % \
               (result, params)
         self.assertListEqual(result, params, msg)
+
+    def test_reuse(self):
+        """Verify that a parser instance may be reused for several
+        parameter strings"""
+        p = ParamParser(pt14_params_def)
+        for _ in range(2):
+            result = p.parse("[[[mot1 mot2] 3] [[mot3] 5]]")
+            self.assertListEqual(result,
+                                 [[[["mot1", "mot2"], "3"], [["mot3"], "5"]]])
+        p = ParamParser(pt11_params_def)
+        self.assertListEqual(p.parse("ct1 1 mot1"), ["ct1", ["1"], "mot1"])
+        self.assertListEqual(p.parse("ct1 [1 3] mot1"),
+                             ["ct1", ["1", "3"], "mot1"])
+
+    def test_unbalanced_bracket(self):
+        """Verify that a stray closing bracket raises ParseError"""
+        p = ParamParser(pt3_params_def)
+        self.assertRaises(ParseError, p.parse, "] 1")
@@ -0,0 +1,205 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.sardana-controls.org/
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import os
+import json
+import shutil
+import tempfile
+import time
+import threading
+
+from taurus import Logger
+from taurus.external.unittest import TestCase
+
+from sardana.util.profiler import Profiler, get_current_profiler, \
+    set_current_profiler, get_process_uptime, StartupTrace
+from sardana.macroserver.macro import mAPI, ProfiledHook, ExecMacroHook
+from sardana.taurus.core.tango.sardana.pool import MeasurementGroup, \
+    TangoAttributeEG
+
+
+class _FakeMacro(object):
+
+    _stopped = False
+    _processingStop = False
+
+    @mAPI
+    def checkPoint(self):
+        pass
+
+
+class _FakeDevice(object):
+
+    def getNormalName(self):
+        return "mntgrp/pool/mntgrp01"
+
+    def getSimpleName(self):
+        return "mntgrp01"
+
+
+class _FakeAttribute(Logger):
+    """Taurus attribute like object recording the written values"""
+
+    def __init__(self, name):
+        Logger.__init__(self, name)
+        self.name = name
+        self.values = []
+
+    def getParentObj(self):
+        return _FakeDevice()
+
+    def getSimpleName(self):
+        return self.name
+
+    def addListener(self, listener):
+        pass
+
+    def write(self, value, with_read=True):
+        self.values.append(value)
+
+
+class ProfilerTestCase(TestCase):
+
+    def tearDown(self):
+        set_current_profiler(None)
+
+    def test_record(self):
+        profiler = Profiler()
+        profiler.record("pool", "mot01.read_attribute", 0.5)
+        profiler.record("pool", "mot01.read_attribute", 1.5)
+        profiler.record("macro", "ct", 0.1)
+        with profiler.measure("macro", "ascan"):
+            pass
+        stats = profiler.get_stats("pool")
+        self.assertEqual(len(stats), 1)
+        stat = stats[0]
+        self.assertEqual(stat.count, 2)
+        self.assertAlmostEqual(stat.total, 2.0)
+        self.assertAlmostEqual(stat.max, 1.5)
+        stats = profiler.get_stats()
+        self.assertEqual(len(stats), 3)
+        # sorted by total time
+        self.assertEqual(stats[0].name, "mot01.read_attribute")
+        profiler.reset()
+        self.assertEqual(profiler.get_stats(), [])
+
+    def test_current_profiler(self):
+        profiler = Profiler()
+        set_current_profiler(profiler)
+        self.assertIs(get_current_profiler(), profiler)
+        other = []
+        th = threading.Thread(target=lambda: other.append(
+            get_current_profiler()))
+        th.start()
+        th.join()
+        self.assertEqual(other, [None])
+
+    def test_mapi(self):
+        macro = _FakeMacro()
+        macro.checkPoint()
+        profiler = Profiler()
+        set_current_profiler(profiler)
+        macro.checkPoint()
+        macro.checkPoint()
+        stats = profiler.get_stats("api")
+        self.assertEqual([(s.name, s.count) for s in stats],
+                         [("checkPoint", 2)])
+        stats = profiler.get_stats("stop_check")
+        self.assertEqual([(s.name, s.count) for s in stats],
+                         [("checkPoint", 2)])
+
+    def test_hook(self):
+        profiler = Profiler()
+        calls = []
+
+        def my_hook():
+            calls.append(1)
+
+        ProfiledHook(profiler, "pre-acq", my_hook)()
+        hook = ExecMacroHook(_FakeMacro(), ["ct", 0.1])
+        self.assertEqual(ProfiledHook(profiler, "post-acq", hook)._name,
+                         "post-acq ct")
+        self.assertEqual(calls, [1])
+        stats = profiler.get_stats("hook")
+        self.assertEqual([(s.name, s.count) for s in stats],
+                         [("pre-acq my_hook", 1)])
+
+    def test_process_uptime(self):
+        """Verify that the process uptime (used by the startup trace to
+        account the interpreter startup) increases with the time"""
+        uptime = get_process_uptime()
+        if uptime is None:
+            self.skipTest("process creation time not available")
+        # at least the import of this module took place
+        self.assertGreater(uptime, 0)
+        time.sleep(0.1)
+        self.assertGreater(get_process_uptime() - uptime, 0.05)
+
+    def test_startup_trace(self):
+        trace = StartupTrace()
+        with trace.measure("macro libraries", "standard"):
+            pass
+        self.assertEqual(trace.get_phases(), [])
+        directory = tempfile.mkdtemp()
+        try:
+            file_name = os.path.join(directory, "startup.json")
+            trace.enable(file_name)
+            self.assertTrue(trace.is_active())
+            trace.record("module imports", "server classes", 1.0)
+            trace.record("macro libraries", "standard", 0.5)
+            trace.record("macro libraries", "scan", 1.5)
+            report = trace.finish()
+            trace.save(report)
+            self.assertFalse(trace.is_active())
+            with trace.measure("macro libraries", "expert"):
+                pass
+            phases = report["phases"]
+            # phases in the order they were first recorded
+            self.assertEqual([phase["name"] for phase in phases],
+                             ["module imports", "macro libraries"])
+            self.assertEqual(phases[1]["count"], 2)
+            self.assertAlmostEqual(phases[1]["total"], 2.0)
+            self.assertEqual([item["name"] for item in phases[1]["items"]],
+                             ["scan", "standard"])
+            with open(file_name) as f:
+                self.assertEqual(json.load(f)["phases"], phases)
+            lines = StartupTrace.format_report(report, max_items=1)
+            self.assertEqual(len(lines), 5)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_pool_attribute(self):
+        """Verify that the Pool calls done with the attribute objects
+        e.g. MeasurementGroup.setIntegrationTime are recorded"""
+        attr = _FakeAttribute("IntegrationTime")
+        mg = MeasurementGroup.__new__(MeasurementGroup)
+        mg._attrEG = {"IntegrationTime": TangoAttributeEG(attr)}
+        mg.setIntegrationTime(0.1)
+        profiler = Profiler()
+        set_current_profiler(profiler)
+        mg.setIntegrationTime(0.2)
+        mg.setIntegrationTime(0.3)
+        self.assertEqual(attr.values, [0.1, 0.2, 0.3])
+        stats = profiler.get_stats("pool")
+        self.assertEqual([(s.name, s.count) for s in stats],
+                         [("mntgrp01.write_attribute IntegrationTime", 2)])
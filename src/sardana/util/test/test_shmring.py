@@ -0,0 +1,83 @@
+##############################################################################
+##
+# This file is part of Sardana
+##
+# http://www.tango-controls.org/static/sardana/latest/doc/html/index.html
+##
+# Copyright 2011 CELLS / ALBA Synchrotron, Bellaterra, Spain
+##
+# Sardana is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+##
+# Sardana is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+##
+# You should have received a copy of the GNU Lesser General Public License
+# along with Sardana.  If not, see <http://www.gnu.org/licenses/>.
+##
+##############################################################################
+
+import os
+import unittest
+
+import numpy
+
+from sardana.util import shmring
+from sardana.util.shmring import ShmRingWriter, ShmRingReader
+
+
+COLUMNS = [dict(name="point_nb", dtype="int64", shape=()),
+           dict(name="ct01", dtype="float64", shape=()),
+           dict(name="mca01", dtype="float32", shape=(4,))]
+
+
+@unittest.skipIf(shmring.shared_memory is None,
+                 "POSIX shared memory is not available")
+class ShmRingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.name = "sardana_test_%d" % os.getpid()
+        self.writer = ShmRingWriter(self.name, COLUMNS, 4,
+                                    info=dict(title="ascan"))
+        self.reader = ShmRingReader(self.name)
+
+    def test_layout(self):
+        """Test that the reader gets the columns and the information"""
+        self.assertEqual([c["name"] for c in self.reader.columns],
+                         ["point_nb", "ct01", "mca01"])
+        self.assertEqual(self.reader.info, dict(title="ascan"))
+        self.assertEqual(self.reader.capacity, 4)
+
+    def test_read(self):
+        """Test reading rows incrementally and the missing values"""
+        self.writer.append(dict(point_nb=0, ct01=1.5, mca01=[1, 2, 3, 4]))
+        rows, seq = self.reader.read()
+        self.assertEqual(seq, 1)
+        self.assertEqual(rows["ct01"][0], 1.5)
+        numpy.testing.assert_array_equal(rows["mca01"][0], [1, 2, 3, 4])
+        self.writer.append(dict(point_nb=1, mca01=[1, 2]))
+        rows, seq = self.reader.read(seq)
+        self.assertEqual(seq, 2)
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(numpy.isnan(rows["ct01"][0]))
+        numpy.testing.assert_array_equal(rows["mca01"][0],
+                                         [1, 2, numpy.nan, numpy.nan])
+        self.assertFalse(self.reader.is_ended())
+        self.writer.end()
+        self.assertTrue(self.reader.is_ended())
+
+    def test_overwritten(self):
+        """Test that the rows overwritten by the writer are skipped"""
+        for i in range(10):
+            self.writer.append(dict(point_nb=i))
+        rows, seq = self.reader.read()
+        self.assertEqual(seq, 10)
+        numpy.testing.assert_array_equal(rows["point_nb"], [6, 7, 8, 9])
+
+    def tearDown(self):
+        self.reader.close()
+        self.writer.close(unlink=True)